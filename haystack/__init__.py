@@ -1,6 +1,6 @@
 # pylint: disable=wrong-import-position,wrong-import-order
 
-from typing import Union
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 from types import ModuleType
 
 try:
@@ -15,13 +15,27 @@ __version__: str = str(metadata.version("farm-haystack"))
 # Logging is not configured here on purpose, see https://github.com/deepset-ai/haystack/issues/2485
 import logging
 
-import pandas as pd
-
-from haystack.schema import Document, Answer, Label, MultiLabel, Span, EvaluationResult
-from haystack.nodes.base import BaseComponent
-from haystack.pipelines.base import Pipeline
 from haystack.environment import set_pytorch_secure_model_loading
+from haystack.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from haystack.schema import Document, Answer, Label, MultiLabel, Span, EvaluationResult
+    from haystack.nodes.base import BaseComponent
+    from haystack.pipelines.base import Pipeline
 
 
-pd.options.display.max_colwidth = 80
 set_pytorch_secure_model_loading()
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "Document": "haystack.schema",
+    "Answer": "haystack.schema",
+    "Label": "haystack.schema",
+    "MultiLabel": "haystack.schema",
+    "Span": "haystack.schema",
+    "EvaluationResult": "haystack.schema",
+    "BaseComponent": "haystack.nodes.base",
+    "Pipeline": "haystack.pipelines.base",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,25 +1,48 @@
-import os
-import importlib
-from haystack.utils.import_utils import safe_import
-from haystack.document_stores.base import BaseDocumentStore, BaseKnowledgeGraph, KeywordDocumentStore
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 
-from haystack.document_stores.memory import InMemoryDocumentStore
-from haystack.document_stores.deepsetcloud import DeepsetCloudDocumentStore
-from haystack.document_stores.utils import eval_data_from_json, eval_data_from_jsonl, squad_json_to_jsonl
+from haystack.utils.lazy_imports import lazy_exports
 
-from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
-from haystack.document_stores.es_converter import (
-    elasticsearch_index_to_document_store,
-    open_search_index_to_document_store,
-)
+if TYPE_CHECKING:
+    from haystack.document_stores.base import BaseDocumentStore, BaseKnowledgeGraph, KeywordDocumentStore
+    from haystack.document_stores.memory import InMemoryDocumentStore
+    from haystack.document_stores.deepsetcloud import DeepsetCloudDocumentStore
+    from haystack.document_stores.utils import eval_data_from_json, eval_data_from_jsonl, squad_json_to_jsonl
+    from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
+    from haystack.document_stores.es_converter import (
+        elasticsearch_index_to_document_store,
+        open_search_index_to_document_store,
+    )
+    from haystack.document_stores.opensearch import OpenSearchDocumentStore
+    from haystack.document_stores.sql import SQLDocumentStore
+    from haystack.document_stores.faiss import FAISSDocumentStore
+    from haystack.document_stores.pinecone import PineconeDocumentStore
+    from haystack.document_stores.milvus import MilvusDocumentStore
+    from haystack.document_stores.weaviate import WeaviateDocumentStore
+    from haystack.document_stores.graphdb import GraphDBKnowledgeGraph
+    from haystack.document_stores.memory_knowledgegraph import InMemoryKnowledgeGraph
 
-OpenSearchDocumentStore = safe_import("haystack.document_stores.opensearch", "OpenSearchDocumentStore", "opensearch")
-SQLDocumentStore = safe_import("haystack.document_stores.sql", "SQLDocumentStore", "sql")
-FAISSDocumentStore = safe_import("haystack.document_stores.faiss", "FAISSDocumentStore", "faiss")
-PineconeDocumentStore = safe_import("haystack.document_stores.pinecone", "PineconeDocumentStore", "pinecone")
-MilvusDocumentStore = safe_import("haystack.document_stores.milvus", "MilvusDocumentStore", "milvus")
-WeaviateDocumentStore = safe_import("haystack.document_stores.weaviate", "WeaviateDocumentStore", "weaviate")
-GraphDBKnowledgeGraph = safe_import("haystack.document_stores.graphdb", "GraphDBKnowledgeGraph", "graphdb")
-InMemoryKnowledgeGraph = safe_import(
-    "haystack.document_stores.memory_knowledgegraph", "InMemoryKnowledgeGraph", "inmemorygraph"
-)
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "BaseDocumentStore": "haystack.document_stores.base",
+    "BaseKnowledgeGraph": "haystack.document_stores.base",
+    "KeywordDocumentStore": "haystack.document_stores.base",
+    "InMemoryDocumentStore": "haystack.document_stores.memory",
+    "DeepsetCloudDocumentStore": "haystack.document_stores.deepsetcloud",
+    "eval_data_from_json": "haystack.document_stores.utils",
+    "eval_data_from_jsonl": "haystack.document_stores.utils",
+    "squad_json_to_jsonl": "haystack.document_stores.utils",
+    "ElasticsearchDocumentStore": "haystack.document_stores.elasticsearch",
+    "elasticsearch_index_to_document_store": "haystack.document_stores.es_converter",
+    "open_search_index_to_document_store": "haystack.document_stores.es_converter",
+    "OpenSearchDocumentStore": ("haystack.document_stores.opensearch", "opensearch"),
+    "SQLDocumentStore": ("haystack.document_stores.sql", "sql"),
+    "FAISSDocumentStore": ("haystack.document_stores.faiss", "faiss"),
+    "PineconeDocumentStore": ("haystack.document_stores.pinecone", "pinecone"),
+    "MilvusDocumentStore": ("haystack.document_stores.milvus", "milvus"),
+    "WeaviateDocumentStore": ("haystack.document_stores.weaviate", "weaviate"),
+    "GraphDBKnowledgeGraph": ("haystack.document_stores.graphdb", "graphdb"),
+    "InMemoryKnowledgeGraph": ("haystack.document_stores.memory_knowledgegraph", "inmemorygraph"),
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,6 @@
 # pylint: disable=too-many-public-methods
 
-from typing import Generator, Optional, Dict, List, Set, Union, Any
+from typing import Generator, Iterable, Optional, Dict, List, Set, Union, Any
 
 import warnings
 import logging
@@ -93,6 +93,9 @@ class BaseDocumentStore(BaseComponent):
                           Optionally: Include meta data via {"text": "<the-actual-text>",
                           "meta":{"name": "<some-document-name>, "author": "somebody", ...}}
                           It can be used for filtering and is accessible in the responses of the Finder.
+                          The InMemory, SQL, Elasticsearch and OpenSearch document stores also accept any iterable
+                          or generator and consume it in chunks of `batch_size`. FAISS and Milvus accept iterables
+                          but load them into memory at once. The other document stores expect a list.
         :param index: Optional name of index where the documents shall be written to.
                       If None, the DocumentStore's default index (self.index) will be used.
         :param batch_size: Number of documents that are passed to bulk function at a time.
@@ -644,6 +647,79 @@ class BaseDocumentStore(BaseComponent):
 
         return _documents
 
+    def _get_document_batches(
+        self,
+        documents: Iterable[Union[dict, Document]],
+        batch_size: int,
+        field_map: Optional[Dict[str, Any]] = None,
+        drop_duplicates: bool = False,
+        index: Optional[str] = None,
+    ) -> Generator[List[Document], None, None]:
+        """
+        Consume documents in chunks of `batch_size` and convert them into Document objects.
+
+        Only one chunk is held in memory at a time, so `documents` can be a generator over a corpus that doesn't fit
+        into memory.
+
+        :param documents: An iterable of Python dictionaries or Haystack Document objects.
+        :param batch_size: Number of documents per chunk.
+        :param field_map: Optional field map to convert dictionaries into Document objects.
+        :param drop_duplicates: Whether to drop documents whose ID already occurred earlier in `documents`.
+                                The IDs of all documents seen so far are kept in memory for that purpose, so memory
+                                still grows linearly with the number of documents, though by their IDs only.
+        :param index: name of the index, used for logging dropped duplicates.
+        """
+        seen_ids: Set[str] = set()
+        for batch in get_batches_from_generator(documents, batch_size):
+            document_batch = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in batch]
+            if drop_duplicates:
+                unique_documents = []
+                for document in document_batch:
+                    if document.id in seen_ids:
+                        logger.info(
+                            "Duplicate Documents: Document with id '%s' already exists in index '%s'",
+                            document.id,
+                            index or self.index,
+                        )
+                        continue
+                    seen_ids.add(document.id)
+                    unique_documents.append(document)
+                document_batch = unique_documents
+            yield document_batch
+
+    def _fail_on_existing_documents(
+        self,
+        documents: Iterable[Union[dict, Document]],
+        batch_size: int,
+        field_map: Optional[Dict[str, Any]] = None,
+        index: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterable[Union[dict, Document]]:
+        """
+        Check all `documents` for IDs that already exist in the index before any of them gets written, so that
+        `duplicate_documents="fail"` doesn't leave the index with only a part of the documents written.
+
+        `documents` needs to be read twice for that, so iterators and generators are loaded into a list first.
+
+        :param documents: An iterable of Python dictionaries or Haystack Document objects.
+        :param batch_size: Number of documents whose IDs are looked up in the index at a time.
+        :param field_map: Optional field map to convert dictionaries into Document objects.
+        :param index: name of the index
+        :param headers: Custom HTTP headers to pass to document store client if supported.
+        :raises DuplicateDocumentError: If any of the documents already exists in the index.
+        :return: The documents, as a list if they were passed as an iterator.
+        """
+        if not isinstance(documents, collections.abc.Collection):
+            documents = list(documents)
+        document_batches = self._get_document_batches(
+            documents, batch_size=batch_size, field_map=field_map, drop_duplicates=True, index=index
+        )
+        for document_batch in document_batches:
+            self._handle_duplicate_documents(
+                documents=document_batch, index=index, duplicate_documents="fail", headers=headers
+            )
+        return documents
+
     def _handle_duplicate_documents(
         self,
         documents: List[Document],
@@ -678,7 +754,8 @@ class BaseDocumentStore(BaseComponent):
                     f"Document with ids '{', '.join(ids_exist_in_db)} already exists" f" in index = '{index}'."
                 )
 
-            documents = list(filter(lambda doc: doc.id not in ids_exist_in_db, documents))
+            existing_ids = set(ids_exist_in_db)
+            documents = [doc for doc in documents if doc.id not in existing_ids]
 
         return documents
 
@@ -694,17 +771,23 @@ class BaseDocumentStore(BaseComponent):
         """
         index = index or self.label_index
         new_ids: List[str] = [label.id for label in labels]
-        duplicate_ids: List[str] = []
+        duplicate_ids: Set[str] = {label_id for label_id, count in collections.Counter(new_ids).items() if count > 1}
+        duplicate_ids |= self._get_existing_label_ids(set(new_ids), index=index, headers=headers)
 
-        for label_id, count in collections.Counter(new_ids).items():
-            if count > 1:
-                duplicate_ids.append(label_id)
+        return [label for label in labels if label.id in duplicate_ids]
 
-        for label in self.get_all_labels(index=index, headers=headers):
-            if label.id in new_ids:
-                duplicate_ids.append(label.id)
+    def _get_existing_label_ids(self, ids: Set[str], index: str, headers: Optional[Dict[str, str]] = None) -> Set[str]:
+        """
+        Return the subset of `ids` that belong to labels already stored in `index`.
 
-        return [label for label in labels if label.id in duplicate_ids]
+        DocumentStores that can look up labels by their ids should override this method,
+        the default implementation scans all labels of the index.
+
+        :param ids: Label ids to look up
+        :param index: Name of the label index
+        :param headers: Custom HTTP headers to pass to document store client if supported (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='} for basic authentication)
+        """
+        return {label.id for label in self.get_all_labels(index=index, headers=headers) if label.id in ids}
 
     @classmethod
     def _validate_embeddings_shape(cls, embeddings: np.ndarray, num_documents: int, embedding_dim: int):
@@ -14,7 +14,7 @@ except (ImportError, ModuleNotFoundError) as ie:
 
 from haystack.errors import DocumentStoreError
 from haystack.schema import Document, FilterType
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
 
 from .search_engine import SearchEngineDocumentStore, prepare_hosts
 
@@ -56,6 +56,8 @@ class ElasticsearchDocumentStore(SearchEngineDocumentStore):
         synonyms: Optional[List] = None,
         synonym_type: str = "synonym",
         use_system_proxy: bool = False,
+        bulk_thread_count: int = 1,
+        bulk_target_latency: float = 10.0,
     ):
         """
         A DocumentStore using Elasticsearch to store and query the documents for our search.
@@ -127,6 +129,11 @@ class ElasticsearchDocumentStore(SearchEngineDocumentStore):
                              Synonym or Synonym_graph to handle synonyms, including multi-word synonyms correctly during the analysis process.
                              More info at https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-synonym-graph-tokenfilter.html
         :param use_system_proxy: Whether to use system proxy.
+        :param bulk_thread_count: Maximum number of bulk requests that are sent to the cluster in parallel when writing
+                                  documents. Batches are assembled while earlier ones are still in flight. Default: 1
+        :param bulk_target_latency: Number of seconds a bulk request may take before the size of the following bulk
+                                    requests is halved. The size grows back while requests take less than half of it.
+                                    Default: 10.0
 
         """
         # Base constructor might need the client to be ready, create it first
@@ -167,6 +174,8 @@ class ElasticsearchDocumentStore(SearchEngineDocumentStore):
             skip_missing_embeddings=skip_missing_embeddings,
             synonyms=synonyms,
             synonym_type=synonym_type,
+            bulk_thread_count=bulk_thread_count,
+            bulk_target_latency=bulk_target_latency,
         )
 
         # Let the base class trap the right exception from the elasticpy client
@@ -390,10 +399,9 @@ class ElasticsearchDocumentStore(SearchEngineDocumentStore):
                 raise self._RequestError(e.status_code, error_message, e.info)
             raise e
 
-        documents = [
-            self._convert_es_hit_to_document(hit, adapt_score_for_embedding=True, scale_score=scale_score)
-            for hit in result
-        ]
+        documents = self._convert_es_hits_to_documents(
+            result, adapt_score_for_embedding=True, scale_score=scale_score, return_embedding=return_embedding
+        )
         return documents
 
     def _construct_dense_query_body(
@@ -401,7 +409,7 @@ class ElasticsearchDocumentStore(SearchEngineDocumentStore):
     ):
         body = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
         if filters:
-            filter_ = {"bool": {"filter": LogicalFilterClause.parse(filters).convert_to_elasticsearch()}}
+            filter_ = {"bool": {"filter": compile_filter(filters).convert_to_elasticsearch()}}
             if body["query"]["script_score"]["query"] == {"match_all": {}}:
                 body["query"]["script_score"]["query"] = filter_
             else:
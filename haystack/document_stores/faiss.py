@@ -1,4 +1,4 @@
-from typing import Union, List, Optional, Dict, Generator
+from typing import TYPE_CHECKING, Union, Iterable, List, Optional, Dict, Generator
 
 import json
 import logging
@@ -21,7 +21,9 @@ except (ImportError, ModuleNotFoundError) as ie:
 
 from haystack.schema import Document, FilterType
 from haystack.document_stores.base import get_batches_from_generator
-from haystack.nodes.retriever import DenseRetriever
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
@@ -216,7 +218,7 @@ class FAISSDocumentStore(SQLDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -313,7 +315,7 @@ class FAISSDocumentStore(SQLDocumentStore):
 
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         update_existing_embeddings: bool = True,
         filters: Optional[FilterType] = None,
@@ -1,6 +1,9 @@
-from typing import Union, List, Dict, Optional, Tuple
+from typing import Any, Callable, Hashable, Union, List, Dict, Optional, Tuple
+import operator
+import threading
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from copy import deepcopy
 
 from sqlalchemy.sql import select
 from sqlalchemy import and_, or_
@@ -9,6 +12,13 @@ from haystack.document_stores.utils import convert_date_to_rfc3339
 from haystack.errors import FilterError
 
 
+# Number of distinct filters whose compiled form `compile_filter` keeps in memory
+FILTER_CACHE_SIZE = 1000
+
+# Placeholder for metadata fields that a document doesn't have
+_MISSING = object()
+
+
 def nested_defaultdict() -> defaultdict:
     """
     Data structure that recursively adds a dictionary as value if a key does not exist. Advantage: In nested dictionary
@@ -94,6 +104,13 @@ class LogicalFilterClause(ABC):
     def evaluate(self, fields) -> bool:
         pass
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Returns a function that evaluates the filter on a dictionary of metadata fields, with the same result as
+        `evaluate` but without dispatching on the filter tree for each document.
+        """
+        return self.evaluate
+
     @classmethod
     def parse(cls, filter_term: Union[dict, List[dict]]) -> Union["LogicalFilterClause", "ComparisonOperation"]:
         """
@@ -190,6 +207,48 @@ class ComparisonOperation(ABC):
     def evaluate(self, fields) -> bool:
         pass
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Returns a function that evaluates the operation on a dictionary of metadata fields, with the same result as
+        `evaluate`.
+        """
+        return self.evaluate
+
+    def _compile_comparison(self, compare: Callable[[Any, Any], bool]) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_value = self.comparison_value
+
+        def evaluate(fields: Dict[str, Any]) -> bool:
+            field_value = fields.get(field_name, _MISSING)
+            return field_value is not _MISSING and compare(field_value, comparison_value)
+
+        return evaluate
+
+    def _compile_membership(self, negate: bool) -> Callable[[Dict[str, Any]], bool]:
+        field_name = self.field_name
+        comparison_values = self.comparison_value
+        comparison_set = None
+        if isinstance(comparison_values, (list, tuple, set)):
+            try:
+                comparison_set = frozenset(comparison_values)
+            except TypeError:
+                # Unhashable comparison values like lists are looked up in the list instead
+                pass
+
+        def evaluate(fields: Dict[str, Any]) -> bool:
+            field_value = fields.get(field_name, _MISSING)
+            if field_value is _MISSING:
+                return False
+            if comparison_set is not None:
+                try:
+                    return (field_value in comparison_set) != negate
+                except TypeError:
+                    # Unhashable field values like lists can't be looked up in the set
+                    pass
+            return (field_value in comparison_values) != negate  # type: ignore
+
+        return evaluate
+
     @classmethod
     def parse(cls, field_name, comparison_clause: Union[Dict, List, str, float]) -> List["ComparisonOperation"]:
         comparison_operations: List[ComparisonOperation] = []
@@ -304,6 +363,17 @@ class NotOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return not any(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        conditions = tuple(condition.compile() for condition in self.conditions)
+
+        def evaluate(fields: Dict[str, Any]) -> bool:
+            for condition in conditions:
+                if condition(fields):
+                    return False
+            return True
+
+        return evaluate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -351,6 +421,17 @@ class AndOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return all(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        conditions = tuple(condition.compile() for condition in self.conditions)
+
+        def evaluate(fields: Dict[str, Any]) -> bool:
+            for condition in conditions:
+                if not condition(fields):
+                    return False
+            return True
+
+        return evaluate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -383,6 +464,17 @@ class OrOperation(LogicalFilterClause):
     def evaluate(self, fields) -> bool:
         return any(condition.evaluate(fields) for condition in self.conditions)
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        conditions = tuple(condition.compile() for condition in self.conditions)
+
+        def evaluate(fields: Dict[str, Any]) -> bool:
+            for condition in conditions:
+                if condition(fields):
+                    return True
+            return False
+
+        return evaluate
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict]:
         conditions = [condition.convert_to_elasticsearch() for condition in self.conditions]
         conditions = self._merge_es_range_queries(conditions)
@@ -417,6 +509,9 @@ class EqOperation(ComparisonOperation):
             return False
         return fields[self.field_name] == self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.eq)
+
     def convert_to_elasticsearch(
         self,
     ) -> Dict[str, Dict[str, Union[str, int, float, bool, Dict[str, Union[list, Dict[str, str]]]]]]:
@@ -460,6 +555,9 @@ class InOperation(ComparisonOperation):
         return fields[self.field_name] in self.comparison_value  # type: ignore
         # is only initialized with lists, but changing the type annotation would mean duplicating __init__
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_membership(negate=False)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, List]]:
         if not isinstance(self.comparison_value, list):
             raise FilterError("'$in' operation requires comparison value to be a list.")
@@ -502,6 +600,9 @@ class NeOperation(ComparisonOperation):
             return False
         return fields[self.field_name] != self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.ne)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Union[str, int, float, bool]]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Use '$nin' operation for lists as comparison values.")
@@ -534,6 +635,9 @@ class NinOperation(ComparisonOperation):
         return fields[self.field_name] not in self.comparison_value  # type: ignore
         # is only initialized with lists, but changing the type annotation would mean duplicating __init__
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_membership(negate=True)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Dict[str, List]]]]:
         if not isinstance(self.comparison_value, list):
             raise FilterError("'$nin' operation requires comparison value to be a list.")
@@ -576,6 +680,9 @@ class GtOperation(ComparisonOperation):
             return False
         return fields[self.field_name] > self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.gt)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$gt' operation must not be a list.")
@@ -611,6 +718,9 @@ class GteOperation(ComparisonOperation):
             return False
         return fields[self.field_name] >= self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.ge)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$gte' operation must not be a list.")
@@ -646,6 +756,9 @@ class LtOperation(ComparisonOperation):
             return False
         return fields[self.field_name] < self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.lt)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$lt' operation must not be a list.")
@@ -681,6 +794,9 @@ class LteOperation(ComparisonOperation):
             return False
         return fields[self.field_name] <= self.comparison_value
 
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        return self._compile_comparison(operator.le)
+
     def convert_to_elasticsearch(self) -> Dict[str, Dict[str, Dict[str, Union[str, float, int]]]]:
         if isinstance(self.comparison_value, list):
             raise FilterError("Comparison value for '$lte' operation must not be a list.")
@@ -704,3 +820,83 @@ class LteOperation(ComparisonOperation):
 
     def invert(self) -> "GtOperation":
         return GtOperation(self.field_name, self.comparison_value)
+
+
+class CompiledFilter:
+    """
+    A filter that is parsed once and then evaluated or converted to the format of a document store as often as
+    needed. The conversions are computed on first use and reused afterwards. Get instances with `compile_filter` to
+    share them between all queries with the same filter.
+
+    :param filter_term: Dictionary or list that contains the filter definition (see `LogicalFilterClause`).
+    """
+
+    def __init__(self, filter_term: Union[dict, List[dict]]):
+        # Parse a copy, so that changing the filter afterwards doesn't change the cached CompiledFilter
+        self.clause = LogicalFilterClause.parse(deepcopy(filter_term))
+        self.evaluate: Callable[[Dict[str, Any]], bool] = self.clause.compile()
+        self._conversions: Dict[Hashable, Any] = {}
+
+    def _convert(self, key: Hashable, convert: Callable[[], Any]) -> Any:
+        if key not in self._conversions:
+            self._conversions[key] = convert()
+        return self._conversions[key]
+
+    def convert_to_elasticsearch(self):
+        # Callers embed the filter into their query bodies, so they get a copy they are free to modify
+        return deepcopy(self._convert("elasticsearch", self.clause.convert_to_elasticsearch))
+
+    def convert_to_sql(self, meta_document_orm):
+        # SQLAlchemy statements are immutable, so they can be shared
+        return self._convert(("sql", meta_document_orm), lambda: self.clause.convert_to_sql(meta_document_orm))
+
+    def convert_to_weaviate(self):
+        return deepcopy(self._convert("weaviate", self.clause.convert_to_weaviate))
+
+    def convert_to_pinecone(self):
+        return deepcopy(self._convert("pinecone", self.clause.convert_to_pinecone))
+
+
+_compiled_filters: "OrderedDict[Hashable, CompiledFilter]" = OrderedDict()
+_compiled_filters_lock = threading.Lock()
+
+
+def _filter_cache_key(filter_term: Any) -> Hashable:
+    """
+    Converts a filter into a hashable key. The keys of dictionaries keep their order, as the conditions are evaluated
+    in that order, and the types of values are part of the key, as `1`, `1.0` and `True` are converted differently for
+    some document stores.
+    """
+    if isinstance(filter_term, dict):
+        return ("dict", tuple((key, _filter_cache_key(value)) for key, value in filter_term.items()))
+    if isinstance(filter_term, (list, tuple)):
+        return (type(filter_term).__name__, tuple(_filter_cache_key(value) for value in filter_term))
+    return (type(filter_term).__name__, filter_term)
+
+
+def compile_filter(filter_term: Union[dict, List[dict]]) -> CompiledFilter:
+    """
+    Returns the compiled form of a filter, taking it from a least recently used cache of the last `FILTER_CACHE_SIZE`
+    distinct filters if the same filter was compiled before.
+
+    :param filter_term: Dictionary or list that contains the filter definition (see `LogicalFilterClause`).
+    """
+    try:
+        key = _filter_cache_key(filter_term)
+        hash(key)
+    except TypeError:
+        # Filters with unhashable values can't be cached
+        return CompiledFilter(filter_term)
+
+    with _compiled_filters_lock:
+        compiled_filter = _compiled_filters.get(key)
+        if compiled_filter is not None:
+            _compiled_filters.move_to_end(key)
+            return compiled_filter
+
+    compiled_filter = CompiledFilter(filter_term)
+    with _compiled_filters_lock:
+        _compiled_filters[key] = compiled_filter
+        if len(_compiled_filters) > FILTER_CACHE_SIZE:
+            _compiled_filters.popitem(last=False)
+    return compiled_filter
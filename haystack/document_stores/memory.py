@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union, Generator
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union, Generator
 
 try:
     from typing import Literal
@@ -23,8 +23,11 @@ from haystack.errors import DuplicateDocumentError, DocumentStoreError
 from haystack.document_stores import KeywordDocumentStore
 from haystack.document_stores.base import get_batches_from_generator
 from haystack.modeling.utils import initialize_device_settings
-from haystack.document_stores.filter_utils import LogicalFilterClause
-from haystack.nodes.retriever import DenseRetriever
+from haystack.document_stores.filter_utils import compile_filter
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
+
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +143,7 @@ class InMemoryDocumentStore(KeywordDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -150,19 +153,21 @@ class InMemoryDocumentStore(KeywordDocumentStore):
          Indexes documents for later queries.
 
 
-        :param documents: a list of Python dictionaries or a list of Haystack Document objects.
+        :param documents: a list, iterable or generator of Python dictionaries or Haystack Document objects.
                            For documents as dictionaries, the format is {"content": "<the-actual-text>"}.
                            Optionally: Include meta data via {"content": "<the-actual-text>",
                            "meta": {"name": "<some-document-name>, "author": "somebody", ...}}
                            It can be used for filtering and is accessible in the responses of the Finder.
          :param index: write documents to a custom namespace. For instance, documents for evaluation can be indexed in a
                        separate index than the documents for search.
+         :param batch_size: Number of documents that are read from `documents` and processed at a time.
          :param duplicate_documents: Handle duplicates document based on parameter options.
                                      Parameter options : ( 'skip','overwrite','fail')
                                      skip: Ignore the duplicates documents
                                      overwrite: Update any existing documents with the same ID when adding documents.
                                      fail: an error is raised if the document ID of the document being added already
-                                     exists.
+                                     exists. All documents are checked before any of them is written, so a generator
+                                     passed as `documents` is loaded into memory in this mode.
          :raises DuplicateDocumentError: Exception trigger on duplicate document
          :return: None
         """
@@ -176,25 +181,34 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         ), f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
 
         field_map = self._create_document_field_map()
-        documents = deepcopy(documents)
-        documents_objects = [
-            Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents
-        ]
-        documents_objects = self._drop_duplicate_documents(documents=documents_objects)
+        if duplicate_documents == "fail":
+            documents = self._fail_on_existing_documents(
+                documents, batch_size=batch_size, field_map=field_map, index=index
+            )
+        document_batches = self._get_document_batches(
+            (deepcopy(d) for d in documents),
+            batch_size=batch_size,
+            field_map=field_map,
+            drop_duplicates=True,
+            index=index,
+        )
         modified_documents = 0
-        for document in documents_objects:
-            if document.id in self.indexes[index]:
-                if duplicate_documents == "fail":
-                    raise DuplicateDocumentError(
-                        f"Document with id '{document.id} already " f"exists in index '{index}'"
-                    )
-                if duplicate_documents == "skip":
-                    logger.warning(
-                        "Duplicate Documents: Document with id '%s' already exists in index '%s'", document.id, index
-                    )
-                    continue
-            self.indexes[index][document.id] = document
-            modified_documents += 1
+        for document_batch in document_batches:
+            for document in document_batch:
+                if document.id in self.indexes[index]:
+                    if duplicate_documents == "fail":
+                        raise DuplicateDocumentError(
+                            f"Document with id '{document.id} already " f"exists in index '{index}'"
+                        )
+                    if duplicate_documents == "skip":
+                        logger.warning(
+                            "Duplicate Documents: Document with id '%s' already exists in index '%s'",
+                            document.id,
+                            index,
+                        )
+                        continue
+                self.indexes[index][document.id] = document
+                modified_documents += 1
 
         if self.use_bm25 is True and modified_documents > 0:
             self.update_bm25(index=index)
@@ -266,6 +280,10 @@ class InMemoryDocumentStore(KeywordDocumentStore):
                 label.updated_at = label.created_at
             self.indexes[index][label.id] = label
 
+    def _get_existing_label_ids(self, ids: Set[str], index: str, headers: Optional[Dict[str, str]] = None) -> Set[str]:
+        labels = self.indexes.get(index, {})
+        return {label_id for label_id in ids if label_id in labels}
+
     def get_document_by_id(
         self, id: str, index: Optional[str] = None, headers: Optional[Dict[str, str]] = None
     ) -> Optional[Document]:
@@ -282,6 +300,34 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         else:
             return None
 
+    def _handle_duplicate_documents(
+        self,
+        documents: List[Document],
+        index: Optional[str] = None,
+        duplicate_documents: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Like `BaseDocumentStore._handle_duplicate_documents()`, but checks the IDs against the index directly, because
+        `get_documents_by_id()` raises a `KeyError` for IDs that aren't in the index.
+        """
+        if headers:
+            raise NotImplementedError("InMemoryDocumentStore does not support headers.")
+        index = index or self.index
+        if duplicate_documents in ("skip", "fail"):
+            documents = self._drop_duplicate_documents(documents, index)
+            ids_exist_in_db = [doc.id for doc in documents if doc.id in self.indexes[index]]
+
+            if len(ids_exist_in_db) > 0 and duplicate_documents == "fail":
+                raise DuplicateDocumentError(
+                    f"Document with ids '{', '.join(ids_exist_in_db)} already exists" f" in index = '{index}'."
+                )
+
+            existing_ids = set(ids_exist_in_db)
+            documents = [doc for doc in documents if doc.id not in existing_ids]
+
+        return documents
+
     def get_documents_by_id(
         self,
         ids: List[str],
@@ -502,7 +548,7 @@ class InMemoryDocumentStore(KeywordDocumentStore):
 
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         filters: Optional[FilterType] = None,
         update_existing_embeddings: bool = True,
@@ -628,23 +674,21 @@ class InMemoryDocumentStore(KeywordDocumentStore):
         only_documents_without_embedding: bool = False,
     ):
         index = index or self.index
-        documents = deepcopy(list(self.indexes[index].values()))
-        documents = [d for d in documents if isinstance(d, Document)]
+        documents = [d for d in self.indexes[index].values() if isinstance(d, Document)]
+        if only_documents_without_embedding:
+            documents = [doc for doc in documents if doc.embedding is None]
+        if filters:
+            evaluate_filter = compile_filter(filters).evaluate
+            documents = [doc for doc in documents if evaluate_filter(doc.meta)]
 
+        # Only copy the documents that passed the filters
+        filtered_documents = deepcopy(documents)
         if return_embedding is None:
             return_embedding = self.return_embedding
         if return_embedding is False:
-            for doc in documents:
+            for doc in filtered_documents:
                 doc.embedding = None
 
-        if only_documents_without_embedding:
-            documents = [doc for doc in documents if doc.embedding is None]
-        if filters:
-            parsed_filter = LogicalFilterClause.parse(filters)
-            filtered_documents = list(filter(lambda doc: parsed_filter.evaluate(doc.meta), documents))
-        else:
-            filtered_documents = documents
-
         return filtered_documents
 
     def get_all_documents(
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Union
 
 import logging
 import warnings
@@ -18,7 +18,9 @@ except (ImportError, ModuleNotFoundError) as ie:
 from haystack.schema import Document, FilterType
 from haystack.document_stores import SQLDocumentStore
 from haystack.document_stores.base import get_batches_from_generator
-from haystack.nodes.retriever import DenseRetriever
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
@@ -232,7 +234,7 @@ class MilvusDocumentStore(SQLDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -265,12 +267,12 @@ class MilvusDocumentStore(SQLDocumentStore):
             duplicate_documents in self.duplicate_documents_options
         ), f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
         field_map = self._create_document_field_map()
+        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
 
-        if len(documents) == 0:
+        if len(document_objects) == 0:
             logger.warning("Calling DocumentStore.write_documents() with empty list")
             return
 
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
         document_objects = self._handle_duplicate_documents(document_objects, duplicate_documents)
         add_vectors = False if document_objects[0].embedding is None else True
 
@@ -327,7 +329,7 @@ class MilvusDocumentStore(SQLDocumentStore):
 
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         batch_size: int = 10_000,
         update_existing_embeddings: bool = True,
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Union, Dict, Any, Generator, Iterable
 
 import logging
 
@@ -17,12 +17,15 @@ except (ImportError, ModuleNotFoundError) as e:
 
 from haystack.schema import Document, FilterType
 from haystack.document_stores.base import get_batches_from_generator
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
 from haystack.errors import DocumentStoreError
-from haystack.nodes.retriever import DenseRetriever
 
 from .search_engine import SearchEngineDocumentStore, prepare_hosts
 
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +77,8 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
         knn_engine: str = "nmslib",
         knn_parameters: Optional[Dict] = None,
         ivf_train_size: Optional[int] = None,
+        bulk_thread_count: int = 1,
+        bulk_target_latency: float = 10.0,
     ):
         """
         Document Store using OpenSearch (https://opensearch.org/). It is compatible with the Amazon OpenSearch Service.
@@ -165,6 +170,11 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
                                index type and knn parameters). If `0`, training doesn't happen automatically but needs
                                to be triggered manually via the `train_index` method.
                                Default: `None`
+        :param bulk_thread_count: Maximum number of bulk requests that are sent to the cluster in parallel when writing
+                                  documents. Batches are assembled while earlier ones are still in flight. Default: 1
+        :param bulk_target_latency: Number of seconds a bulk request may take before the size of the following bulk
+                                    requests is halved. The size grows back while requests take less than half of it.
+                                    Default: 10.0
         """
         # These parameters aren't used by Opensearch at the moment but could be in the future, see
         # https://github.com/opensearch-project/security/issues/1504. Let's not deprecate them for
@@ -243,6 +253,8 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
             skip_missing_embeddings=skip_missing_embeddings,
             synonyms=synonyms,
             synonym_type=synonym_type,
+            bulk_thread_count=bulk_thread_count,
+            bulk_target_latency=bulk_target_latency,
         )
 
         # Let the base class catch the right error from the Opensearch client
@@ -319,7 +331,7 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -335,7 +347,7 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
         If you don't set custom IDs for your Documents or just pass a list of dictionaries here,
         they automatically get UUIDs assigned. See the `Document` class for details.)
 
-        :param documents: A list of Python dictionaries or a list of Haystack Document objects.
+        :param documents: A list, iterable or generator of Python dictionaries or Haystack Document objects.
                           For documents as dictionaries, the format is {"content": "<the-actual-text>"}.
                           Optionally: Include meta data via {"content": "<the-actual-text>",
                           "meta":{"name": "<some-document-name>, "author": "somebody", ...}}
@@ -349,7 +361,8 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
                                     skip: Ignore the duplicate documents
                                     overwrite: Update any existing documents with the same ID when adding documents.
                                     fail: Raises an error if the document ID of the document being added already
-                                    exists.
+                                    exists. All documents are checked before any of them is written, so a generator
+                                    passed as `documents` is loaded into memory in this mode.
         :param headers: Custom HTTP headers to pass to OpenSearch client (for example {'Authorization': 'Basic YWRtaW46cm9vdA=='})
                 For more information, see [HTTP/REST clients and security](https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html).
         :raises DuplicateDocumentError: Exception trigger on duplicate document
@@ -359,12 +372,7 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
             index = self.index
 
         if self.knn_engine == "faiss" and self.similarity == "cosine":
-            field_map = self._create_document_field_map()
-            documents = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
-            embeddings_to_index = np.array([d.embedding for d in documents], dtype="float32")
-            self.normalize_embedding(embeddings_to_index)
-            for document, embedding in zip(documents, embeddings_to_index):
-                document.embedding = None if np.isnan(embedding).any() else embedding
+            documents = self._normalize_document_embeddings(documents, batch_size=batch_size)
 
         super().write_documents(
             documents=documents,
@@ -384,7 +392,25 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
                 train_docs = self.get_all_documents(index=index, return_embedding=True, headers=headers)
                 self._train_ivf_index(index=index, documents=train_docs, headers=headers)
 
-    def _embed_documents(self, documents: List[Document], retriever: DenseRetriever) -> np.ndarray:
+    def _normalize_document_embeddings(
+        self, documents: Iterable[Union[dict, Document]], batch_size: int
+    ) -> Generator[Document, None, None]:
+        """
+        Normalize the embeddings of documents in chunks of `batch_size`.
+        :param documents: Documents whose embeddings to normalize.
+        :param batch_size: Number of documents to normalize at a time.
+        :return: Documents with normalized embeddings.
+        """
+        field_map = self._create_document_field_map()
+        for batch in get_batches_from_generator(documents, batch_size):
+            document_batch = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in batch]
+            embeddings_to_index = np.array([d.embedding for d in document_batch], dtype="float32")
+            self.normalize_embedding(embeddings_to_index)
+            for document, embedding in zip(document_batch, embeddings_to_index):
+                document.embedding = None if np.isnan(embedding).any() else embedding
+            yield from document_batch
+
+    def _embed_documents(self, documents: List[Document], retriever: "DenseRetriever") -> np.ndarray:
         """
         Embed a list of documents using a Retriever.
         :param documents: List of documents to embed.
@@ -503,10 +529,9 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
         logger.debug("Retriever query: %s", body)
         result = self.client.search(index=index, body=body, request_timeout=300, headers=headers)["hits"]["hits"]
 
-        documents = [
-            self._convert_es_hit_to_document(hit, adapt_score_for_embedding=True, scale_score=scale_score)
-            for hit in result
-        ]
+        documents = self._convert_es_hits_to_documents(
+            result, adapt_score_for_embedding=True, scale_score=scale_score, return_embedding=return_embedding
+        )
 
         if self.index_type == "hnsw":
             ef_search = self._get_ef_search_value()
@@ -623,7 +648,7 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
     ):
         body: Dict[str, Any] = {"size": top_k, "query": self._get_vector_similarity_query(query_emb, top_k)}
         if filters:
-            filter_ = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+            filter_ = compile_filter(filters).convert_to_elasticsearch()
             if "script_score" in body["query"]:
                 # set filter for pre-filtering (see https://opensearch.org/docs/latest/search-plugins/knn/knn-score-script/)
                 body["query"]["script_score"]["query"] = {"bool": {"filter": filter_}}
@@ -1323,7 +1348,7 @@ class OpenSearchDocumentStore(SearchEngineDocumentStore):
             opensearch_logger.setLevel(logging.CRITICAL)
             with tqdm(total=document_count, position=0, unit=" Docs", desc="Cloning embeddings") as progress_bar:
                 for result_batch in get_batches_from_generator(result, batch_size):
-                    document_batch = [self._convert_es_hit_to_document(hit) for hit in result_batch]
+                    document_batch = self._convert_es_hits_to_documents(list(result_batch))
                     doc_updates = []
                     for doc in document_batch:
                         if doc.embedding is not None:
@@ -1,6 +1,7 @@
-from typing import Set, Union, List, Optional, Dict, Generator, Any
+from typing import TYPE_CHECKING, Set, Union, List, Optional, Dict, Generator, Any
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 from functools import reduce
 import operator
@@ -12,9 +13,11 @@ from tqdm.auto import tqdm
 from haystack.schema import Document, FilterType, Label, Answer, Span
 from haystack.document_stores import BaseDocumentStore
 
-from haystack.document_stores.filter_utils import LogicalFilterClause
-from haystack.errors import PineconeDocumentStoreError, DuplicateDocumentError
-from haystack.nodes.retriever import DenseRetriever
+from haystack.document_stores.filter_utils import compile_filter
+from haystack.errors import HaystackError, PineconeDocumentStoreError, DuplicateDocumentError
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
@@ -70,6 +73,7 @@ class PineconeDocumentStore(BaseDocumentStore):
         recreate_index: bool = False,
         metadata_config: Optional[Dict] = None,
         validate_index_sync: bool = True,
+        query_batch_workers: int = 8,
     ):
         """
         :param api_key: Pinecone vector database API key ([https://app.pinecone.io](https://app.pinecone.io)).
@@ -105,6 +109,7 @@ class PineconeDocumentStore(BaseDocumentStore):
             [selective metadata filtering](https://www.pinecone.io/docs/manage-indexes/#selective-metadata-indexing) feature.
             Should be in the format `{"indexed": ["metadata-field-1", "metadata-field-2", "metadata-field-n"]}`. By default,
             no fields are indexed.
+        :param query_batch_workers: Maximum number of concurrent requests `query_by_embedding_batch` sends to Pinecone.
         """
         if metadata_config is None:
             metadata_config = {"indexed": []}
@@ -137,6 +142,7 @@ class PineconeDocumentStore(BaseDocumentStore):
         self.embedding_field = embedding_field
         self.progress_bar = progress_bar
         self.duplicate_documents = duplicate_documents
+        self.query_batch_workers = query_batch_workers
         self.document_namespace = "no-vectors"
         self.embedding_namespace = "vectors"
 
@@ -288,7 +294,7 @@ class PineconeDocumentStore(BaseDocumentStore):
                 f"'update_embeddings()' to create and populate an index."
             )
 
-        pinecone_syntax_filter = LogicalFilterClause.parse(filters).convert_to_pinecone() if filters else None
+        pinecone_syntax_filter = compile_filter(filters).convert_to_pinecone() if filters else None
 
         stats = self.pinecone_indexes[index].describe_index_stats(filter=pinecone_syntax_filter)
         # Document count is total number of vectors across all namespaces (no-vectors + vectors)
@@ -440,7 +446,7 @@ class PineconeDocumentStore(BaseDocumentStore):
 
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         update_existing_embeddings: bool = True,
         filters: Optional[FilterType] = None,
@@ -995,7 +1001,7 @@ class PineconeDocumentStore(BaseDocumentStore):
                 f"'update_embeddings()' to create and populate an index."
             )
 
-        pinecone_syntax_filter = LogicalFilterClause.parse(filters).convert_to_pinecone() if filters else None
+        pinecone_syntax_filter = compile_filter(filters).convert_to_pinecone() if filters else None
 
         if ids is None and pinecone_syntax_filter is None:
             # If no filters or IDs we delete everything
@@ -1127,7 +1133,7 @@ class PineconeDocumentStore(BaseDocumentStore):
             return_embedding = self.return_embedding
         self._limit_check(top_k, include_values=return_embedding)
 
-        pinecone_syntax_filter = LogicalFilterClause.parse(filters).convert_to_pinecone() if filters else None
+        pinecone_syntax_filter = compile_filter(filters).convert_to_pinecone() if filters else None
 
         index = self._index_name(index)
         if index not in self.pinecone_indexes:
@@ -1186,6 +1192,128 @@ class PineconeDocumentStore(BaseDocumentStore):
 
         return documents
 
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[Union[FilterType, List[Optional[FilterType]]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        scale_score: bool = True,
+        namespace: Optional[str] = None,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric.
+
+        The queries are sent concurrently with up to `query_batch_workers` requests in flight. If `return_embedding`
+        is set, the embeddings of all retrieved documents are fetched afterwards with one request per 1000 distinct
+        documents, so that documents retrieved for several queries are only fetched once.
+
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR). Can be a list of one-dimensional numpy
+            arrays or a two-dimensional numpy array.
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+            conditions. You can either pass one filter that is applied to all queries or a list of filters with one
+            filter (or `None`) per query. See `query_by_embedding` for the filter syntax.
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index from which to retrieve documents.
+        :param return_embedding: Whether to return document embedding.
+        :param headers: PineconeDocumentStore does not support headers.
+        :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
+                            If true (default) similarity scores (e.g. cosine or dot_product) which naturally have a different value range will be scaled to a range of [0,1], where 1 means extremely relevant.
+                            Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
+        :param namespace: Optional namespace to query. If not set, the embedding namespace is used.
+        """
+        if headers:
+            raise NotImplementedError("PineconeDocumentStore does not support headers.")
+
+        if isinstance(filters, list):
+            if len(filters) != len(query_embs):
+                raise HaystackError(
+                    "Number of filters does not match number of query_embs. Please provide as many filters"
+                    " as query_embs or a single filter that will be applied to each query_emb."
+                )
+        else:
+            filters = [filters] * len(query_embs)
+
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+        self._limit_check(top_k, include_values=return_embedding)
+
+        index = self._index_name(index)
+        if index not in self.pinecone_indexes:
+            raise PineconeDocumentStoreError(
+                f"Index named '{index}' does not exist. Try reinitializing PineconeDocumentStore() and running "
+                f"'update_embeddings()' to create and populate an index."
+            )
+        if len(query_embs) == 0:
+            return []
+
+        query_embs = np.array(query_embs, dtype=np.float32)
+        if self.similarity == "cosine":
+            self.normalize_embedding(query_embs)
+
+        if namespace is None:
+            namespace = self.embedding_namespace
+
+        pinecone_index = self.pinecone_indexes[index]
+        pinecone_syntax_filters = [
+            compile_filter(filter).convert_to_pinecone() if filter else None for filter in filters
+        ]
+
+        def query(query_emb: np.ndarray, pinecone_syntax_filter: Optional[Dict]) -> List[dict]:
+            res = pinecone_index.query(
+                query_emb.tolist(),
+                namespace=namespace,
+                top_k=top_k,
+                include_values=False,
+                include_metadata=True,
+                filter=pinecone_syntax_filter,
+            )
+            return res["matches"]
+
+        def fetch_embeddings(ids: List[str]) -> Dict[str, Any]:
+            result = pinecone_index.fetch(ids=ids, namespace=namespace)
+            return {_id: vector.get("values", None) for _id, vector in result["vectors"].items()}
+
+        with ThreadPoolExecutor(max_workers=max(min(self.query_batch_workers, len(query_embs)), 1)) as executor:
+            matches_per_query = list(executor.map(query, query_embs, pinecone_syntax_filters))
+
+            embeddings: Dict[str, Any] = {}
+            if return_embedding:
+                unique_ids = list(dict.fromkeys(match["id"] for matches in matches_per_query for match in matches))
+                id_batches = [unique_ids[i : i + 1000] for i in range(0, len(unique_ids), 1000)]
+                for embedding_batch in executor.map(fetch_embeddings, id_batches):
+                    embeddings.update(embedding_batch)
+
+        results = []
+        for matches, filter in zip(matches_per_query, filters):
+            documents = self._get_documents_by_meta(
+                [match["id"] for match in matches],
+                [match["metadata"] for match in matches],
+                namespace=namespace,
+                index=index,
+                return_embedding=False,
+            )
+
+            if filter is not None and len(documents) == 0:
+                logger.warning(
+                    "This query might have been done without metadata indexed and thus no results were retrieved. "
+                    "Make sure the desired metadata you want to filter with is indexed."
+                )
+
+            for doc, match in zip(documents, matches):
+                score = match["score"]
+                if scale_score:
+                    score = self.scale_to_unit_interval(score, self.similarity)
+                doc.score = score
+                if embeddings.get(doc.id) is not None:
+                    doc.embedding = np.asarray(embeddings[doc.id], dtype=np.float32)
+            results.append(documents)
+
+        return results
+
     def _get_documents_by_meta(
         self,
         ids: List[str],
@@ -1311,7 +1439,7 @@ class PineconeDocumentStore(BaseDocumentStore):
         Retrieves a list of IDs that satisfy a particular filter condition (or any) using
         a dummy query embedding.
         """
-        pinecone_syntax_filter = LogicalFilterClause.parse(filters).convert_to_pinecone() if filters else None
+        pinecone_syntax_filter = compile_filter(filters).convert_to_pinecone() if filters else None
 
         # Retrieve embeddings from Pinecone
         try:
@@ -1558,7 +1686,7 @@ class PineconeDocumentStore(BaseDocumentStore):
                 f"'update_embeddings()' to create and populate an index."
             )
 
-        pinecone_syntax_filter = LogicalFilterClause.parse(filters).convert_to_pinecone() if filters else None
+        pinecone_syntax_filter = compile_filter(filters).convert_to_pinecone() if filters else None
 
         i = 0
         dummy_query = np.asarray(self.dummy_query)
@@ -2,14 +2,18 @@
 
 
 from copy import deepcopy
-from typing import List, Optional, Union, Dict, Any, Generator
+from typing import TYPE_CHECKING, List, Optional, Union, Dict, Any, Generator, Iterable, Set, Tuple
 from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import json
 import logging
+import threading
 import time
+from queue import Queue
 from string import Template
 
 import numpy as np
+import pandas as pd
 from scipy.special import expit
 from tqdm.auto import tqdm
 from pydantic.error_wrappers import ValidationError
@@ -17,9 +21,12 @@ from pydantic.error_wrappers import ValidationError
 from haystack.document_stores import KeywordDocumentStore
 from haystack.schema import Document, FilterType, Label
 from haystack.document_stores.base import get_batches_from_generator
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
 from haystack.errors import DocumentStoreError, HaystackError
-from haystack.nodes.retriever import DenseRetriever
+from haystack.utils.stages import STAGE_DONE, StageThroughput, get_unless_stopped, put_unless_stopped
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +49,29 @@ def prepare_hosts(host, port):
     return hosts
 
 
+class _AdaptiveBulkBatchSize:
+    """
+    Picks the number of documents for the next bulk request based on how the cluster handled the previous ones.
+
+    The size is halved whenever a request was throttled with '429 Too Many Requests' or took longer than
+    `target_latency` seconds and grows back towards `max_size` while requests complete quickly.
+    """
+
+    def __init__(self, max_size: int, target_latency: float = 10.0):
+        self.max_size = max(max_size, 1)
+        self.target_latency = target_latency
+        self.size = self.max_size
+        self._lock = threading.Lock()
+
+    def update(self, latency: float, throttled: bool) -> int:
+        with self._lock:
+            if throttled or latency > self.target_latency:
+                self.size = max(self.size // 2, 1)
+            elif latency < self.target_latency / 2:
+                self.size = min(self.size * 2, self.max_size)
+            return self.size
+
+
 class SearchEngineDocumentStore(KeywordDocumentStore):
     """
     Base class implementing the common logic for Elasticsearch and Opensearch
@@ -70,6 +100,8 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         skip_missing_embeddings: bool = True,
         synonyms: Optional[List] = None,
         synonym_type: str = "synonym",
+        bulk_thread_count: int = 1,
+        bulk_target_latency: float = 10.0,
     ):
         super().__init__()
 
@@ -98,6 +130,8 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         self.skip_missing_embeddings: bool = skip_missing_embeddings
         self.duplicate_documents = duplicate_documents
         self.refresh_type = refresh_type
+        self.bulk_thread_count = bulk_thread_count
+        self.bulk_target_latency = bulk_target_latency
         if similarity in ["cosine", "dot_product", "l2"]:
             self.similarity: str = similarity
         else:
@@ -188,7 +222,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         refresh: str = "wait_for",
         _timeout: int = 1,
         _remaining_tries: int = 10,
-    ) -> None:
+    ) -> int:
         """
         Bulk index documents using a custom retry logic with
         exponential backoff and exponential batch size reduction to avoid overloading the cluster.
@@ -204,10 +238,12 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         :param refresh: Refresh policy for the bulk request
         :param _timeout: Timeout for the exponential backoff
         :param _remaining_tries: Number of remaining retries
+        :return: Number of requests that were rejected with '429 Too Many Requests' before the documents got indexed.
         """
 
         try:
             self._do_bulk(self.client, documents, request_timeout=300, refresh=self.refresh_type, headers=headers)
+            return 0
         except Exception as e:
             if hasattr(e, "status_code") and e.status_code == 429:  # type: ignore
                 logger.warning(
@@ -227,8 +263,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
                 if _remaining_tries == 0:
                     raise DocumentStoreError("Last try of bulk indexing documents failed.")
 
+                throttled_requests = 1
                 for split_docs in self._split_document_list(documents, 2):
-                    self._bulk(
+                    throttled_requests += self._bulk(
                         documents=split_docs,
                         headers=headers,
                         request_timeout=request_timeout,
@@ -236,9 +273,109 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
                         _timeout=_timeout * 2,
                         _remaining_tries=_remaining_tries,
                     )
-                return
+                return throttled_requests
             raise e
 
+    def _bulk_batches(
+        self, actions: Iterable[Dict[str, Any]], batch_size: _AdaptiveBulkBatchSize
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Group a stream of bulk actions into batches. The size of each batch is read from `batch_size` at the time the
+        batch is assembled so that it reflects the feedback of all bulk requests that completed so far.
+        """
+        batch: List[Dict[str, Any]] = []
+        for action in actions:
+            batch.append(action)
+            if len(batch) >= batch_size.size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _send_bulk_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        batch_size: _AdaptiveBulkBatchSize,
+        headers: Optional[Dict[str, str]] = None,
+        throughput: Optional[StageThroughput] = None,
+    ) -> None:
+        start = time.perf_counter()
+        throttled_requests = self._bulk(batch, request_timeout=300, refresh=self.refresh_type, headers=headers)
+        latency = time.perf_counter() - start
+        if throughput is not None:
+            throughput.add(len(batch), latency)
+        next_size = batch_size.update(latency=latency, throttled=throttled_requests > 0)
+        logger.debug(
+            "Bulk indexed %s documents in %.2f s (%.1f docs/s, %s throttled requests). Next batch size: %s",
+            len(batch),
+            latency,
+            len(batch) / latency if latency > 0 else float("inf"),
+            throttled_requests,
+            next_size,
+        )
+
+    def _parallel_bulk(
+        self,
+        actions: Iterable[Dict[str, Any]],
+        batch_size: int,
+        headers: Optional[Dict[str, str]] = None,
+        thread_count: Optional[int] = None,
+        throughput: Optional[StageThroughput] = None,
+    ) -> None:
+        """
+        Send a stream of bulk actions to the cluster with up to `thread_count` bulk requests in flight.
+
+        Batches are assembled lazily from `actions` so that at most `thread_count + 1` batches are held in memory.
+        The batch size starts at `batch_size` and adapts to the latency and '429 Too Many Requests' responses of the
+        cluster (see `_AdaptiveBulkBatchSize`).
+
+        :param actions: Bulk actions to send, as expected by the bulk helper of the client.
+        :param batch_size: Maximum number of actions per bulk request.
+        :param headers: Custom HTTP headers to pass to the client.
+        :param thread_count: Maximum number of concurrent bulk requests. If not set, `self.bulk_thread_count` is used.
+        :param throughput: Optional counter that collects the number of indexed documents and the time spent in bulk
+                           requests.
+        """
+        thread_count = max(thread_count or self.bulk_thread_count, 1)
+        adaptive_batch_size = _AdaptiveBulkBatchSize(max_size=batch_size, target_latency=self.bulk_target_latency)
+        batches = self._bulk_batches(actions, batch_size=adaptive_batch_size)
+        start = time.perf_counter()
+        indexed = 0
+
+        if thread_count == 1:
+            for batch in batches:
+                self._send_bulk_batch(batch, batch_size=adaptive_batch_size, headers=headers, throughput=throughput)
+                indexed += len(batch)
+        else:
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                in_flight: Set[Future] = set()
+                try:
+                    for batch in batches:
+                        if len(in_flight) >= thread_count:
+                            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                future.result()
+                        in_flight.add(
+                            executor.submit(self._send_bulk_batch, batch, adaptive_batch_size, headers, throughput)
+                        )
+                        indexed += len(batch)
+                    for future in wait(in_flight).done:
+                        future.result()
+                except Exception:
+                    for future in in_flight:
+                        future.cancel()
+                    raise
+
+        if indexed:
+            elapsed = time.perf_counter() - start
+            logger.debug(
+                "Bulk indexed %s documents in %.2f s (%.1f docs/s) with %s parallel requests.",
+                indexed,
+                elapsed,
+                indexed / elapsed if elapsed > 0 else float("inf"),
+                thread_count,
+            )
+
     # TODO: Add flexibility to define other non-meta and meta fields expected by the Document class
     def _create_document_field_map(self) -> Dict:
         return {self.content_field: "content", self.embedding_field: "embedding"}
@@ -282,7 +419,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             if not self.return_embedding and self.embedding_field:
                 query["_source"] = {"excludes": [self.embedding_field]}
             result = self.client.search(index=index, body=query, headers=headers)["hits"]["hits"]
-            documents.extend([self._convert_es_hit_to_document(hit) for hit in result])
+            documents.extend(self._convert_es_hits_to_documents(result, return_embedding=self.return_embedding))
         return documents
 
     def get_metadata_values_by_key(
@@ -343,7 +480,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         if filters:
             if not body.get("query"):
                 body["query"] = {"bool": {}}
-            body["query"]["bool"].update({"filter": LogicalFilterClause.parse(filters).convert_to_elasticsearch()})
+            body["query"]["bool"].update({"filter": compile_filter(filters).convert_to_elasticsearch()})
         result = self.client.search(body=body, index=index, headers=headers)
 
         values = []
@@ -365,7 +502,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -381,7 +518,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         If you don't set custom IDs for your Documents or just pass a list of dictionaries here,
         they automatically get UUIDs assigned. See the `Document` class for details.)
 
-        :param documents: A list of Python dictionaries or a list of Haystack Document objects.
+        :param documents: A list, iterable or generator of Python dictionaries or Haystack Document objects.
+                          The documents are consumed in chunks of `batch_size`, so a generator is never fully
+                          loaded into memory.
                           For documents as dictionaries, the format is {"content": "<the-actual-text>"}.
                           Optionally: Include meta data via {"content": "<the-actual-text>",
                           "meta":{"name": "<some-document-name>, "author": "somebody", ...}}
@@ -389,13 +528,17 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
                           Advanced: If you are using your own field mapping, change the key names in the dictionary
                           to what you have set for self.content_field and self.name_field.
         :param index: search index where the documents should be indexed. If you don't specify it, self.index is used.
-        :param batch_size: Number of documents that are passed to the bulk function at each round.
+        :param batch_size: Maximum number of documents that are passed to the bulk function at each round.
+                           The actual batch size is reduced while the cluster answers slowly or with
+                           '429 Too Many Requests' and grows back to `batch_size` once it recovers.
+                           Up to `self.bulk_thread_count` bulk requests are sent in parallel.
         :param duplicate_documents: Handle duplicate documents based on parameter options.
                                     Parameter options: ( 'skip','overwrite','fail')
                                     skip: Ignore the duplicate documents
                                     overwrite: Update any existing documents with the same ID when adding documents.
                                     fail: Raises an error if the document ID of the document being added already
-                                    exists.
+                                    exists. All documents are checked before any of them is written, so a generator
+                                    passed as `documents` is loaded into memory in this mode.
         :param headers: Custom HTTP headers to pass to the client (for example {'Authorization': 'Basic YWRtaW46cm9vdA=='})
                 For more information, see [HTTP/REST clients and security](https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html).
         :raises DuplicateDocumentError: Exception trigger on duplicate document
@@ -413,45 +556,68 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         ), f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
 
         field_map = self._create_document_field_map()
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
-        document_objects = self._handle_duplicate_documents(
-            documents=document_objects, index=index, duplicate_documents=duplicate_documents, headers=headers
-        )
-        documents_to_index = []
-        for doc in document_objects:
-            _doc = {
-                "_op_type": "index" if duplicate_documents == "overwrite" else "create",
-                "_index": index,
-                **doc.to_dict(field_map=self._create_document_field_map()),
-            }  # type: Dict[str, Any]
+        op_type = "index" if duplicate_documents == "overwrite" else "create"
+        if duplicate_documents == "fail":
+            documents = self._fail_on_existing_documents(
+                documents, batch_size=batch_size, field_map=field_map, index=index, headers=headers
+            )
+
+        def actions() -> Generator[Dict[str, Any], None, None]:
+            document_batches = self._get_document_batches(
+                documents,
+                batch_size=batch_size,
+                field_map=field_map,
+                drop_duplicates=duplicate_documents in ("skip", "fail"),
+                index=index,
+            )
+            for document_batch in document_batches:
+                document_batch = self._handle_duplicate_documents(
+                    documents=document_batch, index=index, duplicate_documents=duplicate_documents, headers=headers
+                )
+                yield from self._documents_to_bulk_actions(
+                    document_batch, index=index, op_type=op_type, field_map=field_map
+                )
+
+        self._parallel_bulk(actions(), batch_size=batch_size, headers=headers)
+
+    def _documents_to_bulk_actions(
+        self, documents: List[Document], index: str, op_type: str, field_map: Dict[str, Any]
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Convert a batch of Documents into bulk actions with a flat structure as expected by the search engine.
 
-            # cast embedding type as ES cannot deal with np.array
-            if _doc[self.embedding_field] is not None:
-                if type(_doc[self.embedding_field]) == np.ndarray:
-                    _doc[self.embedding_field] = _doc[self.embedding_field].tolist()
+        The embeddings of the batch are converted to lists in one go, as the search engine can't deal with np.array.
+        """
+        inv_field_map = {v: k for k, v in field_map.items()}
+        embeddings: List[Any] = [doc.embedding for doc in documents]
+        numpy_embeddings = [idx for idx, embedding in enumerate(embeddings) if isinstance(embedding, np.ndarray)]
+        if len({embeddings[idx].shape for idx in numpy_embeddings}) == 1:
+            embedding_lists = np.stack([embeddings[idx] for idx in numpy_embeddings]).tolist()
+        else:
+            embedding_lists = [embeddings[idx].tolist() for idx in numpy_embeddings]
+        for idx, embedding_list in zip(numpy_embeddings, embedding_lists):
+            embeddings[idx] = embedding_list
+
+        for document, embedding in zip(documents, embeddings):
+            _doc: Dict[str, Any] = {"_op_type": op_type, "_index": index}
+            for key, value in document.__dict__.items():
+                # Exclude internal fields (Pydantic, ...), the query score and empty fields
+                if key.startswith("__") or key == "score" or value is None:
+                    continue
+                if key == "embedding":
+                    value = embedding
+                elif key == "content" and document.content_type == "table" and isinstance(value, pd.DataFrame):
+                    value = [value.columns.tolist()] + value.values.tolist()
+                _doc[inv_field_map.get(key, key)] = value
 
             # rename id for elastic
             _doc["_id"] = str(_doc.pop("id"))
 
-            # don't index query score and empty fields
-            _ = _doc.pop("score", None)
-            _doc = {k: v for k, v in _doc.items() if v is not None}
-
             # In order to have a flat structure in elastic + similar behaviour to the other DocumentStores,
             # we "unnest" all value within "meta"
-            if "meta" in _doc.keys():
-                for k, v in _doc["meta"].items():
-                    _doc[k] = v
-                _doc.pop("meta")
-            documents_to_index.append(_doc)
-
-            # Pass batch_size number of documents to bulk
-            if len(documents_to_index) % batch_size == 0:
-                self._bulk(documents_to_index, request_timeout=300, refresh=self.refresh_type, headers=headers)
-                documents_to_index = []
-
-        if documents_to_index:
-            self._bulk(documents_to_index, request_timeout=300, refresh=self.refresh_type, headers=headers)
+            if "meta" in _doc:
+                _doc.update(_doc.pop("meta"))
+            yield _doc
 
     def write_labels(
         self,
@@ -473,7 +639,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             self._create_label_index(index, headers=headers)
 
         label_list: List[Label] = [Label.from_dict(label) if isinstance(label, dict) else label for label in labels]
-        duplicate_ids: list = [label.id for label in self._get_duplicate_labels(label_list, index=index)]
+        duplicate_ids: list = [
+            label.id for label in self._get_duplicate_labels(label_list, index=index, headers=headers)
+        ]
         if len(duplicate_ids) > 0:
             logger.warning(
                 "Duplicate Label IDs: Inserting a Label whose id already exists in this document store."
@@ -482,6 +650,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
                 " Problematic ids: %s",
                 ",".join(duplicate_ids),
             )
+        duplicate_id_set = set(duplicate_ids)
         labels_to_index = []
         for label in label_list:
             # create timestamps if not available yet
@@ -492,7 +661,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
             _label = {
                 "_op_type": "index"
-                if self.duplicate_documents == "overwrite" or label.id in duplicate_ids
+                if self.duplicate_documents == "overwrite" or label.id in duplicate_id_set
                 else "create",  # type: ignore
                 "_index": index,
                 **label.to_dict(),  # type: ignore
@@ -512,6 +681,18 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         if labels_to_index:
             self._bulk(labels_to_index, request_timeout=300, refresh=self.refresh_type, headers=headers)
 
+    def _get_existing_label_ids(
+        self, ids: Set[str], index: str, headers: Optional[Dict[str, str]] = None, batch_size: int = 10_000
+    ) -> Set[str]:
+        ids_list = list(ids)
+        existing_ids = set()
+        for i in range(0, len(ids_list), batch_size):
+            ids_for_batch = ids_list[i : i + batch_size]
+            query = {"size": len(ids_for_batch), "query": {"ids": {"values": ids_for_batch}}, "_source": False}
+            result = self.client.search(index=index, body=query, headers=headers)["hits"]["hits"]
+            existing_ids.update(hit["_id"] for hit in result)
+        return existing_ids
+
     def update_document_meta(
         self, id: str, meta: Dict[str, str], index: Optional[str] = None, headers: Optional[Dict[str, str]] = None
     ):
@@ -540,7 +721,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             body["query"]["bool"]["must_not"] = [{"exists": {"field": self.embedding_field}}]
 
         if filters:
-            body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+            body["query"]["bool"]["filter"] = compile_filter(filters).convert_to_elasticsearch()
 
         result = self.client.count(index=index, body=body, headers=headers)
         count = result["count"]
@@ -567,7 +748,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
         body: dict = {"query": {"bool": {"must": [{"exists": {"field": self.embedding_field}}]}}}
         if filters:
-            body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+            body["query"]["bool"]["filter"] = compile_filter(filters).convert_to_elasticsearch()
 
         result = self.client.count(index=index, body=body, headers=headers)
         count = result["count"]
@@ -717,14 +898,20 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         only_documents_without_embedding: bool = False,
         headers: Optional[Dict[str, str]] = None,
         excludes: Optional[List[str]] = None,
+        scroll_slice: Optional[Tuple[int, int]] = None,
     ) -> Generator[dict, None, None]:
         """
         Return all documents in a specific index in the document store
+
+        :param scroll_slice: Optional tuple `(slice_id, max_slices)` to only return one slice of a sliced scroll.
         """
         body: dict = {"query": {"bool": {}}}
 
+        if scroll_slice:
+            body["slice"] = {"id": scroll_slice[0], "max": scroll_slice[1]}
+
         if filters:
-            body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+            body["query"]["bool"]["filter"] = compile_filter(filters).convert_to_elasticsearch()
 
         if only_documents_without_embedding:
             body["query"]["bool"]["must_not"] = [{"exists": {"field": self.embedding_field}}]
@@ -910,7 +1097,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
         result = self.client.search(index=index, body=body, headers=headers)["hits"]["hits"]
 
-        documents = [self._convert_es_hit_to_document(hit, scale_score=scale_score) for hit in result]
+        documents = self._convert_es_hits_to_documents(
+            result, scale_score=scale_score, return_embedding=self.return_embedding
+        )
         return documents
 
     def query_batch(
@@ -1044,7 +1233,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         cur_documents = []
         for response in responses["responses"]:
             cur_result = response["hits"]["hits"]
-            cur_documents = [self._convert_es_hit_to_document(hit, scale_score=scale_score) for hit in cur_result]
+            cur_documents = self._convert_es_hits_to_documents(
+                cur_result, scale_score=scale_score, return_embedding=self.return_embedding
+            )
             all_documents.append(cur_documents)
 
         return all_documents
@@ -1062,7 +1253,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             body = {"query": {"bool": {"must": {"match_all": {}}}}}  # type: Dict[str, Any]
             body["size"] = "10000"  # Set to the ES default max_result_window
             if filters:
-                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+                body["query"]["bool"]["filter"] = compile_filter(filters).convert_to_elasticsearch()
 
         # Retrieval via custom query
         elif custom_query:  # substitute placeholder for query and filters for the custom_query template string
@@ -1108,7 +1299,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             }
 
             if filters:
-                body["query"]["bool"]["filter"] = LogicalFilterClause.parse(filters).convert_to_elasticsearch()
+                body["query"]["bool"]["filter"] = compile_filter(filters).convert_to_elasticsearch()
 
         excluded_fields = self._get_excluded_fields(return_embedding=self.return_embedding)
         if excluded_fields:
@@ -1133,51 +1324,100 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
     def _convert_es_hit_to_document(
         self, hit: dict, adapt_score_for_embedding: bool = False, scale_score: bool = True
     ) -> Document:
-        # We put all additional data of the doc into meta_data and return it in the API
-        try:
-            meta_data = {
-                k: v
-                for k, v in hit["_source"].items()
-                if k not in (self.content_field, "content_type", "id_hash_keys", self.embedding_field)
-            }
-            name = meta_data.pop(self.name_field, None)
-            if name:
-                meta_data["name"] = name
+        return self._convert_es_hits_to_documents(
+            [hit], adapt_score_for_embedding=adapt_score_for_embedding, scale_score=scale_score
+        )[0]
 
-            if "highlight" in hit:
-                meta_data["highlighted"] = hit["highlight"]
+    def _convert_es_hits_to_documents(
+        self,
+        hits: List[dict],
+        adapt_score_for_embedding: bool = False,
+        scale_score: bool = True,
+        return_embedding: bool = True,
+    ) -> List[Document]:
+        """
+        Convert a list of hits into Documents.
 
-            score = hit["_score"]
-            if score:
-                if adapt_score_for_embedding:
-                    score = self._get_raw_similarity_score(score)
-
-                if scale_score:
-                    if adapt_score_for_embedding:
-                        score = self.scale_to_unit_interval(score, self.similarity)
-                    else:
-                        score = float(expit(np.asarray(score / 8)))  # scaling probability from TFIDF/BM25
-
-            embedding = None
-            embedding_list = hit["_source"].get(self.embedding_field)
-            if embedding_list:
-                embedding = np.asarray(embedding_list, dtype=np.float32)
-
-            doc_dict = {
-                "id": hit["_id"],
-                "content": hit["_source"].get(self.content_field),
-                "content_type": hit["_source"].get("content_type", None),
-                "id_hash_keys": hit["_source"].get("id_hash_keys", None),
-                "meta": meta_data,
-                "score": score,
-                "embedding": embedding,
-            }
-            document = Document.from_dict(doc_dict)
+        The embeddings of all hits are decoded with a single numpy call and the Documents are created directly from
+        the hit fields instead of going through `Document.from_dict`.
+
+        :param hits: Hits as returned by the client.
+        :param adapt_score_for_embedding: Whether the scores are vector similarity scores.
+        :param scale_score: Whether to scale the scores to the unit interval.
+        :param return_embedding: Whether to decode embeddings contained in `_source`. If False, they are ignored.
+        """
+        excluded_fields = (self.content_field, "content_type", "id_hash_keys", self.embedding_field)
+        try:
+            embeddings = self._decode_embeddings(
+                [hit["_source"].get(self.embedding_field) if return_embedding else None for hit in hits]
+            )
+            documents = []
+            for hit, embedding in zip(hits, embeddings):
+                source = hit["_source"]
+                # We put all additional data of the doc into meta_data and return it in the API
+                meta_data = {k: v for k, v in source.items() if k not in excluded_fields}
+                name = meta_data.pop(self.name_field, None)
+                if name:
+                    meta_data["name"] = name
+
+                if "highlight" in hit:
+                    meta_data["highlighted"] = hit["highlight"]
+
+                content = source.get(self.content_field)
+                content_type = source.get("content_type", None)
+                # Convert list of rows to pd.DataFrame
+                if content_type == "table" and isinstance(content, list):
+                    content = pd.DataFrame(columns=content[0], data=content[1:])
+
+                documents.append(
+                    Document(
+                        id=hit["_id"],
+                        content=content,
+                        content_type=content_type,
+                        id_hash_keys=source.get("id_hash_keys", None),
+                        meta=meta_data,
+                        score=self._scale_hit_score(hit["_score"], adapt_score_for_embedding, scale_score),
+                        embedding=embedding,
+                    )
+                )
         except (KeyError, ValidationError) as e:
             raise DocumentStoreError(
                 "Failed to create documents from the content of the document store. Make sure the index you specified contains documents."
             ) from e
-        return document
+        return documents
+
+    def _scale_hit_score(self, score: Optional[float], adapt_score_for_embedding: bool, scale_score: bool):
+        if score:
+            if adapt_score_for_embedding:
+                score = self._get_raw_similarity_score(score)
+
+            if scale_score:
+                if adapt_score_for_embedding:
+                    score = self.scale_to_unit_interval(score, self.similarity)
+                else:
+                    score = float(expit(np.asarray(score / 8)))  # scaling probability from TFIDF/BM25
+        return score
+
+    @staticmethod
+    def _decode_embeddings(embedding_lists: List[Optional[List[float]]]) -> List[Optional[np.ndarray]]:
+        """
+        Convert embedding lists into float32 arrays. Embeddings of the same dimension are decoded into one matrix
+        whose rows are returned, missing or empty embeddings are returned as None.
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(embedding_lists)
+        positions = [i for i, embedding_list in enumerate(embedding_lists) if embedding_list]
+        if not positions:
+            return embeddings
+
+        dims = {len(embedding_lists[i]) for i in positions}  # type: ignore [arg-type]
+        if len(dims) == 1:
+            matrix = np.array([embedding_lists[i] for i in positions], dtype=np.float32)
+            for i, row in zip(positions, matrix):
+                embeddings[i] = row
+        else:
+            for i in positions:
+                embeddings[i] = np.asarray(embedding_lists[i], dtype=np.float32)
+        return embeddings
 
     def query_by_embedding_batch(
         self,
@@ -1303,10 +1543,9 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         cur_documents = []
         for response in responses["responses"]:
             cur_result = response["hits"]["hits"]
-            cur_documents = [
-                self._convert_es_hit_to_document(hit, adapt_score_for_embedding=True, scale_score=scale_score)
-                for hit in cur_result
-            ]
+            cur_documents = self._convert_es_hits_to_documents(
+                cur_result, adapt_score_for_embedding=True, scale_score=scale_score, return_embedding=return_embedding
+            )
             all_documents.append(cur_documents)
 
         return all_documents
@@ -1319,17 +1558,22 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
 
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         filters: Optional[FilterType] = None,
         update_existing_embeddings: bool = True,
         batch_size: int = 10_000,
         headers: Optional[Dict[str, str]] = None,
+        scroll_slices: int = 1,
+        prefetch_batches: int = 2,
     ):
         """
         Updates the embeddings in the the document store using the encoding model specified in the retriever.
         This can be useful if want to add or change the embeddings for your documents (e.g. after changing the retriever config).
 
+        Scrolling the documents, embedding them and writing the embeddings back run as a pipeline: while the retriever
+        embeds one batch, the next batches are fetched and the previous ones are written to the index.
+
         :param retriever: Retriever to use to update the embeddings.
         :param index: Index name to update
         :param update_existing_embeddings: Whether to update existing embeddings of the documents. If set to False,
@@ -1365,6 +1609,8 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         :param batch_size: When working with large number of documents, batching can help reduce memory footprint.
         :param headers: Custom HTTP headers to pass to the client (e.g. {'Authorization': 'Basic YWRtaW46cm9vdA=='})
                 Check out https://www.elastic.co/guide/en/elasticsearch/reference/current/http-clients.html for more information.
+        :param scroll_slices: Number of slices of a sliced scroll that are read in parallel. Default: 1 (no slicing)
+        :param prefetch_batches: Maximum number of batches waiting to be embedded or written at each stage.
         :return: None
         """
         if index is None:
@@ -1389,36 +1635,107 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
             "without embeddings" if not update_existing_embeddings else "",
         )
 
-        result = self._get_all_documents_in_index(
-            index=index,
-            filters=filters,
-            batch_size=batch_size,
-            only_documents_without_embedding=not update_existing_embeddings,
-            headers=headers,
-            excludes=[self.embedding_field],
+        scroll_slices = max(scroll_slices, 1)
+        hit_batches: Queue = Queue(maxsize=max(prefetch_batches, 1))
+        update_batches: Queue = Queue(maxsize=max(prefetch_batches, 1))
+        stop = threading.Event()
+        errors: List[Exception] = []
+        scroll_stage = StageThroughput("Scrolling documents")
+        embed_stage = StageThroughput("Embedding documents")
+        write_stage = StageThroughput("Writing embeddings")
+
+        def scroll(scroll_slice: Optional[Tuple[int, int]]):
+            try:
+                hits = self._get_all_documents_in_index(
+                    index=index,
+                    filters=filters,
+                    batch_size=batch_size,
+                    only_documents_without_embedding=not update_existing_embeddings,
+                    headers=headers,
+                    excludes=[self.embedding_field],
+                    scroll_slice=scroll_slice,
+                )
+                batches = get_batches_from_generator(hits, batch_size)
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    hit_batch = next(batches, None)
+                    if hit_batch is None:
+                        break
+                    scroll_stage.add(len(hit_batch), time.perf_counter() - start)
+                    put_unless_stopped(hit_batches, hit_batch, stop)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put_unless_stopped(hit_batches, STAGE_DONE, stop)
+
+        def write():
+            def updates() -> Generator[Dict[str, Any], None, None]:
+                while True:
+                    update_batch = get_unless_stopped(update_batches, stop)
+                    if update_batch is STAGE_DONE:
+                        return
+                    yield from update_batch
+
+            try:
+                self._parallel_bulk(updates(), batch_size=batch_size, headers=headers, throughput=write_stage)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        scroll_slices_to_read: List[Optional[Tuple[int, int]]] = (
+            [(slice_id, scroll_slices) for slice_id in range(scroll_slices)] if scroll_slices > 1 else [None]
         )
+        readers = [
+            threading.Thread(target=scroll, args=(scroll_slice,), daemon=True) for scroll_slice in scroll_slices_to_read
+        ]
+        writer = threading.Thread(target=write, daemon=True)
+        for thread in readers + [writer]:
+            thread.start()
 
-        logging.getLogger(__name__).setLevel(logging.CRITICAL)
-
-        with tqdm(total=document_count, position=0, unit=" Docs", desc="Updating embeddings") as progress_bar:
-            for result_batch in get_batches_from_generator(result, batch_size):
-                document_batch = [self._convert_es_hit_to_document(hit) for hit in result_batch]
-                embeddings = self._embed_documents(document_batch, retriever)
-
-                doc_updates = []
-                for doc, emb in zip(document_batch, embeddings):
-                    update = {
-                        "_op_type": "update",
-                        "_index": index,
-                        "_id": doc.id,
-                        "doc": {self.embedding_field: emb.tolist()},
-                    }
-                    doc_updates.append(update)
-
-                self._bulk(documents=doc_updates, request_timeout=300, refresh=self.refresh_type, headers=headers)
-                progress_bar.update(batch_size)
-
-    def _embed_documents(self, documents: List[Document], retriever: DenseRetriever) -> np.ndarray:
+        try:
+            with tqdm(total=document_count, position=0, unit=" Docs", desc="Updating embeddings") as progress_bar:
+                finished_readers = 0
+                while finished_readers < len(readers):
+                    hit_batch = get_unless_stopped(hit_batches, stop)
+                    if hit_batch is STAGE_DONE:
+                        if stop.is_set():
+                            break
+                        finished_readers += 1
+                        continue
+
+                    start = time.perf_counter()
+                    document_batch = self._convert_es_hits_to_documents(hit_batch, return_embedding=False)
+                    embeddings = self._embed_documents(document_batch, retriever)
+                    doc_updates = [
+                        {
+                            "_op_type": "update",
+                            "_index": index,
+                            "_id": doc.id,
+                            "doc": {self.embedding_field: emb.tolist()},
+                        }
+                        for doc, emb in zip(document_batch, embeddings)
+                    ]
+                    embed_stage.add(len(document_batch), time.perf_counter() - start)
+
+                    if not put_unless_stopped(update_batches, doc_updates, stop):
+                        break
+                    progress_bar.update(len(document_batch))
+
+            put_unless_stopped(update_batches, STAGE_DONE, stop)
+            writer.join()
+        finally:
+            stop.set()
+            for thread in readers + [writer]:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        for stage in (scroll_stage, embed_stage, write_stage):
+            stage.log()
+
+    def _embed_documents(self, documents: List[Document], retriever: "DenseRetriever") -> np.ndarray:
         """
         Embed a list of documents using a Retriever.
         :param documents: List of documents to embed.
@@ -1530,7 +1847,7 @@ class SearchEngineDocumentStore(KeywordDocumentStore):
         index = index or self.index
         query: Dict[str, Any] = {"query": {}}
         if filters:
-            query["query"]["bool"] = {"filter": LogicalFilterClause.parse(filters).convert_to_elasticsearch()}
+            query["query"]["bool"] = {"filter": compile_filter(filters).convert_to_elasticsearch()}
 
             if ids:
                 query["query"]["bool"]["must"] = {"ids": {"values": ids}}
@@ -1,5 +1,5 @@
 #  type: ignore
-from typing import Any, Dict, Union, List, Optional, Generator
+from typing import Any, Dict, Iterable, Union, List, Optional, Set, Generator
 
 import logging
 import itertools
@@ -34,7 +34,7 @@ except (ImportError, ModuleNotFoundError) as ie:
 
 from haystack.schema import Document, Label, Answer
 from haystack.document_stores.base import BaseDocumentStore, FilterType
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
 
 
 logger = logging.getLogger(__name__)
@@ -304,8 +304,7 @@ class SQLDocumentStore(BaseDocumentStore):
 
         if filters:
             logger.warning("filters won't work on metadata fields containing compound data types")
-            parsed_filter = LogicalFilterClause.parse(filters)
-            select_ids = parsed_filter.convert_to_sql(MetaDocumentORM)
+            select_ids = compile_filter(filters).convert_to_sql(MetaDocumentORM)
             documents_query = documents_query.filter(DocumentORM.id.in_(select_ids))
 
         if only_documents_without_embedding:
@@ -363,7 +362,7 @@ class SQLDocumentStore(BaseDocumentStore):
 
     def write_documents(
         self,
-        documents: Union[List[dict], List[Document]],
+        documents: Union[Iterable[dict], Iterable[Document]],
         index: Optional[str] = None,
         batch_size: int = 10_000,
         duplicate_documents: Optional[str] = None,
@@ -372,7 +371,7 @@ class SQLDocumentStore(BaseDocumentStore):
         """
         Indexes documents for later queries.
 
-        :param documents: a list of Python dictionaries or a list of Haystack Document objects.
+        :param documents: a list, iterable or generator of Python dictionaries or Haystack Document objects.
                           For documents as dictionaries, the format is {"text": "<the-actual-text>"}.
                           Optionally: Include meta data via {"text": "<the-actual-text>",
                           "meta":{"name": "<some-document-name>, "author": "somebody", ...}}
@@ -380,13 +379,16 @@ class SQLDocumentStore(BaseDocumentStore):
         :param index: add an optional index attribute to documents. It can be later used for filtering. For instance,
                       documents for evaluation can be indexed in a separate index than the documents for search.
         :param batch_size: When working with large number of documents, batching can help reduce memory footprint.
+                           Documents are read from `documents`, checked for duplicates and written in chunks of
+                           `batch_size`.
         :param duplicate_documents: Handle duplicates document based on parameter options.
                                     Parameter options : ( 'skip','overwrite','fail')
                                     skip: Ignore the duplicates documents
                                     overwrite: Update any existing documents with the same ID when adding documents
                                     but is considerably slower (default).
                                     fail: an error is raised if the document ID of the document being added already
-                                    exists.
+                                    exists. All documents are checked before any of them is written, so a generator
+                                    passed as `documents` is loaded into memory in this mode.
 
         :return: None
         """
@@ -395,17 +397,17 @@ class SQLDocumentStore(BaseDocumentStore):
 
         index = index or self.index
         duplicate_documents = duplicate_documents or self.duplicate_documents
-        if len(documents) == 0:
-            return
-        # Make sure we comply to Document class format
-        document_objects = [Document.from_dict(d) if isinstance(d, dict) else d for d in documents]
-
-        document_objects = self._handle_duplicate_documents(
-            documents=document_objects, index=index, duplicate_documents=duplicate_documents
+        if duplicate_documents == "fail":
+            documents = self._fail_on_existing_documents(documents, batch_size=batch_size, index=index)
+        document_batches = self._get_document_batches(
+            documents, batch_size=batch_size, drop_duplicates=duplicate_documents in ("skip", "fail"), index=index
         )
-        for i in range(0, len(document_objects), batch_size):
+        for document_objects in document_batches:
+            document_objects = self._handle_duplicate_documents(
+                documents=document_objects, index=index, duplicate_documents=duplicate_documents
+            )
             docs_orm = []
-            for doc in document_objects[i : i + batch_size]:
+            for doc in document_objects:
                 meta_fields = doc.meta or {}
                 if "classification" in meta_fields:
                     meta_fields = self._flatten_classification_meta_fields(meta_fields)
@@ -437,6 +439,18 @@ class SQLDocumentStore(BaseDocumentStore):
                 self.session.rollback()
                 raise ex
 
+    def _get_existing_label_ids(
+        self, ids: Set[str], index: str, headers: Optional[Dict[str, str]] = None, batch_size: int = 10_000
+    ) -> Set[str]:
+        ids_list = list(ids)
+        existing_ids = set()
+        for i in range(0, len(ids_list), batch_size):
+            query = self.session.query(LabelORM.id).filter(
+                LabelORM.id.in_(ids_list[i : i + batch_size]), LabelORM.index == index
+            )
+            existing_ids.update(row.id for row in query.all())
+        return existing_ids
+
     def write_labels(self, labels, index=None, headers: Optional[Dict[str, str]] = None):
         """Write annotation labels into document store."""
         if headers:
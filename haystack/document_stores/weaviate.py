@@ -1,10 +1,11 @@
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union
 
 import re
 import uuid
 import json
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from tqdm.auto import tqdm
@@ -20,10 +21,12 @@ except (ImportError, ModuleNotFoundError) as ie:
 from haystack.schema import Document, FilterType, Label
 from haystack.document_stores import KeywordDocumentStore
 from haystack.document_stores.base import get_batches_from_generator
-from haystack.document_stores.filter_utils import LogicalFilterClause
+from haystack.document_stores.filter_utils import compile_filter
 from haystack.document_stores.utils import convert_date_to_rfc3339
 from haystack.errors import DocumentStoreError, HaystackError
-from haystack.nodes.retriever import DenseRetriever
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever import DenseRetriever
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +81,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
         duplicate_documents: str = "overwrite",
         recreate_index: bool = False,
         replication_factor: int = 1,
+        query_batch_workers: int = 8,
     ):
         """
         :param host: Weaviate server connection URL for storing and processing documents and vectors.
@@ -115,6 +119,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
             lost if you choose to recreate the index.
         :param replication_factor: It sets the Weaviate Class's replication factor in Weaviate at the time of Class creation.
                                    See: https://weaviate.io/developers/weaviate/current/configuration/replication.html
+        :param query_batch_workers: Maximum number of concurrent requests `query_by_embedding_batch` sends to Weaviate.
         """
         super().__init__()
 
@@ -167,6 +172,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
         self.progress_bar = progress_bar
         self.duplicate_documents = duplicate_documents
         self.replication_factor = replication_factor
+        self.query_batch_workers = query_batch_workers
 
         self._create_schema_and_index(self.index, recreate_index=recreate_index)
         self.uuid_format_warning_raised = False
@@ -643,7 +649,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
         index = self._sanitize_index_name(index) or self.index
         doc_count = 0
         if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+            filter_dict = compile_filter(filters).convert_to_weaviate()
             result = self.weaviate_client.query.aggregate(index).with_meta_count().with_where(filter_dict).do()
         else:
             result = self.weaviate_client.query.aggregate(index).with_meta_count().do()
@@ -744,7 +750,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
             properties.append("_additional {id, distance, vector}")
 
         if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+            filter_dict = compile_filter(filters).convert_to_weaviate()
             result = (
                 self.weaviate_client.query.get(class_name=index, properties=properties).with_where(filter_dict).do()
             )
@@ -760,7 +766,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
         while len(all_docs) < num_of_documents:
             query = base_query
             if filters:
-                filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+                filter_dict = compile_filter(filters).convert_to_weaviate()
                 query = query.with_where(filter_dict)
 
             if all_docs:
@@ -985,7 +991,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
 
             # Naive retrieval without BM25, only filtering
             elif filters:
-                filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+                filter_dict = compile_filter(filters).convert_to_weaviate()
                 query_output = (
                     self.weaviate_client.query.get(class_name=index, properties=properties)
                     .with_where(filter_dict)
@@ -1001,7 +1007,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
         else:
             # Retrieval with BM25 AND filtering
             if filters:
-                filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+                filter_dict = compile_filter(filters).convert_to_weaviate()
                 gql_query = (
                     gql.get.GetBuilder(class_name=index, properties=properties, connection=self.weaviate_client)
                     .with_limit(top_k)
@@ -1268,7 +1274,7 @@ class WeaviateDocumentStore(KeywordDocumentStore):
 
         query_string = {"vector": query_emb}
         if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+            filter_dict = compile_filter(filters).convert_to_weaviate()
             query_output = (
                 self.weaviate_client.query.get(class_name=index, properties=properties)
                 .with_where(filter_dict)
@@ -1298,9 +1304,87 @@ class WeaviateDocumentStore(KeywordDocumentStore):
 
         return documents
 
+    def query_by_embedding_batch(
+        self,
+        query_embs: Union[List[np.ndarray], np.ndarray],
+        filters: Optional[Union[FilterType, List[Optional[FilterType]]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        scale_score: bool = True,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided `query_embs` by using a vector similarity
+        metric.
+
+        The schema is looked up once for the whole batch and the queries are sent concurrently with up to
+        `query_batch_workers` requests in flight over the client's connection pool.
+
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR). Can be a list of one-dimensional numpy
+                           arrays or a two-dimensional numpy array.
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions. You can either pass one filter that is applied to all queries or a list of filters
+                        with one filter (or `None`) per query. See `query_by_embedding` for the filter syntax.
+        :param top_k: How many documents to return per query.
+        :param index: index name for storing the docs and metadata
+        :param return_embedding: To return document embedding
+        :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
+                            If true (default) similarity scores (e.g. cosine or dot_product) which naturally have a different value range will be scaled to a range of [0,1], where 1 means extremely relevant.
+                            Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
+        """
+        if headers:
+            raise NotImplementedError("WeaviateDocumentStore does not support headers.")
+
+        if isinstance(filters, list):
+            if len(filters) != len(query_embs):
+                raise HaystackError(
+                    "Number of filters does not match number of query_embs. Please provide as many filters"
+                    " as query_embs or a single filter that will be applied to each query_emb."
+                )
+        else:
+            filters = [filters] * len(query_embs)
+
+        if len(query_embs) == 0:
+            return []
+
+        if return_embedding is None:
+            return_embedding = self.return_embedding
+        index = self._sanitize_index_name(index) or self.index
+
+        # Build the properties to retrieve from Weaviate once for all queries
+        properties = self._get_current_properties(index)
+        additional = "certainty" if self.similarity == "cosine" else "distance"
+        properties.append(f"_additional {{id, {additional}{', vector' if return_embedding else ''}}}")
+
+        query_embs = np.array(query_embs, dtype=np.float32)
+        if self.similarity == "cosine":
+            self.normalize_embedding(query_embs)
+
+        def query(query_emb: np.ndarray, filter: Optional[FilterType]) -> List[Document]:
+            query_builder = self.weaviate_client.query.get(class_name=index, properties=properties)
+            if filter:
+                query_builder = query_builder.with_where(compile_filter(filter).convert_to_weaviate())
+            query_output = query_builder.with_near_vector({"vector": query_emb.reshape(1, -1)}).with_limit(top_k).do()
+
+            results = []
+            if query_output and "data" in query_output and "Get" in query_output.get("data"):
+                if query_output.get("data").get("Get").get(index):
+                    results = query_output.get("data").get("Get").get(index)
+
+            return [
+                self._convert_weaviate_result_to_document(
+                    result, return_embedding=return_embedding, scale_score=scale_score
+                )
+                for result in results
+            ]
+
+        with ThreadPoolExecutor(max_workers=max(min(self.query_batch_workers, len(query_embs)), 1)) as executor:
+            return list(executor.map(query, query_embs, filters))
+
     def update_embeddings(
         self,
-        retriever: DenseRetriever,
+        retriever: "DenseRetriever",
         index: Optional[str] = None,
         filters: Optional[FilterType] = None,
         update_existing_embeddings: bool = True,
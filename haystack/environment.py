@@ -5,9 +5,6 @@ import platform
 import sys
 from typing import Any, Dict, Optional
 
-import torch
-import transformers
-
 from haystack import __version__
 
 # Any remote API (OpenAI, Cohere etc.)
@@ -83,11 +80,16 @@ def collect_static_system_specs() -> Dict[str, Any]:
     operating system, python version, Haystack version, transformers version,
     pytorch version, number of GPUs, execution environment.
     """
+    # torch and transformers are only reported if they're already in use: importing them takes several seconds,
+    # which is too slow for pipelines that don't need them
+    torch = sys.modules.get("torch")
+    transformers = sys.modules.get("transformers")
+    cuda_available = torch is not None and torch.cuda.is_available()
     return {
         "libraries.haystack": __version__,
-        "libraries.transformers": transformers.__version__ if "transformers" in sys.modules.keys() else False,
-        "libraries.torch": torch.__version__ if "torch" in sys.modules.keys() else False,
-        "libraries.cuda": torch.version.cuda if "torch" in sys.modules.keys() and torch.cuda.is_available() else False,
+        "libraries.transformers": transformers.__version__ if transformers is not None else False,
+        "libraries.torch": torch.__version__ if torch is not None else False,
+        "libraries.cuda": torch.version.cuda if cuda_available else False,
         "os.containerized": is_containerized(),
         # FIXME review these
         "os.version": platform.release(),
@@ -95,7 +97,7 @@ def collect_static_system_specs() -> Dict[str, Any]:
         "os.machine": platform.machine(),
         "python.version": platform.python_version(),  # FIXME verify
         "hardware.cpus": os.cpu_count(),  # FIXME verify
-        "hardware.gpus": torch.cuda.device_count() if torch.cuda.is_available() else 0,  # probably ok
+        "hardware.gpus": torch.cuda.device_count() if cuda_available else 0,  # probably ok
     }
 
 
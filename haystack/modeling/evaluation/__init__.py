@@ -1 +1,12 @@
-from haystack.modeling.evaluation.eval import Evaluator
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+from haystack.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from haystack.modeling.evaluation.eval import Evaluator
+
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {"Evaluator": "haystack.modeling.evaluation.eval"}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,9 @@
+import itertools
 import logging
-from functools import reduce
-from typing import Callable, Dict, List, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from functools import partial, reduce
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 from scipy.stats import pearsonr, spearmanr
@@ -11,7 +14,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from transformers import AutoConfig
 
 from haystack.modeling.model.prediction_head import PredictionHead
-from haystack.modeling.utils import flatten_list
+from haystack.modeling.utils import flatten_list, initialize_device_settings
 
 logger = logging.getLogger(__name__)
 
@@ -379,6 +382,23 @@ def text_similarity_metric(preds, labels) -> Dict[str, float]:
     return scores
 
 
+SAS_CACHE_SIZE = 100000
+"""Number of answer embeddings, or cross-encoder scores of answer pairs, cached per SAS model."""
+
+_sas_models: Dict[Tuple[str, str], Tuple[Union[CrossEncoder, SentenceTransformer], bool]] = {}
+_sas_caches: Dict[Tuple[str, str], "OrderedDict[Union[str, Tuple[str, str]], Any]"] = {}
+_sas_lock = threading.Lock()
+
+
+def clear_sas_cache():
+    """
+    Frees the SAS models loaded by `semantic_answer_similarity()`, together with their cached embeddings and scores.
+    """
+    with _sas_lock:
+        _sas_models.clear()
+        _sas_caches.clear()
+
+
 def semantic_answer_similarity(
     predictions: List[List[str]],
     gold_labels: List[List[str]],
@@ -393,6 +413,10 @@ def semantic_answer_similarity(
                         b) the highest similarity of all predictions to gold labels
                         c) a matrix consisting of the similarities of all the predictions compared to all gold labels
 
+    The SAS model is loaded once per model and device and kept in memory for later calls. The embeddings of the answers
+    (or, for cross-encoders, the scores of the answer pairs) are cached as well, so that answers repeated across
+    queries, nodes, and evaluation runs are encoded only once. Call `clear_sas_cache()` to free the memory.
+
     :param predictions: Predicted answers as list of multiple preds per question
     :param gold_labels: Labels as list of multiple possible answers per question
     :param sas_model_name_or_path: SentenceTransformers semantic textual similarity model, should be path or string
@@ -409,67 +433,98 @@ def semantic_answer_similarity(
     """
     assert len(predictions) == len(gold_labels)
 
-    config = AutoConfig.from_pretrained(sas_model_name_or_path, use_auth_token=use_auth_token)
-    cross_encoder_used = False
-    if config.architectures is not None:
-        cross_encoder_used = any(arch.endswith("ForSequenceClassification") for arch in config.architectures)
-
-    device = None if use_gpu else "cpu"
+    devices, _ = initialize_device_settings(use_cuda=use_gpu, multi_gpu=False)
+    model_key = (sas_model_name_or_path, str(devices[0]))
+    model, cross_encoder_used = _get_sas_model(model_key, use_auth_token=use_auth_token)
 
     # Compute similarities
     top_1_sas = []
     top_k_sas = []
     pred_label_matrix = []
-    lengths: List[Tuple[int, int]] = []
 
     # Based on Modelstring we can load either Bi-Encoders or Cross Encoders.
     # Similarity computation changes for both approaches
     if cross_encoder_used:
-        model = CrossEncoder(
-            sas_model_name_or_path,
-            device=device,
-            tokenizer_args={"use_auth_token": use_auth_token},
-            automodel_args={"use_auth_token": use_auth_token},
-        )
-        grid = []
+        pairs = {(p, l) for preds, labels in zip(predictions, gold_labels) for p in preds for l in labels}
+        scores = _get_cached_sas_values(model_key, pairs, partial(_cross_encode, model, batch_size=batch_size))
         for preds, labels in zip(predictions, gold_labels):
-            for p in preds:
-                for l in labels:
-                    grid.append((p, l))
-            lengths.append((len(preds), len(labels)))
-        scores = model.predict(grid, batch_size=batch_size)
-
-        current_position = 0
-        for len_p, len_l in lengths:
-            scores_window = scores[current_position : current_position + len_p * len_l]
-            # Per predicted doc there are len_l entries comparing it to all len_l labels.
-            # So to only consider the first doc we have to take the first len_l entries
-            top_1_sas.append(np.max(scores_window[:len_l]))
-            top_k_sas.append(np.max(scores_window))
-            pred_label_matrix.append(scores_window.reshape(len_p, len_l).tolist())
-            current_position += len_p * len_l
+            scores_matrix = np.array([[scores[(p, l)] for l in labels] for p in preds]).reshape(len(preds), len(labels))
+            # The first row compares the most likely prediction to all labels
+            top_1_sas.append(np.max(scores_matrix[0, :]))
+            top_k_sas.append(np.max(scores_matrix))
+            pred_label_matrix.append(scores_matrix.tolist())
     else:
-        # For Bi-encoders we can flatten predictions and labels into one list
-        model = SentenceTransformer(sas_model_name_or_path, device=device, use_auth_token=use_auth_token)
-        all_texts: List[str] = []
+        # For Bi-encoders we can encode each distinct prediction and label once
+        texts = {text for p, l in zip(predictions, gold_labels) for text in itertools.chain(p, l)}
+        embeddings = _get_cached_sas_values(model_key, texts, partial(_bi_encode, model, batch_size=batch_size))
         for p, l in zip(predictions, gold_labels):  # type: ignore
             # TODO potentially exclude (near) exact matches from computations
-            all_texts.extend(p)
-            all_texts.extend(l)
-            lengths.append((len(p), len(l)))
-        # then compute embeddings
-        embeddings = model.encode(all_texts, batch_size=batch_size)
-
-        # then select which embeddings will be used for similarity computations
-        current_position = 0
-        for len_p, len_l in lengths:
-            pred_embeddings = embeddings[current_position : current_position + len_p, :]
-            current_position += len_p
-            label_embeddings = embeddings[current_position : current_position + len_l, :]
-            current_position += len_l
+            pred_embeddings = np.stack([embeddings[text] for text in p])
+            label_embeddings = np.stack([embeddings[text] for text in l])
             sims = cosine_similarity(pred_embeddings, label_embeddings)
             top_1_sas.append(np.max(sims[0, :]))
             top_k_sas.append(np.max(sims))
             pred_label_matrix.append(sims.tolist())
 
     return top_1_sas, top_k_sas, pred_label_matrix
+
+
+def _get_sas_model(
+    model_key: Tuple[str, str], use_auth_token: Optional[Union[str, bool]] = None
+) -> Tuple[Union[CrossEncoder, SentenceTransformer], bool]:
+    """
+    Returns the SAS model for a model name and device, and whether it's a cross-encoder. Loads it on first use.
+    """
+    with _sas_lock:
+        if model_key not in _sas_models:
+            sas_model_name_or_path, device = model_key
+            config = AutoConfig.from_pretrained(sas_model_name_or_path, use_auth_token=use_auth_token)
+            cross_encoder_used = False
+            if config.architectures is not None:
+                cross_encoder_used = any(arch.endswith("ForSequenceClassification") for arch in config.architectures)
+            if cross_encoder_used:
+                model = CrossEncoder(
+                    sas_model_name_or_path,
+                    device=device,
+                    tokenizer_args={"use_auth_token": use_auth_token},
+                    automodel_args={"use_auth_token": use_auth_token},
+                )
+            else:
+                model = SentenceTransformer(sas_model_name_or_path, device=device, use_auth_token=use_auth_token)
+            _sas_models[model_key] = (model, cross_encoder_used)
+            _sas_caches[model_key] = OrderedDict()
+        return _sas_models[model_key]
+
+
+def _get_cached_sas_values(model_key: Tuple[str, str], keys: Set[Any], compute: Callable[[List[Any]], Any]) -> Dict:
+    """
+    Returns the embeddings or scores for `keys`, computing only the ones that aren't cached yet.
+    The cache of each model keeps the `SAS_CACHE_SIZE` most recently used values.
+    """
+    with _sas_lock:
+        cache = _sas_caches.setdefault(model_key, OrderedDict())
+        values = {key: cache[key] for key in keys if key in cache}
+    missing = [key for key in keys if key not in values]
+    if missing:
+        values.update(zip(missing, compute(missing)))
+    with _sas_lock:
+        for key in keys:
+            cache[key] = values[key]
+            cache.move_to_end(key)
+        while len(cache) > SAS_CACHE_SIZE:
+            cache.popitem(last=False)
+    return values
+
+
+def _bi_encode(model: SentenceTransformer, texts: List[str], batch_size: int) -> np.ndarray:
+    # SentenceTransformer.encode() already sorts the texts by length to batch texts of similar length
+    return model.encode(texts, batch_size=batch_size)
+
+
+def _cross_encode(model: CrossEncoder, pairs: List[Tuple[str, str]], batch_size: int) -> np.ndarray:
+    # Score the pairs sorted by length, so that each batch is padded to a similar length, then restore their order
+    order = np.argsort([len(p) + len(l) for p, l in pairs], kind="stable")
+    sorted_scores = model.predict([pairs[i] for i in order], batch_size=batch_size)
+    scores = np.empty(len(pairs), dtype=np.float32)
+    scores[order] = sorted_scores
+    return scores
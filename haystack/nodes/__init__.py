@@ -1,66 +1,145 @@
-from haystack.utils.import_utils import safe_import
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 
-from haystack.nodes.base import BaseComponent
+from haystack.utils.lazy_imports import lazy_exports
 
-from haystack.nodes.answer_generator import BaseGenerator, RAGenerator, Seq2SeqGenerator, OpenAIAnswerGenerator
-from haystack.nodes.document_classifier import BaseDocumentClassifier, TransformersDocumentClassifier
-from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
-from haystack.nodes.file_classifier import FileTypeClassifier
-from haystack.nodes.file_converter import (
-    BaseConverter,
-    DocxToTextConverter,
-    ImageToTextConverter,
-    MarkdownConverter,
-    PDFToTextConverter,
-    PDFToTextOCRConverter,
-    TikaConverter,
-    TikaXHTMLParser,
-    TextConverter,
-    AzureConverter,
-    ParsrConverter,
-    CsvTextConverter,
-    JsonConverter,
-)
-from haystack.nodes.image_to_text import TransformersImageToText
-from haystack.nodes.label_generator import PseudoLabelGenerator
-from haystack.nodes.other import Docs2Answers, JoinDocuments, RouteDocuments, JoinAnswers, DocumentMerger, Shaper
-from haystack.nodes.preprocessor import BasePreProcessor, PreProcessor
-from haystack.nodes.prompt import (
-    PromptNode,
-    PromptTemplate,
-    PromptModel,
-    PromptModelInvocationLayer,
-    BaseOutputParser,
-    AnswerParser,
-)
-from haystack.nodes.query_classifier import SklearnQueryClassifier, TransformersQueryClassifier
-from haystack.nodes.question_generator import QuestionGenerator
-from haystack.nodes.ranker import BaseRanker, SentenceTransformersRanker
-from haystack.nodes.reader import BaseReader, FARMReader, TransformersReader, TableReader, RCIReader
-from haystack.nodes.retriever import (
-    BaseRetriever,
-    DenseRetriever,
-    DensePassageRetriever,
-    EmbeddingRetriever,
-    BM25Retriever,
-    FilterRetriever,
-    MultihopEmbeddingRetriever,
-    TfidfRetriever,
-    Text2SparqlRetriever,
-    TableTextRetriever,
-    MultiModalRetriever,
-    WebRetriever,
-)
+if TYPE_CHECKING:
+    from haystack.nodes.base import BaseComponent
+    from haystack.nodes.answer_generator import BaseGenerator, RAGenerator, Seq2SeqGenerator, OpenAIAnswerGenerator
+    from haystack.nodes.document_classifier import BaseDocumentClassifier, TransformersDocumentClassifier
+    from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
+    from haystack.nodes.file_classifier import FileTypeClassifier
+    from haystack.nodes.file_converter import (
+        BaseConverter,
+        DocxToTextConverter,
+        ImageToTextConverter,
+        MarkdownConverter,
+        PDFToTextConverter,
+        PDFToTextOCRConverter,
+        TikaConverter,
+        TikaXHTMLParser,
+        TextConverter,
+        AzureConverter,
+        ParsrConverter,
+        CsvTextConverter,
+        JsonConverter,
+    )
+    from haystack.nodes.image_to_text import TransformersImageToText
+    from haystack.nodes.label_generator import PseudoLabelGenerator
+    from haystack.nodes.other import Docs2Answers, JoinDocuments, RouteDocuments, JoinAnswers, DocumentMerger, Shaper
+    from haystack.nodes.preprocessor import BasePreProcessor, PreProcessor
+    from haystack.nodes.prompt import (
+        PromptNode,
+        PromptTemplate,
+        PromptModel,
+        PromptModelInvocationLayer,
+        BaseOutputParser,
+        AnswerParser,
+    )
+    from haystack.nodes.query_classifier import SklearnQueryClassifier, TransformersQueryClassifier
+    from haystack.nodes.question_generator import QuestionGenerator
+    from haystack.nodes.ranker import BaseRanker, SentenceTransformersRanker
+    from haystack.nodes.reader import BaseReader, FARMReader, TransformersReader, TableReader, RCIReader
+    from haystack.nodes.retriever import (
+        BaseRetriever,
+        DenseRetriever,
+        DensePassageRetriever,
+        EmbeddingRetriever,
+        BM25Retriever,
+        FilterRetriever,
+        MultihopEmbeddingRetriever,
+        TfidfRetriever,
+        Text2SparqlRetriever,
+        TableTextRetriever,
+        MultiModalRetriever,
+        WebRetriever,
+    )
+    from haystack.nodes.sampler import BaseSampler, TopPSampler
+    from haystack.nodes.search_engine import WebSearch
+    from haystack.nodes.summarizer import BaseSummarizer, TransformersSummarizer
+    from haystack.nodes.translator import BaseTranslator, TransformersTranslator
+    from haystack.nodes.doc_language_classifier import (
+        LangdetectDocumentLanguageClassifier,
+        TransformersDocumentLanguageClassifier,
+    )
+    from haystack.nodes.audio import WhisperTranscriber, WhisperModel
+    from haystack.nodes.connector.crawler import Crawler
 
-from haystack.nodes.sampler import BaseSampler, TopPSampler
-from haystack.nodes.search_engine import WebSearch
-from haystack.nodes.summarizer import BaseSummarizer, TransformersSummarizer
-from haystack.nodes.translator import BaseTranslator, TransformersTranslator
-from haystack.nodes.doc_language_classifier import (
-    LangdetectDocumentLanguageClassifier,
-    TransformersDocumentLanguageClassifier,
-)
 
-from haystack.nodes.audio import WhisperTranscriber, WhisperModel
-
-Crawler = safe_import("haystack.nodes.connector.crawler", "Crawler", "crawler")  # Has optional dependencies
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "BaseComponent": "haystack.nodes.base",
+    "BaseGenerator": "haystack.nodes.answer_generator",
+    "RAGenerator": "haystack.nodes.answer_generator",
+    "Seq2SeqGenerator": "haystack.nodes.answer_generator",
+    "OpenAIAnswerGenerator": "haystack.nodes.answer_generator",
+    "BaseDocumentClassifier": "haystack.nodes.document_classifier",
+    "TransformersDocumentClassifier": "haystack.nodes.document_classifier",
+    "EntityExtractor": "haystack.nodes.extractor",
+    "simplify_ner_for_qa": "haystack.nodes.extractor",
+    "FileTypeClassifier": "haystack.nodes.file_classifier",
+    "BaseConverter": "haystack.nodes.file_converter",
+    "DocxToTextConverter": "haystack.nodes.file_converter",
+    "ImageToTextConverter": "haystack.nodes.file_converter",
+    "MarkdownConverter": "haystack.nodes.file_converter",
+    "PDFToTextConverter": "haystack.nodes.file_converter",
+    "PDFToTextOCRConverter": "haystack.nodes.file_converter",
+    "TikaConverter": "haystack.nodes.file_converter",
+    "TikaXHTMLParser": "haystack.nodes.file_converter",
+    "TextConverter": "haystack.nodes.file_converter",
+    "AzureConverter": "haystack.nodes.file_converter",
+    "ParsrConverter": "haystack.nodes.file_converter",
+    "CsvTextConverter": "haystack.nodes.file_converter",
+    "JsonConverter": "haystack.nodes.file_converter",
+    "TransformersImageToText": "haystack.nodes.image_to_text",
+    "PseudoLabelGenerator": "haystack.nodes.label_generator",
+    "Docs2Answers": "haystack.nodes.other",
+    "JoinDocuments": "haystack.nodes.other",
+    "RouteDocuments": "haystack.nodes.other",
+    "JoinAnswers": "haystack.nodes.other",
+    "DocumentMerger": "haystack.nodes.other",
+    "Shaper": "haystack.nodes.other",
+    "BasePreProcessor": "haystack.nodes.preprocessor",
+    "PreProcessor": "haystack.nodes.preprocessor",
+    "PromptNode": "haystack.nodes.prompt",
+    "PromptTemplate": "haystack.nodes.prompt",
+    "PromptModel": "haystack.nodes.prompt",
+    "PromptModelInvocationLayer": "haystack.nodes.prompt",
+    "BaseOutputParser": "haystack.nodes.prompt",
+    "AnswerParser": "haystack.nodes.prompt",
+    "SklearnQueryClassifier": "haystack.nodes.query_classifier",
+    "TransformersQueryClassifier": "haystack.nodes.query_classifier",
+    "QuestionGenerator": "haystack.nodes.question_generator",
+    "BaseRanker": "haystack.nodes.ranker",
+    "SentenceTransformersRanker": "haystack.nodes.ranker",
+    "BaseReader": "haystack.nodes.reader",
+    "FARMReader": "haystack.nodes.reader",
+    "TransformersReader": "haystack.nodes.reader",
+    "TableReader": "haystack.nodes.reader",
+    "RCIReader": "haystack.nodes.reader",
+    "BaseRetriever": "haystack.nodes.retriever",
+    "DenseRetriever": "haystack.nodes.retriever",
+    "DensePassageRetriever": "haystack.nodes.retriever",
+    "EmbeddingRetriever": "haystack.nodes.retriever",
+    "BM25Retriever": "haystack.nodes.retriever",
+    "FilterRetriever": "haystack.nodes.retriever",
+    "MultihopEmbeddingRetriever": "haystack.nodes.retriever",
+    "TfidfRetriever": "haystack.nodes.retriever",
+    "Text2SparqlRetriever": "haystack.nodes.retriever",
+    "TableTextRetriever": "haystack.nodes.retriever",
+    "MultiModalRetriever": "haystack.nodes.retriever",
+    "WebRetriever": "haystack.nodes.retriever",
+    "BaseSampler": "haystack.nodes.sampler",
+    "TopPSampler": "haystack.nodes.sampler",
+    "WebSearch": "haystack.nodes.search_engine",
+    "BaseSummarizer": "haystack.nodes.summarizer",
+    "TransformersSummarizer": "haystack.nodes.summarizer",
+    "BaseTranslator": "haystack.nodes.translator",
+    "TransformersTranslator": "haystack.nodes.translator",
+    "LangdetectDocumentLanguageClassifier": "haystack.nodes.doc_language_classifier",
+    "TransformersDocumentLanguageClassifier": "haystack.nodes.doc_language_classifier",
+    "WhisperTranscriber": "haystack.nodes.audio",
+    "WhisperModel": "haystack.nodes.audio",
+    "Crawler": ("haystack.nodes.connector.crawler", "crawler"),
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
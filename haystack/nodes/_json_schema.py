@@ -1,8 +1,8 @@
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import os
-import sys
 import json
+import importlib
 import inspect
 import logging
 from pathlib import Path
@@ -121,7 +121,7 @@ def find_subclasses_in_modules(importable_modules: List[str]):
     return [
         (module, class_)
         for module in importable_modules
-        for _, class_ in inspect.getmembers(sys.modules[module])
+        for _, class_ in inspect.getmembers(importlib.import_module(module))
         if is_valid_component_class(class_)
     ]
 
@@ -6,10 +6,12 @@ from abc import ABC, abstractmethod
 from functools import wraps
 import inspect
 import logging
+import importlib
 
 from haystack.schema import Document, MultiLabel
 from haystack.errors import PipelineSchemaError
 from haystack.utils import args_to_kwargs
+from haystack.utils.tracing import trace_span
 
 
 logger = logging.getLogger(__name__)
@@ -117,6 +119,11 @@ class BaseComponent(ABC):
 
     @classmethod
     def get_subclass(cls, component_type: str) -> Type[BaseComponent]:
+        if component_type not in cls._subclasses.keys():
+            # Components are registered when their module is imported, which `haystack.nodes` and
+            # `haystack.document_stores` only do once one of their names is used
+            for package in ("haystack.nodes", "haystack.document_stores"):
+                getattr(importlib.import_module(package), component_type, None)
         if component_type not in cls._subclasses.keys():
             raise PipelineSchemaError(
                 f"Haystack component with the name '{component_type}' not found. "
@@ -213,6 +220,7 @@ class BaseComponent(ABC):
           - inspect run_method's signature to validate if all necessary arguments are available
           - pop `debug` and sets them on the instance to control debug output
           - call run_method with the corresponding arguments and gather output
+          - trace the call if a tracer is registered, see `haystack.utils.tracing`
           - collate `_debug` information if present
           - merge component output with the preceding output and pass it on to the subsequent Component in the Pipeline
         """
@@ -242,7 +250,11 @@ class BaseComponent(ABC):
             if key in run_signature_args:
                 run_inputs[key] = value
 
-        output, stream = run_method(**run_inputs, **run_params)
+        with trace_span(
+            self.name or type(self).__name__, "node", run_method.__name__, type(self).__name__, run_inputs
+        ) as span:
+            output, stream = run_method(**run_inputs, **run_params)
+            span.set_output(output)
 
         # Collect debug information
         debug_info = {}
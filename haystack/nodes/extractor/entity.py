@@ -204,14 +204,14 @@ class EntityExtractor(BaseComponent):
         """
         if documents:
             is_doc = isinstance(documents[0], Document)
-            for doc in tqdm(documents, disable=not self.progress_bar, desc="Extracting entities"):
-                # In a querying pipeline, doc is a haystack.schema.Document object
-                if is_doc:
-                    content = doc.content  # type: ignore
-                # In an indexing pipeline, doc is a dictionary
-                else:
-                    content = doc["content"]  # type: ignore
-                entities = self.extract(content)
+            # In a querying pipeline, doc is a haystack.schema.Document object
+            if is_doc:
+                contents = [doc.content for doc in documents]  # type: ignore
+            # In an indexing pipeline, doc is a dictionary
+            else:
+                contents = [doc["content"] for doc in documents]  # type: ignore
+            all_entities = self.extract(contents, batch_size=self.batch_size)
+            for doc, entities in zip(documents, all_entities):
                 self._add_entities_to_doc(
                     doc, entities=entities, flatten_entities_in_meta_data=self.flatten_entities_in_meta_data
                 )
@@ -247,6 +247,9 @@ class EntityExtractor(BaseComponent):
     def preprocess(self, sentence: List[str]):
         """Preprocessing step to tokenize the provided text.
 
+        All texts are tokenized with a single call to the fast tokenizer. Long texts are split into chunks of at most
+        `max_seq_len` tokens. The chunks are not padded here, padding happens per batch in `extract`.
+
         :param sentence: List of text to tokenize. This expects a list of texts.
         """
         text_to_tokenize = sentence
@@ -256,11 +259,9 @@ class EntityExtractor(BaseComponent):
 
         model_inputs = self.tokenizer(
             text_to_tokenize,
-            return_tensors="pt",
             return_special_tokens_mask=True,
             return_offsets_mapping=True,
             return_overflowing_tokens=True,
-            padding="max_length",
             truncation=True,
             max_length=self.max_seq_len,
             is_split_into_words=self.pre_split_text,
@@ -270,7 +271,7 @@ class EntityExtractor(BaseComponent):
         if self.pre_split_text:
             model_inputs["word_offset_mapping"] = word_offset_mapping
 
-        word_ids = [model_inputs.word_ids(i) for i in range(model_inputs.input_ids.shape[0])]
+        word_ids = [model_inputs.word_ids(i) for i in range(len(model_inputs["input_ids"]))]
         model_inputs["word_ids"] = word_ids
         return model_inputs
 
@@ -279,9 +280,9 @@ class EntityExtractor(BaseComponent):
 
         :param model_inputs: Dictionary of inputs to be given to the model.
         """
-        special_tokens_mask = model_inputs.pop("special_tokens_mask")
+        special_tokens_mask = model_inputs.pop("special_tokens_mask", None)
         offset_mapping = model_inputs.pop("offset_mapping", None)
-        overflow_to_sample_mapping = model_inputs.pop("overflow_to_sample_mapping")
+        overflow_to_sample_mapping = model_inputs.pop("overflow_to_sample_mapping", None)
 
         logits = self.model(**model_inputs)[0]
 
@@ -318,99 +319,77 @@ class EntityExtractor(BaseComponent):
     ) -> List[Dict[str, Any]]:
         """Aggregate each of the items in `model_outputs` based on which Document they originally came from.
 
-        :param model_outputs: Dictionary of model outputs.
+        :param model_outputs: Dictionary with one entry per chunk for `logits`, `input_ids`, `offset_mapping` and
+            `special_tokens_mask`, and the `overflow_to_sample_mapping` of the chunks. Chunks are not padded, so the
+            entries of different chunks can have different lengths.
         :param sentence: num_docs x length of text
         :param word_ids: List of list of integers or None types that provides the token index to word id mapping.
-            None types correspond to special tokens. The shape is (num_splits_per_doc * num_docs) x model_max_length.
+            None types correspond to special tokens. The shape is (num_splits_per_doc * num_docs) x num_tokens_per_split.
         :param word_offset_mapping: List of (word, (char_start, char_end)) tuples for each word in a text. The shape is
             num_docs x num_words_per_doc.
         """
         # overflow_to_sample_mapping tells me which documents need be aggregated
         # e.g. model_outputs['overflow_to_sample_mapping'] = [0, 0, 1, 1, 1, 1] means first two elements of
         # predictions belong to document 0 and the other four elements belong to document 1.
-        sample_mapping = model_outputs["overflow_to_sample_mapping"]
-        all_num_splits_per_doc = torch.zeros(sample_mapping[-1] + 1, dtype=torch.long)
-        for idx in sample_mapping:
-            all_num_splits_per_doc[idx] += 1
+        sample_mapping = np.asarray(model_outputs["overflow_to_sample_mapping"])
+        all_num_splits_per_doc = np.bincount(sample_mapping, minlength=len(sentence))
 
-        logits = model_outputs["logits"]  # (num_splits_per_doc * num_docs) x model_max_length x num_classes
-        input_ids = model_outputs["input_ids"]  # (num_splits_per_doc * num_docs) x model_max_length
-        offset_mapping = model_outputs["offset_mapping"]  # (num_splits_per_doc * num_docs) x model_max_length x 2
-        special_tokens_mask = model_outputs["special_tokens_mask"]  # (num_splits_per_doc * num_docs) x model_max_length
+        logits = model_outputs["logits"]  # (num_splits_per_doc * num_docs) x num_tokens_per_split x num_classes
+        input_ids = model_outputs["input_ids"]  # (num_splits_per_doc * num_docs) x num_tokens_per_split
+        offset_mapping = model_outputs["offset_mapping"]  # (num_splits_per_doc * num_docs) x num_tokens_per_split x 2
+        special_tokens_mask = model_outputs["special_tokens_mask"]  # (num_splits_per_doc * num_docs) x num_tokens_per_split
 
         model_outputs_grouped_by_doc = []
         bef_idx = 0
         for i, num_splits_per_doc in enumerate(all_num_splits_per_doc):
             aft_idx = bef_idx + num_splits_per_doc
 
-            logits_per_doc = logits[bef_idx:aft_idx].reshape(
-                1, -1, logits.shape[2]
-            )  # 1 x (num_splits_per_doc * model_max_length) x num_classes
-            input_ids_per_doc = input_ids[bef_idx:aft_idx].reshape(1, -1)  # 1 x (num_splits_per_doc * model_max_length)
-            offset_mapping_per_doc = offset_mapping[bef_idx:aft_idx].reshape(
-                1, -1, offset_mapping.shape[2]
-            )  # 1 x (num_splits_per_doc * model_max_length) x 2
-            special_tokens_mask_per_doc = special_tokens_mask[bef_idx:aft_idx].reshape(
-                1, -1
-            )  # 1 x (num_splits_per_doc * model_max_length)
-            sentence_per_doc = sentence[i]
-            word_ids_per_doc = list(
-                itertools.chain.from_iterable(word_ids[bef_idx:aft_idx])
-            )  # 1 x (num_splits_per_doc * model_max_length)
-            if word_offset_mapping is not None:
-                word_offset_mapping_per_doc = word_offset_mapping[i]  # 1 x num_words_per_doc
-
-            bef_idx += num_splits_per_doc
-
             output = {
-                "logits": logits_per_doc,
-                "sentence": sentence_per_doc,
-                "input_ids": input_ids_per_doc,
-                "offset_mapping": offset_mapping_per_doc,
-                "special_tokens_mask": special_tokens_mask_per_doc,
-                "word_ids": word_ids_per_doc,
+                # 1 x (num_splits_per_doc * num_tokens_per_split) x num_classes
+                "logits": np.concatenate(logits[bef_idx:aft_idx])[np.newaxis],
+                "sentence": sentence[i],
+                # 1 x (num_splits_per_doc * num_tokens_per_split)
+                "input_ids": np.concatenate(
+                    [np.asarray(ids, dtype=np.int64) for ids in input_ids[bef_idx:aft_idx]]
+                )[np.newaxis],
+                # 1 x (num_splits_per_doc * num_tokens_per_split) x 2
+                "offset_mapping": np.concatenate(
+                    [np.asarray(offsets, dtype=np.int64).reshape(-1, 2) for offsets in offset_mapping[bef_idx:aft_idx]]
+                )[np.newaxis],
+                # 1 x (num_splits_per_doc * num_tokens_per_split)
+                "special_tokens_mask": np.concatenate(
+                    [np.asarray(mask, dtype=np.int64) for mask in special_tokens_mask[bef_idx:aft_idx]]
+                )[np.newaxis],
+                # num_splits_per_doc * num_tokens_per_split
+                "word_ids": list(itertools.chain.from_iterable(word_ids[bef_idx:aft_idx])),
             }
             if word_offset_mapping is not None:
-                output["word_offset_mapping"] = word_offset_mapping_per_doc
+                output["word_offset_mapping"] = word_offset_mapping[i]  # 1 x num_words_per_doc
 
+            bef_idx = aft_idx
             model_outputs_grouped_by_doc.append(output)
         return model_outputs_grouped_by_doc
 
-    def _flatten_predictions(self, predictions: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Flatten the predictions across the batch dimension.
+    def _length_sorted_batches(self, model_inputs: Dict[str, Any], batch_size: int) -> List[List[int]]:
+        """Group the indices of the tokenized chunks into batches of chunks with similar length.
+
+        Chunks of all texts are sorted by their number of tokens, so that each batch only needs to be padded to the
+        length of its longest chunk.
 
-        :param predictions: List of model output dictionaries
+        :param model_inputs: The tokenized chunks as returned by `preprocess`.
+        :param batch_size: Number of chunks per batch.
         """
-        flattened_predictions: Dict[str, Any] = {
-            "logits": [],
-            "input_ids": [],
-            "special_tokens_mask": [],
-            "offset_mapping": [],
-            "overflow_to_sample_mapping": [],
-        }
-        for pred in predictions:
-            flattened_predictions["logits"].append(pred["logits"])
-            flattened_predictions["input_ids"].append(pred["input_ids"])
-            flattened_predictions["special_tokens_mask"].append(pred["special_tokens_mask"])
-            flattened_predictions["offset_mapping"].append(pred["offset_mapping"])
-            flattened_predictions["overflow_to_sample_mapping"].append(pred["overflow_to_sample_mapping"])
-
-        flattened_predictions["logits"] = torch.vstack(flattened_predictions["logits"])
-        flattened_predictions["input_ids"] = torch.vstack(flattened_predictions["input_ids"])
-        flattened_predictions["special_tokens_mask"] = torch.vstack(flattened_predictions["special_tokens_mask"])
-        flattened_predictions["offset_mapping"] = torch.vstack(flattened_predictions["offset_mapping"])
-        # Make sure to hstack overflow_to_sample_mapping since it doesn't have a batch dimension
-        flattened_predictions["overflow_to_sample_mapping"] = torch.hstack(
-            flattened_predictions["overflow_to_sample_mapping"]
-        )
-        return flattened_predictions
+        lengths = [len(ids) for ids in model_inputs["input_ids"]]
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
 
-    def extract(self, text: Union[str, List[str]], batch_size: int = 1):
+    def extract(self, text: Union[str, List[str]], batch_size: Optional[int] = None):
         """
         This function can be called to perform entity extraction when using the node in isolation.
 
         :param text: Text to extract entities from. Can be a str or a List of str.
-        :param batch_size: Number of texts to make predictions on at a time.
+        :param batch_size: Number of text chunks to make predictions on at a time. If None, the `batch_size` set in
+            the constructor is used.
         """
         is_single_text = False
 
@@ -422,23 +401,44 @@ class EntityExtractor(BaseComponent):
         else:
             raise ValueError("The variable text must be a string, or a list of strings.")
 
+        if batch_size is None:
+            batch_size = self.batch_size
+
         # Preprocess
         model_inputs = self.preprocess(text)
         word_offset_mapping = model_inputs.pop("word_offset_mapping", None)
         word_ids = model_inputs.pop("word_ids")
         sentence = model_inputs.pop("sentence")
         dataset = TokenClassificationDataset(model_inputs.data)
-        dataloader = DataLoader(dataset, shuffle=False, batch_size=batch_size, num_workers=self.num_workers)
+        batches = self._length_sorted_batches(model_inputs.data, batch_size=batch_size)
+        dataloader = DataLoader(
+            dataset,
+            batch_sampler=batches,
+            collate_fn=_TokenClassificationCollator(
+                pad_token_id=self.tokenizer.pad_token_id, pad_token_type_id=self.tokenizer.pad_token_type_id
+            ),
+            num_workers=self.num_workers,
+        )
 
         # Forward
-        predictions: List[Dict[str, Any]] = []
-        for batch in tqdm(dataloader, disable=not self.progress_bar, total=len(dataloader), desc="Extracting entities"):
+        logits: List[Optional[np.ndarray]] = [None] * len(dataset)
+        for batch_indices, batch in tqdm(
+            zip(batches, dataloader), disable=not self.progress_bar, total=len(batches), desc="Extracting entities"
+        ):
             batch = ensure_tensor_on_device(batch, device=self.devices[0])
             with torch.inference_mode():
                 model_outputs = self.forward(batch)
-            model_outputs = ensure_tensor_on_device(model_outputs, device=torch.device("cpu"))
-            predictions.append(model_outputs)
-        predictions = self._flatten_predictions(predictions)  # type: ignore
+            batch_logits = model_outputs["logits"].cpu().numpy()
+            # Remove the padding again and put the chunks back into their original order
+            for row, chunk_idx in enumerate(batch_indices):
+                logits[chunk_idx] = batch_logits[row, : len(model_inputs["input_ids"][chunk_idx])]
+        predictions = {
+            "logits": logits,
+            "input_ids": model_inputs["input_ids"],
+            "special_tokens_mask": model_inputs["special_tokens_mask"],
+            "offset_mapping": model_inputs["offset_mapping"],
+            "overflow_to_sample_mapping": model_inputs["overflow_to_sample_mapping"],
+        }
         predictions = self._group_predictions_by_doc(predictions, sentence, word_ids, word_offset_mapping)  # type: ignore
 
         # Postprocess
@@ -449,14 +449,17 @@ class EntityExtractor(BaseComponent):
 
         return predictions
 
-    def extract_batch(self, texts: Union[List[str], List[List[str]]], batch_size: int = 1) -> List[List[Dict]]:
+    def extract_batch(
+        self, texts: Union[List[str], List[List[str]]], batch_size: Optional[int] = None
+    ) -> List[List[Dict]]:
         """
         This function allows the extraction of entities out of a list of strings or a list of lists of strings.
         The only difference between this function and `self.extract` is that it has additional logic to handle a
         list of lists of strings.
 
         :param texts: List of str or list of lists of str to extract entities from.
-        :param batch_size: Number of texts to make predictions on at a time.
+        :param batch_size: Number of text chunks to make predictions on at a time. If None, the `batch_size` set in
+            the constructor is used.
         """
         if isinstance(texts[0], str):
             single_list_of_texts = True
@@ -556,11 +559,11 @@ class _EntityPostProcessor:
         """
         if ignore_labels is None:
             ignore_labels = ["O"]
-        logits = model_outputs["logits"][0].numpy()
+        logits = np.asarray(model_outputs["logits"][0])
         sentence = model_outputs["sentence"]
-        input_ids = model_outputs["input_ids"][0]
-        offset_mapping = model_outputs["offset_mapping"][0].numpy()
-        special_tokens_mask = model_outputs["special_tokens_mask"][0].numpy()
+        input_ids = np.asarray(model_outputs["input_ids"][0])
+        offset_mapping = np.asarray(model_outputs["offset_mapping"][0])
+        special_tokens_mask = np.asarray(model_outputs["special_tokens_mask"][0])
         word_ids = model_outputs["word_ids"]
         word_offset_mapping = model_outputs.get("word_offset_mapping", None)
 
@@ -659,84 +662,43 @@ class _EntityPostProcessor:
         :param word_ids: List of integers or None types that provides the token index to word id mapping. None types
             correspond to special tokens.
         """
-        previous_word_id = -1
-        pre_entities = []
-        for token_idx, token_scores in enumerate(scores):
-            current_word_id = word_ids[token_idx]
-
-            # Filter special_tokens, they should only occur
-            # at the sentence boundaries since we're not encoding pairs of
-            # sentences so we don't have to keep track of those.
-            if special_tokens_mask[token_idx]:
-                continue
-
-            word = self.tokenizer.convert_ids_to_tokens(int(input_ids[token_idx]))
-
-            if current_word_id != previous_word_id:
-                is_subword = False
-            else:
-                is_subword = True
+        # Filter special_tokens, they should only occur
+        # at the sentence boundaries since we're not encoding pairs of
+        # sentences so we don't have to keep track of those.
+        token_indices = np.flatnonzero(np.asarray(special_tokens_mask) == 0)
+        if len(token_indices) == 0:
+            return []
+
+        token_ids = np.asarray(input_ids)[token_indices].tolist()
+        words = self.tokenizer.convert_ids_to_tokens(token_ids)
+        kept_word_ids = np.array([-1 if word_ids[idx] is None else word_ids[idx] for idx in token_indices])
+        previous_word_ids = np.concatenate(([-1], kept_word_ids[:-1]))
+        is_subword = kept_word_ids == previous_word_ids
+        is_unk = np.asarray(token_ids) == self.tokenizer.unk_token_id
+        # Unknown tokens are never treated as subwords
+        is_subword &= ~is_unk
 
+        pre_entities = []
+        for pos, token_idx in enumerate(token_indices.tolist()):
+            word = words[pos]
             start_ind, end_ind = offset_mapping[token_idx]
-            if int(input_ids[token_idx]) == self.tokenizer.unk_token_id:
+            if is_unk[pos]:
                 if isinstance(sentence, list):
-                    word = sentence[current_word_id][start_ind:end_ind]
+                    word = sentence[word_ids[token_idx]][start_ind:end_ind]
                 else:
                     word = sentence[start_ind:end_ind]
-                is_subword = False
 
             pre_entity = {
                 "word": word,
-                "scores": token_scores,
+                "scores": scores[token_idx],
                 "start": start_ind,
                 "end": end_ind,
                 "index": token_idx,
-                "is_subword": is_subword,
+                "is_subword": bool(is_subword[pos]),
             }
             pre_entities.append(pre_entity)
-
-            previous_word_id = current_word_id
         return pre_entities
 
-    def aggregate_word(
-        self, entities: List[Dict[str, Any]], aggregation_strategy: Literal["first", "average", "max"]
-    ) -> Dict[str, Any]:
-        """Aggregate token entities into a single word entity.
-
-        :param entities: List of token entities to be combined.
-        :param aggregation_strategy: The strategy to fuse the tokens based on the model prediction.
-        """
-        word = self.tokenizer.convert_tokens_to_string([entity["word"] for entity in entities])
-        tokens = [entity["word"] for entity in entities]
-        if aggregation_strategy == "first":
-            scores = entities[0]["scores"]
-            idx = scores.argmax()
-            score = scores[idx]
-            entity = self.model.config.id2label[idx]
-        elif aggregation_strategy == "max":
-            max_entity = max(entities, key=lambda entity: entity["scores"].max())
-            scores = max_entity["scores"]
-            idx = scores.argmax()
-            score = scores[idx]
-            entity = self.model.config.id2label[idx]
-        elif aggregation_strategy == "average":
-            scores = np.stack([entity["scores"] for entity in entities])
-            average_scores = np.nanmean(scores, axis=0)
-            entity_idx = average_scores.argmax()
-            entity = self.model.config.id2label[entity_idx]
-            score = average_scores[entity_idx]
-        else:
-            raise ValueError("Invalid aggregation_strategy")
-        new_entity = {
-            "entity": entity,
-            "score": score,
-            "word": word,
-            "tokens": tokens,
-            "start": entities[0]["start"],
-            "end": entities[-1]["end"],
-        }
-        return new_entity
-
     def aggregate_words(
         self, entities: List[Dict[str, Any]], aggregation_strategy: Literal[None, "simple", "first", "average", "max"]
     ) -> List[Dict[str, Any]]:
@@ -752,18 +714,47 @@ class _EntityPostProcessor:
         if aggregation_strategy is None or aggregation_strategy == "simple":
             logger.error("None and simple aggregation strategies are invalid for word aggregation")
 
+        if not entities:
+            return []
+
+        # Every token that is not a subword starts a new word
+        word_starts = np.flatnonzero([idx == 0 or not entity["is_subword"] for idx, entity in enumerate(entities)])
+        word_ends = np.append(word_starts[1:], len(entities))
+        scores = np.stack([entity["scores"] for entity in entities])  # num_tokens x num_classes
+
+        if aggregation_strategy == "first":
+            word_scores = scores[word_starts]
+        elif aggregation_strategy == "max":
+            # Pick the first token with the highest score within each word
+            word_idx = np.repeat(np.arange(len(word_starts)), word_ends - word_starts)
+            order = np.lexsort((-scores.max(axis=-1), word_idx))
+            word_scores = scores[order[word_starts]]
+        elif aggregation_strategy == "average":
+            # Same as np.nanmean per word: NaN scores count neither in the sum nor in the number of tokens
+            is_score = ~np.isnan(scores)
+            score_sums = np.add.reduceat(np.where(is_score, scores, 0.0), word_starts, axis=0)
+            score_counts = np.add.reduceat(is_score, word_starts, axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                word_scores = score_sums / score_counts
+        else:
+            raise ValueError("Invalid aggregation_strategy")
+
+        label_ids = word_scores.argmax(axis=-1)
+        label_scores = word_scores[np.arange(len(word_scores)), label_ids]
+
         word_entities = []
-        word_group = None
-        for entity in entities:
-            if word_group is None:
-                word_group = [entity]
-            elif entity["is_subword"]:
-                word_group.append(entity)
-            else:
-                word_entities.append(self.aggregate_word(word_group, aggregation_strategy))  # type: ignore
-                word_group = [entity]
-        # Last item
-        word_entities.append(self.aggregate_word(word_group, aggregation_strategy))  # type: ignore
+        for word_start, word_end, label_id, score in zip(word_starts, word_ends, label_ids, label_scores):
+            tokens = [entity["word"] for entity in entities[word_start:word_end]]
+            word_entities.append(
+                {
+                    "entity": self.model.config.id2label[label_id],
+                    "score": score,
+                    "word": self.tokenizer.convert_tokens_to_string(tokens),
+                    "tokens": tokens,
+                    "start": entities[word_start]["start"],
+                    "end": entities[word_end - 1]["end"],
+                }
+            )
         return word_entities
 
     def group_sub_entities(self, entities: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -846,6 +837,39 @@ class _EntityPostProcessor:
         return entity_groups
 
 
+class _TokenClassificationCollator:
+    """Pad a list of tokenized chunks of different lengths to the length of the longest chunk in the batch.
+
+    Every key the tokenizer returned is padded, so models that use `token_type_ids` get them as well.
+
+    :param pad_token_id: Id of the padding token of the tokenizer.
+    :param pad_token_type_id: Token type id the tokenizer uses for padding.
+    """
+
+    def __init__(self, pad_token_id: int, pad_token_type_id: int = 0):
+        self.pad_values = {
+            "input_ids": pad_token_id,
+            "token_type_ids": pad_token_type_id,
+            "special_tokens_mask": 1,
+        }
+
+    def __call__(self, batch: List[Dict[str, Any]]) -> Dict[str, torch.Tensor]:
+        padded_batch = {}
+        for key in batch[0]:
+            values = [torch.as_tensor(item[key], dtype=torch.long) for item in batch]
+            if values[0].dim() == 0:
+                padded_batch[key] = torch.stack(values)
+                continue
+            max_len = max(len(value) for value in values)
+            padded = torch.full(
+                (len(values), max_len, *values[0].shape[1:]), self.pad_values.get(key, 0), dtype=torch.long
+            )
+            for row, value in enumerate(values):
+                padded[row, : len(value)] = value
+            padded_batch[key] = padded
+        return padded_batch
+
+
 class TokenClassificationDataset(Dataset):
     """Token Classification Dataset
 
@@ -861,18 +885,7 @@ class TokenClassificationDataset(Dataset):
         self._len = len(model_inputs["input_ids"])
 
     def __getitem__(self, item):
-        input_ids = self.model_inputs["input_ids"][item]
-        attention_mask = self.model_inputs["attention_mask"][item]
-        special_tokens_mask = self.model_inputs["special_tokens_mask"][item]
-        offset_mapping = self.model_inputs["offset_mapping"][item]
-        overflow_to_sample_mapping = self.model_inputs["overflow_to_sample_mapping"][item]
-        single_input = {
-            "input_ids": input_ids,
-            "attention_mask": attention_mask,
-            "special_tokens_mask": special_tokens_mask,
-            "offset_mapping": offset_mapping,
-            "overflow_to_sample_mapping": overflow_to_sample_mapping,
-        }
+        single_input = {key: values[item] for key, values in self.model_inputs.items()}
         return single_input
 
     def __len__(self):
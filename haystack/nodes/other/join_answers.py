@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Optional, List, Dict, Tuple
 
 from haystack.schema import Answer
@@ -41,51 +42,40 @@ class JoinAnswers(JoinNode):
         self.sort_by_score = sort_by_score
 
     def run_accumulated(self, inputs: List[Dict], top_k_join: Optional[int] = None) -> Tuple[Dict, str]:  # type: ignore
-        reader_results = [inp["answers"] for inp in inputs]
-
-        if not top_k_join:
-            top_k_join = self.top_k_join
-
-        if self.join_mode == "concatenate":
-            concatenated_answers = [answer for cur_reader_result in reader_results for answer in cur_reader_result]
-            if self.sort_by_score:
-                concatenated_answers = sorted(concatenated_answers, reverse=True)
-            concatenated_answers = concatenated_answers[:top_k_join]
-            return {"answers": concatenated_answers, "labels": inputs[0].get("labels", None)}, "output_1"
-
-        elif self.join_mode == "merge":
-            merged_answers = self._merge_answers(reader_results)
-            merged_answers = merged_answers[:top_k_join]
-            return {"answers": merged_answers, "labels": inputs[0].get("labels", None)}, "output_1"
-
-        else:
-            raise ValueError(f"Invalid join_mode: {self.join_mode}")
+        answers = self._join_results([[inp["answers"]] for inp in inputs], top_k_join=top_k_join)[0]
+        return {"answers": answers, "labels": inputs[0].get("labels", None)}, "output_1"
 
     def run_batch_accumulated(self, inputs: List[Dict], top_k_join: Optional[int] = None) -> Tuple[Dict, str]:  # type: ignore
-        output_ans = []
-        incoming_edges = [inp["answers"] for inp in inputs]
         # At each idx, we find predicted answers for the same query from different Readers
-        for idx in range(len(incoming_edges[0])):
-            cur_ans_to_join = []
-            # Aggregate predicted answer from each Reader
-            for edge in incoming_edges:
-                cur_ans_to_join.append({"answers": edge[idx]})
-            cur, _ = self.run(inputs=cur_ans_to_join, top_k_join=top_k_join)
-            output_ans.append(cur["answers"])
+        output_ans = self._join_results([inp["answers"] for inp in inputs], top_k_join=top_k_join)
 
         output = {"answers": output_ans, "labels": inputs[0].get("labels", None)}
 
         return output, "output_1"
 
-    def _merge_answers(self, reader_results: List[List[Answer]]) -> List[Answer]:
-        weights = self.weights if self.weights else [1 / len(reader_results)] * len(reader_results)
-
-        for result, weight in zip(reader_results, weights):
-            for answer in result:
-                if isinstance(answer.score, float):
-                    answer.score *= weight
-        merged_answers = [answer for cur_reader_result in reader_results for answer in cur_reader_result]
-        if self.sort_by_score:
-            merged_answers = sorted(merged_answers, reverse=True)
+    def _join_results(self, results: List[List[List[Answer]]], top_k_join: Optional[int] = None) -> List[List[Answer]]:
+        """
+        Joins the answer lists of all queries in one pass.
 
-        return sorted([answer for cur_reader_result in reader_results for answer in cur_reader_result], reverse=True)
+        :param results: For each Reader, the list of answers it predicted for each query.
+        :param top_k_join: Limit the answers of each query to top_k based on the resulting scores of the join.
+        """
+        top_k_join = top_k_join or self.top_k_join
+        weights = self.weights if self.weights else [1 / len(results)] * len(results)
+
+        joined_answers = []
+        for query_results in zip(*results):
+            if self.join_mode == "merge":
+                for result, weight in zip(query_results, weights):
+                    for answer in result:
+                        if isinstance(answer.score, float):
+                            answer.score *= weight
+            elif self.join_mode != "concatenate":
+                raise ValueError(f"Invalid join_mode: {self.join_mode}")
+
+            answers = [answer for result in query_results for answer in result]
+            if self.sort_by_score:
+                # Sorting by the score directly is much faster than comparing the Answers
+                answers.sort(key=attrgetter("score"), reverse=True)
+            joined_answers.append(answers[:top_k_join])
+        return joined_answers
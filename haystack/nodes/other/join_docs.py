@@ -1,8 +1,8 @@
-from collections import defaultdict
 import logging
 from math import inf
+from operator import attrgetter
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from haystack.schema import Document
 from haystack.nodes.other.join import JoinNode
@@ -60,40 +60,7 @@ class JoinDocuments(JoinNode):
         self.sort_by_score = sort_by_score
 
     def run_accumulated(self, inputs: List[dict], top_k_join: Optional[int] = None):  # type: ignore
-        results = [inp["documents"] for inp in inputs]
-        document_map = {doc.id: doc for result in results for doc in result}
-
-        if self.join_mode == "concatenate":
-            scores_map = self._concatenate_results(results)
-        elif self.join_mode == "merge":
-            scores_map = self._calculate_comb_sum(results)
-        elif self.join_mode == "reciprocal_rank_fusion":
-            scores_map = self._calculate_rrf(results)
-        else:
-            raise ValueError(f"Invalid join_mode: {self.join_mode}")
-
-        # only sort the docs if that was requested
-        if self.sort_by_score:
-            sorted_docs = sorted(scores_map.items(), key=lambda d: d[1] if d[1] is not None else -inf, reverse=True)
-            if any(s is None for s in scores_map.values()):
-                logger.info(
-                    "The `JoinDocuments` node has received some documents with `score=None` - and was requested "
-                    "to sort the documents by score, so the `score=None` documents got sorted as if their "
-                    "score would be `-infinity`."
-                )
-        else:
-            sorted_docs = [(k, v) for k, v in scores_map.items()]
-
-        if not top_k_join:
-            top_k_join = self.top_k_join
-        if not top_k_join:
-            top_k_join = len(sorted_docs)
-
-        docs = []
-        for id, score in sorted_docs[:top_k_join]:
-            doc = document_map[id]
-            doc.score = score
-            docs.append(doc)
+        docs = self._join_results([[inp["documents"]] for inp in inputs], top_k_join=top_k_join)[0]
 
         output = {"documents": docs, "labels": inputs[0].get("labels", None)}
 
@@ -105,48 +72,76 @@ class JoinDocuments(JoinNode):
             return self.run(inputs=inputs, top_k_join=top_k_join)
         # Join lists of document lists
         else:
-            output_docs = []
-            incoming_edges = [inp["documents"] for inp in inputs]
-            for idx in range(len(incoming_edges[0])):
-                cur_docs_to_join = []
-                for edge in incoming_edges:
-                    cur_docs_to_join.append({"documents": edge[idx]})
-                cur, _ = self.run(inputs=cur_docs_to_join, top_k_join=top_k_join)
-                output_docs.append(cur["documents"])
+            output_docs = self._join_results([inp["documents"] for inp in inputs], top_k_join=top_k_join)
 
             output = {"documents": output_docs, "labels": inputs[0].get("labels", None)}
 
             return output, "output_1"
 
-    def _concatenate_results(self, results):
+    def _join_results(
+        self, results: List[List[List[Document]]], top_k_join: Optional[int] = None
+    ) -> List[List[Document]]:
         """
-        Concatenates multiple document result lists.
-        """
-        return {doc.id: doc.score for result in results for doc in result}
+        Joins the document lists of all queries in one pass.
 
-    def _calculate_comb_sum(self, results):
-        """
-        Calculates a combination sum by multiplying each score by its weight.
+        :param results: For each input node, the list of documents it returned for each query.
+        :param top_k_join: Limit the documents of each query to top_k based on the resulting scores of the join.
         """
-        scores_map = defaultdict(int)
+        top_k_join = top_k_join or self.top_k_join
         weights = self.weights if self.weights else [1 / len(results)] * len(results)
-
-        for result, weight in zip(results, weights):
-            for doc in result:
-                scores_map[doc.id] += (doc.score if doc.score else 0) * weight
-
-        return scores_map
-
-    def _calculate_rrf(self, results):
-        """
-        Calculates the reciprocal rank fusion. The constant K is set to 61 (60 was suggested by the original paper,
-        plus 1 as python lists are 0-based and the paper used 1-based ranking).
-        """
-        K = 61
-
-        scores_map = defaultdict(int)
-        for result in results:
-            for rank, doc in enumerate(result):
-                scores_map[doc.id] += 1 / (K + rank)
-
-        return scores_map
+        score_none_logged = False
+
+        joined_docs = []
+        for query_results in zip(*results):
+            if self.join_mode == "concatenate":
+                # Any duplicate documents are discarded, the score is only determined by the last node that outputs
+                # the document
+                docs = list({doc.id: doc for result in query_results for doc in result}.values())
+                if self.sort_by_score:
+                    if any(doc.score is None for doc in docs):
+                        docs.sort(key=lambda doc: doc.score if doc.score is not None else -inf, reverse=True)
+                        if not score_none_logged:
+                            logger.info(
+                                "The `JoinDocuments` node has received some documents with `score=None` - and was "
+                                "requested to sort the documents by score, so the `score=None` documents got sorted "
+                                "as if their score would be `-infinity`."
+                            )
+                            score_none_logged = True
+                    else:
+                        docs.sort(key=attrgetter("score"), reverse=True)
+                joined_docs.append(docs[:top_k_join])
+                continue
+
+            # Maps the id of each document to the document returned by the last node and to its joined score
+            docs_by_id: Dict[str, Document] = {}
+            scores_by_id: Dict[str, float] = {}
+            if self.join_mode == "merge":
+                # Combination sum of the scores multiplied by their weight
+                for result, weight in zip(query_results, weights):
+                    for doc in result:
+                        doc_id = doc.id
+                        docs_by_id[doc_id] = doc
+                        scores_by_id[doc_id] = scores_by_id.get(doc_id, 0) + (doc.score if doc.score else 0) * weight
+            elif self.join_mode == "reciprocal_rank_fusion":
+                # The constant K is set to 61 (60 was suggested by the original paper, plus 1 as python lists are
+                # 0-based and the paper used 1-based ranking)
+                K = 61
+                for result in query_results:
+                    for rank, doc in enumerate(result):
+                        doc_id = doc.id
+                        docs_by_id[doc_id] = doc
+                        scores_by_id[doc_id] = scores_by_id.get(doc_id, 0) + 1 / (K + rank)
+            else:
+                raise ValueError(f"Invalid join_mode: {self.join_mode}")
+
+            doc_ids: List[str] = list(scores_by_id)
+            # only sort the docs if that was requested
+            if self.sort_by_score:
+                doc_ids.sort(key=scores_by_id.__getitem__, reverse=True)
+            docs = []
+            for doc_id in doc_ids[:top_k_join]:
+                doc = docs_by_id[doc_id]
+                doc.score = scores_by_id[doc_id]
+                docs.append(doc)
+            joined_docs.append(docs)
+        return joined_docs
@@ -1,9 +1,10 @@
 import logging
+import multiprocessing as mp
 import re
+import weakref
 from copy import deepcopy
-from functools import partial, reduce
-from itertools import chain
-from typing import List, Optional, Generator, Set, Union, Tuple, Dict
+from functools import partial
+from typing import Any, List, Optional, Set, Union, Tuple, Dict
 
 try:
     from typing import Literal
@@ -48,6 +49,10 @@ iso639_to_nltk = {
 }
 
 
+# Sentence tokenizers by language and model folder, see PreProcessor._get_sentence_tokenizer()
+_sentence_tokenizers: Dict[Tuple[str, Optional[str]], nltk.tokenize.punkt.PunktSentenceTokenizer] = {}
+
+
 class PreProcessor(BasePreProcessor):
     def __init__(
         self,
@@ -65,6 +70,9 @@ class PreProcessor(BasePreProcessor):
         progress_bar: bool = True,
         add_page_number: bool = False,
         max_chars_check: int = 10_000,
+        num_processes: Optional[int] = 1,
+        multiprocessing_chunksize: Optional[int] = None,
+        header_footer_sample_pages: Optional[int] = None,
     ):
         """
         :param clean_header_footer: Use heuristic to remove footers and headers across different pages by searching
@@ -99,6 +107,17 @@ class PreProcessor(BasePreProcessor):
                                 in between pages by `PDFToTextConverter`, `TikaConverter`, `ParsrConverter` and
                                 `AzureConverter`.
         :param max_chars_check: the maximum length a document is expected to have. Each document that is longer than max_chars_check in characters after pre-processing will raise a warning.
+        :param num_processes: The number of processes that clean and split a list of documents in parallel. The
+                              processes are started on the first call to `process()` with more than one document and
+                              are reused until you call `close_multiprocessing_pool()` or the PreProcessor is garbage
+                              collected. They are restarted if you change an attribute of the PreProcessor in between.
+                              Set to 1 to disable multiprocessing. Set to None to use all CPU cores.
+        :param multiprocessing_chunksize: The number of documents sent to a process at once. Set to None to split the
+                                          documents into about four chunks per process.
+        :param header_footer_sample_pages: The maximum number of pages to search for a common header and footer when
+                                           `clean_header_footer` is enabled. Longer documents are searched on evenly
+                                           spaced pages and the header and footer found there are removed from all
+                                           pages. Set to None to search all pages.
         """
         if remove_substrings is None:
             remove_substrings = []
@@ -127,6 +146,20 @@ class PreProcessor(BasePreProcessor):
         self.progress_bar = progress_bar
         self.add_page_number = add_page_number
         self.max_chars_check = max_chars_check
+        self.num_processes = num_processes if num_processes is not None else mp.cpu_count()
+        self.multiprocessing_chunksize = multiprocessing_chunksize
+        self.header_footer_sample_pages = header_footer_sample_pages
+        self._pool: Optional[Any] = None
+        self._pool_config: Optional[Dict[str, Any]] = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pool can't be sent to other processes and must not be shared by copies of this PreProcessor
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_config"] = None
+        state["_pool_finalizer"] = None
+        return state
 
     def process(
         self,
@@ -250,12 +283,47 @@ class PreProcessor(BasePreProcessor):
     def _process_batch(
         self, documents: List[Union[dict, Document]], id_hash_keys: Optional[List[str]] = None, **kwargs
     ) -> List[Document]:
-        nested_docs = [
-            self._process_single(d, id_hash_keys=id_hash_keys, **kwargs)
-            for d in tqdm(documents, disable=not self.progress_bar, desc="Preprocessing", unit="docs")
-        ]
+        if self.num_processes > 1 and len(documents) > 1:
+            chunksize = self.multiprocessing_chunksize or max(len(documents) // (self.num_processes * 4), 1)
+            # imap returns the results in the order of the input documents
+            results = self._get_multiprocessing_pool().imap(
+                partial(_process_single_in_worker, id_hash_keys=id_hash_keys, **kwargs), documents, chunksize
+            )
+        else:
+            results = (self._process_single(d, id_hash_keys=id_hash_keys, **kwargs) for d in documents)
+        nested_docs = list(
+            tqdm(results, total=len(documents), disable=not self.progress_bar, desc="Preprocessing", unit="docs")
+        )
         return [d for x in nested_docs for d in x]
 
+    def _get_multiprocessing_pool(self):
+        # The worker processes got a copy of this PreProcessor when they started, so they need to be restarted
+        # whenever its configuration changed since then
+        config = self.__getstate__()
+        config.pop("print_log")
+        if self._pool is not None and config != self._pool_config:
+            self.close_multiprocessing_pool()
+        if self._pool is None:
+            # The pool keeps its initargs, so it gets a copy to not keep this PreProcessor alive through the finalizer
+            self._pool = mp.Pool(
+                processes=self.num_processes, initializer=_init_preprocessor_worker, initargs=(deepcopy(self),)
+            )
+            self._pool_config = deepcopy(config)
+            # Stop the processes once this PreProcessor is garbage collected
+            self._pool_finalizer = weakref.finalize(self, _close_pool, self._pool)
+        return self._pool
+
+    def close_multiprocessing_pool(self):
+        """
+        Stops the processes that `process()` started to preprocess documents in parallel. They are started again
+        the next time `process()` gets more than one document.
+        """
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool = None
+        self._pool_config = None
+        self._pool_finalizer = None
+
     def clean(
         self,
         document: Union[dict, Document],
@@ -456,16 +524,21 @@ class PreProcessor(BasePreProcessor):
         Splits the text into parts of split_length words while respecting sentence boundaries.
         """
         sentences = self._split_sentences(text)
+        # Count the words and find the start of each sentence once, then build the splits from sentence indices
+        word_counts = [len(sen.split()) for sen in sentences]
+        sentence_starts = [0]
+        for sen in sentences:
+            sentence_starts.append(sentence_starts[-1] + len(sen))
+        joined_sentences = "".join(sentences)
 
         word_count_slice = 0
         cur_page = 1
-        cur_start_idx = 0
         splits_pages = []
-        list_splits = []
+        splits_ranges = []
         splits_start_idxs = []
-        current_slice: List[str] = []
-        for sen in sentences:
-            word_count_sen = len(sen.split())
+        slice_start = 0
+        for sen_idx, sen in enumerate(sentences):
+            word_count_sen = word_counts[sen_idx]
 
             if word_count_sen > split_length:
                 long_sentence_message = (
@@ -477,76 +550,65 @@ class PreProcessor(BasePreProcessor):
 
             if word_count_slice + word_count_sen > split_length:
                 # Number of words exceeds split_length -> save current slice and start a new one
-                if current_slice:
-                    list_splits.append(current_slice)
+                if slice_start < sen_idx:
+                    splits_ranges.append((slice_start, sen_idx))
                     splits_pages.append(cur_page)
-                    splits_start_idxs.append(cur_start_idx)
+                    splits_start_idxs.append(sentence_starts[slice_start])
 
                 if split_overlap:
-                    processed_sents, current_slice, word_count_slice = self._get_overlap_from_slice(
-                        current_slice, split_length, split_overlap
+                    next_slice_start, word_count_slice = self._get_overlap_start(
+                        word_counts, slice_start, sen_idx, split_length, split_overlap
                     )
                 else:
-                    processed_sents = current_slice
-                    current_slice = []
+                    next_slice_start = sen_idx
                     word_count_slice = 0
 
-                cur_start_idx += len("".join(processed_sents))
-
                 # Count number of page breaks in processed sentences
                 if self.add_page_number:
                     num_page_breaks = self._count_processed_page_breaks(
-                        sentences=processed_sents,
+                        sentences=sentences[slice_start:next_slice_start],
                         split_overlap=split_overlap,
-                        overlapping_sents=current_slice,
+                        overlapping_sents=sentences[next_slice_start:sen_idx],
                         current_sent=sen,
                     )
                     cur_page += num_page_breaks
+                slice_start = next_slice_start
 
-            current_slice.append(sen)
             word_count_slice += word_count_sen
 
-        if current_slice:
-            list_splits.append(current_slice)
+        if slice_start < len(sentences):
+            splits_ranges.append((slice_start, len(sentences)))
             splits_pages.append(cur_page)
-            splits_start_idxs.append(cur_start_idx)
+            splits_start_idxs.append(sentence_starts[slice_start])
 
         text_splits = []
-        for sl in list_splits:
-            txt = "".join(sl)
+        for first, last in splits_ranges:
+            txt = joined_sentences[sentence_starts[first] : sentence_starts[last]]
             if len(txt) > 0:
                 text_splits.append(txt)
 
         return text_splits, splits_pages, splits_start_idxs
 
     @staticmethod
-    def _get_overlap_from_slice(
-        current_slice: List[str], split_length: int, split_overlap: int
-    ) -> Tuple[List[str], List[str], int]:
+    def _get_overlap_start(
+        word_counts: List[int], slice_start: int, slice_end: int, split_length: int, split_overlap: int
+    ) -> Tuple[int, int]:
         """
         Returns a tuple with the following elements:
-        - processed_sents: List of sentences that are not overlapping the with next slice (= completely processed sentences)
-        - next_slice: List of sentences that are overlapping with the next slice
-        - word_count_slice: Number of words in the next slice
+        - the index of the first sentence of the slice `[slice_start, slice_end)` that overlaps with the next slice
+          (`slice_end` if there's no overlap). The sentences before it are completely processed.
+        - word_count_slice: Number of words in the overlapping sentences
         """
-
-        overlap = []
+        overlap_start = slice_end
         word_count_overlap = 0
-        current_slice_copy = deepcopy(current_slice)
         # Next overlapping Document should not start exactly the same as the previous one, so we skip the first sentence
-        for idx, s in reversed(list(enumerate(current_slice))[1:]):
-            sen_len = len(s.split())
-            if word_count_overlap < split_overlap and sen_len < split_length:
-                overlap.append(s)
-                word_count_overlap += sen_len
-                current_slice_copy.pop(idx)
+        for idx in range(slice_end - 1, slice_start, -1):
+            if word_count_overlap < split_overlap and word_counts[idx] < split_length:
+                overlap_start = idx
+                word_count_overlap += word_counts[idx]
             else:
                 break
-        processed_sents = current_slice_copy
-        next_slice = list(reversed(overlap))
-        word_count_slice = word_count_overlap
-
-        return processed_sents, next_slice, word_count_slice
+        return overlap_start, word_count_overlap
 
     def _split_into_units(self, text: str, split_by: str) -> Tuple[List[str], str]:
         if split_by == "passage":
@@ -569,25 +631,35 @@ class PreProcessor(BasePreProcessor):
         """
         Concatenates the elements into parts of split_length units.
         """
-        segments = windowed(elements, n=split_length, step=split_length - split_overlap)
+        segments = windowed(range(len(elements)), n=split_length, step=split_length - split_overlap)
         split_at_len = len(split_at)
+        # Each part is a slice of all elements joined together, found from the start offsets of its first and last unit
+        joined_elements = split_at.join(elements)
+        unit_starts = [0]
+        page_breaks = [0]
+        for element in elements:
+            unit_starts.append(unit_starts[-1] + len(element) + split_at_len)
+            if self.add_page_number:
+                page_breaks.append(page_breaks[-1] + element.count("\f"))
         text_splits = []
         splits_pages = []
         splits_start_idxs = []
         cur_page = 1
         cur_start_idx = 0
         for seg in segments:
-            current_units = [unit for unit in seg if unit is not None]
-            txt = split_at.join(current_units)
+            unit_idxs = [unit_idx for unit_idx in seg if unit_idx is not None]
+            if not unit_idxs:
+                continue
+            first, last = unit_idxs[0], unit_idxs[-1] + 1
+            txt = joined_elements[unit_starts[first] : unit_starts[last] - split_at_len]
             if len(txt) > 0:
                 text_splits.append(txt)
                 splits_pages.append(cur_page)
                 splits_start_idxs.append(cur_start_idx)
-                processed_units = current_units[: split_length - split_overlap]
-                cur_start_idx += len((split_at_len * " ").join(processed_units)) + split_at_len
+                processed_end = first + len(unit_idxs[: split_length - split_overlap])
+                cur_start_idx += unit_starts[processed_end] - unit_starts[first]
                 if self.add_page_number:
-                    num_page_breaks = sum(processed_unit.count("\f") for processed_unit in processed_units)
-                    cur_page += num_page_breaks
+                    cur_page += page_breaks[processed_end] - page_breaks[first]
 
         return text_splits, splits_pages, splits_start_idxs
 
@@ -704,15 +776,21 @@ class PreProcessor(BasePreProcessor):
         """
 
         pages = text.split("\f")
+        searched_pages = pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]
+        if self.header_footer_sample_pages and len(searched_pages) > self.header_footer_sample_pages:
+            # Evenly spaced pages are enough to find a string that all pages have in common
+            step = len(searched_pages) / self.header_footer_sample_pages
+            searched_pages = [searched_pages[int(i * step)] for i in range(self.header_footer_sample_pages)]
 
         # header
-        start_of_pages = [p[:n_chars] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
+        start_of_pages = [p[:n_chars] for p in searched_pages]
         found_header = self._find_longest_common_ngram(start_of_pages)
         if found_header:
             pages = [page.replace(found_header, "") for page in pages]
+            searched_pages = [page.replace(found_header, "") for page in searched_pages]
 
         # footer
-        end_of_pages = [p[-n_chars:] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
+        end_of_pages = [p[-n_chars:] for p in searched_pages]
         found_footer = self._find_longest_common_ngram(end_of_pages)
         if found_footer:
             pages = [page.replace(found_footer, "") for page in pages]
@@ -720,31 +798,18 @@ class PreProcessor(BasePreProcessor):
         text = "\f".join(pages)
         return text
 
-    def _ngram(self, seq: str, n: int) -> Generator[str, None, None]:
+    @staticmethod
+    def _ngram_tokens(seq: str) -> List[str]:
         """
-        Return ngram (of tokens - currently split by whitespace)
-        :param seq: str, string from which the ngram shall be created
-        :param n: int, n of ngram
-        :return: str, ngram as string
+        Split a string into the tokens that make up ngrams: words separated by spaces, where \\n and \\t start a new
+        token. Joining the tokens of an ngram with spaces and removing the spaces in front of \\n and \\t gives back
+        the original string.
         """
-
         # In order to maintain the original whitespace, but still consider \n and \t for n-gram tokenization,
-        # we add a space here and remove it after creation of the ngrams again (see below)
+        # we add a space here and remove it after creation of the ngrams again (see _find_longest_common_ngram)
         seq = seq.replace("\n", " \n")
         seq = seq.replace("\t", " \t")
-
-        words = seq.split(" ")
-        ngrams = (
-            " ".join(words[i : i + n]).replace(" \n", "\n").replace(" \t", "\t") for i in range(0, len(words) - n + 1)
-        )
-
-        return ngrams
-
-    def _allngram(self, seq: str, min_ngram: int, max_ngram: int) -> Set[str]:
-        lengths = range(min_ngram, max_ngram) if max_ngram else range(min_ngram, len(seq))
-        ngrams = map(partial(self._ngram, seq), lengths)
-        res = set(chain.from_iterable(ngrams))
-        return res
+        return seq.split(" ")
 
     def _find_longest_common_ngram(
         self, sequences: List[str], max_ngram: int = 30, min_ngram: int = 3
@@ -753,23 +818,71 @@ class PreProcessor(BasePreProcessor):
         Find the longest common ngram across different text sequences (e.g. start of pages).
         Considering all ngrams between the specified range. Helpful for finding footers, headers etc.
 
+        The ngrams are compared by integer ids, one ngram length after the other. Every ngram of a common ngram is
+        common as well, so the search stops at the first length without any common ngram. This takes time linear in
+        the total number of tokens for each ngram length and never materializes the ngrams as strings.
+
         :param sequences: list[str], list of strings that shall be searched for common n_grams
-        :param max_ngram: int, maximum length of ngram to consider
+        :param max_ngram: int, maximum length of ngram to consider (exclusive)
         :param min_ngram: minimum length of ngram to consider
         :return: str, common string of all sections
         """
         sequences = [s for s in sequences if s]  # filter empty sequences
         if not sequences:
             return None
-        seqs_ngrams = map(partial(self._allngram, min_ngram=min_ngram, max_ngram=max_ngram), sequences)
-        intersection = reduce(set.intersection, seqs_ngrams)
 
-        try:
-            longest = max(intersection, key=len)
-        except ValueError:
-            # no common sequence found
-            longest = ""
-        return longest if longest.strip() else None
+        vocabulary: Dict[str, int] = {}
+        tokens = [self._ngram_tokens(seq) for seq in sequences]
+        token_ids = [[vocabulary.setdefault(token, len(vocabulary)) for token in seq_tokens] for seq_tokens in tokens]
+        # Look for the candidates in the shortest sequence, the others only need to contain them
+        shortest = min(range(len(sequences)), key=lambda i: len(token_ids[i]))
+        candidate_tokens = tokens[shortest]
+
+        # The length of an ngram string is the length of its tokens plus the spaces joining them, except for the
+        # spaces in front of tokens starting with \n or \t
+        char_offsets = [0]
+        joined_offsets = [0]
+        for token in candidate_tokens:
+            char_offsets.append(char_offsets[-1] + len(token))
+            joined_offsets.append(joined_offsets[-1] + (0 if token[:1] in ("\n", "\t") else 1))
+
+        # An ngram of length n gets an id from the id of its first n - 1 tokens and its last token, so equal ngrams
+        # get equal ids across all sequences without building their strings
+        ngram_ids = [list(ids) for ids in token_ids]
+        max_length = min(max_ngram - 1 if max_ngram else len(candidate_tokens), len(candidate_tokens))
+        longest: Optional[Tuple[int, int]] = None
+        longest_chars = 0
+        for n in range(1, max_length + 1):
+            if n > 1:
+                extended_ids: Dict[Tuple[int, int], int] = {}
+                for seq_ngram_ids, ids in zip(ngram_ids, token_ids):
+                    seq_ngram_ids[:] = [
+                        extended_ids.setdefault((seq_ngram_ids[i], ids[i + n - 1]), len(extended_ids))
+                        for i in range(len(ids) - n + 1)
+                    ]
+            candidate_starts: Dict[int, int] = {}
+            for start, ngram_id in enumerate(ngram_ids[shortest]):
+                candidate_starts.setdefault(ngram_id, start)
+            common_ids = set(candidate_starts)
+            for i, seq_ngram_ids in enumerate(ngram_ids):
+                if i != shortest:
+                    common_ids.intersection_update(seq_ngram_ids)
+            if not common_ids:
+                break
+            if n < min_ngram:
+                continue
+            for ngram_id in common_ids:
+                start = candidate_starts[ngram_id]
+                chars = char_offsets[start + n] - char_offsets[start]
+                chars += joined_offsets[start + n] - joined_offsets[start + 1]
+                if chars > longest_chars:
+                    longest, longest_chars = (start, n), chars
+
+        if longest is None:
+            return None
+        start, n = longest
+        longest_ngram = " ".join(candidate_tokens[start : start + n]).replace(" \n", "\n").replace(" \t", "\t")
+        return longest_ngram if longest_ngram.strip() else None
 
     def _split_sentences(self, text: str) -> List[str]:
         """
@@ -777,34 +890,43 @@ class PreProcessor(BasePreProcessor):
         :param text: str, text to tokenize
         :return: list[str], list of sentences
         """
-        language_name = iso639_to_nltk.get(self.language)
-
-        sentence_tokenizer = self._load_sentence_tokenizer(language_name)
-        # The following adjustment of PunktSentenceTokenizer is inspired by:
-        # https://stackoverflow.com/questions/33139531/preserve-empty-lines-with-nltks-punkt-tokenizer
-        # It is needed for preserving whitespace while splitting text into sentences.
-        period_context_fmt = r"""
-            %(SentEndChars)s             # a potential sentence ending
-            \s*                          # match potential whitespace (is originally in lookahead assertion)
-            (?=(?P<after_tok>
-                %(NonWord)s              # either other punctuation
-                |
-                (?P<next_tok>\S+)        # or some other token - original version: \s+(?P<next_tok>\S+)
-            ))"""
-        re_period_context = re.compile(
-            period_context_fmt
-            % {
-                "NonWord": sentence_tokenizer._lang_vars._re_non_word_chars,
-                # SentEndChars might be followed by closing brackets, so we match them here.
-                "SentEndChars": sentence_tokenizer._lang_vars._re_sent_end_chars + r"[\)\]}]*",
-            },
-            re.UNICODE | re.VERBOSE,
-        )
-        sentence_tokenizer._lang_vars._re_period_context = re_period_context
-
-        sentences = sentence_tokenizer.tokenize(text)
+        sentences = self._get_sentence_tokenizer().tokenize(text)
         return sentences
 
+    def _get_sentence_tokenizer(self) -> nltk.tokenize.punkt.PunktSentenceTokenizer:
+        """
+        Returns the sentence tokenizer for this PreProcessor's language and model folder. It's loaded and adjusted only
+        once per process and then shared by all PreProcessors with the same settings.
+        """
+        model_folder = str(Path(self.tokenizer_model_folder).absolute()) if self.tokenizer_model_folder else None
+        cache_key = (self.language, model_folder)
+        sentence_tokenizer = _sentence_tokenizers.get(cache_key)
+        if sentence_tokenizer is None:
+            sentence_tokenizer = self._load_sentence_tokenizer(iso639_to_nltk.get(self.language))
+            # The following adjustment of PunktSentenceTokenizer is inspired by:
+            # https://stackoverflow.com/questions/33139531/preserve-empty-lines-with-nltks-punkt-tokenizer
+            # It is needed for preserving whitespace while splitting text into sentences.
+            period_context_fmt = r"""
+                %(SentEndChars)s             # a potential sentence ending
+                \s*                          # match potential whitespace (is originally in lookahead assertion)
+                (?=(?P<after_tok>
+                    %(NonWord)s              # either other punctuation
+                    |
+                    (?P<next_tok>\S+)        # or some other token - original version: \s+(?P<next_tok>\S+)
+                ))"""
+            re_period_context = re.compile(
+                period_context_fmt
+                % {
+                    "NonWord": sentence_tokenizer._lang_vars._re_non_word_chars,
+                    # SentEndChars might be followed by closing brackets, so we match them here.
+                    "SentEndChars": sentence_tokenizer._lang_vars._re_sent_end_chars + r"[\)\]}]*",
+                },
+                re.UNICODE | re.VERBOSE,
+            )
+            sentence_tokenizer._lang_vars._re_period_context = re_period_context
+            _sentence_tokenizers[cache_key] = sentence_tokenizer
+        return sentence_tokenizer
+
     def _load_sentence_tokenizer(self, language_name: Optional[str]) -> nltk.tokenize.punkt.PunktSentenceTokenizer:
         # Try to load a custom model from 'tokenizer_model_path'
         if self.tokenizer_model_folder is not None:
@@ -868,3 +990,25 @@ class PreProcessor(BasePreProcessor):
                 num_page_breaks += 1
 
         return num_page_breaks
+
+
+def _close_pool(pool):
+    pool.close()
+    pool.join()
+
+
+# The PreProcessor of the current worker process, set once by _init_preprocessor_worker()
+_worker_preprocessor: Optional[PreProcessor] = None
+
+
+def _init_preprocessor_worker(preprocessor: PreProcessor):
+    global _worker_preprocessor  # pylint: disable=global-statement
+    _worker_preprocessor = preprocessor
+    # Load the sentence tokenizer once per process before the first document arrives
+    if preprocessor.split_by == "sentence" or preprocessor.split_respect_sentence_boundary:
+        preprocessor._get_sentence_tokenizer()
+
+
+def _process_single_in_worker(document: Union[dict, Document], **kwargs) -> List[Document]:
+    assert _worker_preprocessor is not None, "The preprocessor worker process was not initialized."
+    return _worker_preprocessor._process_single(document, **kwargs)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Dict, Union
+from typing import Any, List, Optional, Tuple, Dict, Union
 
 try:
     from typing import Literal
@@ -6,7 +6,7 @@ except ImportError:
     from typing_extensions import Literal  # type: ignore
 
 import logging
-import itertools
+from collections import OrderedDict
 from statistics import mean
 import torch
 import numpy as np
@@ -71,6 +71,8 @@ class TableReader(BaseReader):
         max_seq_len: int = 256,
         use_auth_token: Optional[Union[str, bool]] = None,
         devices: Optional[List[Union[str, torch.device]]] = None,
+        batch_size: int = 16,
+        table_cache_size: int = 1000,
     ):
         """
         Load a TableQA model from Transformers.
@@ -112,6 +114,10 @@ class TableReader(BaseReader):
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param batch_size: Number of query-table pairs the model processes in one forward pass. Pairs are sorted by
+                           their number of tokens, so each batch is only padded to its longest pair.
+        :param table_cache_size: Number of tokenized tables to keep in memory, keyed by Document id. Tables that
+                                 are retrieved for many queries are then only tokenized once.
         """
         super().__init__()
 
@@ -133,6 +139,8 @@ class TableReader(BaseReader):
                 tokenizer=tokenizer,
                 max_seq_len=max_seq_len,
                 use_auth_token=use_auth_token,
+                batch_size=batch_size,
+                table_cache_size=table_cache_size,
             )
         elif config.architectures[0] == "TapasForScoredQA":
             self.table_encoder = _TapasScoredEncoder(
@@ -144,6 +152,8 @@ class TableReader(BaseReader):
                 return_no_answer=return_no_answer,
                 max_seq_len=max_seq_len,
                 use_auth_token=use_auth_token,
+                batch_size=batch_size,
+                table_cache_size=table_cache_size,
             )
         else:
             logger.error(
@@ -156,6 +166,7 @@ class TableReader(BaseReader):
         self.top_k_per_candidate = top_k_per_candidate
         self.max_seq_len = max_seq_len
         self.return_no_answer = return_no_answer
+        self.batch_size = batch_size
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> Dict:
         """
@@ -205,7 +216,8 @@ class TableReader(BaseReader):
         :param documents: Single list of Documents or list of lists of Documents in which to search for the answers.
                           Documents should be of content_type ``'table'``.
         :param top_k: The maximum number of answers to return per query.
-        :param batch_size: Not applicable.
+        :param batch_size: Number of query-table pairs to process in one forward pass. If None, the `batch_size` set
+                           in the constructor is used.
         """
         if top_k is None:
             top_k = self.top_k
@@ -214,7 +226,7 @@ class TableReader(BaseReader):
 
         inputs = _flatten_inputs(queries, documents)
         results: Dict = self.table_encoder.predict_batch(
-            queries=inputs["queries"], documents=inputs["docs"], top_k=top_k
+            queries=inputs["queries"], documents=inputs["docs"], top_k=top_k, batch_size=batch_size
         )
 
         # Group answers by question in case of multiple queries and single doc list
@@ -238,6 +250,8 @@ class _TapasEncoder:
         tokenizer: Optional[str] = None,
         max_seq_len: int = 256,
         use_auth_token: Optional[Union[str, bool]] = None,
+        batch_size: int = 16,
+        table_cache_size: int = 1000,
     ):
         self.model = TapasForQuestionAnswering.from_pretrained(
             model_name_or_path, revision=model_version, use_auth_token=use_auth_token
@@ -252,6 +266,10 @@ class _TapasEncoder:
             )
         self.max_seq_len = max_seq_len
         self.device = device
+        self.batch_size = batch_size
+        self.table_cache = _TokenizedTableCache(tokenizer=self.tokenizer, max_size=table_cache_size)
+        # The pipeline is only used to turn the model outputs into Answers, the forward passes are batched by
+        # _TapasEncoder itself.
         self.pipeline = _TableQuestionAnsweringPipeline(
             task="table-question-answering",
             model=self.model,
@@ -262,40 +280,48 @@ class _TapasEncoder:
         )
 
     def predict(self, query: str, documents: List[Document], top_k: int) -> Dict:
-        table_documents = _check_documents(documents)
-        if len(table_documents) == 0:
-            return {"query": query, "answers": []}
-
-        # Create list of all data points
-        pipeline_inputs = []
-        for document in table_documents:
-            table: pd.DataFrame = document.content
-            pipeline_inputs.append({"query": query, "table": table.astype(str)})
-
-        # Run the pipeline
-        answers = self.pipeline(pipeline_inputs, sequential=False, padding=True, truncation=True)
-
-        # Unpack batched answers
-        if isinstance(answers[0], list):
-            answers = list(itertools.chain.from_iterable(answers))
-        for ans, doc in zip(answers, table_documents):
-            if ans is not None:
-                ans.document_ids = [doc.id]
-
-        # Remove no_answers from the answers list
-        answers = [ans for ans in answers if ans is not None]
-
-        answers = sorted(answers, reverse=True)
-        results = {"query": query, "answers": answers[:top_k]}
+        answers = self._predict_batched(queries=[query], documents=[documents], top_k=top_k)[0]
+        results = {"query": query, "answers": answers}
         return results
 
-    def predict_batch(self, queries: List[str], documents: List[List[Document]], top_k: int):
-        results: Dict = {"queries": queries, "answers": []}
-        for query, docs in zip(queries, documents):
-            preds = self.predict(query=query, documents=docs, top_k=top_k)
-            results["answers"].append(preds["answers"])
+    def predict_batch(
+        self, queries: List[str], documents: List[List[Document]], top_k: int, batch_size: Optional[int] = None
+    ):
+        answers = self._predict_batched(queries=queries, documents=documents, top_k=top_k, batch_size=batch_size)
+        results: Dict = {"queries": queries, "answers": answers}
         return results
 
+    def _predict_batched(
+        self, queries: List[str], documents: List[List[Document]], top_k: int, batch_size: Optional[int] = None
+    ) -> List[List[Answer]]:
+        encoded_inputs = _encode_query_table_pairs(
+            queries=queries, documents=documents, table_cache=self.table_cache, max_seq_len=self.max_seq_len
+        )
+
+        answers_per_query: List[List[Answer]] = [[] for _ in queries]
+        for batch_inputs, batch_items in _batch_encoded_inputs(
+            encoded_inputs, tokenizer=self.tokenizer, batch_size=batch_size or self.batch_size, device=self.device
+        ):
+            with torch.inference_mode():
+                outputs = self.model(**batch_inputs)
+
+            for row, (query_idx, document, string_table, seq_len) in enumerate(batch_items):
+                # Remove the padding again so that each table is postprocessed as if it was encoded on its own
+                model_inputs = {key: value[row : row + 1, :seq_len].cpu() for key, value in batch_inputs.items()}
+                model_outputs: Tuple = (outputs.logits[row : row + 1, :seq_len].cpu(),)
+                if self.pipeline.aggregate:
+                    model_outputs += (outputs.logits_aggregation[row : row + 1].cpu(),)
+                answer = self.pipeline.postprocess(
+                    {"model_inputs": model_inputs, "table": string_table, "outputs": model_outputs}
+                )[0]
+                # The model did not select any cell as answer
+                if answer is None:
+                    continue
+                answer.document_ids = [document.id]
+                answers_per_query[query_idx].append(answer)
+
+        return [sorted(answers, reverse=True)[:top_k] for answers in answers_per_query]
+
 
 class _TableQuestionAnsweringPipeline(TableQuestionAnsweringPipeline):
     """Modified from transformers TableQuestionAnsweringPipeline.postprocess to return Haystack Answer objects."""
@@ -445,6 +471,8 @@ class _TapasScoredEncoder:
         return_no_answer: bool = False,
         max_seq_len: int = 256,
         use_auth_token: Optional[Union[str, bool]] = None,
+        batch_size: int = 16,
+        table_cache_size: int = 1000,
     ):
         self.model = self._TapasForScoredQA.from_pretrained(
             model_name_or_path, revision=model_version, use_auth_token=use_auth_token
@@ -457,16 +485,26 @@ class _TapasScoredEncoder:
         self.device = device
         self.top_k_per_candidate = top_k_per_candidate
         self.return_no_answer = return_no_answer
+        self.batch_size = batch_size
+        self.table_cache = _TokenizedTableCache(tokenizer=self.tokenizer, max_size=table_cache_size)
 
-    def _predict_tapas_scored(self, inputs: BatchEncoding, document: Document) -> Tuple[List[Answer], float]:
-        orig_table: pd.DataFrame = document.content
-        string_table = orig_table.astype(str)
-
-        # Forward pass through model
-        with torch.inference_mode():
-            outputs = self.model.tapas(**inputs)
-            table_score = self.model.classifier(outputs.pooler_output)
+    def _predict_tapas_scored(
+        self,
+        token_type_ids: torch.Tensor,
+        sequence_output: torch.Tensor,
+        table_score: torch.Tensor,
+        document: Document,
+        string_table: pd.DataFrame,
+    ) -> Tuple[List[Answer], float]:
+        """
+        Extract the answers for a single query-table pair from the outputs of the batched forward pass.
 
+        :param token_type_ids: Unpadded token type ids of the pair, shape 1 x seq_len x 7.
+        :param sequence_output: Unpadded last hidden state of the pair, shape 1 x seq_len x hidden_size.
+        :param table_score: Output of the table scoring head for the pair, shape 1 x 2.
+        :param document: The Document containing the table.
+        :param string_table: The table of the Document converted to strings.
+        """
         # Get general table score
         table_score_softmax = torch.nn.functional.softmax(table_score, dim=1)
         table_relevancy_prob = table_score_softmax[0][1].item()
@@ -482,8 +520,8 @@ class _TapasScoredEncoder:
             "inv_column_ranks",
             "numeric_relations",
         ]
-        row_ids: List[int] = inputs.token_type_ids[:, :, token_types.index("row_ids")].tolist()[0]
-        column_ids: List[int] = inputs.token_type_ids[:, :, token_types.index("column_ids")].tolist()[0]
+        row_ids: List[int] = token_type_ids[:, :, token_types.index("row_ids")].tolist()[0]
+        column_ids: List[int] = token_type_ids[:, :, token_types.index("column_ids")].tolist()[0]
 
         possible_answer_spans: List[
             Tuple[int, int, int, int]
@@ -516,7 +554,6 @@ class _TapasScoredEncoder:
         )
 
         # Concat logits of start token and end token of possible answer spans
-        sequence_output = outputs.last_hidden_state
         concatenated_logits = []
         for possible_span in possible_answer_spans:
             start_token_logits = sequence_output[0, possible_span[2], :]
@@ -557,45 +594,63 @@ class _TapasScoredEncoder:
         return answers, no_answer_score
 
     def predict(self, query: str, documents: List[Document], top_k: int) -> Dict:
-        answers = []
-        no_answer_score = 1.0
-        table_documents = _check_documents(documents)
-        for document in table_documents:
-            table: pd.DataFrame = document.content
-            table = table.astype(str)
-            model_inputs = self.tokenizer(
-                table=table, queries=query, max_length=self.max_seq_len, return_tensors="pt", truncation=True
-            )
-            model_inputs.to(self.device)
-
-            current_answers, current_no_answer_score = self._predict_tapas_scored(model_inputs, document)
-            answers.extend(current_answers)
-            if current_no_answer_score < no_answer_score:
-                no_answer_score = current_no_answer_score
-
-        if self.return_no_answer:
-            answers.append(
-                Answer(
-                    answer="",
-                    type="extractive",
-                    score=no_answer_score,
-                    context=None,
-                    offsets_in_context=[Span(start=0, end=0)],
-                    offsets_in_document=[Span(start=0, end=0)],
-                    document_ids=None,
-                    meta=None,
-                )
-            )
+        answers = self._predict_batched(queries=[query], documents=[documents], top_k=top_k)[0]
+        results = {"query": query, "answers": answers}
+        return results
 
-        answers = sorted(answers, reverse=True)
-        results = {"query": query, "answers": answers[:top_k]}
+    def predict_batch(
+        self, queries: List[str], documents: List[List[Document]], top_k: int, batch_size: Optional[int] = None
+    ):
+        answers = self._predict_batched(queries=queries, documents=documents, top_k=top_k, batch_size=batch_size)
+        results: Dict = {"queries": queries, "answers": answers}
         return results
 
-    def predict_batch(self, queries: List[str], documents: List[List[Document]], top_k: int):
-        results: Dict = {"queries": queries, "answers": []}
-        for query, docs in zip(queries, documents):
-            preds = self.predict(query=query, documents=docs, top_k=top_k)
-            results["answers"].append(preds["answers"])
+    def _predict_batched(
+        self, queries: List[str], documents: List[List[Document]], top_k: int, batch_size: Optional[int] = None
+    ) -> List[List[Answer]]:
+        encoded_inputs = _encode_query_table_pairs(
+            queries=queries, documents=documents, table_cache=self.table_cache, max_seq_len=self.max_seq_len
+        )
+
+        answers_per_query: List[List[Answer]] = [[] for _ in queries]
+        no_answer_scores = [1.0 for _ in queries]
+        for batch_inputs, batch_items in _batch_encoded_inputs(
+            encoded_inputs, tokenizer=self.tokenizer, batch_size=batch_size or self.batch_size, device=self.device
+        ):
+            # Forward pass through model
+            with torch.inference_mode():
+                outputs = self.model.tapas(**batch_inputs)
+                table_scores = self.model.classifier(outputs.pooler_output)
+
+            for row, (query_idx, document, string_table, seq_len) in enumerate(batch_items):
+                # Remove the padding again, otherwise the span of the last cell would include the padding tokens
+                with torch.inference_mode():
+                    current_answers, current_no_answer_score = self._predict_tapas_scored(
+                        token_type_ids=batch_inputs["token_type_ids"][row : row + 1, :seq_len],
+                        sequence_output=outputs.last_hidden_state[row : row + 1, :seq_len],
+                        table_score=table_scores[row : row + 1],
+                        document=document,
+                        string_table=string_table,
+                    )
+                answers_per_query[query_idx].extend(current_answers)
+                no_answer_scores[query_idx] = min(no_answer_scores[query_idx], current_no_answer_score)
+
+        results = []
+        for answers, no_answer_score in zip(answers_per_query, no_answer_scores):
+            if self.return_no_answer:
+                answers.append(
+                    Answer(
+                        answer="",
+                        type="extractive",
+                        score=no_answer_score,
+                        context=None,
+                        offsets_in_context=[Span(start=0, end=0)],
+                        offsets_in_document=[Span(start=0, end=0)],
+                        document_ids=None,
+                        meta=None,
+                    )
+                )
+            results.append(sorted(answers, reverse=True)[:top_k])
         return results
 
     class _TapasForScoredQA(TapasPreTrainedModel):
@@ -649,6 +704,7 @@ class RCIReader(BaseReader):
         top_k: int = 10,
         max_seq_len: int = 256,
         use_auth_token: Optional[Union[str, bool]] = None,
+        batch_size: int = 32,
     ):
         """
         Load an RCI model from Transformers.
@@ -677,6 +733,8 @@ class RCIReader(BaseReader):
                                 `transformers-cli login` (stored in ~/.huggingface) will be used.
                                 Additional information can be found here
                                 https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
+        :param batch_size: Number of row (or column) representations the row (or column) model scores in one forward
+                           pass. Rows and columns of all candidate tables are scored together.
         """
         super().__init__()
 
@@ -721,6 +779,7 @@ class RCIReader(BaseReader):
 
         self.top_k = top_k
         self.max_seq_len = max_seq_len
+        self.batch_size = batch_size
         self.return_no_answers = False
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> Dict:
@@ -741,77 +800,125 @@ class RCIReader(BaseReader):
         if top_k is None:
             top_k = self.top_k
 
-        answers = []
-        table_documents = _check_documents(documents)
-        for document in table_documents:
-            # Create row and column representations
-            table: pd.DataFrame = document.content
-            string_table = table.astype(str)
-            row_reps, column_reps = self._create_row_column_representations(string_table)
-
-            # Get row logits
-            row_inputs = self.row_tokenizer(
-                [(query, row_rep) for row_rep in row_reps],
-                max_length=self.max_seq_len,
-                return_tensors="pt",
-                add_special_tokens=True,
-                truncation=True,
-                padding=True,
-            )
-            row_inputs.to(self.devices[0])
-            with torch.inference_mode():
-                row_outputs = self.row_model(**row_inputs)
-            row_logits = row_outputs[0].detach().cpu().numpy()[:, 1]
+        answers = self._predict_batched(queries=[query], documents=[documents], top_k=top_k)[0]
+        results = {"query": query, "answers": answers}
 
-            # Get column logits
-            column_inputs = self.column_tokenizer(
-                [(query, column_rep) for column_rep in column_reps],
-                max_length=self.max_seq_len,
-                return_tensors="pt",
-                add_special_tokens=True,
-                truncation=True,
-                padding=True,
-            )
-            column_inputs.to(self.devices[0])
-            with torch.inference_mode():
-                column_outputs = self.column_model(**column_inputs)
-            column_logits = column_outputs[0].detach().cpu().numpy()[:, 1]
-
-            # Calculate cell scores
-            current_answers: List[Answer] = []
-            cell_scores_table: List[List[float]] = []
-            for row_idx, row_score in enumerate(row_logits):
-                cell_scores_table.append([])
-                for col_idx, col_score in enumerate(column_logits):
-                    current_cell_score = float(row_score + col_score)
-                    cell_scores_table[-1].append(current_cell_score)
-
-                    answer_str = string_table.iloc[row_idx, col_idx]
-                    answer_offsets = self._calculate_answer_offsets(row_idx, col_idx, string_table)
-                    current_answers.append(
-                        Answer(
-                            answer=answer_str,
-                            type="extractive",
-                            score=current_cell_score,
-                            context=string_table,
-                            offsets_in_document=[answer_offsets],
-                            offsets_in_context=[answer_offsets],
-                            document_ids=[document.id],
-                        )
+        return results
+
+    def _predict_batched(
+        self, queries: List[str], documents: List[List[Document]], top_k: int, batch_size: Optional[int] = None
+    ) -> List[List[Answer]]:
+        """
+        Find answers for each query in its corresponding list of Documents.
+
+        The rows of all candidate tables of all queries are scored with a few large padded batches of the row model,
+        and the columns likewise with the column model. The score of each cell is the sum of its row score and its
+        column score, and the top_k cells per query are selected across all its tables at once.
+
+        :param queries: List of query strings.
+        :param documents: One list of Documents per query.
+        :param top_k: The maximum number of answers to return per query.
+        :param batch_size: Number of row or column representations scored in one forward pass.
+        """
+        batch_size = batch_size or self.batch_size
+
+        tables_per_query = []
+        row_pairs: List[Tuple[str, str]] = []
+        column_pairs: List[Tuple[str, str]] = []
+        for query, docs in zip(queries, documents):
+            tables = []
+            for document in _check_documents(docs):
+                # Create row and column representations
+                string_table = document.content.astype(str)
+                row_reps, column_reps = self._create_row_column_representations(string_table)
+                tables.append((document, string_table, len(row_pairs), len(column_pairs)))
+                row_pairs.extend((query, row_rep) for row_rep in row_reps)
+                column_pairs.extend((query, column_rep) for column_rep in column_reps)
+            tables_per_query.append(tables)
+
+        row_logits = self._score_representations(self.row_model, self.row_tokenizer, row_pairs, batch_size)
+        column_logits = self._score_representations(
+            self.column_model, self.column_tokenizer, column_pairs, batch_size
+        )
+
+        answers_per_query = []
+        for tables in tables_per_query:
+            if not tables:
+                answers_per_query.append([])
+                continue
+
+            # Calculate cell scores as the outer sum of row and column scores
+            cell_scores_per_table = []
+            for _, string_table, row_offset, column_offset in tables:
+                n_rows, n_columns = string_table.shape
+                cell_scores_per_table.append(
+                    np.add.outer(
+                        row_logits[row_offset : row_offset + n_rows],
+                        column_logits[column_offset : column_offset + n_columns],
                     )
+                )
+
+            # Select the top_k cells across all tables
+            all_cell_scores = np.concatenate([cell_scores.ravel() for cell_scores in cell_scores_per_table])
+            if all_cell_scores.size == 0:
+                # All tables are empty, so there are no cells to select
+                answers_per_query.append([])
+                continue
+            table_offsets = np.cumsum([0] + [cell_scores.size for cell_scores in cell_scores_per_table])
+            num_answers = min(top_k, len(all_cell_scores))
+            top_cells = np.argpartition(-all_cell_scores, max(num_answers - 1, 0))[:num_answers]
+            top_cells = top_cells[np.argsort(-all_cell_scores[top_cells], kind="stable")]
 
             # Add cell scores to Answers' meta to be able to use as heatmap
-            for answer in current_answers:
-                answer.meta = {"table_scores": cell_scores_table}
-            answers.extend(current_answers)
+            table_scores_meta = [cell_scores.tolist() for cell_scores in cell_scores_per_table]
+            answers = []
+            for cell in top_cells:
+                table_idx = int(np.searchsorted(table_offsets, cell, side="right") - 1)
+                document, string_table, _, _ = tables[table_idx]
+                row_idx, col_idx = divmod(int(cell - table_offsets[table_idx]), string_table.shape[1])
+                answer_offsets = self._calculate_answer_offsets(row_idx, col_idx, string_table)
+                answers.append(
+                    Answer(
+                        answer=string_table.iloc[row_idx, col_idx],
+                        type="extractive",
+                        score=float(all_cell_scores[cell]),
+                        context=string_table,
+                        offsets_in_document=[answer_offsets],
+                        offsets_in_context=[answer_offsets],
+                        document_ids=[document.id],
+                        meta={"table_scores": table_scores_meta[table_idx]},
+                    )
+                )
+            answers_per_query.append(answers)
 
-        # Sort answers by score and select top-k answers
-        answers = sorted(answers, reverse=True)
-        answers = answers[:top_k]
+        return answers_per_query
 
-        results = {"query": query, "answers": answers}
+    def _score_representations(
+        self, model, tokenizer, pairs: List[Tuple[str, str]], batch_size: int
+    ) -> np.ndarray:
+        """
+        Score (query, row/column representation) pairs with the given model in batches of similar sequence length,
+        so each batch only needs to be padded to its longest sequence.
 
-        return results
+        :return: The relevance logit of each pair in the order of `pairs`.
+        """
+        logits = np.zeros(len(pairs), dtype=np.float32)
+        if not pairs:
+            return logits
+
+        encodings = tokenizer(pairs, max_length=self.max_seq_len, add_special_tokens=True, truncation=True)
+        order = np.argsort([len(input_ids) for input_ids in encodings["input_ids"]], kind="stable")
+        for batch_start in range(0, len(order), batch_size):
+            batch_indices = order[batch_start : batch_start + batch_size]
+            batch_inputs = tokenizer.pad(
+                [{key: values[idx] for key, values in encodings.items()} for idx in batch_indices],
+                return_tensors="pt",
+            )
+            batch_inputs.to(self.devices[0])
+            with torch.inference_mode():
+                outputs = model(**batch_inputs)
+            logits[batch_indices] = outputs[0].detach().cpu().numpy()[:, 1]
+        return logits
 
     @staticmethod
     def _create_row_column_representations(table: pd.DataFrame) -> Tuple[List[str], List[str]]:
@@ -852,9 +959,9 @@ class RCIReader(BaseReader):
         inputs = _flatten_inputs(queries, documents)
 
         results: Dict[str, List] = {"queries": inputs["queries"], "answers": []}
-        for query, docs in zip(inputs["queries"], inputs["docs"]):
-            preds = self.predict(query=query, documents=docs, top_k=top_k)
-            results["answers"].append(preds["answers"])
+        results["answers"] = self._predict_batched(
+            queries=inputs["queries"], documents=inputs["docs"], top_k=top_k, batch_size=batch_size
+        )
 
         # Group answers by question in case of multiple queries and single doc list
         if single_doc_list and len(queries) > 1:
@@ -868,6 +975,115 @@ class RCIReader(BaseReader):
         return results
 
 
+class _TokenizedTableCache:
+    """
+    LRU cache of tables converted to strings and tokenized by a TapasTokenizer, keyed by Document id.
+
+    Reusing the tokenized tables relies on private TapasTokenizer methods. If the installed transformers version
+    doesn't provide them, the cache falls back to encoding each query-table pair with the public tokenizer call and
+    only caches the string tables.
+
+    :param tokenizer: The TapasTokenizer used to tokenize the tables.
+    :param max_size: Maximum number of tables to keep in the cache.
+    """
+
+    def __init__(self, tokenizer: TapasTokenizer, max_size: int = 1000):
+        self.tokenizer = tokenizer
+        self.max_size = max_size
+        self._cache: "OrderedDict[str, Tuple[pd.DataFrame, Any]]" = OrderedDict()
+        self._reuse_tokenized_tables = all(
+            hasattr(tokenizer, name) for name in ("_tokenize_table", "_get_question_tokens", "prepare_for_model")
+        )
+
+    def get(self, document: Document) -> Tuple[pd.DataFrame, Any]:
+        """
+        Get the string table and the tokenized table of a Document, tokenizing the table only on a cache miss.
+        The tokenized table is None if the tokenizer doesn't support reusing tokenized tables.
+        """
+        if document.id in self._cache:
+            self._cache.move_to_end(document.id)
+            return self._cache[document.id]
+
+        table: pd.DataFrame = document.content
+        string_table = table.astype(str)
+        tokenized_table = self.tokenizer._tokenize_table(string_table) if self._reuse_tokenized_tables else None
+        entry = (string_table, tokenized_table)
+        if self.max_size > 0:
+            self._cache[document.id] = entry
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return entry
+
+    def encode(self, query: str, document: Document, max_seq_len: int) -> Tuple[pd.DataFrame, BatchEncoding]:
+        """
+        Encode a query-table pair without padding, reusing the cached tokenization of the table.
+        """
+        if self._reuse_tokenized_tables:
+            try:
+                string_table, tokenized_table = self.get(document)
+                query, query_tokens = self.tokenizer._get_question_tokens(query)
+                encoding = self.tokenizer.prepare_for_model(
+                    string_table,
+                    query,
+                    tokenized_table=tokenized_table,
+                    query_tokens=query_tokens,
+                    max_length=max_seq_len,
+                    truncation=True,
+                )
+                return string_table, encoding
+            except (AttributeError, TypeError) as e:
+                logger.warning(
+                    "Can't reuse tokenized tables with this version of TapasTokenizer, tokenizing each query-table "
+                    "pair from scratch instead: %s",
+                    e,
+                )
+                self._reuse_tokenized_tables = False
+                self._cache.clear()
+
+        string_table, _ = self.get(document)
+        encoding = self.tokenizer(table=string_table, queries=query, max_length=max_seq_len, truncation=True)
+        return string_table, encoding
+
+
+def _encode_query_table_pairs(
+    queries: List[str], documents: List[List[Document]], table_cache: _TokenizedTableCache, max_seq_len: int
+) -> List[Tuple[int, Document, pd.DataFrame, BatchEncoding]]:
+    """
+    Encode each query with each table Document in its corresponding list of Documents.
+
+    :return: List of (query index, Document, string table, encoding) tuples.
+    """
+    encoded_inputs = []
+    for query_idx, (query, docs) in enumerate(zip(queries, documents)):
+        for document in _check_documents(docs):
+            string_table, encoding = table_cache.encode(query, document, max_seq_len=max_seq_len)
+            encoded_inputs.append((query_idx, document, string_table, encoding))
+    return encoded_inputs
+
+
+def _batch_encoded_inputs(
+    encoded_inputs: List[Tuple[int, Document, pd.DataFrame, BatchEncoding]],
+    tokenizer: TapasTokenizer,
+    batch_size: int,
+    device: torch.device,
+):
+    """
+    Group the encoded query-table pairs into batches of similar length and pad each batch to its longest pair.
+
+    :return: Generator of (padded model inputs, list of (query index, Document, string table, sequence length)).
+    """
+    order = sorted(range(len(encoded_inputs)), key=lambda idx: len(encoded_inputs[idx][3]["input_ids"]))
+    for batch_start in range(0, len(order), batch_size):
+        batch_indices = order[batch_start : batch_start + batch_size]
+        batch_inputs = tokenizer.pad([encoded_inputs[idx][3] for idx in batch_indices], return_tensors="pt")
+        batch_inputs.to(device)
+        batch_items = [
+            (query_idx, document, string_table, len(encoding["input_ids"]))
+            for query_idx, document, string_table, encoding in (encoded_inputs[idx] for idx in batch_indices)
+        ]
+        yield batch_inputs, batch_items
+
+
 def _calculate_answer_offsets(answer_coordinates: List[Tuple[int, int]], table: pd.DataFrame) -> List[Span]:
     """
     Calculates the answer cell offsets of the linearized table based on the answer cell coordinates.
@@ -1,12 +1,36 @@
-from haystack.nodes.retriever.base import BaseRetriever
-from haystack.nodes.retriever.dense import (
-    DensePassageRetriever,
-    DenseRetriever,
-    EmbeddingRetriever,
-    MultihopEmbeddingRetriever,
-    TableTextRetriever,
-)
-from haystack.nodes.retriever.multimodal import MultiModalRetriever
-from haystack.nodes.retriever.sparse import BM25Retriever, FilterRetriever, TfidfRetriever
-from haystack.nodes.retriever.text2sparql import Text2SparqlRetriever
-from haystack.nodes.retriever.web import WebRetriever
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+from haystack.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from haystack.nodes.retriever.base import BaseRetriever
+    from haystack.nodes.retriever.dense import (
+        DensePassageRetriever,
+        DenseRetriever,
+        EmbeddingRetriever,
+        MultihopEmbeddingRetriever,
+        TableTextRetriever,
+    )
+    from haystack.nodes.retriever.multimodal import MultiModalRetriever
+    from haystack.nodes.retriever.sparse import BM25Retriever, FilterRetriever, TfidfRetriever
+    from haystack.nodes.retriever.text2sparql import Text2SparqlRetriever
+    from haystack.nodes.retriever.web import WebRetriever
+
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "BaseRetriever": "haystack.nodes.retriever.base",
+    "DensePassageRetriever": "haystack.nodes.retriever.dense",
+    "DenseRetriever": "haystack.nodes.retriever.dense",
+    "EmbeddingRetriever": "haystack.nodes.retriever.dense",
+    "MultihopEmbeddingRetriever": "haystack.nodes.retriever.dense",
+    "TableTextRetriever": "haystack.nodes.retriever.dense",
+    "MultiModalRetriever": "haystack.nodes.retriever.multimodal",
+    "BM25Retriever": "haystack.nodes.retriever.sparse",
+    "FilterRetriever": "haystack.nodes.retriever.sparse",
+    "TfidfRetriever": "haystack.nodes.retriever.sparse",
+    "Text2SparqlRetriever": "haystack.nodes.retriever.text2sparql",
+    "WebRetriever": "haystack.nodes.retriever.web",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,12 +1,13 @@
 import logging
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from multiprocessing import cpu_count
-from typing import Any, Dict, Iterator, List, Optional, Literal, Union
+from typing import Any, Dict, List, Optional, Literal, Union
 from unicodedata import combining, normalize
 
 import requests
+from requests.adapters import HTTPAdapter
 from boilerpy3 import extractors
 
 from haystack import Document, __version__
@@ -65,6 +66,8 @@ class WebRetriever(BaseRetriever):
         cache_index: Optional[str] = None,
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: int = 1 * 24 * 60 * 60,
+        max_workers: int = 10,
+        pool_maxsize: int = 10,
     ):
         """
         :param top_k: Top k documents to be returned by the retriever.
@@ -74,6 +77,9 @@ class WebRetriever(BaseRetriever):
         :param cache_index: Index name to be used to cache search results.
         :param cache_headers: Headers to be used to cache search results.
         :param cache_time: Time in seconds to cache search results. Defaults to 24 hours.
+        :param max_workers: Maximum number of web searches and page downloads running concurrently, shared by all
+                            queries of a batch. Defaults to 10.
+        :param pool_maxsize: Maximum number of connections kept open and reused per host. Defaults to 10.
         """
         super().__init__()
         self.web_search = WebSearch(
@@ -85,6 +91,11 @@ class WebRetriever(BaseRetriever):
         self.cache_headers = cache_headers
         self.cache_time = cache_time
         self.top_k = top_k
+        self.max_workers = max_workers
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         if preprocessor is not None:
             self.preprocessor = preprocessor
         else:
@@ -101,14 +112,30 @@ class WebRetriever(BaseRetriever):
         cache_time: Optional[int] = None,
     ) -> List[Document]:
         """Check documents retrieved based on the query in cache."""
+        return self._check_cache_batch(
+            [query], cache_index=cache_index, cache_headers=cache_headers, cache_time=cache_time
+        )[query]
 
-        cache_document_store = self.cache_document_store
+    def _check_cache_batch(
+        self,
+        queries: List[str],
+        cache_document_store: Optional[BaseDocumentStore] = None,
+        cache_index: Optional[str] = None,
+        cache_headers: Optional[Dict[str, str]] = None,
+        cache_time: Optional[int] = None,
+    ) -> Dict[str, List[Document]]:
+        """
+        Check the cache for documents retrieved for any of the given queries using a single DocumentStore lookup.
 
-        documents = []
+        :return: A dictionary mapping each query, as given, to its cached documents. The cache is looked up by the
+                 normalized queries.
+        """
+        cache_document_store = cache_document_store or self.cache_document_store
+        queries_norm = [self._normalize_query(query) for query in queries]
+        cached_docs: Dict[str, List[Document]] = {query: [] for query in queries}
 
-        if cache_document_store is not None:
-            query_norm = self._normalize_query(query)
-            cache_filter: FilterType = {"$and": {"search.query": query_norm}}
+        if cache_document_store is not None and queries_norm:
+            cache_filter: FilterType = {"search.query": {"$in": list(set(queries_norm))}}
 
             if cache_time is not None and cache_time > 0:
                 cache_filter["timestamp"] = {
@@ -119,10 +146,15 @@ class WebRetriever(BaseRetriever):
             documents = cache_document_store.get_all_documents(
                 filters=cache_filter, index=cache_index, headers=cache_headers, return_embedding=False
             )
+            docs_by_query: Dict[str, List[Document]] = defaultdict(list)
+            for doc in documents:
+                docs_by_query[doc.meta.get("search.query")].append(doc)
+            for query, query_norm in zip(queries, queries_norm):
+                cached_docs[query] = docs_by_query.get(query_norm, [])
 
-        logger.debug("Found %d documents in cache", len(documents))
+            logger.debug("Found %d documents in cache for %d queries", len(documents), len(queries))
 
-        return documents
+        return cached_docs
 
     def _save_cache(
         self,
@@ -132,7 +164,23 @@ class WebRetriever(BaseRetriever):
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: Optional[int] = None,
     ) -> bool:
-        cache_document_store = self.cache_document_store
+        return self._save_cache_batch(
+            [query], documents, cache_index=cache_index, cache_headers=cache_headers, cache_time=cache_time
+        )
+
+    def _save_cache_batch(
+        self,
+        queries: List[str],
+        documents: List[Document],
+        cache_document_store: Optional[BaseDocumentStore] = None,
+        cache_index: Optional[str] = None,
+        cache_headers: Optional[Dict[str, str]] = None,
+        cache_time: Optional[int] = None,
+    ) -> bool:
+        """
+        Write the documents retrieved for all given (normalized) queries to the cache in a single call.
+        """
+        cache_document_store = cache_document_store or self.cache_document_store
 
         if cache_document_store is not None:
             cache_document_store.write_documents(
@@ -141,11 +189,10 @@ class WebRetriever(BaseRetriever):
 
             logger.debug("Saved %d documents in the cache", len(documents))
 
-            cache_filter: FilterType = {"$and": {"search.query": query}}
-
             if cache_time is not None and cache_time > 0:
-                cache_filter["timestamp"] = {
-                    "$lt": int((datetime.utcnow() - timedelta(seconds=cache_time)).timestamp())
+                cache_filter: FilterType = {
+                    "search.query": {"$in": list(set(queries))},
+                    "timestamp": {"$lt": int((datetime.utcnow() - timedelta(seconds=cache_time)).timestamp())},
                 }
 
                 cache_document_store.delete_documents(index=cache_index, headers=cache_headers, filters=cache_filter)
@@ -156,6 +203,29 @@ class WebRetriever(BaseRetriever):
 
         return False
 
+    def _scrape_direct(self, link: SearchResult) -> Dict[str, Any]:
+        """
+        Download a single URL using the shared connection pool and extract its main text content.
+        """
+        extractor = extractors.ArticleExtractor(raise_on_failure=False)
+        try:
+            extracted_doc = {}
+            response = self._session.get(link.url, headers=self._request_headers(), timeout=10)
+            if response.status_code == 200 and len(response.text) > 0:
+                extracted_content = extractor.get_content(response.text)
+                if extracted_content:
+                    extracted_doc = {
+                        "text": extracted_content,
+                        "url": link.url,
+                        "search.score": link.score,
+                        "search.position": link.position,
+                    }
+            return extracted_doc
+
+        except Exception as e:
+            logger.error("Error retrieving URL %s: %s", link.url, e)
+            return {}
+
     def retrieve(  # type: ignore[override]
         self,
         query: str,
@@ -179,7 +249,41 @@ class WebRetriever(BaseRetriever):
         :param cache_headers: The headers to save the documents to.
         :param cache_time: The time limit in seconds to check the cache. The default is 24 hours.
         """
+        return self.retrieve_batch(
+            queries=[query],
+            top_k=top_k,
+            preprocessor=preprocessor,
+            cache_document_store=cache_document_store,
+            cache_index=cache_index,
+            cache_headers=cache_headers,
+            cache_time=cache_time,
+        )[0]
 
+    def retrieve_batch(  # type: ignore[override]
+        self,
+        queries: List[str],
+        top_p: Optional[int] = None,
+        top_k: Optional[int] = None,
+        preprocessor: Optional[PreProcessor] = None,
+        cache_document_store: Optional[BaseDocumentStore] = None,
+        cache_index: Optional[str] = None,
+        cache_headers: Optional[Dict[str, str]] = None,
+        cache_time: Optional[int] = None,
+    ) -> List[List[Document]]:
+        """
+        Retrieve documents for a list of queries. The cache is checked for all queries with a single DocumentStore
+        lookup. Web searches for the remaining queries and the downloads of all their result pages run concurrently
+        in one thread pool bounded by `max_workers`, reusing pooled connections to each host.
+
+        :param queries: The query strings.
+        :param top_k: The number of documents to be returned per query. If None, the default value is used.
+        :param preprocessor: The PreProcessor to be used to split documents into paragraphs.
+        :param cache_document_store: The DocumentStore to cache the documents to.
+        :param cache_index: The index name to save the documents to.
+        :param cache_headers: The headers to save the documents to.
+        :param cache_time: The time limit in seconds to check the cache. The default is 24 hours.
+        :return: One list of Documents per query.
+        """
         preprocessor = preprocessor or self.preprocessor
         cache_document_store = cache_document_store or self.cache_document_store
         cache_index = cache_index or self.cache_index
@@ -187,117 +291,93 @@ class WebRetriever(BaseRetriever):
         cache_time = cache_time or self.cache_time
         top_k = top_k or self.top_k
 
-        query_norm = self._normalize_query(query)
+        if not queries:
+            return []
 
-        extracted_docs = self._check_cache(
-            query_norm, cache_index=cache_index, cache_headers=cache_headers, cache_time=cache_time
+        queries_norm = [self._normalize_query(query) for query in queries]
+        cached_docs = self._check_cache_batch(
+            queries,
+            cache_document_store=cache_document_store,
+            cache_index=cache_index,
+            cache_headers=cache_headers,
+            cache_time=cache_time,
         )
-
+        extracted_docs: List[List[Document]] = [list(cached_docs[query]) for query in queries]
         # cache miss
-        if not extracted_docs:
-            search_results, _ = self.web_search.run(query=query)
-            search_results = search_results["documents"]
+        missed = [i for i, docs in enumerate(extracted_docs) if not docs]
+        snippet_only = set()
+
+        if missed:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missed))) as executor:
+                search_outputs = list(executor.map(lambda i: self.web_search.run(query=queries[i])[0], missed))
+
             if self.mode == "snippets":
-                return search_results  # type: ignore
-
-            links: List[SearchResult] = [
-                SearchResult(r.meta["link"], r.meta.get("score", None), r.meta.get("position", None))
-                for r in search_results
-                if r.meta.get("link")
-            ]
-            logger.debug("Starting to fetch %d links from WebSearch results", len(links))
-
-            def scrape_direct(link: SearchResult) -> Dict[str, Any]:
-                extractor = extractors.ArticleExtractor(raise_on_failure=False)
-                try:
-                    extracted_doc = {}
-                    response = requests.get(link.url, headers=self._request_headers(), timeout=10)
-                    if response.status_code == 200 and len(response.text) > 0:
-                        extracted_content = extractor.get_content(response.text)
-                        if extracted_content:
-                            extracted_doc = {
-                                "text": extracted_content,
-                                "url": link.url,
-                                "search.score": link.score,
-                                "search.position": link.position,
-                            }
-                    return extracted_doc
-
-                except Exception as e:
-                    logger.error("Error retrieving URL %s: %s", link.url, e)
-                    return {}
-
-            thread_count = cpu_count() if len(links) > cpu_count() else len(links)
-            with ThreadPoolExecutor(max_workers=thread_count) as executor:
-                scraped_pages: Iterator[Dict[str, Any]] = executor.map(scrape_direct, links)
+                for i, search_output in zip(missed, search_outputs):
+                    extracted_docs[i] = search_output["documents"]
+                snippet_only.update(missed)
+            else:
+                # pair each link with its own search result so that the scraped pages of all queries can be fetched
+                # in one shared, bounded thread pool
+                jobs = [
+                    (i, result, SearchResult(result.meta["link"], result.meta.get("score"), result.meta.get("position")))
+                    for i, search_output in zip(missed, search_outputs)
+                    for result in search_output["documents"]
+                    if result.meta.get("link")
+                ]
+                logger.debug("Starting to fetch %d links from WebSearch results of %d queries", len(jobs), len(missed))
+
+                scraped_pages: List[Dict[str, Any]] = []
+                if jobs:
+                    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                        scraped_pages = list(executor.map(self._scrape_direct, [link for _, _, link in jobs]))
 
                 failed = 0
-                extracted_docs = []
-                for scraped_page, search_result_doc in zip(scraped_pages, search_results):
+                for (i, search_result_doc, _), scraped_page in zip(jobs, scraped_pages):
                     if scraped_page and "text" in scraped_page:
-                        document = self._document_from_scraped_page(search_result_doc, scraped_page, query_norm)
-                        extracted_docs.append(document)
+                        document = self._document_from_scraped_page(
+                            search_result_doc, scraped_page, queries_norm[i]
+                        )
                     else:
                         logger.debug(
                             "Could not extract text from URL %s. Using search snippet.", search_result_doc.meta["link"]
                         )
-                        snippet_doc = self._document_from_snippet(search_result_doc, query_norm)
-                        extracted_docs.append(snippet_doc)
+                        document = self._document_from_snippet(search_result_doc, queries_norm[i])
                         failed += 1
+                    extracted_docs[i].append(document)
 
                 logger.debug(
-                    "Extracted %d documents / %s snippets from %s URLs.",
-                    len(extracted_docs) - failed,
-                    failed,
-                    len(links),
+                    "Extracted %d documents / %s snippets from %s URLs.", len(jobs) - failed, failed, len(jobs)
                 )
 
         if cache_document_store:
-            cached = self._save_cache(query_norm, extracted_docs, cache_index=cache_index, cache_headers=cache_headers)
+            to_cache = [i for i in range(len(queries)) if i not in snippet_only]
+            cached = self._save_cache_batch(
+                [queries_norm[i] for i in to_cache],
+                [doc for i in to_cache for doc in extracted_docs[i]],
+                cache_document_store=cache_document_store,
+                cache_index=cache_index,
+                cache_headers=cache_headers,
+            )
             if not cached:
                 logger.warning(
                     "Could not save retrieved documents to the DocumentStore cache. "
                     "Check your document store configuration."
                 )
 
-        processed_docs = (
-            [t for d in extracted_docs for t in preprocessor.process([d])]
-            if self.mode == "preprocessed_documents"
-            else extracted_docs
-        )
-
-        logger.debug("Processed %d documents resulting in %s documents", len(extracted_docs), len(processed_docs))
-        return processed_docs[:top_k]
-
-    def retrieve_batch(  # type: ignore[override]
-        self,
-        queries: List[str],
-        top_p: Optional[int] = None,
-        top_k: Optional[int] = None,
-        preprocessor: Optional[PreProcessor] = None,
-        cache_document_store: Optional[BaseDocumentStore] = None,
-        cache_index: Optional[str] = None,
-        cache_headers: Optional[Dict[str, str]] = None,
-        cache_time: Optional[int] = None,
-    ) -> List[List[Document]]:
-        documents = []
-
-        # TODO: parallelize using ProcessPoolExecutor and use Lock at document store methods
-        for q in queries:
-            documents.extend(
-                self.retrieve(
-                    q,
-                    top_p=top_p,
-                    top_k=top_k,
-                    preprocessor=preprocessor,
-                    cache_document_store=cache_document_store,
-                    cache_index=cache_index,
-                    cache_headers=cache_headers,
-                    cache_time=cache_time,
-                )
+        results = []
+        for i, docs in enumerate(extracted_docs):
+            if i in snippet_only:
+                results.append(docs)
+                continue
+            processed_docs = (
+                [t for d in docs for t in preprocessor.process([d])]
+                if self.mode == "preprocessed_documents"
+                else docs
             )
+            logger.debug("Processed %d documents resulting in %s documents", len(docs), len(processed_docs))
+            results.append(processed_docs[:top_k])
 
-        return [documents]
+        return results
 
     def _request_headers(self):
         headers = {
@@ -1,17 +1,45 @@
-from haystack.pipelines.base import Pipeline, RootNode
-from haystack.pipelines.ray import RayPipeline
-from haystack.pipelines.standard_pipelines import (
-    BaseStandardPipeline,
-    DocumentSearchPipeline,
-    QuestionGenerationPipeline,
-    TranslationWrapperPipeline,
-    SearchSummarizationPipeline,
-    MostSimilarDocumentsPipeline,
-    QuestionAnswerGenerationPipeline,
-    RetrieverQuestionGenerationPipeline,
-    GenerativeQAPipeline,
-    ExtractiveQAPipeline,
-    FAQPipeline,
-    TextIndexingPipeline,
-    WebQAPipeline,
-)
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+from haystack.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from haystack.pipelines.base import Pipeline, RootNode
+    from haystack.pipelines.ray import RayPipeline
+    from haystack.pipelines.standard_pipelines import (
+        BaseStandardPipeline,
+        DocumentSearchPipeline,
+        QuestionGenerationPipeline,
+        TranslationWrapperPipeline,
+        SearchSummarizationPipeline,
+        MostSimilarDocumentsPipeline,
+        QuestionAnswerGenerationPipeline,
+        RetrieverQuestionGenerationPipeline,
+        GenerativeQAPipeline,
+        ExtractiveQAPipeline,
+        FAQPipeline,
+        TextIndexingPipeline,
+        WebQAPipeline,
+    )
+
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "Pipeline": "haystack.pipelines.base",
+    "RootNode": "haystack.pipelines.base",
+    "RayPipeline": "haystack.pipelines.ray",
+    "BaseStandardPipeline": "haystack.pipelines.standard_pipelines",
+    "DocumentSearchPipeline": "haystack.pipelines.standard_pipelines",
+    "QuestionGenerationPipeline": "haystack.pipelines.standard_pipelines",
+    "TranslationWrapperPipeline": "haystack.pipelines.standard_pipelines",
+    "SearchSummarizationPipeline": "haystack.pipelines.standard_pipelines",
+    "MostSimilarDocumentsPipeline": "haystack.pipelines.standard_pipelines",
+    "QuestionAnswerGenerationPipeline": "haystack.pipelines.standard_pipelines",
+    "RetrieverQuestionGenerationPipeline": "haystack.pipelines.standard_pipelines",
+    "GenerativeQAPipeline": "haystack.pipelines.standard_pipelines",
+    "ExtractiveQAPipeline": "haystack.pipelines.standard_pipelines",
+    "FAQPipeline": "haystack.pipelines.standard_pipelines",
+    "TextIndexingPipeline": "haystack.pipelines.standard_pipelines",
+    "WebQAPipeline": "haystack.pipelines.standard_pipelines",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
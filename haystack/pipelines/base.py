@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import itertools
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from functools import partial
 from hashlib import md5
-from time import time
-from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from time import perf_counter, time
+from typing import Deque, Dict, Generator, List, Optional, Any, Set, Tuple, Union
 
 try:
     from typing import Literal
@@ -17,8 +19,11 @@ import copy
 import json
 import inspect
 import logging
+import os
 import tempfile
+import threading
 from pathlib import Path
+from queue import Queue
 
 import yaml
 import numpy as np
@@ -30,7 +35,6 @@ from networkx import DiGraph
 from networkx.drawing.nx_agraph import to_agraph
 
 from haystack import __version__
-from haystack.modeling.evaluation.metrics import semantic_answer_similarity
 from haystack.modeling.evaluation.squad import compute_f1 as calculate_f1_str
 from haystack.modeling.evaluation.squad import compute_exact as calculate_em_str
 from haystack.pipelines.config import (
@@ -46,12 +50,16 @@ from haystack.pipelines.utils import generate_code, print_eval_report
 from haystack.utils import DeepsetCloud, calculate_context_similarity
 from haystack.schema import Answer, EvaluationResult, MultiLabel, Document, Span
 from haystack.errors import HaystackError, PipelineError, PipelineConfigError, DocumentStoreError
-from haystack.nodes import BaseGenerator, Docs2Answers, BaseReader, BaseSummarizer, BaseTranslator, QuestionGenerator
+from haystack.nodes.file_converter.base import BaseConverter
+from haystack.nodes.preprocessor.base import BasePreProcessor
+from haystack.nodes.file_classifier.file_type import FileTypeClassifier
 from haystack.nodes.base import BaseComponent, RootNode
 from haystack.nodes.retriever.base import BaseRetriever
 from haystack.document_stores.base import BaseDocumentStore
 from haystack.utils.experiment_tracking import MLflowTrackingHead, Tracker as tracker
 from haystack.telemetry import send_event, send_pipeline_event
+from haystack.utils.stages import STAGE_DONE, StageThroughput, get_unless_stopped, put_unless_stopped
+from haystack.utils.tracing import traced_pipeline_method
 
 
 logger = logging.getLogger(__name__)
@@ -60,6 +68,8 @@ logger = logging.getLogger(__name__)
 ROOT_NODE_TO_PIPELINE_NAME = {"query": "query", "file": "indexing"}
 CODE_GEN_DEFAULT_COMMENT = "This code has been generated."
 TRACKING_TOOL_TO_HEAD = {"mlflow": MLflowTrackingHead}
+# Nodes that run_indexing() moves to worker processes, as long as they only depend on the root node or on each other
+PROCESS_POOL_NODE_TYPES = (BaseConverter, BasePreProcessor, FileTypeClassifier)
 
 
 class Pipeline:
@@ -466,6 +476,7 @@ class Pipeline:
     def _run_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
         return self.graph.nodes[node_id]["component"]._dispatch_run(**node_input)
 
+    @traced_pipeline_method
     def run(  # type: ignore
         self,
         query: Optional[str] = None,
@@ -603,6 +614,7 @@ class Pipeline:
 
         return node_output
 
+    @traced_pipeline_method
     def run_batch(  # type: ignore
         self,
         queries: Optional[List[str]] = None,
@@ -764,6 +776,255 @@ class Pipeline:
 
         return node_output
 
+    def run_indexing(
+        self,
+        file_paths: List[str],
+        meta: Optional[Union[dict, List[dict]]] = None,
+        params: Optional[dict] = None,
+        batch_size: int = 16,
+        num_processes: Optional[int] = None,
+        max_queued_batches: int = 4,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Runs an indexing Pipeline on micro-batches of files, so that its nodes work on different batches at the same
+        time instead of one after the other on the whole list of files.
+
+        The nodes that only depend on the root node or on each other and are converters, preprocessors or file type
+        classifiers run in a pool of `num_processes` worker processes. They must be picklable. Each of the remaining
+        nodes, for example a Retriever computing embeddings and a DocumentStore, runs in its own thread and takes its
+        input from a queue of at most `max_queued_batches` micro-batches. When a stage falls behind, the stages in
+        front of it block, so the memory used stays bounded and the overall throughput is the one of the slowest node.
+        The remaining nodes must form a chain: each of them has a single input and a single successor.
+
+        :param file_paths: The files to index.
+        :param meta: Files' metadata. Either a single dictionary applied to all files or one dictionary per file.
+        :param params: A dictionary of parameters that you want to pass to the nodes, as in `run()`.
+        :param batch_size: The number of files in each micro-batch.
+        :param num_processes: The number of worker processes for converters and preprocessors. Defaults to the number
+                              of CPUs. With 1 or less, these nodes run in a thread of the current process instead.
+        :param max_queued_batches: The number of micro-batches that can wait in front of each node.
+        :return: Throughput statistics for each node: the number of `batches` and output `documents` it produced, the
+                 `seconds` spent inside the node (summed over all worker processes) and `documents_per_second`.
+        """
+        send_pipeline_event(pipeline=self, file_paths=file_paths, meta=meta, params=params)
+        self._validate_node_names_in_params(params=params)
+
+        root_node = self.root_node
+        if root_node != "File":
+            raise PipelineError("run_indexing() can only run indexing pipelines, whose root node is 'File'.")
+        if isinstance(meta, list) and len(meta) != len(file_paths):
+            raise PipelineError(f"Got {len(meta)} meta dictionaries for {len(file_paths)} files.")
+
+        process_nodes, thread_nodes = self._get_indexing_stages()
+        num_processes = (os.cpu_count() or 1) if num_processes is None else num_processes
+        max_queued_batches = max(max_queued_batches, 1)
+        node_stats = {node: StageThroughput(node) for node in process_nodes + thread_nodes}
+        # queues[i] holds the inputs of thread_nodes[i]
+        queues: List[Queue] = [Queue(maxsize=max_queued_batches) for _ in thread_nodes]
+        stop = threading.Event()
+        errors: List[Exception] = []
+
+        def forward(result: Tuple[Optional[str], Dict, Optional[str], Dict[str, Tuple[int, float]]]) -> bool:
+            last_node_id, node_output, stream_id, batch_stats = result
+            for node, (documents, seconds) in batch_stats.items():
+                node_stats[node].add(documents, seconds)
+            if not thread_nodes or last_node_id != process_nodes[-1]:
+                return True
+            next_input = self._route_node_output(last_node_id, thread_nodes[0], node_output, stream_id)
+            return next_input is None or put_unless_stopped(queues[0], next_input, stop)
+
+        def feed():
+            try:
+                batches = self._get_indexing_batches(file_paths=file_paths, meta=meta, batch_size=batch_size)
+                if not process_nodes:
+                    for batch_file_paths, batch_meta in batches:
+                        root_output = {"root_node": root_node, "params": params, "file_paths": batch_file_paths}
+                        if batch_meta:
+                            root_output["meta"] = batch_meta
+                        if not put_unless_stopped(queues[0], root_output, stop):
+                            return
+                    return
+
+                stage_pipeline = self._get_indexing_stage_pipeline(process_nodes, in_worker_processes=num_processes > 1)
+                if num_processes <= 1:
+                    for batch_file_paths, batch_meta in batches:
+                        result = _run_indexing_stage(stage_pipeline, batch_file_paths, batch_meta, params)
+                        if not forward(result):
+                            return
+                    return
+
+                with ProcessPoolExecutor(
+                    max_workers=num_processes, initializer=_init_indexing_worker, initargs=(stage_pipeline,)
+                ) as pool:
+                    pending: Deque[Future] = deque()
+                    try:
+                        for batch_file_paths, batch_meta in batches:
+                            pending.append(pool.submit(_run_indexing_worker, batch_file_paths, batch_meta, params))
+                            # Keep every worker busy, but don't convert more files than the next stage can take
+                            if len(pending) >= num_processes + max_queued_batches:
+                                if not forward(pending.popleft().result()):
+                                    return
+                        while pending:
+                            if not forward(pending.popleft().result()):
+                                return
+                    finally:
+                        for future in pending:
+                            future.cancel()
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                if thread_nodes:
+                    put_unless_stopped(queues[0], STAGE_DONE, stop)
+
+        def work(position: int):
+            node_id = thread_nodes[position]
+            next_node_id = thread_nodes[position + 1] if position + 1 < len(thread_nodes) else None
+            try:
+                while True:
+                    node_input = get_unless_stopped(queues[position], stop)
+                    if node_input is STAGE_DONE:
+                        return
+                    start = perf_counter()
+                    node_output, stream_id = self._run_indexing_node(node_id, node_input)
+                    node_stats[node_id].add(len(node_output.get("documents") or []), perf_counter() - start)
+                    if next_node_id is None:
+                        continue
+                    next_input = self._route_node_output(node_id, next_node_id, node_output, stream_id)
+                    if next_input is not None and not put_unless_stopped(queues[position + 1], next_input, stop):
+                        return
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                if next_node_id is not None:
+                    put_unless_stopped(queues[position + 1], STAGE_DONE, stop)
+
+        threads = [threading.Thread(target=feed, daemon=True)]
+        threads += [threading.Thread(target=work, args=(pos,), daemon=True) for pos in range(len(thread_nodes))]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        for stats in node_stats.values():
+            stats.log()
+        return {node: stats.to_dict() for node, stats in node_stats.items()}
+
+    def _get_indexing_stages(self) -> Tuple[List[str], List[str]]:
+        """
+        Splits the nodes of an indexing pipeline for `run_indexing()` into the ones that run in worker processes and
+        the chain of nodes that follows them, each running in its own thread.
+        """
+        root_node = self.root_node
+        nodes = [node for node in nx.topological_sort(self.graph) if node != root_node]
+        process_nodes: List[str] = []
+        for node in nodes:
+            predecessors = set(self.graph.predecessors(node))
+            if isinstance(self.graph.nodes[node]["component"], PROCESS_POOL_NODE_TYPES) and predecessors.issubset(
+                {root_node, *process_nodes}
+            ):
+                process_nodes.append(node)
+        thread_nodes = [node for node in nodes if node not in process_nodes]
+
+        # The worker processes can only hand over the output of a single node: the last one they run
+        process_sinks = [
+            node for node in process_nodes if not any(succ in process_nodes for succ in self.graph.successors(node))
+        ]
+        if len(process_sinks) > 1:
+            raise PipelineError(
+                f"run_indexing() needs the converters and preprocessors to end in a single node, but {process_sinks} "
+                "have no successors among them. Use run() for this pipeline instead."
+            )
+        previous_node = process_nodes[-1] if process_nodes else root_node
+        for node in thread_nodes:
+            predecessors = list(self.graph.predecessors(node))
+            if predecessors != [previous_node] or len(list(self.graph.successors(previous_node))) != 1:
+                raise PipelineError(
+                    f"run_indexing() needs the nodes after the converters and preprocessors to form a chain, but "
+                    f"'{node}' is not the only successor of '{previous_node}'. Use run() for this pipeline instead."
+                )
+            previous_node = node
+        return process_nodes, thread_nodes
+
+    def _get_indexing_stage_pipeline(self, nodes: List[str], in_worker_processes: bool) -> _IndexingStagePipeline:
+        """
+        Creates a Pipeline with the given nodes of this Pipeline that records how long each of them runs.
+
+        If the Pipeline runs in worker processes, nodes that would start a process pool of their own, such as a
+        PreProcessor with `num_processes > 1`, are replaced by copies that run in the worker process itself.
+        """
+        stage_pipeline = _IndexingStagePipeline()
+        for node in nodes:
+            component = self.graph.nodes[node]["component"]
+            if in_worker_processes and getattr(component, "num_processes", 1) > 1:
+                logger.warning(
+                    "Node '%s' uses %s processes, but run_indexing() already runs it in its worker processes. "
+                    "Setting its num_processes to 1 for run_indexing().",
+                    node,
+                    component.num_processes,
+                )
+                component = copy.copy(component)
+                component.num_processes = 1
+            stage_pipeline.add_node(component, name=node, inputs=self.graph.nodes[node]["inputs"])
+        # run_indexing() already sent the telemetry event for the whole pipeline
+        stage_pipeline.last_config_hash = stage_pipeline.config_hash
+        return stage_pipeline
+
+    @staticmethod
+    def _get_indexing_batches(
+        file_paths: List[str], meta: Optional[Union[dict, List[dict]]], batch_size: int
+    ) -> Generator[Tuple[List[str], Optional[Union[dict, List[dict]]]], None, None]:
+        batch_size = max(batch_size, 1)
+        for start in range(0, len(file_paths), batch_size):
+            batch_meta = meta[start : start + batch_size] if isinstance(meta, list) else meta
+            yield file_paths[start : start + batch_size], batch_meta
+
+    def _run_indexing_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+        node_input = {**node_input, "node_id": node_id}
+        try:
+            return self._run_node(node_id, node_input)
+        except Exception as e:
+            logger.debug("Exception while running node '%s' with input %s", node_id, node_input)
+            raise Exception(
+                f"Exception while running node '{node_id}': {e}\nEnable debug logging to see the data that was passed when the pipeline failed."
+            ) from e
+
+    def _route_node_output(
+        self, node_id: str, next_node_id: str, node_output: Dict[str, Any], stream_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the input for `next_node_id` given the output of its predecessor `node_id`, the same way `run()` does,
+        or None if the output was routed to another edge. As `run_indexing()` only runs chains of nodes, that edge has
+        no successor and the output isn't indexed, so a warning is logged.
+        """
+        edge_label = self.graph.edges[node_id, next_node_id]["label"]
+        if stream_id == "split":
+            if edge_label in node_output:
+                next_input = {k: v for k, v in node_output.items() if not k.startswith("output_")}
+                next_input["documents"] = node_output[edge_label]
+                return next_input
+        elif not stream_id or stream_id in (edge_label, "output_all"):
+            return node_output
+
+        logger.warning(
+            "Node '%s' routed a batch of %s documents to an output that no node is connected to, only '%s' is "
+            "connected to %s. The batch is not indexed.",
+            node_id,
+            len(node_output.get("documents") or []),
+            edge_label,
+            next_node_id,
+        )
+        return None
+
     @classmethod
     def eval_beir(
         cls,
@@ -1409,6 +1670,9 @@ class Pipeline:
         # add sas values in batch mode for whole Dataframe
         # this is way faster than if we calculate it for each query separately
         if sas_model_name_or_path is not None:
+            # SAS needs torch and transformers, which are only imported when SAS is used
+            from haystack.modeling.evaluation.metrics import semantic_answer_similarity
+
             for df in eval_result.node_results.values():
                 if len(df[df["type"] == "answer"]) > 0:
                     gold_labels = df["gold_answers"].values
@@ -2334,6 +2598,15 @@ class Pipeline:
         """
         Returns the type of the pipeline.
         """
+        from haystack.nodes import (
+            BaseGenerator,
+            Docs2Answers,
+            BaseReader,
+            BaseSummarizer,
+            BaseTranslator,
+            QuestionGenerator,
+        )
+
         # values of the dict are functions evaluating whether components of this pipeline match the pipeline type
         # specified by dict keys
         pipeline_types = {
@@ -2377,6 +2650,64 @@ class Pipeline:
         return f"{pipeline_type} (retriever: {retrievers_used}, doc_store: {doc_stores_used})"
 
 
+class _IndexingStagePipeline(Pipeline):
+    """
+    The part of an indexing pipeline that `Pipeline.run_indexing()` runs in worker processes. It records the number
+    of documents each node outputs and the time it spends on them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.last_node_id: Optional[str] = None
+        self.last_stream_id: Optional[str] = None
+        self.node_stats: Dict[str, Tuple[int, float]] = {}
+
+    def _run_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+        start = perf_counter()
+        node_output, stream_id = super()._run_node(node_id, node_input)
+        # The root node only passes the files on, it's not an indexing stage
+        if node_id != self.root_node:
+            self.node_stats[node_id] = (len(node_output.get("documents") or []), perf_counter() - start)
+        self.last_node_id, self.last_stream_id = node_id, stream_id
+        return node_output, stream_id
+
+    def _validate_node_names_in_params(self, params: Optional[Dict]):
+        # run_indexing() validated the params against the whole pipeline, which also has nodes this part is missing
+        pass
+
+
+def _run_indexing_stage(
+    stage_pipeline: _IndexingStagePipeline,
+    file_paths: List[str],
+    meta: Optional[Union[dict, List[dict]]],
+    params: Optional[dict],
+) -> Tuple[Optional[str], Dict, Optional[str], Dict[str, Tuple[int, float]]]:
+    """
+    Runs `stage_pipeline` on a micro-batch of files and returns the last node that ran, its output and stream and the
+    statistics of all nodes.
+    """
+    stage_pipeline.node_stats = {}
+    node_output = stage_pipeline.run(file_paths=file_paths, meta=meta, params=params)
+    return stage_pipeline.last_node_id, node_output, stage_pipeline.last_stream_id, stage_pipeline.node_stats
+
+
+# The stage pipeline of the current worker process, set once by _init_indexing_worker() so that it's not pickled
+# again for every micro-batch
+_indexing_worker_pipeline: Optional[_IndexingStagePipeline] = None
+
+
+def _init_indexing_worker(stage_pipeline: _IndexingStagePipeline):
+    global _indexing_worker_pipeline  # pylint: disable=global-statement
+    _indexing_worker_pipeline = stage_pipeline
+
+
+def _run_indexing_worker(
+    file_paths: List[str], meta: Optional[Union[dict, List[dict]]], params: Optional[dict]
+) -> Tuple[Optional[str], Dict, Optional[str], Dict[str, Tuple[int, float]]]:
+    assert _indexing_worker_pipeline is not None, "The indexing worker process was not initialized."
+    return _run_indexing_stage(_indexing_worker_pipeline, file_paths, meta, params)
+
+
 class _HaystackBeirRetrieverAdapter:
     def __init__(self, index_pipeline: Pipeline, query_pipeline: Pipeline, index_params: dict, query_params: dict):
         """
@@ -6,7 +6,7 @@ except ImportError:
     from typing_extensions import Literal  # type: ignore
 
 import re
-import sys
+import importlib
 import inspect
 import logging
 
@@ -147,7 +147,7 @@ def _generate_imports_code(types_to_import: List[str]) -> str:
     importable_classes = {
         name: mod
         for mod in CODE_GEN_ALLOWED_IMPORTS
-        for name, obj in inspect.getmembers(sys.modules[mod])
+        for name, obj in inspect.getmembers(importlib.import_module(mod))
         if inspect.isclass(obj)
     }
 
@@ -3,7 +3,7 @@ import csv
 import hashlib
 import inspect
 
-from typing import Any, Optional, Dict, List, Union
+from typing import Any, Callable, Optional, Dict, List, Union
 
 try:
     from typing import Literal
@@ -34,6 +34,7 @@ logger = logging.getLogger(__name__)
 
 
 BaseConfig.arbitrary_types_allowed = True
+pd.options.display.max_colwidth = 80
 
 #: Types of content_types supported
 ContentTypes = Literal["text", "table", "image", "audio"]
@@ -1209,49 +1210,38 @@ class EvaluationResult:
             documents = self._get_documents_df()
 
             top_k_documents = documents[documents["rank"] <= simulated_top_k_retriever]
-            simulated_answers = []
-            for multilabel_id in multilabel_ids:
-                top_k_document_ids = top_k_documents[top_k_documents["multilabel_id"] == multilabel_id][
-                    "document_id"
-                ].unique()
-                query_answers = answers[answers["multilabel_id"] == multilabel_id]
-                # consider only the answers within simulated_top_k_retriever documents
-
-                simulated_query_answers = query_answers[
-                    query_answers["document_ids"].apply(
-                        lambda document_ids, top_k_document_ids=top_k_document_ids: all(
-                            document_id in top_k_document_ids for document_id in document_ids
-                        )
-                    )
+            top_k_document_ids = top_k_documents.groupby("multilabel_id")["document_id"].agg(set).to_dict()
+            # consider only the answers within simulated_top_k_retriever documents
+            answers = answers[
+                [
+                    all(document_id in top_k_document_ids.get(multilabel_id, ()) for document_id in document_ids)
+                    for multilabel_id, document_ids in zip(answers["multilabel_id"], answers["document_ids"])
                 ]
-                # simulate top k reader
-                if simulated_top_k_reader != -1:
-                    # consider only the simulated_top_k_reader answers within simulated_query_answers
-                    simulated_query_answers = simulated_query_answers.nsmallest(simulated_top_k_reader, "rank")
-                simulated_query_answers["rank"] = np.arange(1, len(simulated_query_answers) + 1)
-                simulated_answers.append(simulated_query_answers)
-            answers = pd.concat(simulated_answers)
+            ]
+            # simulate top k reader
+            if simulated_top_k_reader != -1:
+                # consider only the simulated_top_k_reader answers within simulated_query_answers
+                answers = answers.sort_values("rank", kind="stable")
+                answers = answers.groupby("multilabel_id", sort=False).head(simulated_top_k_reader)
+            answers = answers.assign(rank=answers.groupby("multilabel_id", sort=False).cumcount() + 1)
         # simulate top k reader
         elif simulated_top_k_reader != -1:
             answers = answers[answers["rank"] <= simulated_top_k_reader]
 
         # build metrics df
         answer_metrics = ["exact_match", "f1", "sas"]
-        df_records = []
-
-        for multilabel_id in multilabel_ids:
-            query_df = answers[answers["multilabel_id"] == multilabel_id]
-            metric_to_scoped_col = {
-                metric: f"{metric}_{answer_scope}_scope" if answer_scope != "any" else metric
-                for metric in answer_metrics
-                if metric in query_df.columns
-            }
-            query_metrics = {
-                metric: query_df[col].max() if any(query_df) else 0.0 for metric, col in metric_to_scoped_col.items()
-            }
-            df_records.append(query_metrics)
-
-        metrics_df = pd.DataFrame.from_records(df_records, index=multilabel_ids)
+        metric_to_scoped_col = {
+            metric: f"{metric}_{answer_scope}_scope" if answer_scope != "any" else metric
+            for metric in answer_metrics
+            if metric in answers.columns
+        }
+        # queries without any answer left after the simulation get NaN metrics
+        metrics_df = (
+            answers.groupby("multilabel_id", sort=False)[list(metric_to_scoped_col.values())]
+            .max()
+            .reindex(multilabel_ids)
+        )
+        metrics_df.columns = list(metric_to_scoped_col.keys())
         return metrics_df
 
     def _get_documents_df(self):
@@ -1346,124 +1336,145 @@ class EvaluationResult:
         if simulated_top_k_retriever != -1:
             documents = documents[documents["rank"] <= simulated_top_k_retriever]
 
-        # find out which label matched
-        def find_matched_label_idxs(row) -> List[int]:  # pylint: disable=too-many-return-statements
-            id_matches = [idx for idx, val in enumerate(row["gold_documents_id_match"]) if val == 1.0]
-            context_matches = [
-                idx for idx, val in enumerate(row["gold_contexts_similarity"]) if val > 65.0
-            ]  # TODO: hardcoded threshold for now, will be param of calculate_metrics
-            answer_matches = [idx for idx, val in enumerate(row["gold_answers_match"]) if val == 1.0]
-            if document_relevance_criterion == "document_id":
-                return id_matches
-            elif document_relevance_criterion == "context":
-                return context_matches
-            elif document_relevance_criterion == "answer":
-                return answer_matches
-            elif document_relevance_criterion == "document_id_and_context":
-                return list(set(id_matches) & set(context_matches))
-            elif document_relevance_criterion == "document_id_or_context":
-                return list(set(id_matches) | set(context_matches))
-            elif document_relevance_criterion == "document_id_and_answer":
-                return list(set(id_matches) & set(answer_matches))
-            elif document_relevance_criterion == "document_id_or_answer":
-                return list(set(id_matches) | set(answer_matches))
-            elif document_relevance_criterion == "context_and_answer":
-                return list(set(context_matches) & set(answer_matches))
-            elif document_relevance_criterion == "document_id_and_context_and_answer":
-                return list(set(id_matches) & set(context_matches) & set(answer_matches))
-            else:
-                raise ValueError(f"document_relevance_criterion '{document_relevance_criterion}' not supported.")
-
-        documents["matched_label_idxs"] = documents.apply(find_matched_label_idxs, axis=1)
-
-        metrics = []
-
-        for multilabel_id in documents["multilabel_id"].unique():
-            query_df = documents[documents["multilabel_id"] == multilabel_id]
+        multilabel_ids = documents["multilabel_id"].unique()
+        # Note: Metrics are always calculated on document_ids.
+        # For some document relevance criteria (e.g. context), the gold_document_ids are not enough or not useful at all.
+        # So, we have to adjust the relevant ids according to the document_relevance_criterion.
+        relevance_criterion_col = f"{document_relevance_criterion.replace('document_id', 'gold_id')}_match"
+        rows = pd.DataFrame(
+            {
+                "multilabel_id": documents["multilabel_id"].to_numpy(),
+                "document_id": documents["document_id"].to_numpy(),
+                "rank": documents["rank"].to_numpy(),
+                "relevant": (documents[relevance_criterion_col] == 1).to_numpy(),
+            }
+        )
+        relevant_rows = rows[rows["relevant"]]
+        by_query = rows.groupby("multilabel_id", sort=False)
+        relevant_by_query = relevant_rows.groupby("multilabel_id", sort=False)
+
+        # all labels without no_answers
+        # we need to match all (except for single hit recall)
+        gold_document_ids_col = (
+            "gold_custom_document_ids" if "gold_custom_document_ids" in documents else "gold_document_ids"
+        )
+        first_rows = ~rows["multilabel_id"].duplicated().to_numpy()
+        # remove no_answer label
+        num_labels = np.array(
+            [sum(1 for id in ids if id != "00") for ids in documents[gold_document_ids_col].to_numpy()[first_rows]],
+            dtype=float,
+        )
 
-            # Note: Metrics are always calculated on document_ids.
-            # For some document relevance criteria (e.g. context), the gold_document_ids are not enough or not useful at all.
-            # So, we have to adjust the relevant ids according to the document_relevance_criterion.
-            relevance_criterion_col = f"{document_relevance_criterion.replace('document_id', 'gold_id')}_match"
-            relevant_rows = query_df[query_df[relevance_criterion_col] == 1]
+        # find out which labels the relevant documents matched
+        matched_labels = self._find_matched_labels(documents, document_relevance_criterion)
+        matched_labels = matched_labels[rows["relevant"].to_numpy()[matched_labels["row"].to_numpy()]]
+        matched_labels["multilabel_id"] = rows["multilabel_id"].to_numpy()[matched_labels["row"].to_numpy()]
+        num_matched_labels = matched_labels.drop_duplicates(["multilabel_id", "label"]).groupby("multilabel_id").size()
+
+        # the number of relevant documents retrieved with a rank lower or equal to the rank of each relevant document
+        relevant_rows = relevant_rows.sort_values(["multilabel_id", "rank"], kind="stable")
+        num_relevant_up_to_rank = relevant_rows.groupby("multilabel_id", sort=False).cumcount() + 1
+        num_relevant_up_to_rank = num_relevant_up_to_rank.groupby(
+            [relevant_rows["multilabel_id"], relevant_rows["rank"]]
+        ).transform("max")
+        precision_at_relevant_ranks = (num_relevant_up_to_rank / relevant_rows["rank"]).groupby(
+            relevant_rows["multilabel_id"]
+        )
+        gains = (1.0 / np.log2(relevant_rows["rank"] + 1)).groupby(relevant_rows["multilabel_id"])
+
+        def per_query(values: pd.Series) -> np.ndarray:
+            return values.reindex(multilabel_ids, fill_value=0).to_numpy(dtype=float)
+
+        num_matched_labels = per_query(num_matched_labels)
+        num_missing_labels = num_labels - num_matched_labels
+        num_relevants = per_query(relevant_by_query["document_id"].nunique(dropna=False)) + num_missing_labels
+        num_retrieved = per_query(by_query.size())
+        num_retrieved_relevants = per_query(relevant_by_query.size())
+        min_rank_retrieved_relevants = relevant_by_query["rank"].min().reindex(multilabel_ids).to_numpy(dtype=float)
+        ideal_gains = np.cumsum(1.0 / np.log2(np.arange(1, max(num_relevants.max(initial=0), 1) + 1) + 1))
+        idcg = ideal_gains[np.clip(num_relevants.astype(int), 1, None) - 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metrics = {
+                "recall_multi_hit": num_matched_labels / num_labels,
+                "recall_single_hit": np.ones(len(multilabel_ids)),
+                "precision": num_retrieved_relevants / num_retrieved,
+                "map": per_query(precision_at_relevant_ranks.sum()) / num_relevants,
+                "mrr": 1.0 / min_rank_retrieved_relevants,
+                "ndcg": per_query(gains.sum()) / idcg,
+            }
+        for metric, values in metrics.items():
+            # Set all metrics to 0.0 if no relevant document has been retrieved to avoid undefined metrics.
+            values[num_retrieved_relevants == 0] = 0.0
+            # For no_answer queries, we set all metrics to 1.0, to indicate that the retriever cannot improve the pipeline.
+            # This behavior is different from pytrec_eval, which sets the metrics to 0.0 if there is no relevant document in the evalset.
+            values[num_labels == 0] = 1.0
+
+        metrics_df = pd.DataFrame(metrics, index=multilabel_ids)
+        return metrics_df
 
-            # all labels without no_answers
-            # we need to match all (except for single hit recall)
-            gold_document_ids = (
-                list(query_df["gold_custom_document_ids"].iloc[0])
-                if "gold_custom_document_ids" in query_df
-                else list(query_df["gold_document_ids"].iloc[0])
-            )
-            # remove no_answer label
-            gold_document_ids = [id for id in gold_document_ids if id != "00"]
-
-            num_labels = len(gold_document_ids)
-            num_matched_labels = len(set(idx for idxs in relevant_rows["matched_label_idxs"] for idx in idxs))
-            num_missing_labels = num_labels - num_matched_labels
-
-            relevance_criterion_ids = list(relevant_rows["document_id"].values)
-            num_relevants = len(set(relevance_criterion_ids)) + num_missing_labels
-
-            num_retrieved = len(query_df["document_id"])
-            num_retrieved_relevants = len(relevant_rows)
-            rank_retrieved_relevants = relevant_rows["rank"].values
-
-            if num_labels == 0:
-                # For no_answer queries, we set all metrics to 1.0, to indicate that the retriever cannot improve the pipeline.
-                # This behavior is different from pytrec_eval, which sets the metrics to 0.0 if there is no relevant document in the evalset.
-                rr = 1.0
-                avg_precision = 1.0
-                recall_multi_hit = 1.0
-                recall_single_hit = 1.0
-                precision = 1.0
-                ndcg = 1.0
-            elif num_retrieved_relevants == 0:
-                # Set all metrics to 0.0 if no relevant document has been retrieved to avoid undefined metrics.
-                rr = 0.0
-                avg_precision = 0.0
-                recall_multi_hit = 0.0
-                recall_single_hit = 0.0
-                precision = 0.0
-                ndcg = 0.0
-            else:
-                # The previous checks ensure:
-                # - `num_labels` > 0
-                # - `num_retrieved_relevants` > 0
-                # - `num_relevants` > 0  (`num_relevants` is always >= `num_labels`)
-                # - `num_retrieved` > 0  (`num_retrieved` is always >= `num_retrieved_relevants`)
-                # - `len(rank_retrieved_relevants)` > 0 (`len(rank_retrieved_relevants)` is always == `num_retrieved_relevants`)
-                avp_retrieved_relevants = [
-                    len(relevant_rows[relevant_rows["rank"] <= rank]) / rank for rank in rank_retrieved_relevants
-                ]
-                avg_precision = np.sum(avp_retrieved_relevants) / num_relevants
-                recall_multi_hit = num_matched_labels / num_labels
-                recall_single_hit = 1.0
-                precision = num_retrieved_relevants / num_retrieved
-                rr = 1.0 / rank_retrieved_relevants.min()
-                dcg = np.sum([1.0 / np.log2(rank + 1) for rank in rank_retrieved_relevants])
-                idcg = np.sum([1.0 / np.log2(rank + 1) for rank in range(1, num_relevants + 1)])
-                ndcg = dcg / idcg
-
-            metrics.append(
-                {
-                    "recall_multi_hit": recall_multi_hit,
-                    "recall_single_hit": recall_single_hit,
-                    "precision": precision,
-                    "map": avg_precision,
-                    "mrr": rr,
-                    "ndcg": ndcg,
-                }
-            )
+    @staticmethod
+    def _find_matched_labels(
+        documents: pd.DataFrame,
+        document_relevance_criterion: Literal[
+            "document_id",
+            "context",
+            "document_id_and_context",
+            "document_id_or_context",
+            "answer",
+            "context_and_answer",
+            "document_id_and_answer",
+            "document_id_and_context_and_answer",
+            "document_id_or_answer",
+        ],
+    ) -> pd.DataFrame:
+        """
+        Returns the pairs of `row` position and gold `label` index for which the document in the row matches the label
+        according to the document_relevance_criterion.
+        """
 
-        metrics_df = pd.DataFrame.from_records(metrics, index=documents["multilabel_id"].unique())
-        return metrics_df
+        def matches(column: str, is_match: Callable[[pd.Series], pd.Series]) -> pd.MultiIndex:
+            values = pd.Series(documents[column].to_numpy(), dtype=object).explode()
+            labels = values.groupby(level=0).cumcount()
+            # explode() turns empty lists into NaN, which never match
+            matched = is_match(values.astype(float)).to_numpy()
+            return pd.MultiIndex.from_arrays([values.index[matched], labels[matched]], names=["row", "label"])
+
+        id_matches = matches("gold_documents_id_match", lambda values: values == 1.0)
+        # TODO: hardcoded threshold for now, will be param of calculate_metrics
+        context_matches = matches("gold_contexts_similarity", lambda values: values > 65.0)
+        answer_matches = matches("gold_answers_match", lambda values: values == 1.0)
+        if document_relevance_criterion == "document_id":
+            matched = id_matches
+        elif document_relevance_criterion == "context":
+            matched = context_matches
+        elif document_relevance_criterion == "answer":
+            matched = answer_matches
+        elif document_relevance_criterion == "document_id_and_context":
+            matched = id_matches.intersection(context_matches)
+        elif document_relevance_criterion == "document_id_or_context":
+            matched = id_matches.union(context_matches)
+        elif document_relevance_criterion == "document_id_and_answer":
+            matched = id_matches.intersection(answer_matches)
+        elif document_relevance_criterion == "document_id_or_answer":
+            matched = id_matches.union(answer_matches)
+        elif document_relevance_criterion == "context_and_answer":
+            matched = context_matches.intersection(answer_matches)
+        elif document_relevance_criterion == "document_id_and_context_and_answer":
+            matched = id_matches.intersection(context_matches).intersection(answer_matches)
+        else:
+            raise ValueError(f"document_relevance_criterion '{document_relevance_criterion}' not supported.")
+        return matched.to_frame(index=False)
 
-    def save(self, out_dir: Union[str, Path], **to_csv_kwargs):
+    def save(self, out_dir: Union[str, Path], file_format: Literal["csv", "parquet"] = "csv", **to_csv_kwargs):
         """
         Saves the evaluation result.
-        The result of each node is saved in a separate csv with file name {node_name}.csv to the out_dir folder.
+        The result of each node is saved in a separate file with file name {node_name}.csv or {node_name}.parquet
+        to the out_dir folder.
 
-        :param out_dir: Path to the target folder the csvs will be saved.
+        :param out_dir: Path to the target folder the files will be saved.
+        :param file_format: The format of the files. Parquet files keep the list columns as nested types and are much
+                            faster to load than csv files. Saving to Parquet requires pyarrow.
         :param to_csv_kwargs: kwargs to be passed to pd.DataFrame.to_csv(). See https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_csv.html.
                         This method uses different default values than pd.DataFrame.to_csv() for the following parameters:
                         index=False, quoting=csv.QUOTE_NONNUMERIC (to avoid problems with \r chars)
@@ -1473,6 +1484,11 @@ class EvaluationResult:
         if not out_dir.exists():
             out_dir.mkdir(parents=True)
         for node_name, df in self.node_results.items():
+            if file_format == "parquet":
+                import pyarrow.parquet as pq
+
+                pq.write_table(_to_arrow_table(df), out_dir / f"{node_name}.parquet")
+                continue
             target_path = out_dir / f"{node_name}.csv"
             default_to_csv_kwargs = {
                 "index": False,
@@ -1482,18 +1498,25 @@ class EvaluationResult:
             df.to_csv(target_path, **to_csv_kwargs)
 
     @classmethod
-    def load(cls, load_dir: Union[str, Path], **read_csv_kwargs):
+    def load(cls, load_dir: Union[str, Path], columns: Optional[List[str]] = None, **read_csv_kwargs):
         """
-        Loads the evaluation result from disk. Expects one csv file per node. See save() for further information.
+        Loads the evaluation result from disk. Expects one csv or Parquet file per node.
+        See save() for further information.
 
-        :param load_dir: The directory containing the csv files.
+        :param load_dir: The directory containing the csv or Parquet files. If a node has both, the Parquet file is
+                         loaded.
+        :param columns: Load only these columns, for example only the metric columns to compare two evaluation runs.
+                        Columns that a node's file doesn't have are skipped.
         :param read_csv_kwargs: kwargs to be passed to pd.read_csv(). See https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_csv.html.
                                 This method uses different default values than pd.read_csv() for the following parameters:
                                 header=0, converters=CONVERTERS
                                 where CONVERTERS is a dictionary mapping all array typed columns to ast.literal_eval.
         """
         load_dir = load_dir if isinstance(load_dir, Path) else Path(load_dir)
-        csv_files = [file for file in load_dir.iterdir() if file.is_file() and file.suffix == ".csv"]
+        files = [file for file in load_dir.iterdir() if file.is_file()]
+        parquet_files = [file for file in files if file.suffix == ".parquet"]
+        parquet_nodes = {file.stem for file in parquet_files}
+        csv_files = [file for file in files if file.suffix == ".csv" and file.stem not in parquet_nodes]
         cols_to_convert = [
             "filters",
             "gold_document_ids",
@@ -1522,8 +1545,11 @@ class EvaluationResult:
 
         converters = dict.fromkeys(cols_to_convert, safe_literal_eval)
         default_read_csv_kwargs = {"converters": converters, "header": 0}
+        if columns is not None:
+            default_read_csv_kwargs["usecols"] = lambda column: column in columns
         read_csv_kwargs = {**default_read_csv_kwargs, **read_csv_kwargs}
         node_results = {file.stem: pd.read_csv(file, **read_csv_kwargs) for file in csv_files}
+        node_results.update({file.stem: _read_parquet(file, columns) for file in parquet_files})
         # backward compatibility mappings
         for df in node_results.values():
             df.rename(columns={"gold_document_contents": "gold_contexts", "content": "context"}, inplace=True)
@@ -1542,3 +1568,34 @@ class EvaluationResult:
                 df.drop(columns=["custom_document_id"], inplace=True)
         result = cls(node_results)
         return result
+
+
+def _to_arrow_table(df: pd.DataFrame):
+    """
+    Converts an evaluation dataframe to an Arrow table. List columns become nested Arrow types. Columns that Arrow
+    can't convert, for example tables in the context of TableQA answers, are stored as strings, like in csv files.
+    """
+    import pyarrow as pa
+
+    arrays = []
+    for column in df.columns:
+        try:
+            arrays.append(pa.array(df[column], from_pandas=True))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            arrays.append(pa.array([None if value is None else str(value) for value in df[column]], type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def _read_parquet(file: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if columns is not None:
+        columns = [column for column in pq.read_schema(file).names if column in columns]
+    table = pq.read_table(file, columns=columns)
+    df = table.to_pandas()
+    for field in table.schema:
+        # to_pandas() turns lists into numpy arrays, but evaluation dataframes hold lists like the ones loaded from csv
+        if pa.types.is_nested(field.type):
+            df[field.name] = table.column(field.name).to_pylist()
+    return df
@@ -1,31 +1,88 @@
-from haystack.utils.reflection import args_to_kwargs
-from haystack.utils.preprocessing import convert_files_to_docs, tika_convert_files_to_docs
-from haystack.utils.import_utils import fetch_archive_from_http
-from haystack.utils.cleaning import clean_wiki_text
-from haystack.utils.doc_store import (
-    launch_es,
-    launch_milvus,
-    launch_opensearch,
-    launch_weaviate,
-    stop_opensearch,
-    stop_service,
-)
-from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudError, DeepsetCloudExperiments
-from haystack.utils.export_utils import (
-    print_answers,
-    print_documents,
-    print_questions,
-    export_answers_to_csv,
-    convert_labels_to_squad,
-)
-from haystack.utils.squad_data import SquadData
-from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
-from haystack.utils.experiment_tracking import (
-    Tracker,
-    NoTrackingHead,
-    BaseTrackingHead,
-    MLflowTrackingHead,
-    StdoutTrackingHead,
-)
-from haystack.utils.early_stopping import EarlyStopping
-from haystack.utils.labels import aggregate_labels
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+from haystack.utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from haystack.utils.reflection import args_to_kwargs
+    from haystack.utils.preprocessing import (
+        ConversionReport,
+        convert_files_to_docs,
+        convert_files_to_docs_generator,
+        tika_convert_files_to_docs,
+        tika_convert_files_to_docs_generator,
+    )
+    from haystack.utils.import_utils import fetch_archive_from_http
+    from haystack.utils.cleaning import clean_wiki_text
+    from haystack.utils.doc_store import (
+        launch_es,
+        launch_milvus,
+        launch_opensearch,
+        launch_weaviate,
+        stop_opensearch,
+        stop_service,
+    )
+    from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudError, DeepsetCloudExperiments
+    from haystack.utils.export_utils import (
+        print_answers,
+        print_documents,
+        print_questions,
+        export_answers_to_csv,
+        convert_labels_to_squad,
+    )
+    from haystack.utils.squad_data import SquadData
+    from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
+    from haystack.utils.experiment_tracking import (
+        Tracker,
+        NoTrackingHead,
+        BaseTrackingHead,
+        MLflowTrackingHead,
+        StdoutTrackingHead,
+    )
+    from haystack.utils.early_stopping import EarlyStopping
+    from haystack.utils.labels import aggregate_labels
+    from haystack.utils.tracing import BaseTracer, ChromeTraceExporter, TraceAggregator, add_tracer, remove_tracer
+
+
+# The modules are only imported when one of their names is first used, see `lazy_exports()`
+_EXPORTS: Dict[str, Union[str, Tuple[str, str]]] = {
+    "args_to_kwargs": "haystack.utils.reflection",
+    "ConversionReport": "haystack.utils.preprocessing",
+    "convert_files_to_docs": "haystack.utils.preprocessing",
+    "convert_files_to_docs_generator": "haystack.utils.preprocessing",
+    "tika_convert_files_to_docs": "haystack.utils.preprocessing",
+    "tika_convert_files_to_docs_generator": "haystack.utils.preprocessing",
+    "fetch_archive_from_http": "haystack.utils.import_utils",
+    "clean_wiki_text": "haystack.utils.cleaning",
+    "launch_es": "haystack.utils.doc_store",
+    "launch_milvus": "haystack.utils.doc_store",
+    "launch_opensearch": "haystack.utils.doc_store",
+    "launch_weaviate": "haystack.utils.doc_store",
+    "stop_opensearch": "haystack.utils.doc_store",
+    "stop_service": "haystack.utils.doc_store",
+    "DeepsetCloud": "haystack.utils.deepsetcloud",
+    "DeepsetCloudError": "haystack.utils.deepsetcloud",
+    "DeepsetCloudExperiments": "haystack.utils.deepsetcloud",
+    "print_answers": "haystack.utils.export_utils",
+    "print_documents": "haystack.utils.export_utils",
+    "print_questions": "haystack.utils.export_utils",
+    "export_answers_to_csv": "haystack.utils.export_utils",
+    "convert_labels_to_squad": "haystack.utils.export_utils",
+    "SquadData": "haystack.utils.squad_data",
+    "calculate_context_similarity": "haystack.utils.context_matching",
+    "match_context": "haystack.utils.context_matching",
+    "match_contexts": "haystack.utils.context_matching",
+    "Tracker": "haystack.utils.experiment_tracking",
+    "NoTrackingHead": "haystack.utils.experiment_tracking",
+    "BaseTrackingHead": "haystack.utils.experiment_tracking",
+    "MLflowTrackingHead": "haystack.utils.experiment_tracking",
+    "StdoutTrackingHead": "haystack.utils.experiment_tracking",
+    "EarlyStopping": "haystack.utils.early_stopping",
+    "aggregate_labels": "haystack.utils.labels",
+    "BaseTracer": "haystack.utils.tracing",
+    "ChromeTraceExporter": "haystack.utils.tracing",
+    "TraceAggregator": "haystack.utils.tracing",
+    "add_tracer": "haystack.utils.tracing",
+    "remove_tracer": "haystack.utils.tracing",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,9 +1,9 @@
-from typing import Generator, Iterable, Optional, Tuple, List, Union
+from typing import Dict, Generator, Iterable, Iterator, Optional, Set, Tuple, List, Union
 
 import re
-from itertools import groupby
+from contextlib import contextmanager
 from multiprocessing.pool import Pool
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 from rapidfuzz import fuzz
 from tqdm.auto import tqdm
@@ -11,19 +11,76 @@ from tqdm.auto import tqdm
 
 _CandidateScore = namedtuple("_CandidateScore", ["context_id", "candidate_id", "score"])
 
+# Length of the character n-grams and size of the winnowing window used by the prefilter index.
+# Any context and candidate sharing a substring of at least _SHINGLE_SIZE + _WINNOWING_WINDOW - 1 characters
+# (after normalization) are guaranteed to be scored.
+_SHINGLE_SIZE = 8
+_WINNOWING_WINDOW = 16
+
+_WHITE_SPACE_PATTERN = re.compile(r"\s+")
+
 
 def _score_candidate(args: Tuple[Union[str, Tuple[object, str]], Tuple[object, str], int, bool]):
     context, candidate, min_length, boost_split_overlaps = args
     candidate_id, candidate_text = candidate
     context_id, context_text = (None, context) if isinstance(context, str) else context
-    score = calculate_context_similarity(
+    score = _calculate_normalized_context_similarity(
         context=context_text, candidate=candidate_text, min_length=min_length, boost_split_overlaps=boost_split_overlaps
     )
     return _CandidateScore(context_id=context_id, candidate_id=candidate_id, score=score)
 
 
+@contextmanager
+def _scoring_pool(num_processes: Optional[int], pool: Optional[Pool]) -> Iterator[Optional[Pool]]:
+    """
+    Yields the pool to score candidates in: the caller's `pool` if given, otherwise a pool with `num_processes`
+    processes that is closed on exit, or None for scoring in the current process.
+    """
+    if pool is not None or (num_processes is not None and num_processes <= 1):
+        yield pool
+        return
+
+    with Pool(processes=num_processes) as scoring_pool:
+        yield scoring_pool
+
+
+class _ShingleIndex:
+    """
+    Inverted index from winnowed character shingles to the ids of the texts containing them.
+
+    Used to prefilter the (context, candidate) pairs that get fuzzy-scored: only pairs sharing at least one
+    fingerprint are scored instead of all pairs.
+    """
+
+    def __init__(self, texts: List[str], shingle_size: int = _SHINGLE_SIZE, window: int = _WINNOWING_WINDOW):
+        self.shingle_size = shingle_size
+        self.window = window
+        self._index: Dict[int, List[int]] = defaultdict(list)
+        for text_id, text in enumerate(texts):
+            for fingerprint in self.fingerprints(text):
+                self._index[fingerprint].append(text_id)
+
+    def fingerprints(self, text: str) -> Set[int]:
+        """
+        Selects the minimum shingle hash of every window of `window` consecutive shingles (winnowing).
+        """
+        hashes = [hash(text[i : i + self.shingle_size]) for i in range(len(text) - self.shingle_size + 1)]
+        if len(hashes) <= self.window:
+            return {min(hashes)} if hashes else set()
+        return {min(hashes[i : i + self.window]) for i in range(len(hashes) - self.window + 1)}
+
+    def query(self, text: str) -> List[int]:
+        """
+        Returns the sorted ids of all indexed texts sharing at least one fingerprint with `text`.
+        """
+        text_ids: Set[int] = set()
+        for fingerprint in self.fingerprints(text):
+            text_ids.update(self._index.get(fingerprint, ()))
+        return sorted(text_ids)
+
+
 def normalize_white_space_and_case(str: str) -> str:
-    return re.sub(r"\s+", " ", str).lower().strip()
+    return _WHITE_SPACE_PATTERN.sub(" ", str).lower().strip()
 
 
 def _no_processor(str: str) -> str:
@@ -51,6 +108,18 @@ def calculate_context_similarity(
     # this has to be done after normalizing
     context = normalize_white_space_and_case(context)
     candidate = normalize_white_space_and_case(candidate)
+    return _calculate_normalized_context_similarity(
+        context=context, candidate=candidate, min_length=min_length, boost_split_overlaps=boost_split_overlaps
+    )
+
+
+def _calculate_normalized_context_similarity(
+    context: str, candidate: str, min_length: int = 100, boost_split_overlaps: bool = True
+) -> float:
+    """
+    Same as `calculate_context_similarity` but expects context and candidate to be normalized already
+    (see `normalize_white_space_and_case`).
+    """
     context_len = len(context)
     candidate_len = len(candidate)
     if candidate_len < min_length or context_len < min_length:
@@ -91,6 +160,33 @@ def calculate_context_similarity(
     return score
 
 
+def _score_candidates(
+    score_candidate_args: Iterable, show_progress: bool, pool: Optional[Pool], chunksize: int
+) -> Iterator[_CandidateScore]:
+    if pool is not None:
+        candidate_scores: Iterable = pool.imap_unordered(_score_candidate, score_candidate_args, chunksize=chunksize)
+    else:
+        candidate_scores = map(_score_candidate, score_candidate_args)
+
+    if show_progress:
+        candidate_scores = tqdm(candidate_scores)
+
+    return iter(candidate_scores)
+
+
+def _normalized_candidates(
+    candidates: Iterable[Tuple[str, str]], min_length: int, threshold: float
+) -> Iterator[Tuple[str, str]]:
+    """
+    Normalizes the candidate texts and skips candidates that are too short to ever surpass the threshold.
+    """
+    for candidate_id, candidate_text in candidates:
+        candidate_text = normalize_white_space_and_case(candidate_text)
+        if len(candidate_text) < min_length and threshold >= 0.0:
+            continue
+        yield candidate_id, candidate_text
+
+
 def match_context(
     context: str,
     candidates: Generator[Tuple[str, str], None, None],
@@ -100,11 +196,14 @@ def match_context(
     chunksize: int = 1,
     min_length: int = 100,
     boost_split_overlaps: bool = True,
+    use_index: bool = False,
+    pool: Optional[Pool] = None,
 ) -> List[Tuple[str, float]]:
     """
     Matches the context against multiple candidates. Candidates consist of a tuple of an id and its text.
 
     Returns a sorted list of the candidate ids and its scores filtered by the threshold in descending order.
+    Candidates with the same score are sorted by id.
 
     :param context: The context to match.
     :param candidates: The candidates to match the context.
@@ -112,6 +211,8 @@ def match_context(
     :param threshold: Score threshold that candidates must surpass to be included into the result list.
     :param show_progress: Whether to show the progress of matching all candidates.
     :param num_processes: The number of processes to be used for matching in parallel.
+                          The worker pool is created for this call and closed before it returns.
+                          Ignored if `pool` is passed.
     :param chunksize: The chunksize used during parallel processing.
                       If not specified chunksize is 1.
                       For very long iterables using a large value for chunksize can make the job complete much faster than using the default value of 1.
@@ -121,31 +222,34 @@ def match_context(
                                  If we detect that the score is near a half match and the matching part of the candidate is at its boundaries
                                  we cut the context on the same side, recalculate the score and take the mean of both.
                                  Thus [AB] <-> [BC] (score ~50) gets recalculated with B <-> B (score ~100) scoring ~75 in total.
+    :param use_index: Whether to only score candidates that share at least one winnowed character shingle with the context.
+                      This is much faster for many candidates, but candidates that don't share any substring of 23 or more
+                      characters with the context are skipped even if they would have surpassed the threshold (for example
+                      heavily noised texts). By default, all candidates are scored.
+    :param pool: A multiprocessing Pool to match in, for example to reuse the same worker processes across calls:
+                 `with Pool() as pool: match_context(..., pool=pool)`. The caller is responsible for closing it.
     """
-    pool: Optional[Pool] = None
-    try:
-        score_candidate_args = ((context, candidate, min_length, boost_split_overlaps) for candidate in candidates)
-        if num_processes is None or num_processes > 1:
-            pool = Pool(processes=num_processes)
-            candidate_scores: Iterable = pool.imap_unordered(
-                _score_candidate, score_candidate_args, chunksize=chunksize
-            )
-        else:
-            candidate_scores = map(_score_candidate, score_candidate_args)
-
-        if show_progress:
-            candidate_scores = tqdm(candidate_scores)
-
-        matches = (candidate for candidate in candidate_scores if candidate.score > threshold)
-        sorted_matches = sorted(matches, key=lambda candidate: candidate.score, reverse=True)
-        match_list = list((candidate_score.candidate_id, candidate_score.score) for candidate_score in sorted_matches)
+    context = normalize_white_space_and_case(context)
+    if len(context) < min_length and threshold >= 0.0:
+        return []
+
+    index = _ShingleIndex([context]) if use_index else None
+    score_candidate_args = (
+        (context, candidate, min_length, boost_split_overlaps)
+        for candidate in _normalized_candidates(candidates, min_length=min_length, threshold=threshold)
+        if index is None or index.query(candidate[1])
+    )
+    with _scoring_pool(num_processes=num_processes, pool=pool) as scoring_pool:
+        candidate_scores = _score_candidates(
+            score_candidate_args, show_progress=show_progress, pool=scoring_pool, chunksize=chunksize
+        )
+        matches = [candidate for candidate in candidate_scores if candidate.score > threshold]
 
-        return match_list
+    # Break ties by candidate id, as parallel scoring returns the candidates in no particular order
+    sorted_matches = sorted(matches, key=lambda candidate: (-candidate.score, candidate.candidate_id))
+    match_list = list((candidate_score.candidate_id, candidate_score.score) for candidate_score in sorted_matches)
 
-    finally:
-        if pool:
-            pool.close()
-            pool.join()
+    return match_list
 
 
 def match_contexts(
@@ -157,12 +261,18 @@ def match_contexts(
     chunksize: int = 1,
     min_length: int = 100,
     boost_split_overlaps: bool = True,
+    use_index: bool = False,
+    pool: Optional[Pool] = None,
 ) -> List[List[Tuple[str, float]]]:
     """
     Matches the contexts against multiple candidates. Candidates consist of a tuple of an id and its string text.
     This method iterates over candidates only once.
 
+    With `use_index=True`, the contexts are indexed by winnowed character shingles, so that each candidate is only
+    scored against the contexts it shares at least one shingle with instead of against all contexts.
+
     Returns for each context a sorted list of the candidate ids and its scores filtered by the threshold in descending order.
+    Candidates with the same score are sorted by id.
 
     :param contexts: The contexts to match.
     :param candidates: The candidates to match the context.
@@ -170,6 +280,8 @@ def match_contexts(
     :param threshold: Score threshold that candidates must surpass to be included into the result list.
     :param show_progress: Whether to show the progress of matching all candidates.
     :param num_processes: The number of processes to be used for matching in parallel.
+                          The worker pool is created for this call and closed before it returns.
+                          Ignored if `pool` is passed.
     :param chunksize: The chunksize used during parallel processing.
                       If not specified chunksize is 1.
                       For very long iterables using a large value for chunksize can make the job complete much faster than using the default value of 1.
@@ -179,38 +291,33 @@ def match_contexts(
                                  If we detect that the score is near a half match and the matching part of the candidate is at its boundaries
                                  we cut the context on the same side, recalculate the score and take the mean of both.
                                  Thus [AB] <-> [BC] (score ~50) gets recalculated with B <-> B (score ~100) scoring ~75 in total.
+    :param use_index: Whether to only score (context, candidate) pairs that share at least one winnowed character shingle.
+                      This is much faster for many contexts and candidates, but pairs that don't share any substring of 23 or
+                      more characters are skipped even if they would have surpassed the threshold (for example heavily noised
+                      texts). By default, all pairs are scored.
+    :param pool: A multiprocessing Pool to match in, for example to reuse the same worker processes across calls:
+                 `with Pool() as pool: match_contexts(..., pool=pool)`. The caller is responsible for closing it.
     """
-    pool: Optional[Pool] = None
-    try:
-        score_candidate_args = (
-            (context, candidate, min_length, boost_split_overlaps)
-            for candidate in candidates
-            for context in enumerate(contexts)
+    normalized_contexts = [normalize_white_space_and_case(context) for context in contexts]
+    index = _ShingleIndex(normalized_contexts) if use_index else None
+    all_context_ids = list(range(len(normalized_contexts)))
+
+    score_candidate_args = (
+        ((context_id, normalized_contexts[context_id]), candidate, min_length, boost_split_overlaps)
+        for candidate in _normalized_candidates(candidates, min_length=min_length, threshold=threshold)
+        for context_id in (index.query(candidate[1]) if index is not None else all_context_ids)
+    )
+    # Group the matches by context while they come in instead of sorting all matches at the end
+    match_lists: List[List[Tuple[str, float]]] = [[] for _ in contexts]
+    with _scoring_pool(num_processes=num_processes, pool=pool) as scoring_pool:
+        candidate_scores = _score_candidates(
+            score_candidate_args, show_progress=show_progress, pool=scoring_pool, chunksize=chunksize
         )
-
-        if num_processes is None or num_processes > 1:
-            pool = Pool(processes=num_processes)
-            candidate_scores: Iterable = pool.imap_unordered(
-                _score_candidate, score_candidate_args, chunksize=chunksize
-            )
-        else:
-            candidate_scores = map(_score_candidate, score_candidate_args)
-
-        if show_progress:
-            candidate_scores = tqdm(candidate_scores)
-
-        match_lists: List[List[Tuple[str, float]]] = list()
-        matches = (candidate for candidate in candidate_scores if candidate.score > threshold)
-        group_sorted_matches = sorted(matches, key=lambda candidate: candidate.context_id)
-        grouped_matches = groupby(group_sorted_matches, key=lambda candidate: candidate.context_id)
-        for context_id, group in grouped_matches:
-            sorted_group = sorted(group, key=lambda candidate: candidate.score, reverse=True)
-            match_list = list((candiate_score.candidate_id, candiate_score.score) for candiate_score in sorted_group)
-            match_lists.insert(context_id, match_list)
-
-        return match_lists
-
-    finally:
-        if pool:
-            pool.close()
-            pool.join()
+        for candidate_score in candidate_scores:
+            if candidate_score.score > threshold:
+                match_lists[candidate_score.context_id].append((candidate_score.candidate_id, candidate_score.score))
+    for match_list in match_lists:
+        # Break ties by candidate id, as parallel scoring returns the candidates in no particular order
+        match_list.sort(key=lambda match: (-match[1], match[0]))
+
+    return match_lists
@@ -0,0 +1,50 @@
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import importlib
+import sys
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Union[str, Tuple[str, str]]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns the module-level `__getattr__` and `__dir__` functions (PEP 562) that let a package export names without
+    importing the modules that define them until they're first used.
+
+    ```python
+    __getattr__, __dir__ = lazy_exports(__name__, {"BM25Retriever": "haystack.nodes.retriever"})
+    ```
+
+    :param package: The name of the package that exports the names.
+    :param exports: Maps each exported name to the module it's imported from. For names that need optional
+                    dependencies, pass a tuple `(module, dependency group)` instead. If the dependencies are missing,
+                    the name is replaced by a placeholder that raises an error when it's used, like `safe_import()`.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            if name.startswith("__"):
+                raise AttributeError(f"module '{package}' has no attribute '{name}'")
+            # Submodules were available as attributes when the package imported them eagerly
+            try:
+                return importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        module_name = exports[name]
+        if isinstance(module_name, tuple):
+            from haystack.utils.import_utils import safe_import
+
+            value = safe_import(module_name[0], name, module_name[1])
+        else:
+            value = getattr(importlib.import_module(module_name), name)
+        # Cache the value, so that __getattr__ is only called on first access
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
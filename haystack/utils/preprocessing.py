@@ -1,8 +1,15 @@
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Generator, Hashable, Iterable, Iterator, List, Optional, Tuple, Type
 
 import re
+import hashlib
 import logging
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import count
+from multiprocessing import Pool, cpu_count
 from pathlib import Path
+from queue import Empty, Queue
 
 from haystack.nodes.file_converter import BaseConverter, DocxToTextConverter, PDFToTextConverter, TextConverter
 from haystack.schema import Document
@@ -11,6 +18,31 @@ from haystack.schema import Document
 logger = logging.getLogger(__name__)
 
 
+# Converters are created once per process and reused for all files
+_converters: Dict[Hashable, BaseConverter] = {}
+
+_CONVERTER_CLASSES: Dict[str, Type[BaseConverter]] = {
+    ".pdf": PDFToTextConverter,
+    ".txt": TextConverter,
+    ".docx": DocxToTextConverter,
+}
+
+
+@dataclass
+class ConversionReport:
+    """
+    Outcome of a `convert_files_to_docs_generator()` or `tika_convert_files_to_docs_generator()` run.
+
+    :param converted: Paths of the files that were converted.
+    :param skipped: Paths of the files that were skipped because the manifest lists them as converted.
+    :param failed: Paths of the files that couldn't be converted, mapped to the error.
+    """
+
+    converted: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
 def convert_files_to_docs(
     dir_path: str,
     clean_func: Optional[Callable] = None,
@@ -32,56 +64,73 @@ def convert_files_to_docs(
             not unique, you can modify the metadata and pass [`"content"`, `"meta"`] to this field.
             If you do this, the Document ID will be generated by using the content and the defined metadata.
     """
-    file_paths = [p for p in Path(dir_path).glob("**/*")]
-    allowed_suffixes = [".pdf", ".txt", ".docx"]
-    suffix2converter: Dict[str, BaseConverter] = {}
-
-    suffix2paths: Dict[str, List[Path]] = {}
-    for path in file_paths:
-        file_suffix = path.suffix.lower()
-        if file_suffix in allowed_suffixes:
-            if file_suffix not in suffix2paths:
-                suffix2paths[file_suffix] = []
-            suffix2paths[file_suffix].append(path)
-        elif not path.is_dir():
-            logger.warning(
-                "Skipped file %s as type %s is not supported here. "
-                "See haystack.file_converter for support of more file types",
+    documents = []
+    for path in _get_file_paths(dir_path, allowed_suffixes=[".pdf", ".txt", ".docx"]):
+        logger.info("Converting %s", path)
+        documents.extend(
+            _convert_file(
                 path,
-                file_suffix,
+                clean_func=clean_func,
+                split_paragraphs=split_paragraphs,
+                encoding=encoding,
+                id_hash_keys=id_hash_keys,
             )
+        )
 
-    # No need to initialize converter if file type not present
-    for file_suffix in suffix2paths.keys():
-        if file_suffix == ".pdf":
-            suffix2converter[file_suffix] = PDFToTextConverter()
-        if file_suffix == ".txt":
-            suffix2converter[file_suffix] = TextConverter()
-        if file_suffix == ".docx":
-            suffix2converter[file_suffix] = DocxToTextConverter()
+    return documents
 
-    documents = []
-    for suffix, paths in suffix2paths.items():
-        for path in paths:
-            logger.info("Converting %s", path)
-            # PDFToTextConverter, TextConverter, and DocxToTextConverter return a list containing a single Document
-            document = suffix2converter[suffix].convert(
-                file_path=path, meta=None, encoding=encoding, id_hash_keys=id_hash_keys
-            )[0]
-            text = document.content
-
-            if clean_func:
-                text = clean_func(text)
-
-            if split_paragraphs:
-                for para in text.split("\n\n"):
-                    if not para.strip():  # skip empty paragraphs
-                        continue
-                    documents.append(Document(content=para, meta={"name": path.name}, id_hash_keys=id_hash_keys))
-            else:
-                documents.append(Document(content=text, meta={"name": path.name}, id_hash_keys=id_hash_keys))
 
-    return documents
+def convert_files_to_docs_generator(
+    dir_path: str,
+    clean_func: Optional[Callable] = None,
+    split_paragraphs: bool = False,
+    encoding: Optional[str] = None,
+    id_hash_keys: Optional[List[str]] = None,
+    num_processes: Optional[int] = None,
+    timeout: Optional[float] = None,
+    report: Optional[ConversionReport] = None,
+    manifest_path: Optional[str] = None,
+) -> Generator[Document, None, None]:
+    """
+    Convert all files (.txt, .pdf, .docx) in the sub-directories of the given path to Documents like
+    `convert_files_to_docs()`, but convert the files in parallel and yield the Documents of each file as soon as it's
+    converted, so they don't all need to fit in memory. Files that can't be converted are logged and recorded in
+    `report` instead of stopping the conversion. The Documents of the files are yielded in the order the files finish.
+
+    :param dir_path: The path of the directory containing the Files.
+    :param clean_func: A custom cleaning function that gets applied to each Document (input: str, output: str).
+                       It must be picklable (for example, not a lambda) to be used in worker processes.
+    :param split_paragraphs: Whether to split text by paragraph.
+    :param encoding: Character encoding to use when converting pdf documents.
+    :param id_hash_keys: A list of Document attribute names from which the Document ID should be hashed from.
+            Useful for generating unique IDs even if the Document contents are identical.
+            To ensure you don't have duplicate Documents in your Document Store if texts are
+            not unique, you can modify the metadata and pass [`"content"`, `"meta"`] to this field.
+            If you do this, the Document ID will be generated by using the content and the defined metadata.
+    :param num_processes: The number of processes that convert files in parallel. Defaults to the number of CPUs.
+                          With 1 process and no `timeout`, the files are converted in the current process.
+    :param timeout: Seconds after which the conversion of a file is stopped and the file is recorded as failed.
+                    `None` means no timeout.
+    :param report: A `ConversionReport` that records which files were converted, skipped, or failed.
+    :param manifest_path: Path of a file that lists the hashes of the files that were converted. Files whose hash is
+                          in the manifest are skipped, and the hash of each converted file is added once all its
+                          Documents were consumed. Use it to resume a conversion that was interrupted.
+    """
+    convert = partial(
+        _convert_file,
+        clean_func=clean_func,
+        split_paragraphs=split_paragraphs,
+        encoding=encoding,
+        id_hash_keys=id_hash_keys,
+    )
+    yield from _convert_files(
+        convert,
+        _get_file_paths(dir_path, allowed_suffixes=[".pdf", ".txt", ".docx"]),
+        num_processes=num_processes,
+        timeout=timeout,
+        report=report,
+        manifest_path=manifest_path,
+    )
 
 
 def tika_convert_files_to_docs(
@@ -107,20 +156,86 @@ def tika_convert_files_to_docs(
             not unique, you can modify the metadata and pass [`"content"`, `"meta"`] to this field.
             If you do this, the Document ID will be generated by using the content and the defined metadata.
     """
-    try:
-        from haystack.nodes.file_converter import TikaConverter
-    except Exception as ex:
-        logger.error("Tika not installed. Please install tika and try again. Error: %s", ex)
-        raise ex
-    converter = TikaConverter()
-    paths = [p for p in Path(dir_path).glob("**/*")]
-    allowed_suffixes = [".pdf", ".txt"]
-    file_paths: List[Path] = []
+    documents = []
+    for path in _get_file_paths(dir_path, allowed_suffixes=[".pdf", ".txt"]):
+        logger.info("Converting %s", path)
+        documents.extend(
+            _tika_convert_file(
+                path,
+                clean_func=clean_func,
+                split_paragraphs=split_paragraphs,
+                merge_short=merge_short,
+                merge_lowercase=merge_lowercase,
+                id_hash_keys=id_hash_keys,
+            )
+        )
+
+    return documents
+
+
+def tika_convert_files_to_docs_generator(
+    dir_path: str,
+    clean_func: Optional[Callable] = None,
+    split_paragraphs: bool = False,
+    merge_short: bool = True,
+    merge_lowercase: bool = True,
+    id_hash_keys: Optional[List[str]] = None,
+    tika_url: str = "http://localhost:9998/tika",
+    num_processes: Optional[int] = None,
+    timeout: Optional[float] = None,
+    report: Optional[ConversionReport] = None,
+    manifest_path: Optional[str] = None,
+) -> Generator[Document, None, None]:
+    """
+    Convert all files (.txt, .pdf) in the sub-directories of the given path to Documents like
+    `tika_convert_files_to_docs()`, but convert the files in parallel and yield the Documents of each file as soon as
+    it's converted. Files that can't be converted are logged and recorded in `report` instead of stopping the
+    conversion. See `convert_files_to_docs_generator()` for the parallelism, timeout, and resume parameters.
+
+    :param merge_lowercase: Whether to convert merged paragraphs to lowercase.
+    :param merge_short: Whether to allow merging of short paragraphs
+    :param dir_path: The path to the directory containing the files.
+    :param clean_func: A custom cleaning function that gets applied to each doc (input: str, output:str).
+                       It must be picklable (for example, not a lambda) to be used in worker processes.
+    :param split_paragraphs: Whether to split text by paragraphs.
+    :param id_hash_keys: A list of Document attribute names from which the Document ID should be hashed from.
+    :param tika_url: URL of the Tika server.
+    :param num_processes: The number of processes that convert files in parallel. Defaults to the number of CPUs.
+    :param timeout: Seconds after which the conversion of a file is stopped and the file is recorded as failed.
+    :param report: A `ConversionReport` that records which files were converted, skipped, or failed.
+    :param manifest_path: Path of a file that lists the hashes of the files that were converted, to skip them.
+    """
+    convert = partial(
+        _tika_convert_file,
+        clean_func=clean_func,
+        split_paragraphs=split_paragraphs,
+        merge_short=merge_short,
+        merge_lowercase=merge_lowercase,
+        id_hash_keys=id_hash_keys,
+        tika_url=tika_url,
+    )
+    yield from _convert_files(
+        convert,
+        _get_file_paths(dir_path, allowed_suffixes=[".pdf", ".txt"]),
+        num_processes=num_processes,
+        timeout=timeout,
+        report=report,
+        manifest_path=manifest_path,
+    )
 
-    for path in paths:
+
+def _get_file_paths(dir_path: str, allowed_suffixes: List[str]) -> List[Path]:
+    """
+    Returns the paths of the files in the sub-directories of `dir_path` that have one of the `allowed_suffixes`,
+    grouped by suffix.
+    """
+    suffix2paths: Dict[str, List[Path]] = {}
+    for path in Path(dir_path).glob("**/*"):
         file_suffix = path.suffix.lower()
         if file_suffix in allowed_suffixes:
-            file_paths.append(path)
+            if file_suffix not in suffix2paths:
+                suffix2paths[file_suffix] = []
+            suffix2paths[file_suffix].append(path)
         elif not path.is_dir():
             logger.warning(
                 "Skipped file %s as type %s is not supported here. "
@@ -128,59 +243,244 @@ def tika_convert_files_to_docs(
                 path,
                 file_suffix,
             )
+    return [path for paths in suffix2paths.values() for path in paths]
+
+
+def _convert_file(
+    path: Path,
+    clean_func: Optional[Callable] = None,
+    split_paragraphs: bool = False,
+    encoding: Optional[str] = None,
+    id_hash_keys: Optional[List[str]] = None,
+) -> List[Document]:
+    file_suffix = path.suffix.lower()
+
+    # PDFToTextConverter, TextConverter, and DocxToTextConverter return a list containing a single Document
+    document = _get_converter(_CONVERTER_CLASSES[file_suffix]).convert(
+        file_path=path, meta=None, encoding=encoding, id_hash_keys=id_hash_keys
+    )[0]
+    text = document.content
+
+    if clean_func:
+        text = clean_func(text)
 
     documents = []
-    for path in file_paths:
-        logger.info("Converting %s", path)
-        # TikaConverter returns a list containing a single Document
-        document = converter.convert(path)[0]
-        meta = document.meta or {}
-        meta["name"] = path.name
-        text = document.content
-        pages = text.split("\f")
-
-        if split_paragraphs:
-            if pages:
-                paras = pages[0].split("\n\n")
-                # pop the last paragraph from the first page
-                last_para = paras.pop(-1) if paras else ""
-                for page in pages[1:]:
-                    page_paras = page.split("\n\n")
-                    # merge the last paragraph in previous page to the first paragraph in this page
-                    if page_paras:
-                        page_paras[0] = last_para + " " + page_paras[0]
-                        last_para = page_paras.pop(-1)
-                        paras += page_paras
+    if split_paragraphs:
+        for para in text.split("\n\n"):
+            if not para.strip():  # skip empty paragraphs
+                continue
+            documents.append(Document(content=para, meta={"name": path.name}, id_hash_keys=id_hash_keys))
+    else:
+        documents.append(Document(content=text, meta={"name": path.name}, id_hash_keys=id_hash_keys))
+    return documents
+
+
+def _get_converter(converter_class: Type[BaseConverter], **kwargs) -> BaseConverter:
+    """
+    Returns the converter of this process for the given class and init parameters, creating it on first use. The
+    class is part of the key, so a converter class that was replaced (for example, by a mock) isn't reused afterwards.
+    """
+    key = (converter_class, tuple(sorted(kwargs.items())))
+    if key not in _converters:
+        _converters[key] = converter_class(**kwargs)
+    return _converters[key]
+
+
+def _tika_convert_file(
+    path: Path,
+    clean_func: Optional[Callable] = None,
+    split_paragraphs: bool = False,
+    merge_short: bool = True,
+    merge_lowercase: bool = True,
+    id_hash_keys: Optional[List[str]] = None,
+    tika_url: str = "http://localhost:9998/tika",
+) -> List[Document]:
+    try:
+        from haystack.nodes.file_converter import TikaConverter
+    except Exception as ex:
+        logger.error("Tika not installed. Please install tika and try again. Error: %s", ex)
+        raise ex
+
+    # TikaConverter returns a list containing a single Document
+    document = _get_converter(TikaConverter, tika_url=tika_url).convert(path)[0]
+    meta = document.meta or {}
+    meta["name"] = path.name
+    text = document.content
+    pages = text.split("\f")
+
+    documents = []
+    if split_paragraphs:
+        if pages:
+            paras = pages[0].split("\n\n")
+            # pop the last paragraph from the first page
+            last_para = paras.pop(-1) if paras else ""
+            for page in pages[1:]:
+                page_paras = page.split("\n\n")
+                # merge the last paragraph in previous page to the first paragraph in this page
+                if page_paras:
+                    page_paras[0] = last_para + " " + page_paras[0]
+                    last_para = page_paras.pop(-1)
+                    paras += page_paras
+            if last_para:
+                paras.append(last_para)
+            if paras:
+                last_para = ""
+                for para in paras:
+                    para = para.strip()
+                    if not para:
+                        continue
+
+                    # this paragraph is less than 10 characters or 2 words
+                    para_is_short = len(para) < 10 or len(re.findall(r"\s+", para)) < 2
+                    # this paragraph starts with a lower case and last paragraph does not end with a punctuation
+                    para_is_lowercase = (
+                        para and para[0].islower() and last_para and last_para[-1] not in r'.?!"\'\]\)'
+                    )
+
+                    # merge paragraphs to improve qa
+                    if (merge_short and para_is_short) or (merge_lowercase and para_is_lowercase):
+                        last_para += " " + para
+                    else:
+                        if last_para:
+                            documents.append(Document(content=last_para, meta=meta, id_hash_keys=id_hash_keys))
+                        last_para = para
+                # don't forget the last one
                 if last_para:
-                    paras.append(last_para)
-                if paras:
-                    last_para = ""
-                    for para in paras:
-                        para = para.strip()
-                        if not para:
-                            continue
-
-                        # this paragraph is less than 10 characters or 2 words
-                        para_is_short = len(para) < 10 or len(re.findall(r"\s+", para)) < 2
-                        # this paragraph starts with a lower case and last paragraph does not end with a punctuation
-                        para_is_lowercase = (
-                            para and para[0].islower() and last_para and last_para[-1] not in r'.?!"\'\]\)'
-                        )
-
-                        # merge paragraphs to improve qa
-                        if (merge_short and para_is_short) or (merge_lowercase and para_is_lowercase):
-                            last_para += " " + para
-                        else:
-                            if last_para:
-                                documents.append(Document(content=last_para, meta=meta, id_hash_keys=id_hash_keys))
-                            last_para = para
-                    # don't forget the last one
-                    if last_para:
-                        documents.append(Document(content=last_para, meta=meta, id_hash_keys=id_hash_keys))
-
-        else:
-            if clean_func:
-                text = clean_func(text)
-            documents.append(Document(content=text, meta=meta, id_hash_keys=id_hash_keys))
+                    documents.append(Document(content=last_para, meta=meta, id_hash_keys=id_hash_keys))
+
+    else:
+        if clean_func:
+            text = clean_func(text)
+        documents.append(Document(content=text, meta=meta, id_hash_keys=id_hash_keys))
 
     return documents
+
+
+def _convert_files(
+    convert: Callable[[Path], List[Document]],
+    file_paths: List[Path],
+    num_processes: Optional[int],
+    timeout: Optional[float],
+    report: Optional[ConversionReport],
+    manifest_path: Optional[str],
+) -> Generator[Document, None, None]:
+    """
+    Converts the files with `convert`, skipping the files listed in the manifest, and yields their Documents.
+    """
+    report = report if report is not None else ConversionReport()
+    converted_hashes = set()
+    if manifest_path and Path(manifest_path).exists():
+        converted_hashes = set(Path(manifest_path).read_text(encoding="utf-8").split())
+
+    def files_to_convert() -> Iterator[Tuple[Path, Optional[str]]]:
+        for path in file_paths:
+            file_hash = _get_file_hash(path) if manifest_path else None
+            if file_hash in converted_hashes:
+                report.skipped.append(str(path))  # type: ignore [union-attr]
+                continue
+            yield path, file_hash
+
+    manifest = open(manifest_path, "a", encoding="utf-8") if manifest_path else None
+    try:
+        for path, file_hash, documents, error in _run_conversions(
+            convert, files_to_convert(), num_processes=num_processes, timeout=timeout
+        ):
+            if error is not None:
+                logger.warning("Couldn't convert %s: %s", path, error)
+                report.failed[str(path)] = error
+                continue
+            yield from documents
+            report.converted.append(str(path))
+            if manifest:
+                manifest.write(f"{file_hash}\n")
+                manifest.flush()
+    finally:
+        if manifest:
+            manifest.close()
+
+
+def _run_conversions(
+    convert: Callable[[Path], List[Document]],
+    files: Iterable[Tuple[Path, Any]],
+    num_processes: Optional[int],
+    timeout: Optional[float],
+) -> Iterator[Tuple[Path, Any, Optional[List[Document]], Optional[str]]]:
+    """
+    Converts each `(path, key)` of `files` and yields `(path, key, documents, error)` as the files finish. `error`
+    describes why a file couldn't be converted.
+
+    Only as many files as there are processes are converted at a time, so each file starts as soon as it's submitted
+    and its timeout counts from there. When a file times out, the pool is replaced to stop the stuck worker, and the
+    other files that were being converted are submitted again.
+    """
+    num_processes = num_processes if num_processes is not None else cpu_count()
+    if num_processes <= 1 and timeout is None:
+        for path, key in files:
+            try:
+                yield path, key, convert(path), None
+            except Exception as e:  # pylint: disable=broad-except
+                yield path, key, None, f"{type(e).__name__}: {e}"
+        return
+
+    results: Queue = Queue()
+    pending: Dict[int, Tuple[Path, Any, Optional[float]]] = {}
+    task_ids = count()
+    files = iter(files)
+    pool = Pool(processes=num_processes)
+
+    def submit(path: Path, key: Any):
+        task_id = next(task_ids)
+        pending[task_id] = (path, key, time.monotonic() + timeout if timeout is not None else None)
+        pool.apply_async(
+            convert,
+            (path,),
+            callback=lambda documents: results.put((task_id, documents, None)),
+            error_callback=lambda error: results.put((task_id, None, error)),
+        )
+
+    try:
+        files_left = True
+        while True:
+            while files_left and len(pending) < num_processes:
+                next_file = next(files, None)
+                if next_file is None:
+                    files_left = False
+                else:
+                    submit(*next_file)
+            if not pending:
+                return
+
+            deadlines = [deadline for _, _, deadline in pending.values() if deadline is not None]
+            try:
+                task_id, documents, error = results.get(
+                    timeout=max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                )
+            except Empty:
+                now = time.monotonic()
+                expired = [task_id for task_id, (_, _, deadline) in pending.items() if deadline and deadline <= now]
+                for task_id in expired:
+                    path, key, _ = pending.pop(task_id)
+                    yield path, key, None, f"Conversion timed out after {timeout} seconds"
+                pool.terminate()
+                pool.join()
+                pool = Pool(processes=num_processes)
+                for path, key, _ in [pending.pop(task_id) for task_id in list(pending)]:
+                    submit(path, key)
+                continue
+
+            # Results of files that were submitted again after a timeout arrive under their new task ID
+            if task_id not in pending:
+                continue
+            path, key, _ = pending.pop(task_id)
+            yield path, key, documents, None if error is None else f"{type(error).__name__}: {error}"
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _get_file_hash(path: Path) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
@@ -0,0 +1,76 @@
+import logging
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+STAGE_DONE = object()
+"""Sentinel that a stage puts into its output queue once it won't produce any more items."""
+
+
+class StageThroughput:
+    """
+    Thread-safe counter of the documents a pipeline stage processed and the time it spent working on them.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches = 0
+        self.documents = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, documents: int, seconds: float, batches: int = 1):
+        with self._lock:
+            self.batches += batches
+            self.documents += documents
+            self.seconds += seconds
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "documents": self.documents,
+            "seconds": self.seconds,
+            "documents_per_second": self.documents_per_second,
+        }
+
+    def log(self):
+        logger.info(
+            "%s: %s documents in %.2f s (%.1f docs/s)",
+            self.name,
+            self.documents,
+            self.seconds,
+            self.documents_per_second,
+        )
+
+
+def put_unless_stopped(queue: Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Put `item` into a bounded `queue`, giving up as soon as `stop` is set. Returns whether the item was enqueued.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def get_unless_stopped(queue: Queue, stop: threading.Event) -> Any:
+    """
+    Get the next item from `queue`, returning `STAGE_DONE` as soon as `stop` is set.
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=0.1)
+        except Empty:
+            continue
+    return STAGE_DONE
@@ -0,0 +1,320 @@
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, the memory usage isn't traced there
+    resource = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """
+    The execution of a node, or of a whole pipeline, as traced by `trace_span()`.
+
+    `cpu_time` is the CPU time of the whole process and `rss_delta` is the growth of its peak resident memory, in
+    bytes. If nodes run concurrently, for example in the REST API, they include the work of the other nodes.
+    """
+
+    name: str
+    category: str
+    method: str
+    component: str
+    start: float
+    thread_id: int
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rss_delta: Optional[int] = None
+    input_sizes: Dict[str, int] = field(default_factory=dict)
+    output_sizes: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class BaseTracer(ABC):
+    """
+    Base class for tracers. Register a tracer with `add_tracer()` to receive the spans of all the pipelines and nodes
+    that run in this process.
+    """
+
+    @abstractmethod
+    def on_span(self, span: Span):
+        """
+        Called with each finished span. Spans can finish in several threads at the same time.
+        """
+        raise NotImplementedError
+
+
+_tracers: List[BaseTracer] = []
+_tracers_lock = threading.Lock()
+
+
+def add_tracer(tracer: BaseTracer):
+    """
+    Starts sending the spans of all pipelines and nodes to `tracer`.
+    """
+    global _tracers  # pylint: disable=global-statement
+    with _tracers_lock:
+        # Replace the list instead of changing it, so that spans finishing meanwhile can iterate over the old one
+        _tracers = _tracers + [tracer]
+
+
+def remove_tracer(tracer: BaseTracer):
+    global _tracers  # pylint: disable=global-statement
+    with _tracers_lock:
+        _tracers = [registered for registered in _tracers if registered is not tracer]
+
+
+class _NoSpan:
+    """
+    Stands in for `_SpanRecorder` when no tracer is registered, so that tracing costs almost nothing when it's off.
+    """
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_output(self, output: Any):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _SpanRecorder:
+    def __init__(self, tracers: List[BaseTracer], span: Span):
+        self.tracers = tracers
+        self.span = span
+        self._output: Any = None
+
+    def __enter__(self) -> "_SpanRecorder":
+        self._rss = _get_peak_rss()
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def set_output(self, output: Any):
+        self._output = output
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.span.wall_time = time.perf_counter() - self._wall_start
+        self.span.cpu_time = time.process_time() - self._cpu_start
+        if self._rss is not None:
+            self.span.rss_delta = _get_peak_rss() - self._rss  # type: ignore
+        if exc_value is not None:
+            self.span.error = f"{exc_type.__name__}: {exc_value}"
+        if isinstance(self._output, dict):
+            self.span.output_sizes = get_sizes(self._output)
+        for tracer in self.tracers:
+            try:
+                tracer.on_span(self.span)
+            except Exception as e:  # pylint: disable=broad-except
+                # Never let tracing break a pipeline
+                logger.debug("Tracer %s failed to handle span '%s'", tracer, self.span.name, exc_info=e)
+        return False
+
+
+def trace_span(name: str, category: str, method: str, component: str, inputs: Dict[str, Any]):
+    """
+    Returns a context manager that times the code it wraps and sends the resulting span to the registered tracers.
+    Pass the outputs to its `set_output()` method to record their sizes. If no tracer is registered, it does nothing.
+
+    :param name: The name of the node, or "Pipeline".
+    :param category: "node" or "pipeline".
+    :param method: The method that's traced, for example "run" or "run_batch".
+    :param component: The class name of the node or pipeline.
+    :param inputs: The inputs of the method, used to record their sizes.
+    """
+    tracers = _tracers
+    if not tracers:
+        return _NO_SPAN
+    span = Span(
+        name=name,
+        category=category,
+        method=method,
+        component=component,
+        start=time.time(),
+        thread_id=threading.get_ident(),
+        input_sizes=get_sizes(inputs),
+    )
+    return _SpanRecorder(tracers, span)
+
+
+def traced_pipeline_method(method: Callable) -> Callable:
+    """
+    Decorator that traces each call of a `Pipeline` method as a span named "Pipeline".
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _tracers:
+            return method(self, *args, **kwargs)
+        inputs = inspect.signature(method).bind_partial(self, *args, **kwargs).arguments
+        with trace_span("Pipeline", "pipeline", method.__name__, type(self).__name__, inputs) as span:
+            output = method(self, *args, **kwargs)
+            span.set_output(output)
+        return output
+
+    return wrapper
+
+
+def get_sizes(data: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Counts the queries, documents, answers, and whitespace-separated tokens of the queries and documents in the input
+    or output of a node. Join nodes' `inputs` are counted together.
+    """
+    sizes = {"queries": 0, "documents": 0, "answers": 0, "tokens": 0}
+    _add_sizes(data, sizes)
+    return {key: value for key, value in sizes.items() if value}
+
+
+def _add_sizes(data: Dict[str, Any], sizes: Dict[str, int]):
+    queries = data.get("queries") or data.get("query") or []
+    if isinstance(queries, str):
+        queries = [queries]
+    for query in queries:
+        if isinstance(query, str):
+            sizes["queries"] += 1
+            sizes["tokens"] += len(query.split())
+    for document in _flatten(data.get("documents")):
+        sizes["documents"] += 1
+        content = getattr(document, "content", None)
+        if isinstance(content, str):
+            sizes["tokens"] += len(content.split())
+    sizes["answers"] += sum(1 for _ in _flatten(data.get("answers")))
+    for node_input in data.get("inputs") or []:
+        if isinstance(node_input, dict):
+            _add_sizes(node_input, sizes)
+
+
+def _flatten(items: Any):
+    if isinstance(items, (list, tuple)):
+        for item in items:
+            yield from _flatten(item)
+    elif items is not None:
+        yield items
+
+
+def _get_peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+class TraceAggregator(BaseTracer):
+    """
+    Keeps the latest spans of each node in memory and reports the percentiles of their durations.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        :param window: How many of the latest spans of each node are used for the percentiles.
+        """
+        self.window = window
+        self._spans: Dict[str, Deque[Span]] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def on_span(self, span: Span):
+        key = f"{span.name}.{span.method}"
+        with self._lock:
+            self._spans.setdefault(key, deque(maxlen=self.window)).append(span)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            if span.error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns statistics for each node and method, for example for "Retriever.run" and "Pipeline.run": the number of
+        spans and errors, the p50 and p95 of the wall and CPU time in milliseconds, and the largest peak RSS delta.
+        """
+        with self._lock:
+            spans = {key: list(key_spans) for key, key_spans in self._spans.items()}
+            counts = dict(self._counts)
+            errors = dict(self._errors)
+        stats = {}
+        for key, key_spans in spans.items():
+            wall_times = sorted(span.wall_time * 1000 for span in key_spans)
+            cpu_times = sorted(span.cpu_time * 1000 for span in key_spans)
+            rss_deltas = [span.rss_delta for span in key_spans if span.rss_delta is not None]
+            stats[key] = {
+                "count": counts[key],
+                "errors": errors.get(key, 0),
+                "wall_time_ms_p50": _percentile(wall_times, 0.5),
+                "wall_time_ms_p95": _percentile(wall_times, 0.95),
+                "cpu_time_ms_p50": _percentile(cpu_times, 0.5),
+                "cpu_time_ms_p95": _percentile(cpu_times, 0.95),
+                "max_rss_delta": max(rss_deltas) if rss_deltas else None,
+            }
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counts.clear()
+            self._errors.clear()
+
+
+def _percentile(sorted_values: List[float], quantile: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(quantile * len(sorted_values)))]
+
+
+class ChromeTraceExporter(BaseTracer):
+    """
+    Collects spans as Chrome trace events. Open the saved file in chrome://tracing or https://ui.perfetto.dev to see
+    the nodes of each pipeline run on a timeline.
+    """
+
+    def __init__(self, max_events: Optional[int] = 100000):
+        """
+        :param max_events: How many of the latest events to keep. `None` keeps all of them.
+        """
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def on_span(self, span: Span):
+        args = asdict(span)
+        event = {
+            "name": args.pop("name"),
+            "cat": args.pop("category"),
+            "ph": "X",
+            "ts": args.pop("start") * 1e6,
+            "dur": args.pop("wall_time") * 1e6,
+            "pid": os.getpid(),
+            "tid": args.pop("thread_id"),
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+
+    def save(self, file_path: Path):
+        with open(file_path, "w") as trace_file:
+            json.dump(self.to_dict(), trace_file)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
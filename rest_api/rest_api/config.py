@@ -9,8 +9,20 @@ QUERY_PIPELINE_NAME = os.getenv("QUERY_PIPELINE_NAME", "query")
 INDEXING_PIPELINE_NAME = os.getenv("INDEXING_PIPELINE_NAME", "indexing")
 
 FILE_UPLOAD_PATH = os.getenv("FILE_UPLOAD_PATH", str((Path(__file__).parent / "file-upload").absolute()))
+# SQLite database that keeps the state of the background indexing jobs
+INDEXING_JOBS_DB_PATH = os.getenv("INDEXING_JOBS_DB_PATH", str(Path(FILE_UPLOAD_PATH) / "indexing-jobs.sqlite"))
+INDEXING_JOB_WORKERS = int(os.getenv("INDEXING_JOB_WORKERS", "1"))
+INDEXING_JOB_MAX_ATTEMPTS = int(os.getenv("INDEXING_JOB_MAX_ATTEMPTS", "3"))
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 ROOT_PATH = os.getenv("ROOT_PATH", "/")
 
 CONCURRENT_REQUEST_PER_WORKER = int(os.getenv("CONCURRENT_REQUEST_PER_WORKER", "4"))
+# Queries that arrive while all workers are busy wait in a queue of this size and are only rejected when it's full
+QUERY_QUEUE_SIZE = int(os.getenv("QUERY_QUEUE_SIZE", "32"))
+# Seconds after which a query that hasn't been answered fails. Set to 0 to wait indefinitely.
+QUERY_TIMEOUT = float(os.getenv("QUERY_TIMEOUT", "60")) or None
+# Maximum number of waiting queries with the same params that are answered in a single `Pipeline.run_batch` call
+QUERY_BATCH_SIZE = int(os.getenv("QUERY_BATCH_SIZE", "8"))
+# Share of the queries whose full request and response are logged
+QUERY_LOG_SAMPLE_RATE = float(os.getenv("QUERY_LOG_SAMPLE_RATE", "0.01"))
@@ -1,14 +1,22 @@
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import base64
+import binascii
+import json
 import logging
+import threading
+import uuid
+from collections import OrderedDict
+from itertools import chain, islice
 
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from haystack.document_stores import BaseDocumentStore
 from haystack.schema import Document
 
 from rest_api.utils import get_app, get_pipelines
 from rest_api.config import LOG_LEVEL
-from rest_api.schema import FilterRequest
+from rest_api.schema import FilterRequest, DocumentPageRequest, DocumentPageResponse
 
 
 logging.getLogger("haystack").setLevel(LOG_LEVEL)
@@ -19,6 +27,37 @@ router = APIRouter()
 app: FastAPI = get_app()
 document_store: BaseDocumentStore = get_pipelines().get("document_store", None)
 
+# Number of paginated document scans that are kept open to serve their next page
+PAGE_SCAN_CACHE_SIZE = 100
+
+
+class _PageScan:
+    """
+    The document scan of a paginated request, positioned at the first document of the next page.
+    """
+
+    def __init__(
+        self,
+        filters: Optional[Dict[str, Any]],
+        offset: int,
+        documents: Iterator[Document],
+        generator: Iterator[Document],
+    ):
+        self.filters = filters
+        self.offset = offset
+        self.documents = documents
+        self.generator = generator
+
+    def close(self):
+        # Closing the generator lets the document store release its resources, like the scroll context of a search
+        close = getattr(self.generator, "close", None)
+        if close is not None:
+            close()
+
+
+_page_scans: "OrderedDict[str, _PageScan]" = OrderedDict()
+_page_scans_lock = threading.Lock()
+
 
 @router.post("/documents/get_by_filters", response_model=List[Document], response_model_exclude_none=True)
 def get_documents(filters: FilterRequest):
@@ -32,6 +71,9 @@ def get_documents(filters: FilterRequest):
 
     To get all documents you should provide an empty dict, like:
     `'{"filters": {}}'`
+
+    All matching documents are returned in one response. For large document stores, use
+    `/documents/get_by_filters/page` or `/documents/stream_by_filters` instead.
     """
     docs = document_store.get_all_documents(filters=filters.filters)
     for doc in docs:
@@ -39,6 +81,64 @@ def get_documents(filters: FilterRequest):
     return docs
 
 
+@router.post("/documents/get_by_filters/page", response_model=DocumentPageResponse, response_model_exclude_none=True)
+def get_documents_page(request: DocumentPageRequest):
+    """
+    This endpoint returns one page of the documents that match the filters, together with the cursor of the next page.
+    To get the next page, send the same request again with `cursor` set to the returned `next_cursor`. There are no
+    more documents when `next_cursor` is missing.
+
+    The scan of the document store continues where the previous page ended, so each page only fetches its own
+    documents. If the scan is no longer open, for example because the previous page was served by another worker,
+    fetching the page skips over the documents of the previous pages.
+
+    Example:
+    `'{"filters": {"name": ["some", "more"]}, "page_size": 100}'`
+    """
+    offset, scan_id = _decode_cursor(request.cursor)
+    with _page_scans_lock:
+        scan = _page_scans.pop(scan_id, None) if scan_id else None
+    # A cursor that was already used, for example by a retried request, doesn't point to the position of the scan
+    if scan is not None and (scan.filters != request.filters or scan.offset != offset):
+        scan.close()
+        scan = None
+    if scan is None:
+        generator = document_store.get_all_documents_generator(
+            filters=request.filters,
+            return_embedding=False,
+            batch_size=min(offset + request.page_size + 1, 10_000),
+        )
+        scan = _PageScan(request.filters, offset, islice(generator, offset, None), generator)
+
+    docs = list(islice(scan.documents, request.page_size + 1))
+    next_cursor = None
+    if len(docs) > request.page_size:
+        scan_id = scan_id or uuid.uuid4().hex
+        scan.offset = offset + request.page_size
+        scan.documents = chain(docs[request.page_size :], scan.documents)
+        _keep_page_scan(scan_id, scan)
+        next_cursor = _encode_cursor(offset + request.page_size, scan_id)
+    else:
+        scan.close()
+    return {"documents": docs[: request.page_size], "next_cursor": next_cursor}
+
+
+@router.post("/documents/stream_by_filters")
+def stream_documents(filters: FilterRequest):
+    """
+    This endpoint streams all the documents that match the filters as newline-delimited JSON, one document per line.
+    The documents are fetched from the document store in batches while they are sent, so this endpoint works for
+    document stores of any size.
+    """
+
+    def to_ndjson(docs: Iterator[Document]) -> Iterator[str]:
+        for doc in docs:
+            yield doc.to_json() + "\n"
+
+    docs = document_store.get_all_documents_generator(filters=filters.filters, return_embedding=False)
+    return StreamingResponse(to_ndjson(docs), media_type="application/x-ndjson")
+
+
 @router.post("/documents/delete_by_filters", response_model=bool)
 def delete_documents(filters: FilterRequest):
     """
@@ -54,3 +154,29 @@ def delete_documents(filters: FilterRequest):
     """
     document_store.delete_documents(filters=filters.filters)
     return True
+
+
+def _keep_page_scan(scan_id: str, scan: _PageScan):
+    with _page_scans_lock:
+        _page_scans[scan_id] = scan
+        evicted = _page_scans.popitem(last=False)[1] if len(_page_scans) > PAGE_SCAN_CACHE_SIZE else None
+    if evicted is not None:
+        evicted.close()
+
+
+def _encode_cursor(offset: int, scan_id: str) -> str:
+    cursor = {"offset": offset, "scan_id": scan_id}
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: Optional[str]) -> Tuple[int, Optional[str]]:
+    if not cursor:
+        return 0, None
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        offset, scan_id = decoded["offset"], decoded.get("scan_id")
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    if not isinstance(offset, int) or offset < 0 or not (scan_id is None or isinstance(scan_id, str)):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return offset, scan_id
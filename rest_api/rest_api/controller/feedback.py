@@ -1,9 +1,10 @@
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, Iterator, List, Union, Optional
 
 import json
 import logging
 
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import StreamingResponse
 from haystack.schema import Label
 from haystack.document_stores import BaseDocumentStore
 from rest_api.schema import FilterRequest, CreateLabelSerialized
@@ -77,11 +78,8 @@ def get_feedback_metrics(filters: Optional[FilterRequest] = None):
 
     res: Dict[str, Optional[Union[float, int]]]
     if len(labels) > 0:
-        answer_feedback = [1 if l.is_correct_answer else 0 for l in labels]
-        doc_feedback = [1 if l.is_correct_document else 0 for l in labels]
-
-        answer_accuracy = sum(answer_feedback) / len(answer_feedback)
-        doc_accuracy = sum(doc_feedback) / len(doc_feedback)
+        answer_accuracy = sum(1 for l in labels if l.is_correct_answer) / len(labels)
+        doc_accuracy = sum(1 for l in labels if l.is_correct_document) / len(labels)
 
         res = {"answer_accuracy": answer_accuracy, "document_accuracy": doc_accuracy, "n_feedback": len(labels)}
     else:
@@ -98,87 +96,108 @@ def export_feedback(
 
     The context_size param can be used to limit response size for large documents.
     """
-    if only_positive_labels:
-        labels = document_store.get_all_labels(filters={"is_correct_answer": [True], "origin": ["user-feedback"]})
-    else:
-        labels = document_store.get_all_labels(filters={"origin": ["user-feedback"]})
-        # Filter out the labels where the passage is correct but answer is wrong (in SQuAD this matches
-        # neither a "positive example" nor a negative "is_impossible" one)
-        labels = [l for l in labels if not (l.is_correct_document is True and l.is_correct_answer is False)]
-
-    export_data = []
-
-    for label in labels:
-        answer_text = label.answer.answer if label and label.answer else ""
-
-        offset_start_in_document = 0
-        if label.answer and label.answer.offsets_in_document:
-            offset_start_in_document = label.answer.offsets_in_document[0].start
-
-        if full_document_context:
-            context = label.document.content
-            answer_start = offset_start_in_document
-        else:
-            text = label.document.content
-            # the final length of context(including the answer string) is 'context_size'.
-            # we try to add equal characters for context before and after the answer string.
-            # if either beginning or end of text is reached, we correspondingly
-            # append more context characters at the other end of answer string.
-            context_to_add = int((context_size - len(answer_text)) / 2)
-            start_pos = max(offset_start_in_document - context_to_add, 0)
-            additional_context_at_end = max(context_to_add - offset_start_in_document, 0)
-            end_pos = min(offset_start_in_document + len(answer_text) + context_to_add, len(text) - 1)
-            additional_context_at_start = max(
-                offset_start_in_document + len(answer_text) + context_to_add - len(text), 0
-            )
-            start_pos = max(0, start_pos - additional_context_at_start)
-            end_pos = min(len(text) - 1, end_pos + additional_context_at_end)
-            context = text[start_pos:end_pos]
-            answer_start = offset_start_in_document - start_pos
-
-        squad_label: Dict[str, Any]
-        if label.is_correct_answer is False and label.is_correct_document is False:  # No answer
-            squad_label = {
-                "paragraphs": [
-                    {
-                        "context": context,
-                        "id": label.document.id,
-                        "qas": [{"question": label.query, "id": label.id, "is_impossible": True, "answers": []}],
-                    }
-                ]
-            }
-        else:
-            squad_label = {
-                "paragraphs": [
-                    {
-                        "context": context,
-                        "id": label.document.id,
-                        "qas": [
-                            {
-                                "question": label.query,
-                                "id": label.id,
-                                "is_impossible": False,
-                                "answers": [{"text": answer_text, "answer_start": answer_start}],
-                            }
-                        ],
-                    }
-                ]
-            }
-
-            # quality check
-            start = squad_label["paragraphs"][0]["qas"][0]["answers"][0]["answer_start"]
-            answer = squad_label["paragraphs"][0]["qas"][0]["answers"][0]["text"]
-            context = squad_label["paragraphs"][0]["context"]
-            if not context[start : start + len(answer)] == answer:
-                logger.error(
-                    "Skipping invalid squad label as string via offsets ('%s') does not match answer string ('%s') ",
-                    context[start : start + len(answer)],
-                    answer,
-                )
-        export_data.append(squad_label)
+    export_data = [
+        _to_squad_label(label, context_size=context_size, full_document_context=full_document_context)
+        for label in _get_labels_to_export(only_positive_labels)
+    ]
 
     export = {"data": export_data}
 
     with open("feedback_squad_direct.json", "w", encoding="utf8") as f:
         json.dump(export_data, f, ensure_ascii=False, sort_keys=True, indent=4)
     return export
+
+
+@router.get("/export-feedback/stream")
+def stream_feedback_export(
+    context_size: int = 100_000, full_document_context: bool = True, only_positive_labels: bool = False
+):
+    """
+    This endpoint streams the same SQuAD entries as `/export-feedback` as newline-delimited JSON, one entry of the SQuAD
+    `data` list per line. The feedback labels are loaded from the document store at once, as document stores can't
+    return labels in pages, but the SQuAD entries with their document contexts are built and sent one at a time.
+    """
+
+    def to_ndjson(labels: List[Label]) -> Iterator[str]:
+        for label in labels:
+            squad_label = _to_squad_label(label, context_size=context_size, full_document_context=full_document_context)
+            yield json.dumps(squad_label, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(to_ndjson(_get_labels_to_export(only_positive_labels)), media_type="application/x-ndjson")
+
+
+def _get_labels_to_export(only_positive_labels: bool) -> List[Label]:
+    if only_positive_labels:
+        return document_store.get_all_labels(filters={"is_correct_answer": [True], "origin": ["user-feedback"]})
+    labels = document_store.get_all_labels(filters={"origin": ["user-feedback"]})
+    # Filter out the labels where the passage is correct but answer is wrong (in SQuAD this matches
+    # neither a "positive example" nor a negative "is_impossible" one)
+    return [l for l in labels if not (l.is_correct_document is True and l.is_correct_answer is False)]
+
+
+def _to_squad_label(label: Label, context_size: int, full_document_context: bool) -> Dict[str, Any]:
+    answer_text = label.answer.answer if label and label.answer else ""
+
+    offset_start_in_document = 0
+    if label.answer and label.answer.offsets_in_document:
+        offset_start_in_document = label.answer.offsets_in_document[0].start
+
+    if full_document_context:
+        context = label.document.content
+        answer_start = offset_start_in_document
+    else:
+        text = label.document.content
+        # the final length of context(including the answer string) is 'context_size'.
+        # we try to add equal characters for context before and after the answer string.
+        # if either beginning or end of text is reached, we correspondingly
+        # append more context characters at the other end of answer string.
+        context_to_add = int((context_size - len(answer_text)) / 2)
+        start_pos = max(offset_start_in_document - context_to_add, 0)
+        additional_context_at_end = max(context_to_add - offset_start_in_document, 0)
+        end_pos = min(offset_start_in_document + len(answer_text) + context_to_add, len(text) - 1)
+        additional_context_at_start = max(offset_start_in_document + len(answer_text) + context_to_add - len(text), 0)
+        start_pos = max(0, start_pos - additional_context_at_start)
+        end_pos = min(len(text) - 1, end_pos + additional_context_at_end)
+        context = text[start_pos:end_pos]
+        answer_start = offset_start_in_document - start_pos
+
+    squad_label: Dict[str, Any]
+    if label.is_correct_answer is False and label.is_correct_document is False:  # No answer
+        squad_label = {
+            "paragraphs": [
+                {
+                    "context": context,
+                    "id": label.document.id,
+                    "qas": [{"question": label.query, "id": label.id, "is_impossible": True, "answers": []}],
+                }
+            ]
+        }
+    else:
+        squad_label = {
+            "paragraphs": [
+                {
+                    "context": context,
+                    "id": label.document.id,
+                    "qas": [
+                        {
+                            "question": label.query,
+                            "id": label.id,
+                            "is_impossible": False,
+                            "answers": [{"text": answer_text, "answer_start": answer_start}],
+                        }
+                    ],
+                }
+            ]
+        }
+
+        # quality check
+        start = squad_label["paragraphs"][0]["qas"][0]["answers"][0]["answer_start"]
+        answer = squad_label["paragraphs"][0]["qas"][0]["answers"][0]["text"]
+        context = squad_label["paragraphs"][0]["context"]
+        if not context[start : start + len(answer)] == answer:
+            logger.error(
+                "Skipping invalid squad label as string via offsets ('%s') does not match answer string ('%s') ",
+                context[start : start + len(answer)],
+                answer,
+            )
+    return squad_label
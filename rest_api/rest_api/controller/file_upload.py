@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 import json
 import shutil
@@ -13,11 +13,13 @@ from haystack.nodes import BaseConverter, PreProcessor
 from rest_api.utils import get_app, get_pipelines
 from rest_api.config import FILE_UPLOAD_PATH
 from rest_api.controller.utils import as_form
+from rest_api.jobs import IndexingJobRunner
 
 
 router = APIRouter()
 app: FastAPI = get_app()
 indexing_pipeline: Pipeline = get_pipelines().get("indexing_pipeline", None)
+indexing_job_runner: IndexingJobRunner = get_pipelines().get("indexing_job_runner", None)
 
 
 @as_form
@@ -41,6 +43,10 @@ class Response(BaseModel):
     file_id: str
 
 
+class JobResponse(BaseModel):
+    job_id: str
+
+
 @router.post("/file-upload")
 def upload_file(
     files: List[UploadFile] = File(...),
@@ -53,10 +59,81 @@ def upload_file(
     """
     You can use this endpoint to upload a file for indexing
     (see https://haystack.deepset.ai/guides/rest-api#indexing-documents-in-the-haystack-rest-api-document-store).
+    The files are indexed before the request returns. To index large files, use `/file-upload/jobs` instead.
     """
     if not indexing_pipeline:
         raise HTTPException(status_code=501, detail="Indexing Pipeline is not configured.")
 
+    file_paths, file_metas, params = _save_files(
+        files, meta, additional_params, fileconverter_params, preprocessor_params
+    )
+    indexing_pipeline.run(file_paths=file_paths, meta=file_metas, params=params)
+
+
+@router.post("/file-upload/jobs", response_model=JobResponse)
+def create_upload_job(
+    files: List[UploadFile] = File(...),
+    # JSON serialized string
+    meta: Optional[str] = Form("null"),  # type: ignore
+    additional_params: Optional[str] = Form("null"),  # type: ignore
+    fileconverter_params: FileConverterParams = Depends(FileConverterParams.as_form),  # type: ignore
+    preprocessor_params: PreprocessorParams = Depends(PreprocessorParams.as_form),  # type: ignore
+):
+    """
+    You can use this endpoint to upload files and index them in the background. It takes the same parameters as
+    `/file-upload` and returns the ID of the indexing job. Use `/file-upload/jobs/{job_id}` to follow its progress.
+    """
+    if not indexing_job_runner:
+        raise HTTPException(status_code=501, detail="Indexing Pipeline is not configured.")
+
+    file_paths, file_metas, params = _save_files(
+        files, meta, additional_params, fileconverter_params, preprocessor_params
+    )
+    job_id = indexing_job_runner.store.create_job(file_paths=file_paths, metas=file_metas, params=params)
+    indexing_job_runner.submit(job_id)
+    return {"job_id": job_id}
+
+
+@router.get("/file-upload/jobs/{job_id}")
+def get_upload_job(job_id: str):
+    """
+    This endpoint returns the status of an indexing job and the progress of each of its files: the indexing stages
+    the file went through (for example, `converted`, `preprocessed`, `embedded`, `written`), the number of attempts,
+    and the errors of the failed attempts.
+    """
+    return _get_job(job_id)
+
+
+@router.delete("/file-upload/jobs/{job_id}")
+def cancel_upload_job(job_id: str):
+    """
+    This endpoint cancels an indexing job. Files that are being indexed are finished, the remaining files are skipped.
+    """
+    job = _get_job(job_id)
+    if not indexing_job_runner.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"The indexing job already finished with status '{job['status']}'.")
+    return _get_job(job_id)
+
+
+def _get_job(job_id: str) -> Dict[str, Any]:
+    if not indexing_job_runner:
+        raise HTTPException(status_code=501, detail="Indexing Pipeline is not configured.")
+    job = indexing_job_runner.store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"There's no indexing job with ID '{job_id}'.")
+    return job
+
+
+def _save_files(
+    files: List[UploadFile],
+    meta: Optional[str],
+    additional_params: Optional[str],
+    fileconverter_params: FileConverterParams,
+    preprocessor_params: PreprocessorParams,
+) -> Tuple[List[Path], List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Writes the uploaded files to disk and returns their paths, their metadata, and the params for the indexing pipeline.
+    """
     file_paths: list = []
     file_metas: list = []
 
@@ -71,8 +148,7 @@ def upload_file(
                 shutil.copyfileobj(file.file, buffer)
 
             file_paths.append(file_path)
-            meta_form["name"] = file.filename
-            file_metas.append(meta_form)
+            file_metas.append({**meta_form, "name": file.filename})
         finally:
             file.file.close()
 
@@ -87,4 +163,4 @@ def upload_file(
     for preprocessor in preprocessors:
         params[preprocessor.name] = preprocessor_params.dict()
 
-    indexing_pipeline.run(file_paths=file_paths, meta=file_metas, params=params)
+    return file_paths, file_metas, params
@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, List, Optional
 
 import logging
+import random
 import time
 import json
 
@@ -10,7 +11,15 @@ import haystack
 from haystack import Pipeline
 
 from rest_api.utils import get_app, get_pipelines
-from rest_api.config import LOG_LEVEL
+from rest_api.config import (
+    LOG_LEVEL,
+    CONCURRENT_REQUEST_PER_WORKER,
+    QUERY_QUEUE_SIZE,
+    QUERY_BATCH_SIZE,
+    QUERY_TIMEOUT,
+    QUERY_LOG_SAMPLE_RATE,
+)
+from rest_api.controller.utils import RequestQueue
 from rest_api.schema import QueryRequest, QueryResponse
 
 
@@ -24,7 +33,6 @@ BaseConfig.arbitrary_types_allowed = True
 router = APIRouter()
 app: FastAPI = get_app()
 query_pipeline: Pipeline = get_pipelines().get("query_pipeline", None)
-concurrency_limiter = get_pipelines().get("concurrency_limiter", None)
 
 
 @router.get("/initialized")
@@ -47,15 +55,35 @@ def haystack_version():
     return {"hs_version": haystack.__version__}
 
 
+@router.get("/query_stats")
+def query_stats():
+    """
+    Get the number of queries waiting to be processed, the number of queries and batches processed so far, and the
+    latency percentiles (in seconds) of the most recent queries.
+    """
+    return query_queue.stats()
+
+
 @router.post("/query", response_model=QueryResponse, response_model_exclude_none=True)
-def query(request: QueryRequest):
+async def query(request: QueryRequest):
     """
     This endpoint receives the question as a string and allows the requester to set
     additional parameters that will be passed on to the Haystack pipeline.
     """
-    with concurrency_limiter.run():
-        result = _process_request(query_pipeline, request)
-        return result
+    return await query_queue.submit(request)
+
+
+def _batch_key(request: QueryRequest) -> Optional[Hashable]:
+    # Queries can share a pipeline run only if they use the same params. Debug output isn't split per query.
+    if request.debug:
+        return None
+    return json.dumps(request.params or {}, sort_keys=True, default=str)
+
+
+def _process_requests(requests: List[QueryRequest]) -> List[Dict[str, Any]]:
+    if len(requests) == 1:
+        return [_process_request(query_pipeline, requests[0])]
+    return _process_batch_request(query_pipeline, requests)
 
 
 def _process_request(pipeline, request) -> Dict[str, Any]:
@@ -70,7 +98,48 @@ def _process_request(pipeline, request) -> Dict[str, Any]:
     if not "answers" in result:
         result["answers"] = []
 
-    logger.info(
-        json.dumps({"request": request, "response": result, "time": f"{(time.time() - start_time):.2f}"}, default=str)
-    )
+    _log_response(request, result, time.time() - start_time)
     return result
+
+
+def _process_batch_request(pipeline, requests: List[QueryRequest]) -> List[Dict[str, Any]]:
+    start_time = time.time()
+
+    params = requests[0].params or {}
+    batch_result = pipeline.run_batch(queries=[request.query for request in requests], params=params, debug=False)
+
+    # Split the batch output into one result per query: lists hold one item per query, everything else is shared
+    results = []
+    for i, request in enumerate(requests):
+        result = {"query": request.query, "documents": [], "answers": []}
+        for key, value in batch_result.items():
+            if key in ("query", "queries"):
+                continue
+            if isinstance(value, list):
+                if len(value) != len(requests):
+                    raise ValueError(f"The '{key}' output of the pipeline doesn't contain one item per query.")
+                value = value[i]
+            result[key] = value
+        results.append(result)
+
+    elapsed = time.time() - start_time
+    for request, result in zip(requests, results):
+        _log_response(request, result, elapsed)
+    return results
+
+
+def _log_response(request: QueryRequest, result: Dict[str, Any], elapsed: float):
+    if random.random() < QUERY_LOG_SAMPLE_RATE:
+        logger.info(json.dumps({"request": request, "response": result, "time": f"{elapsed:.2f}"}, default=str))
+    else:
+        logger.debug("Answered query %r in %.2f s", request.query, elapsed)
+
+
+query_queue = RequestQueue(
+    process_batch=_process_requests,
+    workers=CONCURRENT_REQUEST_PER_WORKER,
+    max_queue_size=QUERY_QUEUE_SIZE,
+    max_batch_size=QUERY_BATCH_SIZE,
+    timeout=QUERY_TIMEOUT,
+    batch_key=_batch_key,
+)
@@ -1,26 +1,214 @@
-from typing import Type, NewType
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Type, NewType
 
+import asyncio
 import inspect
-from contextlib import contextmanager
-from threading import Semaphore
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
 
 from fastapi import Form, HTTPException
 from pydantic import BaseModel
 
 
-class RequestLimiter:
-    def __init__(self, limit):
-        self.semaphore = Semaphore(limit)
+logger = logging.getLogger(__name__)
 
-    @contextmanager
-    def run(self):
-        acquired = self.semaphore.acquire(blocking=False)
-        if not acquired:
-            raise HTTPException(status_code=503, detail="The server is busy processing requests.")
+
+class _QueuedRequest:
+    def __init__(self, request: Any, key: Optional[Hashable], deadline: Optional[float]):
+        self.request = request
+        self.key = key
+        self.deadline = deadline
+        self.enqueued_at = time.perf_counter()
+        self.future: Future = Future()
+
+
+class RequestQueue:
+    """
+    Serves requests from a bounded wait queue with a fixed number of worker threads.
+
+    Requests that arrive while all workers are busy wait in the queue instead of being rejected. Only when the queue
+    is full the request is rejected with a 503, and requests that aren't answered within `timeout` seconds fail with a
+    504. Workers take the oldest waiting request together with the waiting requests that have the same batch key (up
+    to `max_batch_size`) and process them in a single call to `process_batch`, so bursts are served in batches without
+    delaying requests that arrive alone. Waiting requests with other keys are left for the next free worker.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        workers: int,
+        max_queue_size: int,
+        max_batch_size: int = 1,
+        timeout: Optional[float] = None,
+        batch_key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+        latency_window: int = 1000,
+    ):
+        """
+        :param process_batch: Processes a list of requests and returns one result per request, in the same order.
+        :param workers: Number of batches that are processed at the same time.
+        :param max_queue_size: Number of requests that can wait for a worker before new requests are rejected.
+        :param max_batch_size: Maximum number of requests processed in one call to `process_batch`.
+        :param timeout: Seconds after which a request that hasn't been answered fails. `None` means no deadline.
+        :param batch_key: Returns the key of a request. Only requests with the same key are processed in the same
+                          batch. Requests with key `None` are always processed alone. By default, all requests can be
+                          batched together.
+        :param latency_window: Number of most recent requests the latency percentiles in `stats()` are computed on.
+        """
+        if workers < 1:
+            raise ValueError("RequestQueue needs at least one worker.")
+        self.process_batch = process_batch
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max(1, max_batch_size)
+        self.timeout = timeout
+        self.batch_key = batch_key or (lambda request: 0)
+        # The waiting requests grouped by batch key, ordered by the arrival of the oldest request of each key
+        self._waiting: "OrderedDict[Hashable, Deque[_QueuedRequest]]" = OrderedDict()
+        self._waiting_count = 0
+        self._not_empty = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._counters = {
+            "requests": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "failed": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "in_progress": 0,
+        }
+
+    async def submit(self, request: Any) -> Any:
+        """
+        Enqueues the request and waits until a worker has processed it.
+        """
+        self._start_workers()
+        item = _QueuedRequest(
+            request,
+            key=self.batch_key(request),
+            deadline=time.perf_counter() + self.timeout if self.timeout else None,
+        )
+        with self._not_empty:
+            if 0 < self.max_queue_size <= self._waiting_count:
+                self._count("rejected")
+                raise HTTPException(status_code=503, detail="The server is busy processing requests.")
+            # Requests with key `None` are never batched, so each of them gets its own group
+            self._waiting.setdefault(item.key if item.key is not None else item, deque()).append(item)
+            self._waiting_count += 1
+            self._not_empty.notify()
+        self._count("requests")
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(item.future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # A request that is already being processed can't be stopped, its result is discarded
+            item.future.cancel()
+            self._count("timed_out")
+            raise HTTPException(status_code=504, detail="The request timed out waiting to be processed.")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the queue depth, the number of requests and batches processed so far, and the latency percentiles
+        (in seconds, from entering the queue to being answered) of the most recent requests.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            latencies = sorted(self._latencies)
+        stats["queue_depth"] = self._waiting_count
+        stats["mean_batch_size"] = stats["batched_requests"] / stats["batches"] if stats["batches"] else 0.0
+        for percentile in (50, 95, 99):
+            stats[f"latency_p{percentile}"] = (
+                latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)] if latencies else None
+            )
+        return stats
+
+    def _count(self, counter: str, value: int = 1):
+        with self._lock:
+            self._counters[counter] += value
+
+    def _start_workers(self):
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"RequestQueue-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._process(batch)
+
+    def _next_batch(self) -> List[_QueuedRequest]:
+        """
+        Takes the oldest waiting request and the waiting requests with the same batch key out of the queue.
+        """
+        with self._not_empty:
+            while not self._waiting:
+                self._not_empty.wait()
+            key, waiting = next(iter(self._waiting.items()))
+            items = [waiting.popleft() for _ in range(min(len(waiting), self.max_batch_size))]
+            if not waiting:
+                del self._waiting[key]
+            self._waiting_count -= len(items)
+        now = time.perf_counter()
+        batch = []
+        for item in items:
+            # Skip the requests whose client stopped waiting for them
+            if item.deadline is not None and item.deadline < now:
+                item.future.cancel()
+            if item.future.set_running_or_notify_cancel():
+                batch.append(item)
+        return batch
+
+    def _process(self, batch: List[_QueuedRequest]):
+        self._count("in_progress", len(batch))
+        start = time.perf_counter()
         try:
-            yield acquired
+            try:
+                results = self.process_batch([item.request for item in batch])
+                if len(results) != len(batch):
+                    raise ValueError(f"Got {len(results)} results for a batch of {len(batch)} requests.")
+            except Exception as e:
+                if len(batch) == 1:
+                    self._count("failed")
+                    batch[0].future.set_exception(e)
+                    return
+                # Process the requests one by one, so that a single failing request doesn't fail the whole batch
+                logger.warning(
+                    "Processing a batch of %s requests failed, processing them one by one: %s", len(batch), e
+                )
+                results = []
+                for item in batch:
+                    try:
+                        results.extend(self.process_batch([item.request]))
+                    except Exception as request_error:  # pylint: disable=broad-except
+                        results.append(request_error)
+            self._count("batches")
+            self._count("batched_requests", len(batch))
+            for item, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self._count("failed")
+                    item.future.set_exception(result)
+                else:
+                    item.future.set_result(result)
         finally:
-            self.semaphore.release()
+            self._count("in_progress", -len(batch))
+            finished = time.perf_counter()
+            with self._lock:
+                self._latencies.extend(finished - item.enqueued_at for item in batch)
+            logger.debug(
+                "Processed a batch of %s requests in %.3f s, %s requests waiting",
+                len(batch),
+                finished - start,
+                self._waiting_count,
+            )
 
 
 StringId = NewType("StringId", str)
@@ -0,0 +1,379 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from haystack import Pipeline
+from haystack.document_stores import BaseDocumentStore
+from haystack.nodes import BaseConverter, BaseRetriever, PreProcessor
+
+
+logger = logging.getLogger(__name__)
+
+
+# Job and file states
+QUEUED = "queued"
+RUNNING = "running"
+INDEXED = "indexed"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (INDEXED, COMPLETED, FAILED, CANCELLED)
+
+
+class IndexingJobStore:
+    """
+    Keeps the state of the indexing jobs in a SQLite database, so that jobs survive restarts of the REST API.
+
+    A job indexes a list of files. For each file, the store records its state, the indexing stages it went through,
+    the number of attempts, and the error of each failed attempt.
+    """
+
+    def __init__(self, db_path: str):
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, status TEXT, params TEXT, created_at REAL, "
+                "updated_at REAL, heartbeat REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_files (job_id TEXT, position INTEGER, file_path TEXT, file_name TEXT, "
+                "meta TEXT, status TEXT, stages TEXT, attempts INTEGER, errors TEXT, PRIMARY KEY (job_id, position))"
+            )
+
+    def create_job(self, file_paths: List[str], metas: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, NULL)", (job_id, QUEUED, json.dumps(params), now, now)
+            )
+            self._connection.executemany(
+                "INSERT INTO job_files VALUES (?, ?, ?, ?, ?, ?, '[]', 0, '[]')",
+                [
+                    (job_id, position, str(file_path), meta.get("name"), json.dumps(meta), QUEUED)
+                    for position, (file_path, meta) in enumerate(zip(file_paths, metas))
+                ],
+            )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the job with its files, or `None` if there's no job with this ID.
+        """
+        with self._lock:
+            job = self._connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            files = self._connection.execute(
+                "SELECT * FROM job_files WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return {
+            "job_id": job["id"],
+            "status": job["status"],
+            "params": json.loads(job["params"]),
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+            "files": [
+                {
+                    "file_name": file["file_name"],
+                    "file_path": file["file_path"],
+                    "meta": json.loads(file["meta"]),
+                    "status": file["status"],
+                    "stages": json.loads(file["stages"]),
+                    "attempts": file["attempts"],
+                    "errors": json.loads(file["errors"]),
+                }
+                for file in files
+            ],
+        }
+
+    def get_job_status(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            job = self._connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return job["status"] if job is not None else None
+
+    def get_queued_job_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def claim_job(self, job_id: str) -> bool:
+        """
+        Marks a queued job as running. Returns `False` if the job isn't queued, for example because another worker
+        process of the REST API claimed it first or because it was cancelled.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ?, heartbeat = ? WHERE id = ? AND status = ?",
+                (RUNNING, now, now, job_id, QUEUED),
+            )
+        return cursor.rowcount > 0
+
+    def send_heartbeat(self, job_ids: List[str]):
+        """
+        Records that the running jobs `job_ids` are still being worked on.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE jobs SET heartbeat = ? WHERE id = ? AND status = ?",
+                [(time.time(), job_id, RUNNING) for job_id in job_ids],
+            )
+
+    def requeue_abandoned_jobs(self, timeout: float) -> int:
+        """
+        Queues the running jobs again whose last heartbeat is older than `timeout` seconds, because the process that
+        ran them stopped. Returns the number of jobs that were queued again.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND heartbeat < ?",
+                (QUEUED, time.time(), RUNNING, time.time() - timeout),
+            )
+        return cursor.rowcount
+
+    def set_job_status(self, job_id: str, status: str, only_if_unfinished: bool = False) -> bool:
+        """
+        Sets the status of the job. Returns whether the job was updated.
+
+        :param only_if_unfinished: Leave jobs that already completed, failed, or were cancelled unchanged.
+        """
+        query = "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?"
+        if only_if_unfinished:
+            query += f" AND status NOT IN ({', '.join('?' * len(FINISHED_STATES))})"
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                query, (status, time.time(), job_id) + (FINISHED_STATES if only_if_unfinished else ())
+            )
+        return cursor.rowcount > 0
+
+    def update_file(
+        self,
+        job_id: str,
+        position: int,
+        status: Optional[str] = None,
+        stage: Optional[str] = None,
+        error: Optional[str] = None,
+        new_attempt: bool = False,
+    ):
+        """
+        Updates the state of a file of a job.
+
+        :param status: The new state of the file.
+        :param stage: An indexing stage the file went through.
+        :param error: The error of a failed attempt.
+        :param new_attempt: Count a new attempt to index the file and forget the stages of the previous attempt.
+        """
+        with self._lock, self._connection:
+            file = self._connection.execute(
+                "SELECT stages, attempts, errors FROM job_files WHERE job_id = ? AND position = ?", (job_id, position)
+            ).fetchone()
+            stages, errors, attempts = json.loads(file["stages"]), json.loads(file["errors"]), file["attempts"]
+            if new_attempt:
+                stages, attempts = [], attempts + 1
+            if stage is not None:
+                stages.append(stage)
+            if error is not None:
+                errors.append(error)
+            self._connection.execute(
+                "UPDATE job_files SET status = COALESCE(?, status), stages = ?, attempts = ?, errors = ? "
+                "WHERE job_id = ? AND position = ?",
+                (status, json.dumps(stages), attempts, json.dumps(errors), job_id, position),
+            )
+            self._connection.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+
+
+class IndexingJobRunner:
+    """
+    Runs indexing jobs in a pool of worker threads. Each file of a job is indexed with its own run of the indexing
+    pipeline, so that the progress and the failures of each file are tracked separately. Failed files are retried
+    up to `max_attempts` times.
+
+    Several worker processes of the REST API can share the same store. Each job is claimed by one of them, and the
+    runners regularly send heartbeats for the jobs they're running. Jobs whose runner stopped sending heartbeats, for
+    example because the REST API was restarted, are queued and resumed again. Files that were being indexed at that
+    time are indexed again.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        store: IndexingJobStore,
+        workers: int = 1,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        heartbeat_interval: float = 10.0,
+    ):
+        """
+        :param pipeline: The indexing pipeline.
+        :param store: The store that keeps the state of the jobs.
+        :param workers: The number of jobs that run at the same time.
+        :param max_attempts: How many times a file is indexed before it's marked as failed.
+        :param retry_delay: Seconds to wait before retrying a failed file. The delay grows with each attempt.
+        :param heartbeat_interval: Seconds between the heartbeats of the running jobs. Jobs without a heartbeat for
+                                   three intervals are resumed by the next runner that checks for them.
+        """
+        self.pipeline = pipeline
+        self.store = store
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.heartbeat_interval = heartbeat_interval
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="IndexingJob")
+        # The jobs submitted to this runner, until they finish
+        self._cancelled: Dict[str, threading.Event] = {}
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        """
+        Resumes the jobs that didn't finish before the last shutdown and starts sending heartbeats for the running
+        jobs in a background thread.
+        """
+        self._resume_jobs()
+        threading.Thread(target=self._send_heartbeats, name="IndexingJobHeartbeat", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def submit(self, job_id: str):
+        with self._lock:
+            if job_id in self._cancelled:
+                return
+            self._cancelled[job_id] = threading.Event()
+        self._executor.submit(self._run_job, job_id)
+
+    def _resume_jobs(self):
+        requeued = self.store.requeue_abandoned_jobs(timeout=3 * self.heartbeat_interval)
+        if requeued:
+            logger.info("Resuming %s abandoned indexing jobs", requeued)
+        # Other runners sharing the store may submit the same jobs, only the first one that claims a job runs it
+        for job_id in self.store.get_queued_job_ids():
+            self.submit(job_id)
+
+    def _send_heartbeats(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                with self._lock:
+                    running = list(self._running)
+                self.store.send_heartbeat(running)
+                self._resume_jobs()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Sending the heartbeats of the indexing jobs failed")
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancels the job. Files that are being indexed are finished, the remaining files are skipped.
+        Returns `False` if the job already finished.
+        """
+        if not self.store.set_job_status(job_id, CANCELLED, only_if_unfinished=True):
+            return False
+        with self._lock:
+            cancelled = self._cancelled.get(job_id)
+        if cancelled is not None:
+            cancelled.set()
+        return True
+
+    def _run_job(self, job_id: str):
+        with self._lock:
+            cancelled = self._cancelled[job_id]
+        try:
+            if not self.store.claim_job(job_id):
+                if self.store.get_job_status(job_id) == CANCELLED:
+                    # The job was cancelled before it started
+                    job = self.store.get_job(job_id)
+                    for position, file in enumerate(job["files"]):  # type: ignore
+                        if file["status"] not in FINISHED_STATES:
+                            self.store.update_file(job_id, position, status=CANCELLED)
+                # Otherwise, another runner claimed the job
+                return
+            with self._lock:
+                self._running.add(job_id)
+            job: Dict[str, Any] = self.store.get_job(job_id)  # type: ignore
+            failed = False
+            for position, file in enumerate(job["files"]):
+                if file["status"] in FINISHED_STATES:
+                    failed = failed or file["status"] == FAILED
+                    continue
+                if self._is_cancelled(job_id, cancelled):
+                    self.store.update_file(job_id, position, status=CANCELLED)
+                    continue
+                failed = not self._index_file(job_id, position, file, job["params"], cancelled) or failed
+            if not self._is_cancelled(job_id, cancelled):
+                self.store.set_job_status(job_id, FAILED if failed else COMPLETED, only_if_unfinished=True)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Indexing job %s failed", job_id)
+            self.store.set_job_status(job_id, FAILED, only_if_unfinished=True)
+        finally:
+            with self._lock:
+                self._cancelled.pop(job_id, None)
+                self._running.discard(job_id)
+
+    def _is_cancelled(self, job_id: str, cancelled: threading.Event) -> bool:
+        # The job can also be cancelled through another worker process of the REST API
+        if not cancelled.is_set() and self.store.get_job_status(job_id) == CANCELLED:
+            cancelled.set()
+        return cancelled.is_set()
+
+    def _index_file(
+        self, job_id: str, position: int, file: Dict[str, Any], params: Dict[str, Any], cancelled: threading.Event
+    ) -> bool:
+        pipeline = _ProgressPipeline(self.pipeline, lambda stage: self.store.update_file(job_id, position, stage=stage))
+        # Attempts that were interrupted by a restart of the REST API didn't fail, so only the failed ones count
+        for attempt in range(len(file["errors"]) + 1, self.max_attempts + 1):
+            self.store.update_file(job_id, position, status=RUNNING, new_attempt=True)
+            try:
+                pipeline.run(file_paths=[file["file_path"]], meta=[file["meta"]], params=params)
+                self.store.update_file(job_id, position, status=INDEXED)
+                return True
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning(
+                    "Indexing %s failed (attempt %s of %s): %s", file["file_name"], attempt, self.max_attempts, e
+                )
+                self.store.update_file(job_id, position, error=f"{type(e).__name__}: {e}")
+            # Wait before the next attempt unless the job is cancelled in the meantime
+            if attempt < self.max_attempts and cancelled.wait(self.retry_delay * attempt):
+                self.store.update_file(job_id, position, status=CANCELLED)
+                return True
+        self.store.update_file(job_id, position, status=FAILED)
+        return False
+
+
+class _ProgressPipeline(Pipeline):
+    """
+    Runs the nodes of an indexing pipeline and reports the indexing stage each node completed.
+    """
+
+    def __init__(self, pipeline: Pipeline, on_stage: Callable[[str], None]):
+        super().__init__()
+        self.__dict__.update(pipeline.__dict__)
+        self.on_stage = on_stage
+
+    def _run_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
+        node_output, stream_id = super()._run_node(node_id, node_input)
+        # The root node only passes the files on, it's not an indexing stage
+        if node_id != self.root_node:
+            self.on_stage(_get_stage(node_id, self.graph.nodes[node_id]["component"]))
+        return node_output, stream_id
+
+
+def _get_stage(node_id: str, component: Any) -> str:
+    if isinstance(component, BaseConverter):
+        return "converted"
+    if isinstance(component, PreProcessor):
+        return "preprocessed"
+    if isinstance(component, BaseRetriever):
+        return "embedded"
+    if isinstance(component, BaseDocumentStore):
+        return "written"
+    return node_id
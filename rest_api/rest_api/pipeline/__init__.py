@@ -8,7 +8,7 @@ from haystack.pipelines.base import Pipeline
 from haystack.document_stores import FAISSDocumentStore, InMemoryDocumentStore
 from haystack.errors import PipelineConfigError
 
-from rest_api.controller.utils import RequestLimiter
+from rest_api.jobs import IndexingJobRunner, IndexingJobStore
 
 
 logger = logging.getLogger(__name__)
@@ -59,11 +59,6 @@ def setup_pipelines() -> Dict[str, Any]:
     pipelines["query_pipeline"] = query_pipeline
     pipelines["document_store"] = document_store
 
-    # Setup concurrency limiter
-    concurrency_limiter = RequestLimiter(config.CONCURRENT_REQUEST_PER_WORKER)
-    logger.info("Concurrent requests per worker: %s", config.CONCURRENT_REQUEST_PER_WORKER)
-    pipelines["concurrency_limiter"] = concurrency_limiter
-
     # Load indexing pipeline
     index_pipeline, _ = _load_pipeline(config.PIPELINE_YAML_PATH, config.INDEXING_PIPELINE_NAME)
     if not index_pipeline:
@@ -73,4 +68,15 @@ def setup_pipelines() -> Dict[str, Any]:
     # Create directory for uploaded files
     os.makedirs(config.FILE_UPLOAD_PATH, exist_ok=True)
 
+    # Run the indexing jobs of the File Upload API in the background, resuming the ones that didn't finish
+    if index_pipeline:
+        job_runner = IndexingJobRunner(
+            pipeline=index_pipeline,
+            store=IndexingJobStore(config.INDEXING_JOBS_DB_PATH),
+            workers=config.INDEXING_JOB_WORKERS,
+            max_attempts=config.INDEXING_JOB_MAX_ATTEMPTS,
+        )
+        job_runner.start()
+        pipelines["indexing_job_runner"] = job_runner
+
     return pipelines
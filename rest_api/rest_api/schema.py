@@ -41,6 +41,11 @@ class FilterRequest(RequestBaseModel):
     filters: Optional[Dict[str, Union[PrimitiveType, List[PrimitiveType], Dict[str, PrimitiveType]]]] = None
 
 
+class DocumentPageRequest(FilterRequest):
+    page_size: int = Field(100, ge=1, le=10_000)
+    cursor: Optional[str] = None
+
+
 class CreateLabelSerialized(RequestBaseModel):
     id: Optional[str] = None
     query: str
@@ -63,3 +68,8 @@ class QueryResponse(BaseModel):
     documents: List[Document] = []
     results: Optional[List[str]] = None
     debug: Optional[Dict] = Field(None, alias="_debug")
+
+
+class DocumentPageResponse(BaseModel):
+    documents: List[Document] = []
+    next_cursor: Optional[str] = None
@@ -2,7 +2,11 @@
 
 from typing import Dict, List, Optional, Union, Generator
 
+import asyncio
+import json
 import os
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
 from unittest import mock
@@ -11,6 +15,7 @@ import numpy as np
 import pandas as pd
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 import posthog
 from haystack import Document, Answer, Pipeline
@@ -23,6 +28,9 @@ from haystack.nodes.file_converter import BaseConverter
 
 from rest_api.pipeline import _load_pipeline
 from rest_api.utils import get_app
+from rest_api.controller.utils import RequestQueue
+from rest_api.jobs import IndexingJobStore
+from rest_api.schema import QueryRequest
 
 # Disable telemetry reports when running tests
 posthog.disabled = True
@@ -272,6 +280,49 @@ def test_get_documents_with_filters(client):
     MockDocumentStore.mocker.get_all_documents.assert_called_with(filters={"test_index": ["2"]})
 
 
+def test_get_documents_page(client, monkeypatch):
+    docs = [Document(content=f"document {i}") for i in range(5)]
+    get_all_documents_generator = MagicMock(side_effect=lambda *args, **kwargs: iter(docs))
+    monkeypatch.setattr(MockDocumentStore, "get_all_documents_generator", get_all_documents_generator)
+
+    pages = []
+    cursors = []
+    request = {"filters": {}, "page_size": 2}
+    while True:
+        response = client.post(url="/documents/get_by_filters/page", json=request)
+        assert 200 == response.status_code
+        pages.append([doc["content"] for doc in response.json()["documents"]])
+        if "next_cursor" not in response.json():
+            break
+        request["cursor"] = response.json()["next_cursor"]
+        cursors.append(request["cursor"])
+
+    assert pages == [["document 0", "document 1"], ["document 2", "document 3"], ["document 4"]]
+    # The pages continue the scan of the first page
+    assert get_all_documents_generator.call_count == 1
+
+    # Cursors that were already used get the same page from a new scan
+    request = {"filters": {}, "page_size": 2, "cursor": cursors[0]}
+    response = client.post(url="/documents/get_by_filters/page", json=request)
+    assert [doc["content"] for doc in response.json()["documents"]] == ["document 2", "document 3"]
+    assert get_all_documents_generator.call_count == 2
+
+
+def test_get_documents_page_with_invalid_cursor(client):
+    response = client.post(url="/documents/get_by_filters/page", json={"filters": {}, "cursor": "invalid"})
+    assert 400 == response.status_code
+
+
+def test_stream_documents(client, monkeypatch):
+    docs = [Document(content=f"document {i}") for i in range(3)]
+    monkeypatch.setattr(MockDocumentStore, "get_all_documents_generator", lambda self, *args, **kwargs: iter(docs))
+
+    response = client.post(url="/documents/stream_by_filters", json={"filters": {}})
+    assert 200 == response.status_code
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [Document.from_json(line) for line in response.text.splitlines()] == docs
+
+
 def test_delete_all_documents(client):
     response = client.post(url="/documents/delete_by_filters", data='{"filters": {}}')
     assert 200 == response.status_code
@@ -324,6 +375,54 @@ def test_file_upload_with_wrong_meta(client):
     MockPDFToTextConverter.mocker.convert.assert_not_called()
 
 
+def test_file_upload_job(client):
+    file_to_upload = {"files": (Path(__file__).parent / "samples" / "pdf" / "sample_pdf_1.pdf").open("rb")}
+    response = client.post(url="/file-upload/jobs", files=file_to_upload, data={"meta": '{"test_key": "test_value"}'})
+    assert 200 == response.status_code
+    job_id = response.json()["job_id"]
+
+    for _ in range(50):
+        job = client.get(url=f"/file-upload/jobs/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.1)
+
+    assert job["status"] == "completed"
+    assert job["files"][0]["file_name"] == "sample_pdf_1.pdf"
+    assert job["files"][0]["status"] == "indexed"
+    assert job["files"][0]["stages"] == ["converted", "preprocessed", "written"]
+    assert job["files"][0]["attempts"] == 1
+    _, kwargs = MockPDFToTextConverter.mocker.convert.call_args
+    assert "sample_pdf_1.pdf" in str(kwargs["file_path"])
+    assert kwargs["meta"] == {"test_key": "test_value", "name": "sample_pdf_1.pdf"}
+
+    # Finished jobs can't be cancelled
+    response = client.delete(url=f"/file-upload/jobs/{job_id}")
+    assert 409 == response.status_code
+
+
+def test_indexing_job_store_claims_and_requeues_jobs(tmp_path):
+    store = IndexingJobStore(str(tmp_path / "jobs.db"))
+    job_id = store.create_job(file_paths=["a.txt"], metas=[{"name": "a.txt"}], params={})
+    assert store.get_queued_job_ids() == [job_id]
+
+    # Only one runner can claim a queued job
+    assert store.claim_job(job_id)
+    assert not store.claim_job(job_id)
+    assert store.get_queued_job_ids() == []
+
+    # Running jobs with a recent heartbeat stay with their runner, abandoned ones are queued again
+    store.send_heartbeat([job_id])
+    assert store.requeue_abandoned_jobs(timeout=60) == 0
+    assert store.requeue_abandoned_jobs(timeout=-1) == 1
+    assert store.get_job_status(job_id) == "queued"
+
+
+def test_get_unknown_file_upload_job(client):
+    response = client.get(url="/file-upload/jobs/unknown")
+    assert 404 == response.status_code
+
+
 def test_query_with_no_filter(client):
     with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
         # `run` must return a dictionary containing a `query` key
@@ -473,6 +572,112 @@ def test_query_with_prompt_node(client):
         mocked_pipeline.run.assert_called_with(query=TEST_QUERY, params={}, debug=False)
 
 
+def test_query_batch_is_split_per_query(client):
+    from rest_api.controller.search import _process_requests
+
+    with mock.patch("rest_api.controller.search.query_pipeline") as mocked_pipeline:
+        mocked_pipeline.run_batch.return_value = {
+            "queries": ["first query", "second query"],
+            "answers": [[Answer(answer="first answer")], [Answer(answer="second answer")]],
+            "documents": [[Document(content="first document")], []],
+        }
+        requests = [QueryRequest(query=query, params={"top_k": 1}) for query in ["first query", "second query"]]
+        results = _process_requests(requests)
+
+        mocked_pipeline.run_batch.assert_called_once_with(
+            queries=["first query", "second query"], params={"top_k": 1}, debug=False
+        )
+        assert [result["query"] for result in results] == ["first query", "second query"]
+        assert [result["answers"][0].answer for result in results] == ["first answer", "second answer"]
+        assert [len(result["documents"]) for result in results] == [1, 0]
+
+
+def test_request_queue_batches_waiting_requests_and_rejects_when_full():
+    processed_batches = []
+    release = threading.Event()
+
+    def process_batch(requests):
+        processed_batches.append(requests)
+        release.wait()
+        return [request.upper() for request in requests]
+
+    async def send_requests():
+        queue = RequestQueue(
+            process_batch=process_batch,
+            workers=1,
+            max_queue_size=3,
+            max_batch_size=8,
+            batch_key=lambda request: None if request == "debug" else 0,
+        )
+        first = asyncio.ensure_future(queue.submit("first"))
+        await asyncio.sleep(0.1)
+        waiting = [asyncio.ensure_future(queue.submit(request)) for request in ["second", "third", "debug"]]
+        await asyncio.sleep(0.1)
+        with pytest.raises(HTTPException) as exc_info:
+            await queue.submit("rejected")
+        assert exc_info.value.status_code == 503
+        release.set()
+        return await asyncio.gather(first, *waiting), queue.stats()
+
+    results, stats = asyncio.run(send_requests())
+
+    assert results == ["FIRST", "SECOND", "THIRD", "DEBUG"]
+    assert processed_batches == [["first"], ["second", "third"], ["debug"]]
+    assert stats["rejected"] == 1
+    assert stats["batches"] == 3
+    assert stats["queue_depth"] == 0
+
+
+def test_request_queue_leaves_requests_with_other_keys_waiting():
+    processed_batches = []
+    release = threading.Event()
+
+    def process_batch(requests):
+        processed_batches.append(requests)
+        release.wait()
+        return requests
+
+    async def send_requests():
+        queue = RequestQueue(
+            process_batch=process_batch,
+            workers=1,
+            max_queue_size=8,
+            max_batch_size=8,
+            batch_key=lambda request: request.split("-")[0],
+        )
+        first = asyncio.ensure_future(queue.submit("a-first"))
+        await asyncio.sleep(0.1)
+        waiting = [asyncio.ensure_future(queue.submit(request)) for request in ["b-1", "a-1", "b-2", "a-2"]]
+        await asyncio.sleep(0.1)
+        release.set()
+        return await asyncio.gather(first, *waiting)
+
+    results = asyncio.run(send_requests())
+
+    assert results == ["a-first", "b-1", "a-1", "b-2", "a-2"]
+    assert processed_batches == [["a-first"], ["b-1", "b-2"], ["a-1", "a-2"]]
+
+
+def test_request_queue_times_out():
+    release = threading.Event()
+
+    def process_batch(requests):
+        release.wait()
+        return requests
+
+    async def send_request():
+        queue = RequestQueue(process_batch=process_batch, workers=1, max_queue_size=1, timeout=0.1)
+        with pytest.raises(HTTPException) as exc_info:
+            await queue.submit("request")
+        release.set()
+        return exc_info.value.status_code, queue.stats()
+
+    status_code, stats = asyncio.run(send_request())
+
+    assert status_code == 504
+    assert stats["timed_out"] == 1
+
+
 def test_write_feedback(client, feedback):
     response = client.post(url="/feedback", json=feedback)
     assert 200 == response.status_code
@@ -549,6 +754,18 @@ def test_export_feedback(client, monkeypatch, feedback):
         assert context[answer_start : answer_start + len(answer)] == answer
 
 
+def test_stream_feedback_export(client, monkeypatch, feedback):
+    def get_all_labels(*args, **kwargs):
+        return [Label.from_dict(feedback)]
+
+    monkeypatch.setattr(MockDocumentStore, "get_all_labels", get_all_labels)
+
+    response = client.get("/export-feedback/stream?full_document_context=false&context_size=50")
+    assert 200 == response.status_code
+    exported = client.get("/export-feedback?full_document_context=false&context_size=50").json()["data"]
+    assert [json.loads(line) for line in response.text.splitlines()] == exported
+
+
 def test_get_feedback_malformed_query(client, feedback):
     feedback["unexpected_field"] = "misplaced-value"
     response = client.post(url="/feedback", json=feedback)
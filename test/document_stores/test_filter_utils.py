@@ -0,0 +1,75 @@
+import pytest
+
+from haystack.document_stores.filter_utils import LogicalFilterClause, compile_filter
+
+
+FILTERS = {
+    "type": "article",
+    "date": {"$gte": "2015-01-01", "$lt": "2021-01-01"},
+    "$or": {"genre": ["economy", "politics"], "publisher": {"$ne": "nytimes"}, "$not": {"rating": {"$lt": 3}}},
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "meta",
+    [
+        {"type": "article", "date": "2018-05-01", "genre": "economy"},
+        {"type": "article", "date": "2018-05-01", "genre": "sports", "publisher": "nytimes", "rating": 2},
+        {"type": "article", "date": "2018-05-01", "genre": "sports", "publisher": "nytimes", "rating": 4},
+        {"type": "article", "date": "2022-05-01", "genre": "economy"},
+        {"type": "blog", "date": "2018-05-01", "genre": "politics"},
+        {"date": "2018-05-01", "publisher": "guardian"},
+        {"type": "article", "date": "2018-05-01", "genre": ["economy"]},
+    ],
+)
+def test_compiled_filter_evaluates_like_parsed_filter(meta):
+    assert compile_filter(FILTERS).evaluate(meta) == LogicalFilterClause.parse(FILTERS).evaluate(meta)
+
+
+@pytest.mark.unit
+def test_compile_filter_is_cached_by_filter():
+    compiled_filter = compile_filter({"type": "article", "rating": {"$gte": 3}})
+
+    assert compile_filter({"type": "article", "rating": {"$gte": 3}}) is compiled_filter
+    # The conditions are evaluated in the order of the filter
+    assert compile_filter({"rating": {"$gte": 3}, "type": "article"}) is not compiled_filter
+    # 1 and True are equal in Python but not for the document stores
+    assert compile_filter({"type": "article", "rating": {"$gte": True}}) is not compiled_filter
+
+
+@pytest.mark.unit
+def test_compiled_filter_is_not_changed_by_changing_the_filter():
+    filters = {"genre": ["economy", "politics"]}
+    compiled_filter = compile_filter(filters)
+    filters["genre"].append("sports")
+
+    assert not compiled_filter.evaluate({"genre": "sports"})
+    assert compile_filter(filters).evaluate({"genre": "sports"})
+
+
+@pytest.mark.unit
+def test_compiled_filter_conversions_are_reused_but_can_be_modified():
+    compiled_filter = compile_filter(FILTERS)
+    es_filter = compiled_filter.convert_to_elasticsearch()
+    assert es_filter == LogicalFilterClause.parse(FILTERS).convert_to_elasticsearch()
+
+    es_filter["bool"]["must"].clear()
+    assert compiled_filter.convert_to_elasticsearch() == LogicalFilterClause.parse(FILTERS).convert_to_elasticsearch()
+
+    # Pinecone only supports numeric range filters
+    numeric_filters = {"type": "article", "rating": {"$gte": 3, "$lt": 5}}
+    assert (
+        compile_filter(numeric_filters).convert_to_pinecone()
+        == LogicalFilterClause.parse(numeric_filters).convert_to_pinecone()
+    )
+
+
+@pytest.mark.unit
+def test_compiled_filter_evaluates_conditions_in_order():
+    # Comparing the rating raises a TypeError, but the type doesn't match first, just like in the parsed filter
+    meta = {"type": "blog", "rating": "high"}
+    filters = {"type": "article", "rating": {"$gte": 3}}
+
+    assert not LogicalFilterClause.parse(filters).evaluate(meta)
+    assert not compile_filter(filters).evaluate(meta)
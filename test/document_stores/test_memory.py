@@ -1,4 +1,5 @@
 import logging
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
@@ -6,6 +7,7 @@ from rank_bm25 import BM25
 import numpy as np
 
 from haystack.document_stores.memory import InMemoryDocumentStore
+from haystack.errors import DuplicateDocumentError
 from haystack.schema import Document
 from haystack.testing import DocumentStoreBaseTestAbstract
 
@@ -124,3 +126,38 @@ class TestInMemoryDocumentStore(DocumentStoreBaseTestAbstract):
             docs = ds.query_by_embedding(query_emb=query_embedding, top_k=1)
             assert "Skipping some of your documents that don't have embeddings" in caplog.text
         assert len(docs) == 0
+
+    @pytest.mark.unit
+    def test_get_duplicate_labels_does_not_scan_label_index(self, ds, labels, monkeypatch):
+        ds.write_labels(labels[:3])
+        monkeypatch.setattr(ds, "get_all_labels", MagicMock())
+
+        duplicates = ds._get_duplicate_labels(labels[2:5] + [labels[4]])
+
+        assert [label.id for label in duplicates] == [labels[2].id, labels[4].id, labels[4].id]
+        ds.get_all_labels.assert_not_called()
+
+    @pytest.mark.unit
+    def test_write_documents_from_generator(self, ds):
+        consumed = []
+
+        def documents():
+            for i in range(25):
+                consumed.append(i)
+                # every fifth document repeats the previous one, also across chunk borders
+                yield Document(content=f"Document {i - 1 if i % 5 == 0 and i > 0 else i}")
+
+        ds.write_documents(documents(), batch_size=4, duplicate_documents="fail")
+
+        assert len(consumed) == 25
+        assert ds.get_document_count() == 21
+
+    @pytest.mark.unit
+    def test_write_documents_fail_on_existing_document_writes_nothing(self, ds):
+        ds.write_documents([Document(content="Document 7")])
+
+        documents = (Document(content=f"Document {i}") for i in range(10))
+        with pytest.raises(DuplicateDocumentError):
+            ds.write_documents(documents, batch_size=4, duplicate_documents="fail")
+
+        assert ds.get_document_count() == 1
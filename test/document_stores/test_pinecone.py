@@ -449,6 +449,29 @@ class TestPineconeDocumentStore(DocumentStoreBaseTestAbstract):
         ds.update_embeddings(retriever, update_existing_embeddings=False)
         ds._validate_embeddings_shape.assert_called_once()
 
+    @pytest.mark.unit
+    def test_query_by_embedding_batch(self, ds: PineconeDocumentStore, monkeypatch):
+        docs = [
+            Document(content=f"Doc {i}", meta={"name": f"name_{i}"}, embedding=np.random.rand(768).astype(np.float32))
+            for i in range(5)
+        ]
+        ds.write_documents(docs)
+        query_embs = np.random.rand(3, 768).astype(np.float32)
+        expected = [ds.query_by_embedding(query_emb.copy(), top_k=3, return_embedding=True) for query_emb in query_embs]
+
+        pinecone_index = ds.pinecone_indexes[ds.index]
+        monkeypatch.setattr(pinecone_index, "fetch", MagicMock(wraps=pinecone_index.fetch))
+        results = ds.query_by_embedding_batch(query_embs, top_k=3, return_embedding=True)
+
+        assert len(results) == 3
+        for result, expected_result in zip(results, expected):
+            assert [doc.id for doc in result] == [doc.id for doc in expected_result]
+            assert [doc.score for doc in result] == [doc.score for doc in expected_result]
+            assert all(np.allclose(doc.embedding, exp.embedding) for doc, exp in zip(result, expected_result))
+        # documents retrieved for several queries are fetched only once
+        pinecone_index.fetch.assert_called_once()
+        assert len(pinecone_index.fetch.call_args.kwargs["ids"]) == 3
+
     @pytest.mark.integration
     def test_get_embedding_count(self, doc_store_with_docs: PineconeDocumentStore):
         """
@@ -1,6 +1,10 @@
+import threading
 from unittest.mock import MagicMock
+import numpy as np
+import pandas as pd
 import pytest
-from haystack.document_stores.search_engine import SearchEngineDocumentStore, prepare_hosts
+from haystack.document_stores.search_engine import SearchEngineDocumentStore, prepare_hosts, _AdaptiveBulkBatchSize
+from haystack.schema import Document
 
 
 @pytest.mark.unit
@@ -8,6 +12,18 @@ def test_prepare_hosts():
     pass
 
 
+@pytest.mark.unit
+def test_adaptive_bulk_batch_size():
+    batch_size = _AdaptiveBulkBatchSize(max_size=100, target_latency=10.0)
+    assert batch_size.update(latency=1.0, throttled=True) == 50
+    assert batch_size.update(latency=20.0, throttled=False) == 25
+    # latencies close to the target keep the size stable
+    assert batch_size.update(latency=7.0, throttled=False) == 25
+    assert batch_size.update(latency=1.0, throttled=False) == 50
+    assert batch_size.update(latency=1.0, throttled=False) == 100
+    assert batch_size.update(latency=1.0, throttled=False) == 100
+
+
 @pytest.mark.document_store
 class SearchEngineDocumentStoreTestAbstract:
     """
@@ -187,6 +203,124 @@ class SearchEngineDocumentStoreTestAbstract:
         labels = mocked_document_store.get_all_labels()
         assert labels[0].answer.document_ids == ["fc18c987a8312e72a47fb1524f230bb0"]
 
+    @pytest.mark.unit
+    def test_convert_es_hits_to_documents(self, mocked_document_store):
+        hits = [
+            {
+                "_id": "1",
+                "_score": None,
+                "_source": {"content": "a", "content_type": "text", "name": "n1", "year": 2020, "embedding": [1, 2]},
+            },
+            {"_id": "2", "_score": None, "_source": {"content": "b", "content_type": "text"}},
+            {
+                "_id": "3",
+                "_score": None,
+                "_source": {"content": "c", "content_type": "text", "embedding": [3, 4]},
+                "highlight": {"content": []},
+            },
+            {
+                "_id": "4",
+                "_score": None,
+                "_source": {"content": [["col"], ["cell"]], "content_type": "table", "embedding": [5, 6, 7]},
+            },
+        ]
+
+        docs = mocked_document_store._convert_es_hits_to_documents(hits)
+
+        assert [doc.id for doc in docs] == ["1", "2", "3", "4"]
+        assert docs[0].meta == {"name": "n1", "year": 2020}
+        assert docs[2].meta == {"highlighted": {"content": []}}
+        assert docs[0].embedding.dtype == np.float32
+        assert docs[0].embedding.tolist() == [1.0, 2.0]
+        assert docs[1].embedding is None
+        assert docs[2].embedding.tolist() == [3.0, 4.0]
+        assert docs[3].embedding.tolist() == [5.0, 6.0, 7.0]
+        assert docs[3].content.columns.tolist() == ["col"]
+
+        docs = mocked_document_store._convert_es_hits_to_documents(hits, return_embedding=False)
+        assert all(doc.embedding is None for doc in docs)
+
+    @pytest.mark.unit
+    def test_write_documents_parallel_bulk(self, mocked_document_store, monkeypatch):
+        lock = threading.Lock()
+        batches = []
+
+        def do_bulk(client, actions, **kwargs):
+            with lock:
+                batches.append(list(actions))
+
+        monkeypatch.setattr(mocked_document_store, "_do_bulk", do_bulk)
+        mocked_document_store.bulk_thread_count = 4
+        docs = [{"content": f"text_{i}", "meta": {"name": f"name_{i}"}} for i in range(95)]
+        mocked_document_store.write_documents(docs, batch_size=10)
+
+        assert all(len(batch) <= 10 for batch in batches)
+        indexed = [action for batch in batches for action in batch]
+        assert sorted(action["content"] for action in indexed) == sorted(doc["content"] for doc in docs)
+        assert all(action["_op_type"] == "index" and "meta" not in action for action in indexed)
+
+    @pytest.mark.unit
+    def test_write_documents_bulk_actions(self, mocked_document_store, monkeypatch):
+        actions = []
+        monkeypatch.setattr(mocked_document_store, "_do_bulk", lambda client, batch, **kwargs: actions.extend(batch))
+        docs = [
+            Document(content="text_0", meta={"name": "name_0"}, embedding=np.array([1.0, 2.0], dtype=np.float32)),
+            Document(content="text_1", meta={"name": "name_1"}),
+            Document(content="text_2", embedding=np.array([3.0, 4.0], dtype=np.float32)),
+            Document(content=pd.DataFrame({"col": ["a", "b"]}), content_type="table", id="table"),
+        ]
+        mocked_document_store.write_documents(docs)
+
+        assert [action["_id"] for action in actions] == [doc.id for doc in docs]
+        assert actions[0]["embedding"] == [1.0, 2.0] and isinstance(actions[0]["embedding"], list)
+        assert "embedding" not in actions[1]
+        assert actions[2]["embedding"] == [3.0, 4.0]
+        assert actions[0]["name"] == "name_0" and "meta" not in actions[0]
+        assert actions[3]["content"] == [["col"], ["a"], ["b"]]
+        assert all("score" not in action and "id" not in action for action in actions)
+
+    @pytest.mark.unit
+    def test_update_embeddings_sliced_scroll(self, mocked_document_store, monkeypatch):
+        hits = [
+            {"_id": str(i), "_score": None, "_source": {"content": f"text_{i}", "content_type": "text"}}
+            for i in range(50)
+        ]
+        lock = threading.Lock()
+        updates = []
+
+        def do_scan(client, query, **kwargs):
+            assert query["_source"] == {"excludes": ["embedding"]}
+            return [hit for i, hit in enumerate(hits) if i % query["slice"]["max"] == query["slice"]["id"]]
+
+        def do_bulk(client, actions, **kwargs):
+            with lock:
+                updates.extend(actions)
+
+        monkeypatch.setattr(mocked_document_store, "_do_scan", do_scan)
+        monkeypatch.setattr(mocked_document_store, "_do_bulk", do_bulk)
+        monkeypatch.setattr(mocked_document_store, "get_document_count", MagicMock(return_value=len(hits)))
+        retriever = MagicMock()
+        retriever.embed_documents.side_effect = lambda docs: np.ones((len(docs), mocked_document_store.embedding_dim))
+
+        mocked_document_store.update_embeddings(retriever, batch_size=8, scroll_slices=3)
+
+        assert sorted(int(update["_id"]) for update in updates) == list(range(50))
+        assert all(update["_op_type"] == "update" and len(update["doc"]["embedding"]) == 768 for update in updates)
+
+    @pytest.mark.unit
+    def test_update_embeddings_raises_embedding_errors(self, mocked_document_store, monkeypatch):
+        hits = [
+            {"_id": str(i), "_score": None, "_source": {"content": f"text_{i}", "content_type": "text"}}
+            for i in range(50)
+        ]
+        monkeypatch.setattr(mocked_document_store, "_do_scan", MagicMock(return_value=hits))
+        monkeypatch.setattr(mocked_document_store, "get_document_count", MagicMock(return_value=len(hits)))
+        retriever = MagicMock()
+        retriever.embed_documents.side_effect = ValueError("Embedding failed")
+
+        with pytest.raises(ValueError, match="Embedding failed"):
+            mocked_document_store.update_embeddings(retriever, batch_size=8)
+
 
 @pytest.mark.document_store
 class TestSearchEngineDocumentStore:
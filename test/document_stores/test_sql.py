@@ -42,6 +42,12 @@ class TestSQLDocumentStore(DocumentStoreBaseTestAbstract):
         with pytest.raises(Exception, match=r"(?i)unique"):
             ds.write_documents([doc2], index="index3")
 
+    @pytest.mark.integration
+    def test_sql_write_documents_from_generator(self, ds):
+        documents = (Document(content=f"Document {i % 15}") for i in range(30))
+        ds.write_documents(documents, batch_size=4, duplicate_documents="skip")
+        assert ds.get_document_count() == 15
+
     @pytest.mark.integration
     def test_sql_get_documents_using_nested_filters_about_classification(self, ds):
         documents = [
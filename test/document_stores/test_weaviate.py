@@ -4,6 +4,7 @@ from haystack.document_stores.weaviate import WeaviateDocumentStore
 from haystack.schema import Document
 from haystack.testing import DocumentStoreBaseTestAbstract
 
+import time
 import uuid
 from unittest.mock import MagicMock
 
@@ -222,6 +223,74 @@ class TestWeaviateDocumentStore(DocumentStoreBaseTestAbstract):
         ds.get_all_documents.assert_called()
         assert ds.get_document_count() == 6
 
+    @pytest.fixture
+    def mocked_ds(self, monkeypatch):
+        monkeypatch.setattr(WeaviateDocumentStore, "_create_schema_and_index", MagicMock())
+        monkeypatch.setattr("haystack.document_stores.weaviate.client.Client", MagicMock())
+        return WeaviateDocumentStore(index=self.index_name, similarity="dot_product", query_batch_workers=3)
+
+    @pytest.mark.unit
+    def test_query_by_embedding_batch_keeps_query_order(self, mocked_ds):
+        class MockQueryBuilder:
+            def __init__(self, class_name, properties):
+                self.class_name = class_name
+                self.where = None
+                self.limit = None
+                self.query_idx = None
+
+            def with_where(self, where):
+                self.where = where
+                return self
+
+            def with_near_vector(self, near_vector):
+                self.query_idx = int(near_vector["vector"][0][0])
+                return self
+
+            def with_limit(self, limit):
+                self.limit = limit
+                return self
+
+            def do(self):
+                # Let the first queries finish last
+                time.sleep(0.05 * (3 - self.query_idx))
+                results = [
+                    {
+                        "content": f'"query {self.query_idx} rank {rank}"',
+                        "content_type": "text",
+                        "_additional": {"id": get_uuid(), "distance": -rank},
+                    }
+                    for rank in range(self.limit, 0, -1)
+                ]
+                return {"data": {"Get": {self.class_name: results}}}
+
+        builders = []
+
+        def get_query_builder(class_name, properties):
+            builders.append(MockQueryBuilder(class_name, properties))
+            return builders[-1]
+
+        mocked_ds.weaviate_client.schema.get.return_value = {
+            "classes": [{"class": self.index_name, "properties": [{"name": "content"}, {"name": "name"}]}]
+        }
+        mocked_ds.weaviate_client.query.get.side_effect = get_query_builder
+
+        query_embs = np.array([[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]], dtype=np.float32)
+        results = mocked_ds.query_by_embedding_batch(
+            query_embs, filters=[None, {"name": "name_1"}, None], top_k=2, scale_score=False
+        )
+
+        assert [[doc.content for doc in docs] for docs in results] == [
+            [f"query {query_idx} rank {rank}" for rank in (2, 1)] for query_idx in range(3)
+        ]
+        assert [doc.score for doc in results[0]] == [2, 1]
+        # The schema is read once for the whole batch and each query only gets its own filter
+        mocked_ds.weaviate_client.schema.get.assert_called_once()
+        assert [builder.where is not None for builder in sorted(builders, key=lambda b: b.query_idx)] == [
+            False,
+            True,
+            False,
+        ]
+
     @pytest.mark.integration
     @pytest.mark.parametrize("similarity", ["cosine", "l2", "dot_product"])
     def test_similarity_existing_index(self, similarity):
@@ -1,3 +1,6 @@
+from unittest.mock import Mock
+
+import numpy as np
 import pytest
 
 from haystack.nodes import TextConverter
@@ -7,6 +10,7 @@ from haystack.pipelines import Pipeline
 from haystack import Document
 
 from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
+from haystack.nodes.extractor.entity import _EntityPostProcessor, _TokenClassificationCollator
 
 from ..conftest import SAMPLES_PATH
 
@@ -235,3 +239,77 @@ def test_extract_method_simple_aggregation():
         {"entity_group": "PER", "word": "De", "start": 30, "end": 32},
         {"entity_group": "LOC", "word": "##bra", "start": 32, "end": 35},
     ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "aggregation_strategy,expected_entities,expected_scores",
+    [("first", ["LOC", "O"], [0.6, 0.9]), ("max", ["PER", "O"], [0.8, 0.9]), ("average", ["PER", "O"], [0.5, 0.9])],
+)
+def test_entity_postprocessor_aggregate_words(aggregation_strategy, expected_entities, expected_scores):
+    model = Mock()
+    model.config.id2label = {0: "O", 1: "LOC", 2: "PER"}
+    tokenizer = Mock()
+    tokenizer.convert_tokens_to_string.side_effect = lambda tokens: "".join(t.replace("##", "") for t in tokens)
+    postprocessor = _EntityPostProcessor(model=model, tokenizer=tokenizer)
+
+    pre_entities = [
+        {"word": "Win", "scores": np.array([0.1, 0.6, 0.3]), "start": 0, "end": 3, "is_subword": False},
+        {"word": "##ter", "scores": np.array([0.1, 0.1, 0.8]), "start": 3, "end": 6, "is_subword": True},
+        {"word": "##fell", "scores": np.array([0.2, 0.4, 0.4]), "start": 6, "end": 10, "is_subword": True},
+        {"word": "is", "scores": np.array([0.9, 0.05, 0.05]), "start": 11, "end": 13, "is_subword": False},
+    ]
+    word_entities = postprocessor.aggregate_words(pre_entities, aggregation_strategy)
+
+    assert [entity["word"] for entity in word_entities] == ["Winterfell", "is"]
+    assert [entity["tokens"] for entity in word_entities] == [["Win", "##ter", "##fell"], ["is"]]
+    assert [(entity["start"], entity["end"]) for entity in word_entities] == [(0, 10), (11, 13)]
+    assert [entity["entity"] for entity in word_entities] == expected_entities
+    assert [entity["score"] for entity in word_entities] == pytest.approx(expected_scores)
+
+
+@pytest.mark.unit
+def test_entity_postprocessor_aggregate_words_average_ignores_nan():
+    model = Mock()
+    model.config.id2label = {0: "O", 1: "LOC", 2: "PER"}
+    tokenizer = Mock()
+    tokenizer.convert_tokens_to_string.side_effect = lambda tokens: "".join(t.replace("##", "") for t in tokens)
+    postprocessor = _EntityPostProcessor(model=model, tokenizer=tokenizer)
+
+    pre_entities = [
+        {"word": "Win", "scores": np.array([0.1, np.nan, 0.3]), "start": 0, "end": 3, "is_subword": False},
+        {"word": "##ter", "scores": np.array([0.1, 0.2, 0.8]), "start": 3, "end": 6, "is_subword": True},
+    ]
+    word_entities = postprocessor.aggregate_words(pre_entities, "average")
+
+    assert word_entities[0]["entity"] == "PER"
+    assert word_entities[0]["score"] == pytest.approx(np.nanmean([0.3, 0.8]))
+
+
+@pytest.mark.unit
+def test_token_classification_collator_pads_every_key():
+    collator = _TokenClassificationCollator(pad_token_id=7, pad_token_type_id=2)
+    batch = collator(
+        [
+            {
+                "input_ids": [1, 2, 3],
+                "attention_mask": [1, 1, 1],
+                "token_type_ids": [0, 0, 1],
+                "offset_mapping": [(0, 0), (0, 2), (3, 5)],
+                "overflow_to_sample_mapping": 0,
+            },
+            {
+                "input_ids": [4],
+                "attention_mask": [1],
+                "token_type_ids": [0],
+                "offset_mapping": [(0, 0)],
+                "overflow_to_sample_mapping": 1,
+            },
+        ]
+    )
+
+    assert batch["input_ids"].tolist() == [[1, 2, 3], [4, 7, 7]]
+    assert batch["attention_mask"].tolist() == [[1, 1, 1], [1, 0, 0]]
+    assert batch["token_type_ids"].tolist() == [[0, 0, 1], [0, 2, 2]]
+    assert batch["offset_mapping"].shape == (2, 3, 2)
+    assert batch["overflow_to_sample_mapping"].tolist() == [0, 1]
@@ -17,3 +17,18 @@ def test_joinanswers(join_mode):
     result, _ = join_answers.run(inputs, top_k_join=1)
     assert len(result["answers"]) == 1
     assert result["answers"][0].answer == "answer 2"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("join_mode", ["concatenate", "merge"])
+def test_joinanswers_batch(join_mode):
+    inputs = [
+        {"answers": [[Answer(answer="answer 1", score=0.7)], [Answer(answer="answer 3", score=0.2)]]},
+        {"answers": [[Answer(answer="answer 2", score=0.8)], [Answer(answer="answer 4", score=0.5)]]},
+    ]
+
+    join_answers = JoinAnswers(join_mode=join_mode, weights=[1, 3] if join_mode == "merge" else None)
+    result, _ = join_answers.run_batch(inputs=inputs, top_k_join=1)
+    assert [[answer.answer for answer in answers] for answers in result["answers"]] == [["answer 2"], ["answer 4"]]
+    if join_mode == "merge":
+        assert [answers[0].score for answers in result["answers"]] == pytest.approx([0.6, 0.375])
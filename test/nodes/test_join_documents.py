@@ -42,3 +42,39 @@ def test_joindocuments_score_none(join_mode, sort_by_score):
 
     result, _ = join_docs.run(inputs, top_k_join=1)
     assert len(result["documents"]) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("join_mode", ["concatenate", "merge", "reciprocal_rank_fusion"])
+@pytest.mark.parametrize("sort_by_score", [True, False])
+def test_joindocuments_batch(join_mode, sort_by_score):
+    def create_inputs():
+        return [
+            {
+                "documents": [
+                    [Document(content="a", id="a", score=0.2), Document(content="b", id="b", score=0.1)],
+                    [Document(content="c", id="c", score=0.9)],
+                ]
+            },
+            {
+                "documents": [
+                    [Document(content="b", id="b", score=0.7), Document(content="c", id="c", score=0.4)],
+                    [Document(content="a", id="a", score=0.3), Document(content="c", id="c", score=0.1)],
+                ]
+            },
+        ]
+
+    join_docs = JoinDocuments(join_mode=join_mode, sort_by_score=sort_by_score)
+    result, _ = join_docs.run_batch(inputs=create_inputs(), top_k_join=2)
+
+    # Joining a batch of queries gives the same documents as joining each query on its own
+    for query_idx, documents in enumerate(result["documents"]):
+        query_inputs = [{"documents": inp["documents"][query_idx]} for inp in create_inputs()]
+        query_result, _ = join_docs.run(inputs=query_inputs, top_k_join=2)
+        assert [(doc.id, doc.score) for doc in documents] == [(doc.id, doc.score) for doc in query_result["documents"]]
+
+    if join_mode == "merge" and sort_by_score:
+        assert [doc.id for doc in result["documents"][0]] == ["b", "c"]
+        assert [doc.score for doc in result["documents"][0]] == pytest.approx([0.4, 0.2])
+        assert [doc.id for doc in result["documents"][1]] == ["c", "a"]
+        assert [doc.score for doc in result["documents"][1]] == pytest.approx([0.5, 0.15])
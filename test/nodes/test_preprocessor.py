@@ -1,3 +1,4 @@
+import gc
 import sys
 from pathlib import Path
 from typing import Any, Optional, List
@@ -212,6 +213,33 @@ def test_clean_header_footer():
     assert "footer" not in documents[0].content
 
 
+@pytest.mark.unit
+def test_find_longest_common_ngram():
+    preprocessor = PreProcessor(split_by=None)
+    sequences = [
+        "Annual report of ACME Corp\nPage one talks about revenue",
+        "Annual report of ACME Corp\nPage two talks about costs",
+        "Intro. Annual report of ACME Corp\nPage three",
+    ]
+    assert preprocessor._find_longest_common_ngram(sequences) == "Annual report of ACME Corp\nPage"
+    assert preprocessor._find_longest_common_ngram(sequences, max_ngram=4) == "Annual report of"
+    assert preprocessor._find_longest_common_ngram(["no common words", "between these texts"]) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("header_footer_sample_pages", [None, 4])
+def test_clean_header_footer_on_many_pages(header_footer_sample_pages):
+    pages = [f"ACME Corp quarterly report\nchapter{i} covers item{i}.\nCopyright 2019 by ACME Corp" for i in range(20)]
+    preprocessor = PreProcessor(
+        clean_header_footer=True, split_by=None, header_footer_sample_pages=header_footer_sample_pages
+    )
+    documents = preprocessor.process([Document(content="\f".join(pages))])
+
+    assert "ACME Corp quarterly report" not in documents[0].content
+    assert "Copyright 2019 by ACME Corp" not in documents[0].content
+    assert "chapter7 covers item7." in documents[0].content
+
+
 @pytest.mark.unit
 def test_remove_substrings():
     document = Document(content="This is a header. Some additional text. wiki. Some emoji ✨ 🪲 Weird whitespace\b\b\b.")
@@ -599,3 +627,67 @@ def test_split_overlap_information():
         documents[2].content[doc2_overlap_doc3[0] : doc2_overlap_doc3[1]]
         == documents[3].content[doc3_overlap_doc2[0] : doc3_overlap_doc2[1]]
     )
+
+
+@pytest.mark.unit
+def test_process_with_multiprocessing_keeps_order_and_ids():
+    documents = [Document(content=TEXT, meta={"file": i}) for i in range(6)]
+    sequential = PreProcessor(split_by="sentence", split_length=2, id_hash_keys=["content", "meta"])
+    parallel = PreProcessor(
+        split_by="sentence",
+        split_length=2,
+        id_hash_keys=["content", "meta"],
+        num_processes=2,
+        multiprocessing_chunksize=2,
+    )
+
+    expected = sequential.process(documents)
+    try:
+        result = parallel.process(documents)
+    finally:
+        parallel.close_multiprocessing_pool()
+
+    assert [doc.id for doc in result] == [doc.id for doc in expected]
+    assert [doc.content for doc in result] == [doc.content for doc in expected]
+    assert [doc.meta for doc in result] == [doc.meta for doc in expected]
+
+
+@pytest.mark.unit
+def test_multiprocessing_pool_follows_config_changes_and_is_closed_with_the_preprocessor():
+    documents = [Document(content=TEXT), Document(content=TEXT)]
+    preprocessor = PreProcessor(split_by="word", split_length=10, split_respect_sentence_boundary=False, num_processes=2)
+
+    preprocessor.process(documents)
+    first_pool = preprocessor._pool
+    preprocessor.process(documents)
+    assert preprocessor._pool is first_pool
+
+    # The workers have a copy of the old configuration, so they get restarted
+    preprocessor.remove_substrings = ["sentence"]
+    result = preprocessor.process(documents)
+    assert preprocessor._pool is not first_pool
+    assert all("sentence" not in doc.content for doc in result)
+
+    finalizer = preprocessor._pool_finalizer
+    del preprocessor
+    gc.collect()
+    assert not finalizer.alive
+
+
+@pytest.mark.unit
+def test_sentence_tokenizer_is_loaded_once_per_language_and_model_folder(monkeypatch: MonkeyPatch, tmp_path: Path):
+    preprocessor = PreProcessor(
+        split_by="sentence", split_length=1, split_respect_sentence_boundary=False, tokenizer_model_folder=tmp_path
+    )
+    load_sentence_tokenizer = Mock(wraps=preprocessor._load_sentence_tokenizer)
+    monkeypatch.setattr(PreProcessor, "_load_sentence_tokenizer", load_sentence_tokenizer)
+
+    documents = preprocessor.process([Document(content=TEXT), Document(content=TEXT)])
+    other_preprocessor = PreProcessor(
+        split_by="sentence", split_length=1, split_respect_sentence_boundary=False, tokenizer_model_folder=tmp_path
+    )
+    other_documents = other_preprocessor.process([Document(content=TEXT)])
+
+    assert load_sentence_tokenizer.call_count == 1
+    assert len(documents) == 30
+    assert [doc.content for doc in other_documents] == [doc.content for doc in documents[:15]]
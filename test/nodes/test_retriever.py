@@ -1188,7 +1188,7 @@ def test_web_retriever_mode_raw_documents(monkeypatch):
             self.text = text
             self.status_code = status_code
 
-    def get(url, headers, timeout):
+    def get(self, url, headers, timeout):
         return MockResponse("mocked", 200)
 
     def get_content(self, text: str) -> str:
@@ -1196,7 +1196,7 @@ def test_web_retriever_mode_raw_documents(monkeypatch):
 
     monkeypatch.setattr(WebSearch, "run", mock_web_search_run)
     monkeypatch.setattr(ArticleExtractor, "get_content", get_content)
-    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(requests.Session, "get", get)
 
     web_retriever = WebRetriever(api_key="", top_search_results=2, mode="raw_documents")
     result = web_retriever.retrieve(query="Who is the father of Arya Stark?")
@@ -1246,7 +1246,7 @@ def test_web_retriever_mode_preprocessed_documents(monkeypatch):
             self.text = text
             self.status_code = status_code
 
-    def get(url, headers, timeout):
+    def get(self, url, headers, timeout):
         return MockResponse("mocked", 200)
 
     def get_content(self, text: str) -> str:
@@ -1254,7 +1254,7 @@ def test_web_retriever_mode_preprocessed_documents(monkeypatch):
 
     monkeypatch.setattr(WebSearch, "run", mock_web_search_run)
     monkeypatch.setattr(ArticleExtractor, "get_content", get_content)
-    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(requests.Session, "get", get)
 
     web_retriever = WebRetriever(api_key="", top_search_results=2, mode="preprocessed_documents")
     result = web_retriever.retrieve(query="Who is the father of Arya Stark?")
@@ -1304,6 +1304,55 @@ def test_web_retriever_mode_snippets(monkeypatch):
     assert result == expected_search_results["documents"]
 
 
+@pytest.mark.unit
+def test_web_retriever_retrieve_batch(monkeypatch):
+    def mock_web_search_run(self, query: str) -> Tuple[Dict, str]:
+        return (
+            {
+                "documents": [
+                    Document(
+                        content=f"Snippet for {query}",
+                        meta={"title": query, "link": f"https://example.com/{query}", "position": 1},
+                    )
+                ]
+            },
+            "output_1",
+        )
+
+    class MockResponse:
+        def __init__(self, text, status_code):
+            self.text = text
+            self.status_code = status_code
+
+    def get(self, url, headers, timeout):
+        return MockResponse(url, 200)
+
+    def get_content(self, text: str) -> str:
+        return f"Content of {text}"
+
+    monkeypatch.setattr(WebSearch, "run", mock_web_search_run)
+    monkeypatch.setattr(ArticleExtractor, "get_content", get_content)
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    cache = InMemoryDocumentStore()
+    web_retriever = WebRetriever(
+        api_key="", top_search_results=2, mode="raw_documents", cache_document_store=cache, max_workers=4
+    )
+    result = web_retriever.retrieve_batch(queries=["berlin", "paris"])
+    assert len(result) == 2
+    assert [doc.content for doc in result[0]] == ["Content of https://example.com/berlin"]
+    assert [doc.content for doc in result[1]] == ["Content of https://example.com/paris"]
+    assert cache.get_document_count() == 2
+
+    # a second batch is served from the cache with a single lookup and without searching the web again
+    monkeypatch.setattr(WebSearch, "run", Mock(side_effect=AssertionError("cache was not used")))
+    with patch.object(cache, "get_all_documents", wraps=cache.get_all_documents) as get_all_documents:
+        result = web_retriever.retrieve_batch(queries=["paris", "berlin"])
+    get_all_documents.assert_called_once()
+    assert [doc.meta["url"] for doc in result[0]] == ["https://example.com/paris"]
+    assert [doc.meta["url"] for doc in result[1]] == ["https://example.com/berlin"]
+
+
 @fail_at_version(1, 17)
 def test_text_2_sparql_retriever_deprecation():
     BartForConditionalGeneration = object()
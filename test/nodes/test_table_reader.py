@@ -1,11 +1,15 @@
 import logging
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import torch
 import pytest
+from transformers import BatchEncoding
 
 from haystack.schema import Document, Answer
 from haystack.pipelines.base import Pipeline
+from haystack.nodes.reader.table import RCIReader, _TokenizedTableCache
 
 
 @pytest.fixture
@@ -254,3 +258,161 @@ def test_text_document(caplog, table_reader_and_param):
         predictions = table_reader.predict(query="test", documents=[document])
         assert "Skipping document with id 'text_doc'" in caplog.text
         assert len(predictions["answers"]) == 0
+
+
+@pytest.mark.unit
+def test_tokenized_table_cache(table_doc1, table_doc2, table_doc3):
+    tokenizer = Mock()
+    tokenizer._tokenize_table.side_effect = lambda table: f"tokenized {table.shape}"
+    cache = _TokenizedTableCache(tokenizer=tokenizer, max_size=2)
+
+    string_table, tokenized_table = cache.get(table_doc1)
+    assert string_table.equals(table_doc1.content.astype(str))
+    assert tokenized_table == "tokenized (3, 4)"
+
+    # Repeated tables are only tokenized once
+    cache.get(table_doc1)
+    cache.get(table_doc2)
+    assert tokenizer._tokenize_table.call_count == 2
+
+    # The least recently used table is evicted
+    cache.get(table_doc1)
+    cache.get(table_doc3)
+    assert tokenizer._tokenize_table.call_count == 3
+    cache.get(table_doc1)
+    assert tokenizer._tokenize_table.call_count == 3
+    cache.get(table_doc2)
+    assert tokenizer._tokenize_table.call_count == 4
+
+
+class MockRCITokenizer:
+    """Tokenizes each distinct (query, representation) pair to a sequence of its pair id of varying length."""
+
+    def __init__(self):
+        self.pair_ids = {}
+
+    def __call__(self, pairs, **kwargs):
+        input_ids = []
+        for pair in pairs:
+            pair_id = self.pair_ids.setdefault(pair, len(self.pair_ids) + 1)
+            input_ids.append([pair_id] * (1 + pair_id % 3))
+        return {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+    def pad(self, encodings, return_tensors):
+        max_len = max(len(encoding["input_ids"]) for encoding in encodings)
+        return BatchEncoding(
+            {
+                key: torch.tensor([encoding[key] + [0] * (max_len - len(encoding[key])) for encoding in encodings])
+                for key in ("input_ids", "attention_mask")
+            }
+        )
+
+
+class MockRCIModel:
+    """Scores each pair with a distinct logit derived from the pair id its tokenizer assigned to it."""
+
+    def __init__(self, tokenizer: MockRCITokenizer, scale: float):
+        self.tokenizer = tokenizer
+        self.scale = scale
+        self.batch_sizes = []
+
+    def to(self, device):
+        return self
+
+    def logit(self, pair) -> float:
+        return self.scale * ((self.tokenizer.pair_ids[pair] * 7) % 101)
+
+    def __call__(self, input_ids, attention_mask):
+        self.batch_sizes.append(len(input_ids))
+        logits = torch.tensor([self.scale * ((int(pair_id) * 7) % 101) for pair_id in input_ids[:, 0]])
+        return (torch.stack([torch.zeros_like(logits), logits], dim=1),)
+
+
+@pytest.mark.unit
+def test_rci_reader_batched_scoring_matches_unbatched_scoring(table_doc1, table_doc2, table_doc3):
+    row_tokenizer, column_tokenizer = MockRCITokenizer(), MockRCITokenizer()
+    # Row logits are distinct integers and column logits distinct fractions below 1, so no two cells tie
+    row_model, column_model = MockRCIModel(row_tokenizer, scale=1.0), MockRCIModel(column_tokenizer, scale=0.001)
+    with patch("haystack.nodes.reader.table.AutoModelForSequenceClassification.from_pretrained") as model_loader:
+        with patch("haystack.nodes.reader.table.AutoTokenizer.from_pretrained") as tokenizer_loader:
+            model_loader.side_effect = [row_model, column_model]
+            tokenizer_loader.side_effect = [row_tokenizer, column_tokenizer]
+            reader = RCIReader(use_gpu=False, batch_size=2)
+
+    queries = ["Who was born in 1961?", "Which mountain is the highest?"]
+    documents = [[table_doc1, table_doc3], [table_doc2]]
+    top_k = 5
+    answers_per_query = reader._predict_batched(queries=queries, documents=documents, top_k=top_k)
+
+    # The rows and columns of all tables were scored in several padded batches
+    assert len(row_model.batch_sizes) > 1 and max(row_model.batch_sizes) == 2
+    assert len(column_model.batch_sizes) > 1 and max(column_model.batch_sizes) == 2
+
+    for query, docs, answers in zip(queries, documents, answers_per_query):
+        # Score every cell on its own as the unbatched RCIReader did
+        expected = []
+        for document in docs:
+            string_table = document.content.astype(str)
+            row_reps, column_reps = reader._create_row_column_representations(string_table)
+            for row_idx, row_rep in enumerate(row_reps):
+                for col_idx, column_rep in enumerate(column_reps):
+                    score = row_model.logit((query, row_rep)) + column_model.logit((query, column_rep))
+                    expected.append((score, document.id, row_idx * len(column_reps) + col_idx))
+        expected = sorted(expected, reverse=True)[:top_k]
+
+        assert [(answer.document_ids[0], answer.offsets_in_document[0].start) for answer in answers] == [
+            (document_id, cell) for _, document_id, cell in expected
+        ]
+        assert np.allclose([answer.score for answer in answers], [score for score, _, _ in expected], atol=1e-4)
+
+
+@pytest.mark.unit
+def test_rci_reader_returns_no_answers_for_empty_tables():
+    row_tokenizer, column_tokenizer = MockRCITokenizer(), MockRCITokenizer()
+    row_model, column_model = MockRCIModel(row_tokenizer, scale=1.0), MockRCIModel(column_tokenizer, scale=0.001)
+    with patch("haystack.nodes.reader.table.AutoModelForSequenceClassification.from_pretrained") as model_loader:
+        with patch("haystack.nodes.reader.table.AutoTokenizer.from_pretrained") as tokenizer_loader:
+            model_loader.side_effect = [row_model, column_model]
+            tokenizer_loader.side_effect = [row_tokenizer, column_tokenizer]
+            reader = RCIReader(use_gpu=False)
+
+    # Tables without rows are skipped, but tables with rows and without columns have no cells either
+    empty_table = Document(content=pd.DataFrame(index=range(2)), content_type="table")
+    answers_per_query = reader._predict_batched(queries=["Who is the oldest?"], documents=[[empty_table]], top_k=3)
+
+    assert answers_per_query == [[]]
+
+
+@pytest.mark.unit
+def test_tokenized_table_cache_falls_back_to_public_tokenizer_api(table_doc1):
+    tokenizer = Mock(spec=["__call__"])
+    tokenizer.return_value = {"input_ids": [1, 2, 3]}
+    cache = _TokenizedTableCache(tokenizer=tokenizer, max_size=2)
+
+    string_table, encoding = cache.encode("Who is the oldest?", table_doc1, max_seq_len=64)
+
+    assert string_table.equals(table_doc1.content.astype(str))
+    assert encoding == {"input_ids": [1, 2, 3]}
+    assert tokenizer.call_args.kwargs["queries"] == "Who is the oldest?"
+    assert tokenizer.call_args.kwargs["table"].equals(string_table)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("table_reader_and_param", ["tapas_small"], indirect=True)
+def test_tapas_encoder_batched_predictions_match_per_query_predictions(
+    table_reader_and_param, table_doc1, table_doc2, table_doc3
+):
+    table_reader, _ = table_reader_and_param
+    encoder = table_reader.table_encoder
+    queries = ["Who was born in 1961?", "How old is Gal Gadot?", "Which is the highest mountain?"]
+    documents = [[table_doc1, table_doc2], [table_doc2], [table_doc1, table_doc3]]
+
+    batched_answers = encoder._predict_batched(queries=queries, documents=documents, top_k=3, batch_size=4)
+    for query, docs, answers in zip(queries, documents, batched_answers):
+        expected_answers = encoder._predict_batched(queries=[query], documents=[docs], top_k=3, batch_size=1)[0]
+        assert [(answer.answer, answer.document_ids) for answer in answers] == [
+            (answer.answer, answer.document_ids) for answer in expected_answers
+        ]
+        assert [answer.score for answer in answers] == pytest.approx(
+            [answer.score for answer in expected_answers], abs=1e-4
+        )
@@ -1,4 +1,4 @@
-from haystack.schema import Document, Label, Answer, Span, MultiLabel
+from haystack.schema import Document, Label, Answer, Span, MultiLabel, EvaluationResult
 import pytest
 import numpy as np
 import pandas as pd
@@ -596,3 +596,91 @@ def test_legacy_answer_document_id_is_none():
 
     label = Label.from_dict(legacy_label)
     assert label.answer.document_ids is None
+
+
+@pytest.fixture
+def eval_result():
+    def document_row(multilabel_id, rank, document_id, gold_document_ids):
+        id_match = [1.0 if gold_id == document_id else 0.0 for gold_id in gold_document_ids]
+        return {
+            "multilabel_id": multilabel_id,
+            "type": "document",
+            "eval_mode": "integrated",
+            "rank": rank,
+            "document_id": document_id,
+            "gold_document_ids": gold_document_ids,
+            "gold_documents_id_match": id_match,
+            "gold_contexts_similarity": [0.0] * len(gold_document_ids),
+            "gold_answers_match": [0.0] * len(gold_document_ids),
+            "gold_id_match": max(id_match),
+            "answer_match": 0.0,
+            "gold_id_or_answer_match": max(id_match),
+            "filters": b"null",
+        }
+
+    def answer_row(multilabel_id, rank, answer, exact_match, f1):
+        return {
+            "multilabel_id": multilabel_id,
+            "type": "answer",
+            "eval_mode": "integrated",
+            "rank": rank,
+            "answer": answer,
+            "document_ids": ["a"],
+            "offsets_in_document": [{"start": 0, "end": len(answer)}],
+            "gold_answers": ["Berlin"],
+            "exact_match": exact_match,
+            "f1": f1,
+        }
+
+    retriever_df = pd.DataFrame(
+        [
+            document_row("q1", 1, "a", ["a", "b"]),
+            document_row("q1", 2, "x", ["a", "b"]),
+            document_row("q1", 3, "b", ["a", "b"]),
+            document_row("q2", 1, "x", ["a"]),
+            document_row("q3", 1, "x", ["00"]),
+        ]
+    )
+    reader_df = pd.DataFrame(
+        [
+            answer_row("q1", 1, "Berlin", 1.0, 1.0),
+            answer_row("q1", 2, "in Berlin", 0.0, 0.67),
+            answer_row("q2", 1, "Paris", 0.0, 0.0),
+        ]
+    )
+    return EvaluationResult({"Retriever": retriever_df, "Reader": reader_df})
+
+
+def test_evaluation_result_metrics(eval_result):
+    metrics = eval_result.calculate_metrics(document_scope="document_id")
+
+    # q1 retrieves both gold documents at rank 1 and 3, q2 retrieves none and q3 is a no_answer query
+    assert metrics["Retriever"]["recall_multi_hit"] == pytest.approx((1.0 + 0.0 + 1.0) / 3)
+    assert metrics["Retriever"]["precision"] == pytest.approx((2 / 3 + 0.0 + 1.0) / 3)
+    assert metrics["Retriever"]["mrr"] == pytest.approx((1.0 + 0.0 + 1.0) / 3)
+    assert metrics["Retriever"]["map"] == pytest.approx(((1.0 + 2 / 3) / 2 + 0.0 + 1.0) / 3)
+    ndcg_q1 = (1.0 + 1.0 / np.log2(4)) / (1.0 + 1.0 / np.log2(3))
+    assert metrics["Retriever"]["ndcg"] == pytest.approx((ndcg_q1 + 0.0 + 1.0) / 3)
+    assert metrics["Reader"]["exact_match"] == pytest.approx(0.5)
+    assert metrics["Reader"]["f1"] == pytest.approx(0.5)
+
+    metrics = eval_result.calculate_metrics(simulated_top_k_retriever=2)
+    assert metrics["Retriever"]["recall_multi_hit"] == pytest.approx((0.5 + 0.0 + 1.0) / 3)
+    assert metrics["Retriever"]["precision"] == pytest.approx((1 / 2 + 0.0 + 1.0) / 3)
+
+
+def test_evaluation_result_save_and_load_parquet(eval_result, tmp_path):
+    eval_result.save(tmp_path, file_format="parquet")
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["Reader.parquet", "Retriever.parquet"]
+
+    loaded_eval_result = EvaluationResult.load(tmp_path)
+    retriever_df = loaded_eval_result["Retriever"]
+    assert retriever_df["gold_document_ids"].iloc[0] == ["a", "b"]
+    assert retriever_df["gold_documents_id_match"].iloc[0] == [1.0, 0.0]
+    assert retriever_df["filters"].iloc[0] == b"null"
+    assert loaded_eval_result["Reader"]["offsets_in_document"].iloc[0] == [{"start": 0, "end": 6}]
+    assert loaded_eval_result.calculate_metrics() == eval_result.calculate_metrics()
+
+    loaded_eval_result = EvaluationResult.load(tmp_path, columns=["multilabel_id", "type", "answer"])
+    assert list(loaded_eval_result["Retriever"].columns) == ["multilabel_id", "type"]
+    assert list(loaded_eval_result["Reader"].columns) == ["multilabel_id", "type", "answer"]
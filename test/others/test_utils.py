@@ -1,5 +1,9 @@
 import importlib
 import logging
+import subprocess
+import sys
+import types
+from multiprocessing.pool import Pool
 from random import random
 from typing import List
 from unittest import mock
@@ -18,7 +22,14 @@ from haystack.schema import Answer, Document, Span, Label
 from haystack.utils import print_answers
 from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudExperiments
 from haystack.utils.labels import aggregate_labels
-from haystack.utils.preprocessing import convert_files_to_docs, tika_convert_files_to_docs
+from haystack.utils.lazy_imports import lazy_exports
+from haystack.utils.preprocessing import (
+    ConversionReport,
+    convert_files_to_docs,
+    convert_files_to_docs_generator,
+    tika_convert_files_to_docs,
+    tika_convert_files_to_docs_generator,
+)
 from haystack.utils.cleaning import clean_wiki_text
 from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
 
@@ -176,6 +187,80 @@ def test_tika_convert_files_to_docs():
     assert documents and len(documents) > 0
 
 
+def test_convert_files_to_docs_generator_reports_failed_files(tmp_path):
+    (tmp_path / "first.txt").write_text("First paragraph.\n\nSecond paragraph.")
+    (tmp_path / "second.txt").write_text("Third paragraph.")
+    # A directory can't be converted
+    (tmp_path / "broken.txt").mkdir()
+
+    report = ConversionReport()
+    documents = list(
+        convert_files_to_docs_generator(dir_path=tmp_path, split_paragraphs=True, num_processes=1, report=report)
+    )
+
+    assert sorted(doc.content for doc in documents) == ["First paragraph.", "Second paragraph.", "Third paragraph."]
+    assert sorted(report.converted) == [str(tmp_path / "first.txt"), str(tmp_path / "second.txt")]
+    assert list(report.failed) == [str(tmp_path / "broken.txt")]
+
+
+def test_convert_files_to_docs_generator_in_worker_processes(tmp_path):
+    for i in range(4):
+        (tmp_path / f"{i}.txt").write_text(f"Document {i}")
+
+    documents = list(convert_files_to_docs_generator(dir_path=tmp_path, num_processes=2, timeout=60))
+
+    assert sorted(doc.content for doc in documents) == [f"Document {i}" for i in range(4)]
+
+
+def test_convert_files_to_docs_generator_resumes_from_manifest(tmp_path):
+    docs_path = tmp_path / "docs"
+    docs_path.mkdir()
+    for i in range(3):
+        (docs_path / f"{i}.txt").write_text(f"Document {i}")
+    manifest_path = tmp_path / "manifest.txt"
+
+    documents = convert_files_to_docs_generator(dir_path=docs_path, num_processes=1, manifest_path=manifest_path)
+    first_document = next(documents)
+    # The first file is recorded in the manifest once its Documents were consumed
+    next(documents)
+    documents.close()
+
+    report = ConversionReport()
+    remaining_documents = list(
+        convert_files_to_docs_generator(dir_path=docs_path, num_processes=1, report=report, manifest_path=manifest_path)
+    )
+
+    assert len(report.skipped) == 1
+    assert first_document.content not in [doc.content for doc in remaining_documents]
+    assert len(remaining_documents) == 2
+
+
+def test_tika_convert_files_to_docs_generator(tmp_path):
+    class TikaStandIn:
+        def __init__(self, tika_url):
+            self.tika_url = tika_url
+
+        def convert(self, file_path):
+            return [Document(content=file_path.read_text(), meta={"tika_url": self.tika_url})]
+
+    (tmp_path / "first.txt").write_text("A first paragraph with some words.\n\nA second paragraph with some words.")
+    (tmp_path / "second.txt").write_text("Another document with some words.")
+
+    with mock.patch("haystack.nodes.file_converter.TikaConverter", TikaStandIn):
+        documents = list(
+            tika_convert_files_to_docs_generator(
+                dir_path=tmp_path, split_paragraphs=True, tika_url="http://tika-stand-in:9998/tika", num_processes=1
+            )
+        )
+
+    assert sorted(doc.content for doc in documents) == [
+        "A first paragraph with some words.",
+        "A second paragraph with some words.",
+        "Another document with some words.",
+    ]
+    assert all(doc.meta["tika_url"] == "http://tika-stand-in:9998/tika" for doc in documents)
+
+
 def test_calculate_context_similarity_on_parts_of_whole_document():
     whole_document = TEST_CONTEXT
     min_length = 100
@@ -325,6 +410,44 @@ def test_match_contexts_multi_process():
         assert score == 100.0
 
 
+def test_match_contexts_returns_list_per_context():
+    min_length = 100
+    contexts = [TEST_CONTEXT_2[:150], "x" * 150, TEST_CONTEXT[200:350]]
+    candidates = ((str(i), TEST_CONTEXT if i % 2 == 0 else TEST_CONTEXT_2) for i in range(4))
+    result_list = match_contexts(contexts, candidates, min_length=min_length, num_processes=1)
+    assert result_list == [[("1", 100.0), ("3", 100.0)], [], [("0", 100.0), ("2", 100.0)]]
+
+
+def test_match_contexts_index_gives_same_results_as_all_pairs():
+    min_length = 100
+    context_size = min_length + 5
+    partial_contexts = [TEST_CONTEXT[i : i + context_size] for i in range(0, len(TEST_CONTEXT) - context_size, 7)]
+    partial_contexts += [TEST_CONTEXT_2[i : i + context_size] for i in range(0, len(TEST_CONTEXT_2) - context_size, 7)]
+    indexed = match_contexts(
+        partial_contexts,
+        ((str(i), TEST_CONTEXT if i == 0 else TEST_CONTEXT_2) for i in range(3)),
+        num_processes=1,
+        use_index=True,
+    )
+    all_pairs = match_contexts(
+        partial_contexts,
+        ((str(i), TEST_CONTEXT if i == 0 else TEST_CONTEXT_2) for i in range(3)),
+        num_processes=1,
+        use_index=False,
+    )
+    assert indexed == all_pairs
+
+
+def test_match_contexts_in_caller_pool():
+    min_length = 100
+    contexts = [TEST_CONTEXT_2[:150], TEST_CONTEXT[200:350]]
+    with Pool(processes=2) as pool:
+        for _ in range(2):
+            candidates = ((str(i), TEST_CONTEXT if i % 2 == 0 else TEST_CONTEXT_2) for i in range(4))
+            result_list = match_contexts(contexts, candidates, min_length=min_length, pool=pool)
+            assert result_list == [[("1", 100.0), ("3", 100.0)], [("0", 100.0), ("2", 100.0)]]
+
+
 def _get_random_chars(size: int):
     chars = np.random.choice(
         list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZß?/.,;:-#äöüÄÖÜ+*~1234567890$€%&!§ "), size=size
@@ -1286,6 +1409,64 @@ def test_secure_model_loading(monkeypatch, caplog):
     assert "already set to" in caplog.text
 
 
+@pytest.mark.unit
+def test_bm25_pipeline_imports_without_torch():
+    script = """
+import sys
+from haystack import Pipeline
+from haystack.nodes import BM25Retriever
+from haystack.nodes.base import BaseComponent
+from haystack.document_stores import ElasticsearchDocumentStore
+
+assert BaseComponent.get_subclass("BM25Retriever") is BM25Retriever
+print(sorted(module for module in ("torch", "transformers") if module in sys.modules))
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.unit
+def test_lazy_exports(monkeypatch):
+    package = types.ModuleType("lazy_test_package")
+    package.__getattr__, package.__dir__ = lazy_exports(
+        "lazy_test_package", {"dumps": "json", "MissingNode": ("lazy_test_missing_module", "missing-extra")}
+    )
+    monkeypatch.setitem(sys.modules, "lazy_test_package", package)
+
+    assert "dumps" in dir(package)
+    assert "dumps" not in vars(package)
+    from lazy_test_package import dumps  # pylint: disable=import-error
+
+    assert dumps is importlib.import_module("json").dumps
+    assert vars(package)["dumps"] is dumps
+    # Names that need missing dependencies are replaced with a placeholder, like with safe_import()
+    with pytest.raises(ImportError, match="missing-extra"):
+        package.MissingNode()
+    with pytest.raises(AttributeError):
+        package.unknown_name
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "package_name",
+    [
+        "haystack",
+        "haystack.nodes",
+        "haystack.nodes.retriever",
+        "haystack.document_stores",
+        "haystack.pipelines",
+        "haystack.utils",
+        "haystack.modeling.evaluation",
+    ],
+)
+def test_lazy_packages_define_all(package_name):
+    package = importlib.import_module(package_name)
+
+    # Star imports and tools that read __all__ see the lazily exported names
+    assert package.__all__
+    assert set(package.__all__) <= set(dir(package))
+
+
 class TestAggregateLabels:
     @pytest.fixture
     def standard_labels(self) -> List[Label]:
@@ -3,8 +3,10 @@ import logging
 from pathlib import Path
 import pytest
 import sys
+import numpy as np
 import pandas as pd
 from copy import deepcopy
+from unittest.mock import MagicMock
 
 import responses
 from haystack.document_stores.memory import InMemoryDocumentStore
@@ -228,6 +230,88 @@ def test_eval_pipeline(document_store, reader, retriever):
     assert metrics_sas_cross_encoder["Reader"]["sas"] == pytest.approx(0.71063, 1e-4)
 
 
+@pytest.fixture
+def sas_metrics():
+    from haystack.modeling.evaluation import metrics
+
+    metrics.clear_sas_cache()
+    yield metrics
+    metrics.clear_sas_cache()
+
+
+@pytest.mark.unit
+def test_semantic_answer_similarity_caches_model_and_embeddings(sas_metrics, monkeypatch):
+    encoded_texts = []
+
+    class MockSentenceTransformer:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def encode(self, texts, batch_size):
+            encoded_texts.extend(texts)
+            return np.array([[len(text), 1.0] for text in texts])
+
+    model_class = MagicMock(side_effect=MockSentenceTransformer)
+    monkeypatch.setattr(sas_metrics, "SentenceTransformer", model_class)
+    monkeypatch.setattr(
+        sas_metrics, "AutoConfig", MagicMock(**{"from_pretrained.return_value.architectures": ["BertModel"]})
+    )
+
+    predictions = [["Berlin"], ["Paris", "Berlin"]]
+    gold_labels = [["Berlin"], ["Paris"]]
+    top_1_sas, top_k_sas, pred_label_matrix = sas_metrics.semantic_answer_similarity(
+        predictions, gold_labels, sas_model_name_or_path="some-model", use_gpu=False
+    )
+    assert top_1_sas == pytest.approx([1.0, 1.0])
+    assert top_k_sas == pytest.approx([1.0, 1.0])
+    assert pred_label_matrix[1][1][0] < 1.0
+    assert sorted(encoded_texts) == ["Berlin", "Paris"]
+
+    # A second evaluation with the same model reuses the loaded model and the embeddings of known answers
+    sas_metrics.semantic_answer_similarity(
+        [["Berlin", "Rome"]], [["Paris"]], sas_model_name_or_path="some-model", use_gpu=False
+    )
+    assert model_class.call_count == 1
+    assert sorted(encoded_texts) == ["Berlin", "Paris", "Rome"]
+
+
+@pytest.mark.unit
+def test_semantic_answer_similarity_cross_encoder_scores_pairs_sorted_by_length(sas_metrics, monkeypatch):
+    scored_pairs = []
+
+    class MockCrossEncoder:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def predict(self, pairs, batch_size):
+            scored_pairs.extend(pairs)
+            return np.array([1.0 if prediction == label else 0.5 for prediction, label in pairs])
+
+    monkeypatch.setattr(sas_metrics, "CrossEncoder", MockCrossEncoder)
+    monkeypatch.setattr(
+        sas_metrics,
+        "AutoConfig",
+        MagicMock(**{"from_pretrained.return_value.architectures": ["BertForSequenceClassification"]}),
+    )
+
+    top_1_sas, top_k_sas, pred_label_matrix = sas_metrics.semantic_answer_similarity(
+        predictions=[["Berlin", "Paris"], ["Berlin"]],
+        gold_labels=[["Paris", "the city of Berlin"], ["Paris"]],
+        sas_model_name_or_path="some-cross-encoder",
+        use_gpu=False,
+    )
+    assert top_1_sas == pytest.approx([0.5, 0.5])
+    assert top_k_sas == pytest.approx([1.0, 0.5])
+    assert pred_label_matrix[0] == [[0.5, 0.5], [1.0, 0.5]]
+    # The pair ("Berlin", "Paris") is scored only once
+    assert scored_pairs == [
+        ("Paris", "Paris"),
+        ("Berlin", "Paris"),
+        ("Paris", "the city of Berlin"),
+        ("Berlin", "the city of Berlin"),
+    ]
+
+
 @pytest.mark.parametrize("document_store", ["elasticsearch", "faiss", "memory", "milvus"], indirect=True)
 def test_eval_data_split_word(document_store):
     # splitting by word
@@ -36,10 +36,11 @@ from haystack.pipelines import (
 )
 from haystack.pipelines.config import get_component_definitions
 from haystack.pipelines.utils import generate_code
-from haystack.errors import PipelineConfigError
+from haystack.errors import PipelineConfigError, PipelineError
 from haystack.nodes import PreProcessor, TextConverter
 from haystack.utils.deepsetcloud import DeepsetCloudError
-from haystack import Answer
+from haystack.utils.tracing import ChromeTraceExporter, TraceAggregator, add_tracer, remove_tracer
+from haystack import Answer, Document
 
 from ..conftest import (
     MOCK_DC,
@@ -2075,3 +2076,148 @@ def test_update_config_hash():
         assert test_pipeline.config_hash == None
         test_pipeline.update_config_hash()
         assert test_pipeline.config_hash == "a30d3273de0d70e63e8cd91d915255b3"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_processes", [1, 2])
+def test_run_indexing(tmp_path, num_processes):
+    file_paths = []
+    for i in range(5):
+        file_path = tmp_path / f"doc_{i}.txt"
+        file_path.write_text(" ".join(f"word{i}_{j}" for j in range(25)))
+        file_paths.append(file_path)
+
+    document_store = InMemoryDocumentStore()
+    pipeline = Pipeline()
+    pipeline.add_node(component=TextConverter(), name="Converter", inputs=["File"])
+    pipeline.add_node(
+        component=PreProcessor(split_by="word", split_length=10, split_respect_sentence_boundary=False),
+        name="PreProcessor",
+        inputs=["Converter"],
+    )
+    pipeline.add_node(component=document_store, name="DocumentStore", inputs=["PreProcessor"])
+
+    stats = pipeline.run_indexing(
+        file_paths=file_paths,
+        meta=[{"file": i} for i in range(5)],
+        batch_size=2,
+        num_processes=num_processes,
+        max_queued_batches=1,
+    )
+
+    documents = document_store.get_all_documents()
+    assert len(documents) == 15
+    assert sorted({doc.meta["file"] for doc in documents}) == [0, 1, 2, 3, 4]
+    assert stats["Converter"]["batches"] == 3
+    assert stats["Converter"]["documents"] == 5
+    assert stats["PreProcessor"]["documents"] == 15
+    assert stats["DocumentStore"]["batches"] == 3
+
+
+@pytest.mark.unit
+def test_run_indexing_needs_a_chain_after_the_preprocessor():
+    pipeline = Pipeline()
+    pipeline.add_node(component=TextConverter(), name="Converter", inputs=["File"])
+    pipeline.add_node(component=InMemoryDocumentStore(), name="DocumentStore1", inputs=["Converter"])
+    pipeline.add_node(component=InMemoryDocumentStore(), name="DocumentStore2", inputs=["Converter"])
+
+    with pytest.raises(PipelineError, match="form a chain"):
+        pipeline.run_indexing(file_paths=[SAMPLES_PATH / "docs" / "doc_1.txt"])
+
+
+@pytest.mark.unit
+def test_run_indexing_runs_preprocessors_in_its_worker_processes_only():
+    preprocessor = PreProcessor(num_processes=4)
+    pipeline = Pipeline()
+    pipeline.add_node(component=TextConverter(), name="Converter", inputs=["File"])
+    pipeline.add_node(component=preprocessor, name="PreProcessor", inputs=["Converter"])
+
+    stage_pipeline = pipeline._get_indexing_stage_pipeline(["Converter", "PreProcessor"], in_worker_processes=True)
+    assert stage_pipeline.get_node("PreProcessor").num_processes == 1
+    assert preprocessor.num_processes == 4
+
+    stage_pipeline = pipeline._get_indexing_stage_pipeline(["Converter", "PreProcessor"], in_worker_processes=False)
+    assert stage_pipeline.get_node("PreProcessor") is preprocessor
+
+
+@pytest.mark.unit
+def test_run_indexing_warns_about_batches_routed_to_unconnected_outputs(caplog):
+    pipeline = Pipeline()
+    pipeline.add_node(component=TextConverter(), name="Converter", inputs=["File"])
+    pipeline.add_node(component=InMemoryDocumentStore(), name="DocumentStore", inputs=["Converter"])
+    node_output = {"documents": [Document(content="text")]}
+
+    assert pipeline._route_node_output("Converter", "DocumentStore", node_output, "output_1") == node_output
+    with caplog.at_level(logging.WARNING):
+        assert pipeline._route_node_output("Converter", "DocumentStore", node_output, "output_2") is None
+    assert "not indexed" in caplog.text
+
+
+@pytest.mark.unit
+def test_pipeline_tracing(tmp_path):
+    document_store = InMemoryDocumentStore(use_bm25=True)
+    document_store.write_documents([Document(content="Carla lives in Berlin"), Document(content="Paul lives in Rome")])
+    pipeline = Pipeline()
+    pipeline.add_node(component=BM25Retriever(document_store=document_store), name="Retriever", inputs=["Query"])
+    aggregator = TraceAggregator()
+    exporter = ChromeTraceExporter()
+    add_tracer(aggregator)
+    add_tracer(exporter)
+    try:
+        pipeline.run(query="Who lives in Berlin?", params={"Retriever": {"top_k": 1}})
+        pipeline.run_batch(queries=["Who lives in Berlin?", "Who lives in Rome?"], params={"Retriever": {"top_k": 1}})
+    finally:
+        remove_tracer(aggregator)
+        remove_tracer(exporter)
+    pipeline.run(query="Who lives in Rome?")
+
+    stats = aggregator.stats()
+    assert set(stats) == {
+        "Pipeline.run",
+        "Pipeline.run_batch",
+        "Query.run",
+        "Query.run_batch",
+        "Retriever.run",
+        "Retriever.run_batch",
+    }
+    assert stats["Retriever.run"]["count"] == 1
+    assert stats["Retriever.run"]["errors"] == 0
+    assert stats["Retriever.run"]["wall_time_ms_p95"] >= stats["Retriever.run"]["wall_time_ms_p50"] > 0
+
+    events = {(event["name"], event["args"]["method"]): event for event in exporter.to_dict()["traceEvents"]}
+    assert len(events) == 6
+    retriever_event = events[("Retriever", "run_batch")]
+    assert retriever_event["ph"] == "X"
+    assert retriever_event["cat"] == "node"
+    assert retriever_event["args"]["component"] == "BM25Retriever"
+    assert retriever_event["args"]["input_sizes"] == {"queries": 2, "tokens": 8}
+    assert retriever_event["args"]["output_sizes"]["documents"] == 2
+    pipeline_event = events[("Pipeline", "run_batch")]
+    assert pipeline_event["ts"] <= retriever_event["ts"]
+    assert pipeline_event["ts"] + pipeline_event["dur"] >= retriever_event["ts"] + retriever_event["dur"]
+
+    exporter.save(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as trace_file:
+        assert len(json.load(trace_file)["traceEvents"]) == 6
+
+
+class FailingNode(MockNode):
+    def run(self, *a, **k):
+        raise ValueError("failed")
+
+
+@pytest.mark.unit
+def test_pipeline_tracing_records_errors():
+    pipeline = Pipeline()
+    pipeline.add_node(component=FailingNode(), name="Node", inputs=["Query"])
+    aggregator = TraceAggregator()
+    add_tracer(aggregator)
+    try:
+        with pytest.raises(Exception, match="failed"):
+            pipeline.run(query="query")
+    finally:
+        remove_tracer(aggregator)
+
+    stats = aggregator.stats()
+    assert stats["Node.run"]["errors"] == 1
+    assert stats["Pipeline.run"]["errors"] == 1